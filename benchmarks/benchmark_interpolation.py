@@ -55,3 +55,30 @@ class InterpolationResize:
         .. [1]: https://asv.readthedocs.io/en/stable/writing_benchmarks.html#peak-memory
         """
         pass
+
+
+class InterpolationResizeKernel:
+    param_names = ['new_shape', 'kernel', 'dtype']
+    params = [
+        ((250, 400), (2000, 4000), (40, 40, 40), (150, 150, 150)),  # new_shape
+        ('linear', 'lanczos', 'area', 'gaussian'),  # kernel
+        (np.float32, np.float64),  # dtype
+    ]
+
+    def setup(self, new_shape, kernel, dtype):
+        ndim = len(new_shape)
+        if ndim == 2:
+            image = np.random.random((1000, 1000))
+        else:
+            image = np.random.random((100, 100, 100))
+        self.image = image.astype(dtype, copy=False)
+        try:
+            transform.resize(self.image[:2, :2], (1, 1), kernel=kernel)
+        except TypeError:
+            raise NotImplementedError("resize does not support kernel")
+
+    def time_resize(self, new_shape, kernel, dtype):
+        transform.resize(self.image, new_shape, kernel=kernel)
+
+    def peakmem_resize(self, new_shape, kernel, dtype):
+        transform.resize(self.image, new_shape, kernel=kernel)
@@ -47,6 +47,40 @@ class RegionpropsTableAll:
     # omit peakmem tests to save time (memory usage was minimal)
 
 
+class RegionpropsTableVectorized:
+    param_names = ['vectorized']
+    params = (False, True)
+
+    def setup(self, vectorized):
+        self.label_image, self.intensity_image = init_regionprops_data()
+        self.properties = [
+            'label',
+            'area',
+            'bbox',
+            'centroid',
+            'moments_central',
+            'inertia_tensor',
+            'intensity_mean',
+            'intensity_std',
+        ]
+        try:
+            measure.regionprops_table(
+                self.label_image[:10, :10], properties=['area'], vectorized=True
+            )
+        except TypeError:
+            raise NotImplementedError("vectorized regionprops_table unavailable")
+
+    def time_regionprops_table(self, vectorized):
+        measure.regionprops_table(
+            self.label_image,
+            self.intensity_image,
+            properties=self.properties,
+            vectorized=vectorized,
+        )
+
+    # omit peakmem tests to save time (memory usage was minimal)
+
+
 class MomentsSuite:
     params = (
         [(64, 64), (4096, 2048), (32, 32, 32), (256, 256, 192)],
@@ -75,3 +109,19 @@ class MomentsSuite:
 
     def peakmem_moments_central(self, shape, dtype, order):
         measure.moments_central(self.image)
+
+
+class LabelSuite:
+    params = ([(8192, 8192), (256, 256, 256)], [1, 4])
+    param_names = ['shape', 'workers']
+
+    def setup(self, shape, workers):
+        self.image = data.binary_blobs(
+            length=shape[0], blob_size_fraction=0.01, n_dim=len(shape), rng=0
+        ).astype(np.uint8)
+
+    def time_label(self, shape, workers):
+        measure.label(self.image, workers=workers)
+
+    def time_label_chunked(self, shape, workers):
+        measure.label(self.image, chunks=256, workers=workers)
@@ -7,7 +7,10 @@ from skimage.morphology import disk, ball
 
 class RankSuite:
     param_names = ["filter_func", "shape"]
-    params = [sorted(all_rank_filters), [(32, 32), (256, 256)]]
+    params = [
+        sorted(set(all_rank_filters) - {'statistics'}),
+        [(32, 32), (256, 256)],
+    ]
 
     def setup(self, filter_func, shape):
         self.image = np.random.randint(0, 255, size=shape, dtype=np.uint8)
@@ -27,3 +30,34 @@ class Rank3DSuite:
 
     def time_3d_filters(self, filter3d, shape3d):
         getattr(rank, filter3d)(self.volume, self.footprint_3d)
+
+
+class RankWorkersSuite:
+    param_names = ["filter_func", "workers"]
+    params = [["median", "entropy", "otsu"], [1, 4]]
+
+    def setup(self, filter_func, workers):
+        rng = np.random.default_rng(0)
+        self.image = rng.integers(0, 4096, size=(1024, 1024), dtype=np.uint16)
+        self.footprint = disk(5)
+
+    def time_filter(self, filter_func, workers):
+        getattr(rank, filter_func)(self.image, self.footprint, workers=workers)
+
+
+class RankStatisticsSuite:
+    stats = ["minimum", "maximum", "mean", "median", ("percentile", 0.9)]
+
+    def setup(self):
+        self.image = np.random.randint(0, 255, size=(512, 512), dtype=np.uint8)
+        self.footprint = disk(5)
+
+    def time_statistics(self):
+        rank.statistics(self.image, self.footprint, self.stats)
+
+    def time_separate_filters(self):
+        for stat in self.stats:
+            if isinstance(stat, tuple):
+                rank.percentile(self.image, self.footprint, p0=stat[1])
+            else:
+                getattr(rank, stat)(self.image, self.footprint)
@@ -87,6 +87,47 @@ class RestorationSuite:
             fast_mode=True,
         )
 
+    def time_denoise_nl_means_fast_workers(self, workers):
+        restoration.denoise_nl_means(
+            self.volume_f64,
+            patch_size=3,
+            patch_distance=2,
+            sigma=self.sigma,
+            h=0.7 * self.sigma,
+            fast_mode=True,
+            workers=workers,
+        )
+
+    time_denoise_nl_means_fast_workers.params = (1, 2, 4, 8)
+    time_denoise_nl_means_fast_workers.param_names = ["workers"]
+
+    def time_denoise_tv_chambolle_f64(self):
+        restoration.denoise_tv_chambolle(self.volume_f64, weight=0.1)
+
+    def time_denoise_tv_chambolle_f32(self):
+        restoration.denoise_tv_chambolle(self.volume_f32, weight=0.1)
+
+    def time_denoise_tv_chambolle_workers(self, workers):
+        restoration.denoise_tv_chambolle(self.volume_f64, weight=0.1, workers=workers)
+
+    time_denoise_tv_chambolle_workers.params = (1, 2, 4, 8)
+    time_denoise_tv_chambolle_workers.param_names = ["workers"]
+
+    def peakmem_denoise_tv_chambolle_f64(self):
+        restoration.denoise_tv_chambolle(self.volume_f64, weight=0.1)
+
+    def time_cycle_spin_workers(self, workers):
+        restoration.cycle_spin(
+            self.volume_f64[..., 0],
+            restoration.denoise_tv_chambolle,
+            max_shifts=3,
+            func_kw=dict(weight=0.1),
+            workers=workers,
+        )
+
+    time_cycle_spin_workers.params = (1, 2, 4, 8)
+    time_cycle_spin_workers.param_names = ["workers"]
+
     def peakmem_denoise_nl_means_f64(self):
         restoration.denoise_nl_means(
             self.volume_f64,
@@ -170,6 +211,30 @@ class DeconvolutionSuite:
         restoration.richardson_lucy(self.volume_f32, self.psf_f32, **rl_iter_kwarg)
 
 
+class DenoiseTVChambolle:
+    """Benchmark total-variation denoising for a fixed number of iterations."""
+
+    param_names = ["shape", "dtype"]
+    params = [
+        [(2048, 2048), (64, 256, 256)],
+        [np.float32, np.float64],
+    ]
+
+    def setup(self, shape, dtype):
+        rng = np.random.default_rng(0)
+        self.image = rng.random(shape).astype(dtype)
+
+    def time_denoise_tv_chambolle(self, shape, dtype):
+        # eps=0 runs all iterations, independently of the convergence
+        restoration.denoise_tv_chambolle(self.image, weight=0.1, eps=0, max_num_iter=20)
+
+    def peakmem_reference(self, *args):
+        pass
+
+    def peakmem_denoise_tv_chambolle(self, shape, dtype):
+        restoration.denoise_tv_chambolle(self.image, weight=0.1, eps=0, max_num_iter=20)
+
+
 class RollingBall:
     """Benchmark Rolling Ball algorithm."""
 
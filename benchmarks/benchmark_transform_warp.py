@@ -56,6 +56,23 @@ class WarpSuite:
         warp(self.image, self.tform, order=self.order, preserve_range=True)
 
 
+class WarpWorkersSuite:
+    params = ([1, 3], [1, 4])
+    param_names = ['order', 'workers']
+
+    def setup(self, order, workers):
+        rng = np.random.default_rng(0)
+        self.image = rng.random((2048, 2048))
+        self.tform = SimilarityTransform(
+            scale=1, rotation=np.pi / 10, translation=(0, 4)
+        )
+        if 'workers' not in inspect.signature(warp).parameters:
+            raise NotImplementedError("warp does not support workers")
+
+    def time_warp(self, order, workers):
+        warp(self.image, self.tform, order=order, workers=workers)
+
+
 class ResizeLocalMeanSuite:
     params = (
         [np.float32, np.float64],
@@ -17,6 +17,7 @@ from .generic import (
     entropy,
     otsu,
     sum,
+    statistics,
     windowed_histogram,
 )
 from ._percentile import (
@@ -64,6 +65,7 @@ __all__ = [
     'entropy',
     'otsu',
     'percentile',
+    'statistics',
     'windowed_histogram',
 ]
 
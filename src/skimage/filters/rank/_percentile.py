@@ -24,7 +24,7 @@ References
 
 from ..._shared.utils import check_nD
 from . import percentile_cy
-from .generic import _preprocess_input
+from .generic import _apply_in_bands, _preprocess_input
 
 __all__ = [
     'autolevel_percentile',
@@ -38,7 +38,20 @@ __all__ = [
 ]
 
 
-def _apply(func, image, footprint, out, mask, shift_x, shift_y, p0, p1, out_dtype=None):
+def _apply(
+    func,
+    image,
+    footprint,
+    out,
+    mask,
+    shift_x,
+    shift_y,
+    p0,
+    p1,
+    out_dtype=None,
+    workers=1,
+    bucketed=False,
+):
     check_nD(image, 2)
     image, footprint, out, mask, n_bins = _preprocess_input(
         image,
@@ -48,15 +61,19 @@ def _apply(func, image, footprint, out, mask, shift_x, shift_y, p0, p1, out_dtyp
         out_dtype,
         shift_x=shift_x,
         shift_y=shift_y,
+        bucketed=bucketed,
     )
 
-    func(
+    _apply_in_bands(
+        func,
         image,
         footprint,
+        out,
+        mask,
+        footprint.shape[0] // 2 + shift_y,
+        workers,
         shift_x=shift_x,
         shift_y=shift_y,
-        mask=mask,
-        out=out,
         n_bins=n_bins,
         p0=p0,
         p1=p1,
@@ -66,7 +83,16 @@ def _apply(func, image, footprint, out, mask, shift_x, shift_y, p0, p1, out_dtyp
 
 
 def autolevel_percentile(
-    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, p0=0, p1=1
+    image,
+    footprint,
+    out=None,
+    mask=None,
+    shift_x=0,
+    shift_y=0,
+    p0=0,
+    p1=1,
+    *,
+    workers=1,
 ):
     """Return grayscale local autolevel of an image.
 
@@ -92,6 +118,12 @@ def autolevel_percentile(
     p0, p1 : float, optional, in interval [0, 1]
         Define the [p0, p1] percentile interval to be considered for computing
         the value.
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -110,11 +142,21 @@ def autolevel_percentile(
         shift_y=shift_y,
         p0=p0,
         p1=p1,
+        workers=workers,
     )
 
 
 def gradient_percentile(
-    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, p0=0, p1=1
+    image,
+    footprint,
+    out=None,
+    mask=None,
+    shift_x=0,
+    shift_y=0,
+    p0=0,
+    p1=1,
+    *,
+    workers=1,
 ):
     """Return local gradient of an image (i.e. local maximum - local minimum).
 
@@ -137,6 +179,12 @@ def gradient_percentile(
     p0, p1 : float, optional, in interval [0, 1]
         Define the [p0, p1] percentile interval to be considered for computing
         the value.
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -155,11 +203,21 @@ def gradient_percentile(
         shift_y=shift_y,
         p0=p0,
         p1=p1,
+        workers=workers,
     )
 
 
 def mean_percentile(
-    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, p0=0, p1=1
+    image,
+    footprint,
+    out=None,
+    mask=None,
+    shift_x=0,
+    shift_y=0,
+    p0=0,
+    p1=1,
+    *,
+    workers=1,
 ):
     """Return local mean of an image.
 
@@ -182,6 +240,12 @@ def mean_percentile(
     p0, p1 : float, optional, in interval [0, 1]
         Define the [p0, p1] percentile interval to be considered for computing
         the value.
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -200,11 +264,21 @@ def mean_percentile(
         shift_y=shift_y,
         p0=p0,
         p1=p1,
+        workers=workers,
     )
 
 
 def subtract_mean_percentile(
-    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, p0=0, p1=1
+    image,
+    footprint,
+    out=None,
+    mask=None,
+    shift_x=0,
+    shift_y=0,
+    p0=0,
+    p1=1,
+    *,
+    workers=1,
 ):
     """Return image subtracted from its local mean.
 
@@ -227,6 +301,12 @@ def subtract_mean_percentile(
     p0, p1 : float, optional, in interval [0, 1]
         Define the [p0, p1] percentile interval to be considered for computing
         the value.
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -245,11 +325,21 @@ def subtract_mean_percentile(
         shift_y=shift_y,
         p0=p0,
         p1=p1,
+        workers=workers,
     )
 
 
 def enhance_contrast_percentile(
-    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, p0=0, p1=1
+    image,
+    footprint,
+    out=None,
+    mask=None,
+    shift_x=0,
+    shift_y=0,
+    p0=0,
+    p1=1,
+    *,
+    workers=1,
 ):
     """Enhance contrast of an image.
 
@@ -276,6 +366,12 @@ def enhance_contrast_percentile(
     p0, p1 : float, optional, in interval [0, 1]
         Define the [p0, p1] percentile interval to be considered for computing
         the value.
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -294,10 +390,13 @@ def enhance_contrast_percentile(
         shift_y=shift_y,
         p0=p0,
         p1=p1,
+        workers=workers,
     )
 
 
-def percentile(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, p0=0):
+def percentile(
+    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, p0=0, *, workers=1
+):
     """Return local percentile of an image.
 
     Returns the value of the p0 lower percentile of the local grayvalue
@@ -321,6 +420,12 @@ def percentile(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, p0=0
         footprint sizes (center must be inside the given footprint).
     p0 : float, optional, in interval [0, 1]
         Set the percentile value.
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -339,11 +444,22 @@ def percentile(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, p0=0
         shift_y=shift_y,
         p0=p0,
         p1=0.0,
+        workers=workers,
+        bucketed=True,
     )
 
 
 def pop_percentile(
-    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, p0=0, p1=1
+    image,
+    footprint,
+    out=None,
+    mask=None,
+    shift_x=0,
+    shift_y=0,
+    p0=0,
+    p1=1,
+    *,
+    workers=1,
 ):
     """Return the local number (population) of pixels.
 
@@ -369,6 +485,12 @@ def pop_percentile(
     p0, p1 : float, optional, in interval [0, 1]
         Define the [p0, p1] percentile interval to be considered for computing
         the value.
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -387,11 +509,21 @@ def pop_percentile(
         shift_y=shift_y,
         p0=p0,
         p1=p1,
+        workers=workers,
     )
 
 
 def sum_percentile(
-    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, p0=0, p1=1
+    image,
+    footprint,
+    out=None,
+    mask=None,
+    shift_x=0,
+    shift_y=0,
+    p0=0,
+    p1=1,
+    *,
+    workers=1,
 ):
     """Return the local sum of pixels.
 
@@ -417,6 +549,12 @@ def sum_percentile(
     p0, p1 : float, optional, in interval [0, 1]
         Define the [p0, p1] percentile interval to be considered for computing
         the value.
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -435,11 +573,12 @@ def sum_percentile(
         shift_y=shift_y,
         p0=p0,
         p1=p1,
+        workers=workers,
     )
 
 
 def threshold_percentile(
-    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, p0=0
+    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, p0=0, *, workers=1
 ):
     """Local threshold of an image.
 
@@ -464,6 +603,12 @@ def threshold_percentile(
         footprint sizes (center must be inside the given footprint).
     p0 : float, optional, in interval [0, 1]
         Set the percentile value.
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -482,4 +627,5 @@ def threshold_percentile(
         shift_y=shift_y,
         p0=p0,
         p1=0,
+        workers=workers,
     )
@@ -25,12 +25,24 @@ References
 
 from ..._shared.utils import check_nD
 from . import bilateral_cy
-from .generic import _preprocess_input
+from .generic import _apply_in_bands, _preprocess_input
 
 __all__ = ['mean_bilateral', 'pop_bilateral', 'sum_bilateral']
 
 
-def _apply(func, image, footprint, out, mask, shift_x, shift_y, s0, s1, out_dtype=None):
+def _apply(
+    func,
+    image,
+    footprint,
+    out,
+    mask,
+    shift_x,
+    shift_y,
+    s0,
+    s1,
+    out_dtype=None,
+    workers=1,
+):
     check_nD(image, 2)
     image, footprint, out, mask, n_bins = _preprocess_input(
         image,
@@ -42,13 +54,16 @@ def _apply(func, image, footprint, out, mask, shift_x, shift_y, s0, s1, out_dtyp
         shift_y=shift_y,
     )
 
-    func(
+    _apply_in_bands(
+        func,
         image,
         footprint,
+        out,
+        mask,
+        footprint.shape[0] // 2 + shift_y,
+        workers,
         shift_x=shift_x,
         shift_y=shift_y,
-        mask=mask,
-        out=out,
         n_bins=n_bins,
         s0=s0,
         s1=s1,
@@ -58,7 +73,16 @@ def _apply(func, image, footprint, out, mask, shift_x, shift_y, s0, s1, out_dtyp
 
 
 def mean_bilateral(
-    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, s0=10, s1=10
+    image,
+    footprint,
+    out=None,
+    mask=None,
+    shift_x=0,
+    shift_y=0,
+    s0=10,
+    s1=10,
+    *,
+    workers=1,
 ):
     """Apply a flat kernel bilateral filter.
 
@@ -91,6 +115,12 @@ def mean_bilateral(
     s0, s1 : int
         Define the [s0, s1] interval around the grayvalue of the center pixel
         to be considered for computing the value.
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -122,11 +152,21 @@ def mean_bilateral(
         shift_y=shift_y,
         s0=s0,
         s1=s1,
+        workers=workers,
     )
 
 
 def pop_bilateral(
-    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, s0=10, s1=10
+    image,
+    footprint,
+    out=None,
+    mask=None,
+    shift_x=0,
+    shift_y=0,
+    s0=10,
+    s1=10,
+    *,
+    workers=1,
 ):
     """Return the local number (population) of pixels.
 
@@ -153,6 +193,12 @@ def pop_bilateral(
     s0, s1 : int
         Define the [s0, s1] interval around the grayvalue of the center pixel
         to be considered for computing the value.
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -188,11 +234,21 @@ def pop_bilateral(
         shift_y=shift_y,
         s0=s0,
         s1=s1,
+        workers=workers,
     )
 
 
 def sum_bilateral(
-    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, s0=10, s1=10
+    image,
+    footprint,
+    out=None,
+    mask=None,
+    shift_x=0,
+    shift_y=0,
+    s0=10,
+    s1=10,
+    *,
+    workers=1,
 ):
     """Apply a flat kernel bilateral filter.
 
@@ -228,6 +284,12 @@ def sum_bilateral(
     s0, s1 : int
         Define the [s0, s1] interval around the grayvalue of the center pixel
         to be considered for computing the value.
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -259,4 +321,5 @@ def sum_bilateral(
         shift_y=shift_y,
         s0=s0,
         s1=s1,
+        workers=workers,
     )
@@ -14,7 +14,9 @@ cdef inline void _kernel_mean(dtype_t_out* out, Py_ssize_t odepth,
                               cnp.float64_t pop, dtype_t g,
                               Py_ssize_t n_bins, Py_ssize_t mid_bin,
                               cnp.float64_t p0, cnp.float64_t p1,
-                              Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                              Py_ssize_t s0, Py_ssize_t s1,
+                              Py_ssize_t bucket_shift,
+                              const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t i
     cdef Py_ssize_t bilat_pop = 0
@@ -38,7 +40,9 @@ cdef inline void _kernel_pop(dtype_t_out* out, Py_ssize_t odepth,
                              cnp.float64_t pop, dtype_t g,
                              Py_ssize_t n_bins, Py_ssize_t mid_bin,
                              cnp.float64_t p0, cnp.float64_t p1,
-                             Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                             Py_ssize_t s0, Py_ssize_t s1,
+                             Py_ssize_t bucket_shift,
+                             const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t i
     cdef Py_ssize_t bilat_pop = 0
@@ -57,7 +61,9 @@ cdef inline void _kernel_sum(dtype_t_out* out, Py_ssize_t odepth,
                              cnp.float64_t pop, dtype_t g,
                              Py_ssize_t n_bins, Py_ssize_t mid_bin,
                              cnp.float64_t p0, cnp.float64_t p1,
-                             Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                             Py_ssize_t s0, Py_ssize_t s1,
+                             Py_ssize_t bucket_shift,
+                             const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t i
     cdef Py_ssize_t bilat_pop = 0
@@ -14,12 +14,20 @@ ctypedef fused dtype_t_out:
 
 cdef dtype_t _max(dtype_t a, dtype_t b) noexcept nogil
 cdef dtype_t _min(dtype_t a, dtype_t b) noexcept nogil
+cdef Py_ssize_t _bucket_shift(Py_ssize_t n_bins) noexcept nogil
+cdef Py_ssize_t _histogram_size(Py_ssize_t n_bins,
+                                Py_ssize_t bucket_shift) noexcept nogil
+cdef Py_ssize_t _bucketed_search(Py_ssize_t[::1] histo, Py_ssize_t n_bins,
+                                 Py_ssize_t bucket_shift,
+                                 float64_t rank) noexcept nogil
+cdef Py_ssize_t _bucketed_last(Py_ssize_t[::1] histo, Py_ssize_t n_bins,
+                               Py_ssize_t bucket_shift) noexcept nogil
 
 
 cdef void _core(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1],
                             float64_t, dtype_t, Py_ssize_t, Py_ssize_t,
                             float64_t, float64_t, Py_ssize_t,
-                            Py_ssize_t) noexcept nogil,
+                            Py_ssize_t, Py_ssize_t, const float64_t*) noexcept nogil,
                 dtype_t[:, ::1] image,
                 char[:, ::1] footprint,
                 char[:, ::1] mask,
@@ -27,4 +35,5 @@ cdef void _core(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1],
                 signed char shift_x, signed char shift_y,
                 float64_t p0, float64_t p1,
                 Py_ssize_t s0, Py_ssize_t s1,
-                Py_ssize_t n_bins) except *
+                Py_ssize_t n_bins, Py_ssize_t bucket_shift=*,
+                const float64_t* params=*) except *
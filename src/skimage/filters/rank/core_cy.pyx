@@ -17,15 +17,91 @@ cdef inline dtype_t _min(dtype_t a, dtype_t b) noexcept nogil:
     return a if a <= b else b
 
 
+# Histograms of more bins than this are searched with a coarse histogram
+cdef Py_ssize_t BUCKETED_MIN_BINS = 2**10
+
+
+cdef inline Py_ssize_t _bucket_shift(Py_ssize_t n_bins) noexcept nogil:
+    """Base 2 logarithm of the number of bins per bucket of the coarse
+    histogram, or 0 for histograms that are searched bin by bin.
+
+    Buckets of about ``sqrt(n_bins)`` bins make a search visit at most about
+    ``2 * sqrt(n_bins)`` bins, e.g. 512 instead of 65536 for 16-bit images.
+    """
+    cdef Py_ssize_t shift = 0
+
+    if n_bins <= BUCKETED_MIN_BINS:
+        return 0
+    while (<Py_ssize_t>1 << (2 * shift)) < n_bins:
+        shift += 1
+    return shift
+
+
+cdef inline Py_ssize_t _histogram_size(Py_ssize_t n_bins,
+                                       Py_ssize_t bucket_shift) noexcept nogil:
+    """Size of a histogram of `n_bins` bins followed by its coarse histogram
+    of buckets of ``2**bucket_shift`` bins, if `bucket_shift` is not 0."""
+    if bucket_shift:
+        return n_bins + ((n_bins - 1) >> bucket_shift) + 1
+    return n_bins
+
+
+cdef inline Py_ssize_t _bucketed_search(Py_ssize_t[::1] histo,
+                                        Py_ssize_t n_bins,
+                                        Py_ssize_t bucket_shift,
+                                        cnp.float64_t rank) noexcept nogil:
+    """First bin whose cumulated count is greater than `rank`, or the last bin
+    if there is none."""
+    cdef Py_ssize_t i = 0, b = 0, stop = n_bins, n_buckets
+    cdef Py_ssize_t total = 0
+
+    if bucket_shift:
+        n_buckets = ((n_bins - 1) >> bucket_shift) + 1
+        while b < n_buckets - 1 and total + histo[n_bins + b] <= rank:
+            total += histo[n_bins + b]
+            b += 1
+        i = b << bucket_shift
+        if b < n_buckets - 1:
+            stop = i + (<Py_ssize_t>1 << bucket_shift)
+    while i < stop - 1 and total + histo[i] <= rank:
+        total += histo[i]
+        i += 1
+    return i
+
+
+cdef inline Py_ssize_t _bucketed_last(Py_ssize_t[::1] histo,
+                                      Py_ssize_t n_bins,
+                                      Py_ssize_t bucket_shift) noexcept nogil:
+    """Last non-empty bin, or the first bin if all bins are empty."""
+    cdef Py_ssize_t i = n_bins - 1, b, start = 0
+
+    if bucket_shift:
+        b = (n_bins - 1) >> bucket_shift
+        while b > 0 and not histo[n_bins + b]:
+            b -= 1
+        start = b << bucket_shift
+        if b < (n_bins - 1) >> bucket_shift:
+            i = start + (<Py_ssize_t>1 << bucket_shift) - 1
+    while i > start and not histo[i]:
+        i -= 1
+    return i
+
+
 cdef inline void histogram_increment(Py_ssize_t[::1] histo, cnp.float64_t* pop,
-                                     dtype_t value) noexcept nogil:
+                                     dtype_t value, Py_ssize_t n_bins,
+                                     Py_ssize_t bucket_shift) noexcept nogil:
     histo[value] += 1
+    if bucket_shift:
+        histo[n_bins + (value >> bucket_shift)] += 1
     pop[0] += 1
 
 
 cdef inline void histogram_decrement(Py_ssize_t[::1] histo, cnp.float64_t* pop,
-                                     dtype_t value) noexcept nogil:
+                                     dtype_t value, Py_ssize_t n_bins,
+                                     Py_ssize_t bucket_shift) noexcept nogil:
     histo[value] -= 1
+    if bucket_shift:
+        histo[n_bins + (value >> bucket_shift)] -= 1
     pop[0] -= 1
 
 
@@ -46,7 +122,8 @@ cdef inline char is_in_mask(Py_ssize_t rows, Py_ssize_t cols,
 
 cdef void _core(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1], cnp.float64_t,
                             dtype_t, Py_ssize_t, Py_ssize_t, cnp.float64_t,
-                            cnp.float64_t, Py_ssize_t, Py_ssize_t) noexcept nogil,
+                            cnp.float64_t, Py_ssize_t, Py_ssize_t, Py_ssize_t,
+                            const cnp.float64_t*) noexcept nogil,
                 dtype_t[:, ::1] image,
                 char[:, ::1] footprint,
                 char[:, ::1] mask,
@@ -54,9 +131,17 @@ cdef void _core(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1], cnp.float
                 signed char shift_x, signed char shift_y,
                 cnp.float64_t p0, cnp.float64_t p1,
                 Py_ssize_t s0, Py_ssize_t s1,
-                Py_ssize_t n_bins) except *:
+                Py_ssize_t n_bins, Py_ssize_t bucket_shift=0,
+                const cnp.float64_t* params=NULL) except *:
     """Compute histogram for each pixel neighborhood, apply kernel function and
     use kernel function return value for output image.
+
+    `params` is passed unchanged to the kernel, for kernels that need more
+    parameters than `p0`, `p1`, `s0` and `s1`.
+
+    If `bucket_shift` is not 0, the counts of the buckets of ``2**bucket_shift``
+    consecutive bins are kept after the `n_bins` bins of the histogram passed
+    to the kernel, along with `bucket_shift`, see `_bucketed_search`.
     """
 
     cdef Py_ssize_t rows = image.shape[0]
@@ -102,7 +187,9 @@ cdef void _core(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1], cnp.float
 
     # the current local histogram distribution
     # cdef Py_ssize_t* histo
-    cdef Py_ssize_t [::1] histo = np.zeros(n_bins, dtype=np.intp)
+    cdef Py_ssize_t [::1] histo = np.zeros(
+        _histogram_size(n_bins, bucket_shift), dtype=np.intp
+    )
 
     # these lists contain the relative pixel row and column for each of the 4
     # attack borders east, west, north and south e.g. se_e_r lists the rows of
@@ -126,9 +213,6 @@ cdef void _core(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1], cnp.float
     num_se_n = num_se_s = num_se_e = num_se_w = 0
 
     with nogil:
-        for i in range(n_bins):
-            histo[i] = 0
-
         for r in range(srows):
             for c in range(scols):
                 if t_e[r, c]:
@@ -154,12 +238,13 @@ cdef void _core(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1], cnp.float
                 cc = c - centre_c
                 if footprint[r, c]:
                     if is_in_mask(rows, cols, rr, cc, mask_data):
-                        histogram_increment(histo, &pop, image[rr, cc])
+                        histogram_increment(histo, &pop, image[rr, cc], n_bins,
+                                            bucket_shift)
 
         r = 0
         c = 0
         kernel(&out[r, c, 0], odepth, histo, pop, image[r, c], n_bins, mid_bin,
-               p0, p1, s0, s1)
+               p0, p1, s0, s1, bucket_shift, params)
 
         # main loop
         r = 0
@@ -171,16 +256,18 @@ cdef void _core(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1], cnp.float
                     rr = r + se_e_r[s]
                     cc = c + se_e_c[s]
                     if is_in_mask(rows, cols, rr, cc, mask_data):
-                        histogram_increment(histo, &pop, image[rr, cc])
+                        histogram_increment(histo, &pop, image[rr, cc], n_bins,
+                                            bucket_shift)
 
                 for s in range(num_se_w):
                     rr = r + se_w_r[s]
                     cc = c + se_w_c[s] - 1
                     if is_in_mask(rows, cols, rr, cc, mask_data):
-                        histogram_decrement(histo, &pop, image[rr, cc])
+                        histogram_decrement(histo, &pop, image[rr, cc], n_bins,
+                                            bucket_shift)
 
                 kernel(&out[r, c, 0], odepth, histo, pop, image[r, c], n_bins,
-                       mid_bin, p0, p1, s0, s1)
+                       mid_bin, p0, p1, s0, s1, bucket_shift, params)
 
             r += 1  # pass to the next row
             if r >= rows:
@@ -191,16 +278,18 @@ cdef void _core(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1], cnp.float
                 rr = r + se_s_r[s]
                 cc = c + se_s_c[s]
                 if is_in_mask(rows, cols, rr, cc, mask_data):
-                    histogram_increment(histo, &pop, image[rr, cc])
+                    histogram_increment(histo, &pop, image[rr, cc], n_bins,
+                                        bucket_shift)
 
             for s in range(num_se_n):
                 rr = r + se_n_r[s] - 1
                 cc = c + se_n_c[s]
                 if is_in_mask(rows, cols, rr, cc, mask_data):
-                    histogram_decrement(histo, &pop, image[rr, cc])
+                    histogram_decrement(histo, &pop, image[rr, cc], n_bins,
+                                        bucket_shift)
 
             kernel(&out[r, c, 0], odepth, histo, pop, image[r, c], n_bins,
-                   mid_bin, p0, p1, s0, s1)
+                   mid_bin, p0, p1, s0, s1, bucket_shift, params)
 
             # ---> east to west
             for c in range(cols - 2, -1, -1):
@@ -208,16 +297,18 @@ cdef void _core(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1], cnp.float
                     rr = r + se_w_r[s]
                     cc = c + se_w_c[s]
                     if is_in_mask(rows, cols, rr, cc, mask_data):
-                        histogram_increment(histo, &pop, image[rr, cc])
+                        histogram_increment(histo, &pop, image[rr, cc], n_bins,
+                                            bucket_shift)
 
                 for s in range(num_se_e):
                     rr = r + se_e_r[s]
                     cc = c + se_e_c[s] + 1
                     if is_in_mask(rows, cols, rr, cc, mask_data):
-                        histogram_decrement(histo, &pop, image[rr, cc])
+                        histogram_decrement(histo, &pop, image[rr, cc], n_bins,
+                                            bucket_shift)
 
                 kernel(&out[r, c, 0], odepth, histo, pop, image[r, c], n_bins,
-                       mid_bin, p0, p1, s0, s1)
+                       mid_bin, p0, p1, s0, s1, bucket_shift, params)
 
             r += 1  # pass to the next row
             if r >= rows:
@@ -228,13 +319,15 @@ cdef void _core(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1], cnp.float
                 rr = r + se_s_r[s]
                 cc = c + se_s_c[s]
                 if is_in_mask(rows, cols, rr, cc, mask_data):
-                    histogram_increment(histo, &pop, image[rr, cc])
+                    histogram_increment(histo, &pop, image[rr, cc], n_bins,
+                                        bucket_shift)
 
             for s in range(num_se_n):
                 rr = r + se_n_r[s] - 1
                 cc = c + se_n_c[s]
                 if is_in_mask(rows, cols, rr, cc, mask_data):
-                    histogram_decrement(histo, &pop, image[rr, cc])
+                    histogram_decrement(histo, &pop, image[rr, cc], n_bins,
+                                        bucket_shift)
 
             kernel(&out[r, c, 0], odepth, histo, pop, image[r, c],
-                   n_bins, mid_bin, p0, p1, s0, s1)
+                   n_bins, mid_bin, p0, p1, s0, s1, bucket_shift, params)
@@ -19,7 +19,7 @@ cdef dtype_t _min(dtype_t a, dtype_t b) noexcept nogil
 cdef void _core_3D(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1],
                                float64_t, dtype_t, Py_ssize_t, Py_ssize_t,
                                float64_t, float64_t, Py_ssize_t,
-                               Py_ssize_t) noexcept nogil,
+                               Py_ssize_t, Py_ssize_t, const float64_t*) noexcept nogil,
                    dtype_t[:, :, ::1] image,
                    char[:, :, ::1] footprint,
                    char[:, :, ::1] mask,
@@ -27,4 +27,5 @@ cdef void _core_3D(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1],
                    signed char shift_x, signed char shift_y, signed char shift_z,
                    float64_t p0, float64_t p1,
                    Py_ssize_t s0, Py_ssize_t s1,
-                   Py_ssize_t n_bins) except *
+                   Py_ssize_t n_bins, Py_ssize_t bucket_shift=*,
+                   const float64_t* params=*) except *
@@ -6,6 +6,8 @@
 import numpy as np
 cimport numpy as cnp
 
+from .core_cy cimport _histogram_size
+
 cnp.import_array()
 
 cdef inline dtype_t _max(dtype_t a, dtype_t b) noexcept nogil:
@@ -88,9 +90,11 @@ cdef inline void _build_initial_histogram_from_neighborhood(dtype_t[:, :, ::1] i
                                                             Py_ssize_t scols,
                                                             Py_ssize_t centre_p,
                                                             Py_ssize_t centre_r,
-                                                            Py_ssize_t centre_c) noexcept:
+                                                            Py_ssize_t centre_c,
+                                                            Py_ssize_t n_bins,
+                                                            Py_ssize_t bucket_shift) noexcept nogil:
 
-    cdef Py_ssize_t r, c, j
+    cdef Py_ssize_t r, c, j, pp, rr, cc
 
     for r in range(srows):
         for c in range(scols):
@@ -104,6 +108,8 @@ cdef inline void _build_initial_histogram_from_neighborhood(dtype_t[:, :, ::1] i
                                      mask_data):
                         # histogram_increment(histo, pop, image[pp, rr, cc])
                         histo[image[pp, rr, cc]] += 1
+                        if bucket_shift:
+                            histo[n_bins + (image[pp, rr, cc] >> bucket_shift)] += 1
                         pop[0] += 1
 
 
@@ -115,7 +121,9 @@ cdef inline void _update_histogram(dtype_t[:, :, ::1] image,
                                    Py_ssize_t p, Py_ssize_t r, Py_ssize_t c,
                                    Py_ssize_t planes, Py_ssize_t rows,
                                    Py_ssize_t cols,
-                                   Py_ssize_t axis_inc) noexcept nogil:
+                                   Py_ssize_t axis_inc,
+                                   Py_ssize_t n_bins,
+                                   Py_ssize_t bucket_shift) noexcept nogil:
 
     cdef Py_ssize_t pp, rr, cc, j
 
@@ -126,6 +134,8 @@ cdef inline void _update_histogram(dtype_t[:, :, ::1] image,
         cc = c + se[axis_inc, 2, j]
         if is_in_mask_3D(planes, rows, cols, pp, rr, cc, mask_data):
             histo[image[pp, rr, cc]] += 1
+            if bucket_shift:
+                histo[n_bins + (image[pp, rr, cc] >> bucket_shift)] += 1
             pop[0] += 1
 
     # Decrement histogram
@@ -142,6 +152,8 @@ cdef inline void _update_histogram(dtype_t[:, :, ::1] image,
             cc += 1
         if is_in_mask_3D(planes, rows, cols, pp, rr, cc, mask_data):
             histo[image[pp, rr, cc]] -= 1
+            if bucket_shift:
+                histo[n_bins + (image[pp, rr, cc] >> bucket_shift)] -= 1
             pop[0] -= 1
 
 
@@ -160,7 +172,8 @@ cdef inline char is_in_mask_3D(Py_ssize_t planes, Py_ssize_t rows,
 
 cdef void _core_3D(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1], cnp.float64_t,
                                dtype_t, Py_ssize_t, Py_ssize_t, cnp.float64_t,
-                               cnp.float64_t, Py_ssize_t, Py_ssize_t) noexcept nogil,
+                               cnp.float64_t, Py_ssize_t, Py_ssize_t, Py_ssize_t,
+                               const cnp.float64_t*) noexcept nogil,
                    dtype_t[:, :, ::1] image,
                    char[:, :, ::1] footprint,
                    char[:, :, ::1] mask,
@@ -168,9 +181,17 @@ cdef void _core_3D(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1], cnp.fl
                    signed char shift_x, signed char shift_y,
                    signed char shift_z, cnp.float64_t p0, cnp.float64_t p1,
                    Py_ssize_t s0, Py_ssize_t s1,
-                   Py_ssize_t n_bins) except *:
+                   Py_ssize_t n_bins, Py_ssize_t bucket_shift=0,
+                   const cnp.float64_t* params=NULL) except *:
     """Compute histogram for each pixel neighborhood, apply kernel function and
     use kernel function return value for output image.
+
+    `params` is passed unchanged to the kernel, for kernels that need more
+    parameters than `p0`, `p1`, `s0` and `s1`.
+
+    If `bucket_shift` is not 0, the counts of the buckets of ``2**bucket_shift``
+    consecutive bins are kept after the `n_bins` bins of the histogram passed
+    to the kernel, along with `bucket_shift`, see `core_cy._bucketed_search`.
     """
 
     cdef Py_ssize_t planes = image.shape[0]
@@ -211,7 +232,9 @@ cdef void _core_3D(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1], cnp.fl
     cdef cnp.float64_t pop = 0
 
     # the current local histogram distribution
-    cdef Py_ssize_t [::1] histo = np.zeros(n_bins, dtype=np.intp)
+    cdef Py_ssize_t [::1] histo = np.zeros(
+        _histogram_size(n_bins, bucket_shift), dtype=np.intp
+    )
 
     # these lists contain the relative pixel plane, row and column for each of
     # the 4 attack borders east, north, west and south
@@ -225,21 +248,22 @@ cdef void _core_3D(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1], cnp.fl
     _count_attack_border_elements(footprint, se, num_se, splanes, srows, scols,
                                   centre_p, centre_r, centre_c)
 
-    for p in range(planes):
-        histo[:] = 0
-        pop = 0
-        _build_initial_histogram_from_neighborhood(image, footprint, histo,
-                                                   &pop, mask_data, p,
-                                                   planes, rows, cols,
-                                                   splanes, srows, scols,
-                                                   centre_p, centre_r,
-                                                   centre_c)
-        r = 0
-        c = 0
-        kernel(&out[p, r, c, 0], odepth, histo, pop, image[p, r, c],
-               n_bins, mid_bin, p0, p1, s0, s1)
-
-        with nogil:
+    with nogil:
+        for p in range(planes):
+            histo[:] = 0
+            pop = 0
+            _build_initial_histogram_from_neighborhood(image, footprint, histo,
+                                                       &pop, mask_data, p,
+                                                       planes, rows, cols,
+                                                       splanes, srows, scols,
+                                                       centre_p, centre_r,
+                                                       centre_c, n_bins,
+                                                       bucket_shift)
+            r = 0
+            c = 0
+            kernel(&out[p, r, c, 0], odepth, histo, pop, image[p, r, c],
+                   n_bins, mid_bin, p0, p1, s0, s1, bucket_shift, params)
+
             # main loop
 
             for even_row in range(0, rows, 2):
@@ -247,10 +271,12 @@ cdef void _core_3D(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1], cnp.fl
                 # ---> west to east
                 for c in range(1, cols):
                     _update_histogram(image, se, num_se, histo, &pop, mask_data, p,
-                                      r, c, planes, rows, cols, axis_inc=0)
+                                      r, c, planes, rows, cols, axis_inc=0,
+                                      n_bins=n_bins, bucket_shift=bucket_shift)
 
                     kernel(&out[p, r, c, 0], odepth, histo, pop,
-                           image[p, r, c], n_bins, mid_bin, p0, p1, s0, s1)
+                           image[p, r, c], n_bins, mid_bin, p0, p1,
+                           s0, s1, bucket_shift, params)
 
                 r += 1  # pass to the next row
                 if r >= rows:
@@ -258,18 +284,22 @@ cdef void _core_3D(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1], cnp.fl
 
                 # ---> north to south
                 _update_histogram(image, se, num_se, histo, &pop, mask_data, p,
-                                  r, c, planes, rows, cols, axis_inc=3)
+                                  r, c, planes, rows, cols, axis_inc=3,
+                                  n_bins=n_bins, bucket_shift=bucket_shift)
 
                 kernel(&out[p, r, c, 0], odepth, histo, pop,
-                       image[p, r, c], n_bins, mid_bin, p0, p1, s0, s1)
+                       image[p, r, c], n_bins, mid_bin, p0, p1,
+                       s0, s1, bucket_shift, params)
 
                 # ---> east to west
                 for c in range(cols - 2, -1, -1):
                     _update_histogram(image, se, num_se, histo, &pop, mask_data, p,
-                                      r, c, planes, rows, cols, axis_inc=2)
+                                      r, c, planes, rows, cols, axis_inc=2,
+                                      n_bins=n_bins, bucket_shift=bucket_shift)
 
                     kernel(&out[p, r, c, 0], odepth, histo, pop,
-                           image[p, r, c], n_bins, mid_bin, p0, p1, s0, s1)
+                           image[p, r, c], n_bins, mid_bin, p0, p1,
+                           s0, s1, bucket_shift, params)
 
                 r += 1  # pass to the next row
                 if r >= rows:
@@ -277,7 +307,8 @@ cdef void _core_3D(void kernel(dtype_t_out*, Py_ssize_t, Py_ssize_t[::1], cnp.fl
 
                 # ---> north to south
                 _update_histogram(image, se, num_se, histo, &pop, mask_data, p,
-                                  r, c, planes, rows, cols, axis_inc=3)
+                                  r, c, planes, rows, cols, axis_inc=3,
+                                  n_bins=n_bins, bucket_shift=bucket_shift)
 
                 kernel(&out[p, r, c, 0], odepth, histo, pop, image[p, r, c],
-                       n_bins, mid_bin, p0, p1, s0, s1)
+                       n_bins, mid_bin, p0, p1, s0, s1, bucket_shift, params)
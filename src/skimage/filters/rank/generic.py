@@ -18,6 +18,14 @@ update the local histogram. The histogram size is 8-bit (256 bins) for 8-bit
 images and 2- to 16-bit for 16-bit images depending on the maximum value of the
 image.
 
+For histograms of more than 1024 bins, the filters that look up an order
+statistic (minimum, maximum, median, percentile, gradient, autolevel and
+enhance_contrast) also keep a coarse histogram counting the values in buckets
+of about ``sqrt(n_bins)`` consecutive bins, as in [2]_. The lookup then visits
+the coarse histogram first and only the bins of a single bucket afterwards, so
+that these filters support the full 16-bit range at a cost per pixel that
+hardly depends on the bit depth.
+
 The filter is applied up to the image border, the neighborhood used is
 adjusted accordingly. The user may provide a mask image (same size as input
 image) where non zero values are the part of the image participating in the
@@ -45,9 +53,15 @@ References
 .. [1] Huang, T. ,Yang, G. ;  Tang, G.. "A fast two-dimensional
        median filtering algorithm", IEEE Transactions on Acoustics, Speech and
        Signal Processing, Feb 1979. Volume: 27 , Issue: 1, Page(s): 13 - 18.
+.. [2] Perreault, S., Hébert, P. "Median Filtering in Constant Time",
+       IEEE Transactions on Image Processing, Sept 2007. Volume: 16,
+       Issue: 9, Page(s): 2389 - 2394. :DOI:`10.1109/TIP.2007.902329`
 
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor as PoolExecutor
+
 import numpy as np
 from scipy import ndimage as ndi
 
@@ -86,6 +100,7 @@ def _preprocess_input(
     pixel_size=1,
     shift_x=None,
     shift_y=None,
+    bucketed=False,
 ):
     """Preprocess and verify input for filters.rank methods.
 
@@ -108,6 +123,9 @@ def _preprocess_input(
     shift_x, shift_y : int, optional
         Offset added to the footprint center point. Shift is bounded to the
         footprint size (center must be inside of the given footprint).
+    bucketed : bool, optional
+        Whether the filter searches the histogram through its coarse
+        histogram, so that its cost hardly depends on the number of bins.
 
     Returns
     -------
@@ -171,7 +189,7 @@ def _preprocess_input(
         # 1 to the maximum of the image.
         n_bins = int(max(3, image.max())) + 1
 
-    if n_bins > 2**10:
+    if n_bins > 2**10 and not bucketed:
         warn(
             f'Bad rank filter performance is expected due to a '
             f'large number of bins ({n_bins}), equivalent to an approximate '
@@ -201,6 +219,7 @@ def _handle_input_3D(
     shift_x=None,
     shift_y=None,
     shift_z=None,
+    bucketed=False,
 ):
     """Preprocess and verify input for filters.rank methods.
 
@@ -223,6 +242,9 @@ def _handle_input_3D(
     shift_x, shift_y, shift_z : int, optional
         Offset added to the footprint center point. Shift is bounded to the
         footprint size (center must be inside of the given footprint).
+    bucketed : bool, optional
+        Whether the filter searches the histogram through its coarse
+        histogram, so that its cost hardly depends on the number of bins.
 
     Returns
     -------
@@ -280,7 +302,7 @@ def _handle_input_3D(
         # 1 to the maximum of the image.
         n_bins = int(max(3, image.max())) + 1
 
-    if n_bins > 2**10:
+    if n_bins > 2**10 and not bucketed:
         warn(
             f'Bad rank filter performance is expected due to a '
             f'large number of bins ({n_bins}), equivalent to an approximate '
@@ -302,8 +324,73 @@ def _handle_input_3D(
     return image, footprint, out, mask, n_bins
 
 
+def _apply_in_bands(func, image, footprint, out, mask, centre, workers, **kwargs):
+    """Apply the Cython function `func` to bands of rows of `image`.
+
+    The first axis of `image` is split into `workers` bands that are filtered
+    concurrently, each with a margin of the rows covered by the footprint
+    around its rows. The Cython functions release the GIL and every output
+    pixel only depends on its neighborhood, so the result is identical to
+    filtering the whole image at once.
+
+    Parameters
+    ----------
+    func : function
+        Cython function to apply.
+    image : ndarray
+        Preprocessed input image.
+    footprint : ndarray
+        Preprocessed neighborhood.
+    out : ndarray
+        Preprocessed output array, with a trailing pixel vector axis.
+    mask : ndarray or None
+        Preprocessed mask.
+    centre : int
+        Row of the footprint center, including the shift.
+    workers : int or None
+        The number of parallel threads to use.
+    **kwargs
+        Remaining arguments of `func`.
+    """
+    if workers is None:
+        workers = os.cpu_count()
+    length = image.shape[0]
+    n_bands = min(workers, length)
+    if n_bands < 2:
+        func(image, footprint, mask=mask, out=out, **kwargs)
+        return
+
+    def filter_band(bounds):
+        start, stop = bounds
+        lo = max(start - centre, 0)
+        hi = min(stop + footprint.shape[0] - 1 - centre, length)
+        band_out = np.empty((hi - lo,) + out.shape[1:], dtype=out.dtype)
+        func(
+            image[lo:hi],
+            footprint,
+            mask=None if mask is None else mask[lo:hi],
+            out=band_out,
+            **kwargs,
+        )
+        out[start:stop] = band_out[start - lo : stop - lo]
+
+    edges = np.linspace(0, length, n_bands + 1).astype(int)
+    with PoolExecutor(max_workers=n_bands) as executor:
+        # consume the results to raise the errors of the threads, if any
+        list(executor.map(filter_band, zip(edges[:-1], edges[1:])))
+
+
 def _apply_scalar_per_pixel(
-    func, image, footprint, out, mask, shift_x, shift_y, out_dtype=None
+    func,
+    image,
+    footprint,
+    out,
+    mask,
+    shift_x,
+    shift_y,
+    out_dtype=None,
+    workers=1,
+    bucketed=False,
 ):
     """Process the specific cython function to the image.
 
@@ -326,21 +413,35 @@ def _apply_scalar_per_pixel(
     out_dtype : data-type, optional
         Desired output data-type. Default is None, which means we cast output
         in input dtype.
+    workers : int or None, optional
+        The number of parallel threads to use.
+    bucketed : bool, optional
+        Whether `func` searches the histogram through its coarse histogram.
 
     """
     # preprocess and verify the input
     image, footprint, out, mask, n_bins = _preprocess_input(
-        image, footprint, out, mask, out_dtype, shift_x=shift_x, shift_y=shift_y
+        image,
+        footprint,
+        out,
+        mask,
+        out_dtype,
+        shift_x=shift_x,
+        shift_y=shift_y,
+        bucketed=bucketed,
     )
 
     # apply cython function
-    func(
+    _apply_in_bands(
+        func,
         image,
         footprint,
+        out,
+        mask,
+        footprint.shape[0] // 2 + shift_y,
+        workers,
         shift_x=shift_x,
         shift_y=shift_y,
-        mask=mask,
-        out=out,
         n_bins=n_bins,
     )
 
@@ -348,7 +449,17 @@ def _apply_scalar_per_pixel(
 
 
 def _apply_scalar_per_pixel_3D(
-    func, image, footprint, out, mask, shift_x, shift_y, shift_z, out_dtype=None
+    func,
+    image,
+    footprint,
+    out,
+    mask,
+    shift_x,
+    shift_y,
+    shift_z,
+    out_dtype=None,
+    workers=1,
+    bucketed=False,
 ):
     image, footprint, out, mask, n_bins = _handle_input_3D(
         image,
@@ -359,16 +470,20 @@ def _apply_scalar_per_pixel_3D(
         shift_x=shift_x,
         shift_y=shift_y,
         shift_z=shift_z,
+        bucketed=bucketed,
     )
 
-    func(
+    _apply_in_bands(
+        func,
         image,
         footprint,
+        out,
+        mask,
+        footprint.shape[0] // 2 + shift_x,
+        workers,
         shift_x=shift_x,
         shift_y=shift_y,
         shift_z=shift_z,
-        mask=mask,
-        out=out,
         n_bins=n_bins,
     )
 
@@ -376,7 +491,16 @@ def _apply_scalar_per_pixel_3D(
 
 
 def _apply_vector_per_pixel(
-    func, image, footprint, out, mask, shift_x, shift_y, out_dtype=None, pixel_size=1
+    func,
+    image,
+    footprint,
+    out,
+    mask,
+    shift_x,
+    shift_y,
+    out_dtype=None,
+    pixel_size=1,
+    workers=1,
 ):
     """
 
@@ -401,6 +525,8 @@ def _apply_vector_per_pixel(
         in input dtype.
     pixel_size : int, optional
         Dimension of each pixel.
+    workers : int or None, optional
+        The number of parallel threads to use.
 
     Returns
     -------
@@ -426,20 +552,25 @@ def _apply_vector_per_pixel(
     )
 
     # apply cython function
-    func(
+    _apply_in_bands(
+        func,
         image,
         footprint,
+        out,
+        mask,
+        footprint.shape[0] // 2 + shift_y,
+        workers,
         shift_x=shift_x,
         shift_y=shift_y,
-        mask=mask,
-        out=out,
         n_bins=n_bins,
     )
 
     return out
 
 
-def autolevel(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0):
+def autolevel(
+    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0, *, workers=1
+):
     """Auto-level image using local histogram.
 
     This filter locally stretches the histogram of gray values to cover the
@@ -459,6 +590,12 @@ def autolevel(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift
     shift_x, shift_y, shift_z : int
         Offset added to the footprint center point. Shift is bounded to the
         footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -489,6 +626,8 @@ def autolevel(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift
             mask=mask,
             shift_x=shift_x,
             shift_y=shift_y,
+            workers=workers,
+            bucketed=True,
         )
     elif np_image.ndim == 3:
         return _apply_scalar_per_pixel_3D(
@@ -500,11 +639,15 @@ def autolevel(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift
             shift_x=shift_x,
             shift_y=shift_y,
             shift_z=shift_z,
+            workers=workers,
+            bucketed=True,
         )
     raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
 
 
-def equalize(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0):
+def equalize(
+    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0, *, workers=1
+):
     """Equalize image using local histogram.
 
     Parameters
@@ -521,6 +664,12 @@ def equalize(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_
     shift_x, shift_y, shift_z : int
         Offset added to the footprint center point. Shift is bounded to the
         footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -551,6 +700,7 @@ def equalize(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_
             mask=mask,
             shift_x=shift_x,
             shift_y=shift_y,
+            workers=workers,
         )
     elif np_image.ndim == 3:
         return _apply_scalar_per_pixel_3D(
@@ -562,11 +712,14 @@ def equalize(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_
             shift_x=shift_x,
             shift_y=shift_y,
             shift_z=shift_z,
+            workers=workers,
         )
     raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
 
 
-def gradient(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0):
+def gradient(
+    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0, *, workers=1
+):
     """Return local gradient of an image (i.e. local maximum - local minimum).
 
     Parameters
@@ -583,6 +736,12 @@ def gradient(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_
     shift_x, shift_y, shift_z : int
         Offset added to the footprint center point. Shift is bounded to the
         footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -613,6 +772,8 @@ def gradient(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_
             mask=mask,
             shift_x=shift_x,
             shift_y=shift_y,
+            workers=workers,
+            bucketed=True,
         )
     elif np_image.ndim == 3:
         return _apply_scalar_per_pixel_3D(
@@ -624,11 +785,15 @@ def gradient(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_
             shift_x=shift_x,
             shift_y=shift_y,
             shift_z=shift_z,
+            workers=workers,
+            bucketed=True,
         )
     raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
 
 
-def maximum(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0):
+def maximum(
+    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0, *, workers=1
+):
     """Return local maximum of an image.
 
     Parameters
@@ -645,6 +810,12 @@ def maximum(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z
     shift_x, shift_y, shift_z : int
         Offset added to the footprint center point. Shift is bounded to the
         footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -684,6 +855,8 @@ def maximum(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z
             mask=mask,
             shift_x=shift_x,
             shift_y=shift_y,
+            workers=workers,
+            bucketed=True,
         )
     elif np_image.ndim == 3:
         return _apply_scalar_per_pixel_3D(
@@ -695,11 +868,15 @@ def maximum(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z
             shift_x=shift_x,
             shift_y=shift_y,
             shift_z=shift_z,
+            workers=workers,
+            bucketed=True,
         )
     raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
 
 
-def mean(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0):
+def mean(
+    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0, *, workers=1
+):
     """Return local mean of an image.
 
     Parameters
@@ -716,6 +893,12 @@ def mean(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0)
     shift_x, shift_y, shift_z : int
         Offset added to the footprint center point. Shift is bounded to the
         footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -746,6 +929,7 @@ def mean(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0)
             mask=mask,
             shift_x=shift_x,
             shift_y=shift_y,
+            workers=workers,
         )
     elif np_image.ndim == 3:
         return _apply_scalar_per_pixel_3D(
@@ -757,12 +941,13 @@ def mean(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0)
             shift_x=shift_x,
             shift_y=shift_y,
             shift_z=shift_z,
+            workers=workers,
         )
     raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
 
 
 def geometric_mean(
-    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0
+    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0, *, workers=1
 ):
     """Return local geometric mean of an image.
 
@@ -780,6 +965,12 @@ def geometric_mean(
     shift_x, shift_y, shift_z : int
         Offset added to the footprint center point. Shift is bounded to the
         footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -815,6 +1006,7 @@ def geometric_mean(
             mask=mask,
             shift_x=shift_x,
             shift_y=shift_y,
+            workers=workers,
         )
     elif np_image.ndim == 3:
         return _apply_scalar_per_pixel_3D(
@@ -826,12 +1018,13 @@ def geometric_mean(
             shift_x=shift_x,
             shift_y=shift_y,
             shift_z=shift_z,
+            workers=workers,
         )
     raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
 
 
 def subtract_mean(
-    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0
+    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0, *, workers=1
 ):
     """Return image subtracted from its local mean.
 
@@ -849,6 +1042,12 @@ def subtract_mean(
     shift_x, shift_y, shift_z : int
         Offset added to the footprint center point. Shift is bounded to the
         footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -887,6 +1086,7 @@ def subtract_mean(
             mask=mask,
             shift_x=shift_x,
             shift_y=shift_y,
+            workers=workers,
         )
     elif np_image.ndim == 3:
         return _apply_scalar_per_pixel_3D(
@@ -898,6 +1098,7 @@ def subtract_mean(
             shift_x=shift_x,
             shift_y=shift_y,
             shift_z=shift_z,
+            workers=workers,
         )
     raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
 
@@ -910,6 +1111,8 @@ def median(
     shift_x=0,
     shift_y=0,
     shift_z=0,
+    *,
+    workers=1,
 ):
     """Return local median of an image.
 
@@ -928,6 +1131,12 @@ def median(
     shift_x, shift_y, shift_z : int
         Offset added to the footprint center point. Shift is bounded to the
         footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -965,6 +1174,8 @@ def median(
             mask=mask,
             shift_x=shift_x,
             shift_y=shift_y,
+            workers=workers,
+            bucketed=True,
         )
     elif np_image.ndim == 3:
         return _apply_scalar_per_pixel_3D(
@@ -976,11 +1187,15 @@ def median(
             shift_x=shift_x,
             shift_y=shift_y,
             shift_z=shift_z,
+            workers=workers,
+            bucketed=True,
         )
     raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
 
 
-def minimum(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0):
+def minimum(
+    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0, *, workers=1
+):
     """Return local minimum of an image.
 
     Parameters
@@ -997,6 +1212,12 @@ def minimum(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z
     shift_x, shift_y, shift_z : int
         Offset added to the footprint center point. Shift is bounded to the
         footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -1036,6 +1257,8 @@ def minimum(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z
             mask=mask,
             shift_x=shift_x,
             shift_y=shift_y,
+            workers=workers,
+            bucketed=True,
         )
     elif np_image.ndim == 3:
         return _apply_scalar_per_pixel_3D(
@@ -1047,11 +1270,15 @@ def minimum(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z
             shift_x=shift_x,
             shift_y=shift_y,
             shift_z=shift_z,
+            workers=workers,
+            bucketed=True,
         )
     raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
 
 
-def modal(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0):
+def modal(
+    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0, *, workers=1
+):
     """Return local mode of an image.
 
     The mode is the value that appears most often in the local histogram.
@@ -1070,6 +1297,12 @@ def modal(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0
     shift_x, shift_y, shift_z : int
         Offset added to the footprint center point. Shift is bounded to the
         footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -1100,6 +1333,7 @@ def modal(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0
             mask=mask,
             shift_x=shift_x,
             shift_y=shift_y,
+            workers=workers,
         )
     elif np_image.ndim == 3:
         return _apply_scalar_per_pixel_3D(
@@ -1111,12 +1345,13 @@ def modal(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0
             shift_x=shift_x,
             shift_y=shift_y,
             shift_z=shift_z,
+            workers=workers,
         )
     raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
 
 
 def enhance_contrast(
-    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0
+    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0, *, workers=1
 ):
     """Enhance contrast of an image.
 
@@ -1138,6 +1373,12 @@ def enhance_contrast(
     shift_x, shift_y, shift_z : int
         Offset added to the footprint center point. Shift is bounded to the
         footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -1168,6 +1409,8 @@ def enhance_contrast(
             mask=mask,
             shift_x=shift_x,
             shift_y=shift_y,
+            workers=workers,
+            bucketed=True,
         )
     elif np_image.ndim == 3:
         return _apply_scalar_per_pixel_3D(
@@ -1179,11 +1422,15 @@ def enhance_contrast(
             shift_x=shift_x,
             shift_y=shift_y,
             shift_z=shift_z,
+            workers=workers,
+            bucketed=True,
         )
     raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
 
 
-def pop(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0):
+def pop(
+    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0, *, workers=1
+):
     """Return the local number (population) of pixels.
 
     The number of pixels is defined as the number of pixels which are included
@@ -1203,6 +1450,12 @@ def pop(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0):
     shift_x, shift_y, shift_z : int
         Offset added to the footprint center point. Shift is bounded to the
         footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -1237,6 +1490,7 @@ def pop(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0):
             mask=mask,
             shift_x=shift_x,
             shift_y=shift_y,
+            workers=workers,
         )
     elif np_image.ndim == 3:
         return _apply_scalar_per_pixel_3D(
@@ -1248,11 +1502,14 @@ def pop(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0):
             shift_x=shift_x,
             shift_y=shift_y,
             shift_z=shift_z,
+            workers=workers,
         )
     raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
 
 
-def sum(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0):
+def sum(
+    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0, *, workers=1
+):
     """Return the local sum of pixels.
 
     Note that the sum may overflow depending on the data type of the input
@@ -1272,6 +1529,12 @@ def sum(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0):
     shift_x, shift_y, shift_z : int
         Offset added to the footprint center point. Shift is bounded to the
         footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -1306,6 +1569,7 @@ def sum(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0):
             mask=mask,
             shift_x=shift_x,
             shift_y=shift_y,
+            workers=workers,
         )
     elif np_image.ndim == 3:
         return _apply_scalar_per_pixel_3D(
@@ -1317,11 +1581,14 @@ def sum(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0):
             shift_x=shift_x,
             shift_y=shift_y,
             shift_z=shift_z,
+            workers=workers,
         )
     raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
 
 
-def threshold(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0):
+def threshold(
+    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0, *, workers=1
+):
     """Local threshold of an image.
 
     The resulting binary mask is True if the gray value of the center pixel is
@@ -1341,6 +1608,12 @@ def threshold(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift
     shift_x, shift_y, shift_z : int
         Offset added to the footprint center point. Shift is bounded to the
         footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -1375,6 +1648,7 @@ def threshold(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift
             mask=mask,
             shift_x=shift_x,
             shift_y=shift_y,
+            workers=workers,
         )
     elif np_image.ndim == 3:
         return _apply_scalar_per_pixel_3D(
@@ -1386,12 +1660,13 @@ def threshold(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift
             shift_x=shift_x,
             shift_y=shift_y,
             shift_z=shift_z,
+            workers=workers,
         )
     raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
 
 
 def noise_filter(
-    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0
+    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0, *, workers=1
 ):
     """Noise feature.
 
@@ -1409,6 +1684,12 @@ def noise_filter(
     shift_x, shift_y, shift_z : int
         Offset added to the footprint center point. Shift is bounded to the
         footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     References
     ----------
@@ -1455,6 +1736,7 @@ def noise_filter(
             mask=mask,
             shift_x=shift_x,
             shift_y=shift_y,
+            workers=workers,
         )
     elif np_image.ndim == 3:
         # ensure that the central pixel in the footprint is empty
@@ -1474,12 +1756,15 @@ def noise_filter(
             shift_x=shift_x,
             shift_y=shift_y,
             shift_z=shift_z,
+            workers=workers,
         )
 
     raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
 
 
-def entropy(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0):
+def entropy(
+    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0, *, workers=1
+):
     """Local entropy.
 
     The entropy is computed using base 2 logarithm i.e. the filter returns the
@@ -1500,6 +1785,12 @@ def entropy(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z
     shift_x, shift_y, shift_z : int
         Offset added to the footprint center point. Shift is bounded to the
         footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -1535,6 +1826,7 @@ def entropy(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z
             shift_x=shift_x,
             shift_y=shift_y,
             out_dtype=np.float64,
+            workers=workers,
         )
     elif np_image.ndim == 3:
         return _apply_scalar_per_pixel_3D(
@@ -1547,11 +1839,14 @@ def entropy(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z
             shift_y=shift_y,
             shift_z=shift_z,
             out_dtype=np.float64,
+            workers=workers,
         )
     raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
 
 
-def otsu(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0):
+def otsu(
+    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0, *, workers=1
+):
     """Local Otsu's threshold value for each pixel.
 
     Parameters
@@ -1568,6 +1863,12 @@ def otsu(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0)
     shift_x, shift_y, shift_z : int
         Offset added to the footprint center point. Shift is bounded to the
         footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -1604,6 +1905,7 @@ def otsu(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0)
             mask=mask,
             shift_x=shift_x,
             shift_y=shift_y,
+            workers=workers,
         )
     elif np_image.ndim == 3:
         return _apply_scalar_per_pixel_3D(
@@ -1615,12 +1917,21 @@ def otsu(image, footprint, out=None, mask=None, shift_x=0, shift_y=0, shift_z=0)
             shift_x=shift_x,
             shift_y=shift_y,
             shift_z=shift_z,
+            workers=workers,
         )
     raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
 
 
 def windowed_histogram(
-    image, footprint, out=None, mask=None, shift_x=0, shift_y=0, n_bins=None
+    image,
+    footprint,
+    out=None,
+    mask=None,
+    shift_x=0,
+    shift_y=0,
+    n_bins=None,
+    *,
+    workers=1,
 ):
     """Normalized sliding window histogram
 
@@ -1641,6 +1952,12 @@ def windowed_histogram(
     n_bins : int or None
         The number of histogram bins. Will default to ``image.max() + 1``
         if None is passed.
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -1678,6 +1995,7 @@ def windowed_histogram(
         shift_y=shift_y,
         out_dtype=np.float64,
         pixel_size=n_bins,
+        workers=workers,
     )
 
 
@@ -1690,6 +2008,7 @@ def majority(
     shift_x=0,
     shift_y=0,
     shift_z=0,
+    workers=1,
 ):
     """Assign to each pixel the most common value within its neighborhood.
 
@@ -1707,6 +2026,12 @@ def majority(
     shift_x, shift_y : int, optional
         Offset added to the footprint center point. Shift is bounded to the
         footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -1737,6 +2062,7 @@ def majority(
             mask=mask,
             shift_x=shift_x,
             shift_y=shift_y,
+            workers=workers,
         )
     elif np_image.ndim == 3:
         return _apply_scalar_per_pixel_3D(
@@ -1748,5 +2074,135 @@ def majority(
             shift_x=shift_x,
             shift_y=shift_y,
             shift_z=shift_z,
+            workers=workers,
+        )
+    raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
+
+
+def statistics(
+    image, footprint, stats, mask=None, shift_x=0, shift_y=0, shift_z=0, *, workers=1
+):
+    """Several local statistics computed from the same sliding histogram.
+
+    Calling ``statistics(image, footprint, ['minimum', 'median'])`` gives the
+    same result as stacking the outputs of :func:`minimum` and :func:`median`
+    computed with a ``float64`` `out` array, but the local histogram is only
+    built once for all statistics instead of once per filter.
+
+    Parameters
+    ----------
+    image : ([P,] M, N) ndarray (uint8, uint16)
+        Input image.
+    footprint : ndarray
+        The neighborhood expressed as an ndarray of 1's and 0's.
+    stats : sequence of str or tuple
+        The statistics to compute. Each one is the name of a filter of this
+        module among 'autolevel', 'equalize', 'gradient', 'maximum', 'mean',
+        'geometric_mean', 'subtract_mean', 'median', 'minimum', 'modal',
+        'enhance_contrast', 'pop', 'sum', 'threshold', 'entropy', 'otsu'
+        and 'majority', or a tuple ``('percentile', p0)`` with ``p0`` in the
+        interval [0, 1], see :func:`percentile`.
+    mask : ndarray (integer or float), optional
+        Mask array that defines (>0) area of the image included in the local
+        neighborhood. If None, the complete image is used (default).
+    shift_x, shift_y, shift_z : int, optional
+        Offset added to the footprint center point. Shift is bounded to the
+        footprint sizes (center must be inside the given footprint).
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. The image is split into bands along
+        its first axis, which are filtered concurrently.
+
+    Returns
+    -------
+    out : ([P,] M, N, S) ndarray (float64)
+        Output image, where ``out[..., i]`` is the ``i``-th statistic of
+        `stats`.
+
+    Notes
+    -----
+    .. versionadded:: 0.26
+
+    Examples
+    --------
+    >>> from skimage import data
+    >>> from skimage.filters.rank import statistics
+    >>> from skimage.morphology import disk
+    >>> img = data.camera()
+    >>> out = statistics(img, disk(5), ['minimum', 'median', ('percentile', 0.9)])
+    >>> out.shape
+    (512, 512, 3)
+
+    """
+
+    if isinstance(stats, str) or len(stats) == 0:
+        raise ValueError('`stats` must be a non-empty sequence of statistics.')
+    params = []
+    for stat in stats:
+        if isinstance(stat, str):
+            name, p0 = stat, 0
+            valid = name in generic_cy.STATISTICS and name != 'percentile'
+        else:
+            name, p0 = stat
+            valid = name == 'percentile'
+        if not valid:
+            raise ValueError(f'Unknown statistic {stat!r}.')
+        if not 0 <= p0 <= 1:
+            raise ValueError(f'Percentile must be in the interval [0, 1], got {p0}.')
+        params.append((generic_cy.STATISTICS.index(name), p0))
+    params = np.array(params, dtype=np.float64)
+
+    np_image = np.asanyarray(image)
+    if np_image.ndim == 2:
+        image, footprint, out, mask, n_bins = _preprocess_input(
+            image,
+            footprint,
+            None,
+            mask,
+            np.float64,
+            len(params),
+            shift_x=shift_x,
+            shift_y=shift_y,
+        )
+        _apply_in_bands(
+            generic_cy._statistics,
+            image,
+            footprint,
+            out,
+            mask,
+            footprint.shape[0] // 2 + shift_y,
+            workers,
+            shift_x=shift_x,
+            shift_y=shift_y,
+            n_bins=n_bins,
+            params=params,
+        )
+        return out
+    elif np_image.ndim == 3:
+        image, footprint, out, mask, n_bins = _handle_input_3D(
+            image,
+            footprint,
+            None,
+            mask,
+            np.float64,
+            len(params),
+            shift_x=shift_x,
+            shift_y=shift_y,
+            shift_z=shift_z,
+        )
+        _apply_in_bands(
+            generic_cy._statistics_3D,
+            image,
+            footprint,
+            out,
+            mask,
+            footprint.shape[0] // 2 + shift_x,
+            workers,
+            shift_x=shift_x,
+            shift_y=shift_y,
+            shift_z=shift_z,
+            n_bins=n_bins,
+            params=params,
         )
+        return out
     raise ValueError(f'`image` must have 2 or 3 dimensions, got {np_image.ndim}.')
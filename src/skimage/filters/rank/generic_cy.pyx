@@ -6,7 +6,8 @@
 cimport numpy as cnp
 from libc.math cimport log, exp
 
-from .core_cy cimport dtype_t, dtype_t_out, _core
+from .core_cy cimport (dtype_t, dtype_t_out, _core, _bucket_shift,
+                       _bucketed_search, _bucketed_last)
 
 from .core_cy_3d cimport _core_3D
 
@@ -19,19 +20,15 @@ cdef inline void _kernel_autolevel(dtype_t_out* out, Py_ssize_t odepth,
                                    cnp.float64_t pop, dtype_t g,
                                    Py_ssize_t n_bins, Py_ssize_t mid_bin,
                                    cnp.float64_t p0, cnp.float64_t p1,
-                                   Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                                   Py_ssize_t s0, Py_ssize_t s1,
+                                   Py_ssize_t bucket_shift,
+                                   const cnp.float64_t* params) noexcept nogil:
 
-    cdef Py_ssize_t i, imin = 0, imax = 0, delta
+    cdef Py_ssize_t imin, imax, delta
 
     if pop:
-        for i in range(n_bins - 1, -1, -1):
-            if histo[i]:
-                imax = i
-                break
-        for i in range(n_bins):
-            if histo[i]:
-                imin = i
-                break
+        imax = _bucketed_last(histo, n_bins, bucket_shift)
+        imin = _bucketed_search(histo, n_bins, bucket_shift, 0)
         delta = imax - imin
         if delta > 0:
             out[0] = <dtype_t_out>((n_bins - 1) * (g - imin) / delta)
@@ -46,7 +43,9 @@ cdef inline void _kernel_equalize(dtype_t_out* out, Py_ssize_t odepth,
                                   cnp.float64_t pop, dtype_t g,
                                   Py_ssize_t n_bins, Py_ssize_t mid_bin,
                                   cnp.float64_t p0, cnp.float64_t p1,
-                                  Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                                  Py_ssize_t s0, Py_ssize_t s1,
+                                  Py_ssize_t bucket_shift,
+                                  const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t i
     cdef Py_ssize_t sum = 0
@@ -66,19 +65,15 @@ cdef inline void _kernel_gradient(dtype_t_out* out, Py_ssize_t odepth,
                                   cnp.float64_t pop, dtype_t g,
                                   Py_ssize_t n_bins, Py_ssize_t mid_bin,
                                   cnp.float64_t p0, cnp.float64_t p1,
-                                  Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                                  Py_ssize_t s0, Py_ssize_t s1,
+                                  Py_ssize_t bucket_shift,
+                                  const cnp.float64_t* params) noexcept nogil:
 
-    cdef Py_ssize_t i, imin = 0, imax = 0
+    cdef Py_ssize_t imin, imax
 
     if pop:
-        for i in range(n_bins - 1, -1, -1):
-            if histo[i]:
-                imax = i
-                break
-        for i in range(n_bins):
-            if histo[i]:
-                imin = i
-                break
+        imax = _bucketed_last(histo, n_bins, bucket_shift)
+        imin = _bucketed_search(histo, n_bins, bucket_shift, 0)
         out[0] = <dtype_t_out>(imax - imin)
     else:
         out[0] = <dtype_t_out>0
@@ -89,15 +84,12 @@ cdef inline void _kernel_maximum(dtype_t_out* out, Py_ssize_t odepth,
                                  cnp.float64_t pop, dtype_t g,
                                  Py_ssize_t n_bins, Py_ssize_t mid_bin,
                                  cnp.float64_t p0, cnp.float64_t p1,
-                                 Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
-
-    cdef Py_ssize_t i
+                                 Py_ssize_t s0, Py_ssize_t s1,
+                                 Py_ssize_t bucket_shift,
+                                 const cnp.float64_t* params) noexcept nogil:
 
     if pop:
-        for i in range(n_bins - 1, -1, -1):
-            if histo[i]:
-                out[0] = <dtype_t_out>i
-                return
+        out[0] = <dtype_t_out>_bucketed_last(histo, n_bins, bucket_shift)
     else:
         out[0] = <dtype_t_out>0
 
@@ -107,7 +99,9 @@ cdef inline void _kernel_mean(dtype_t_out* out, Py_ssize_t odepth,
                               cnp.float64_t pop, dtype_t g,
                               Py_ssize_t n_bins, Py_ssize_t mid_bin,
                               cnp.float64_t p0, cnp.float64_t p1,
-                              Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                              Py_ssize_t s0, Py_ssize_t s1,
+                              Py_ssize_t bucket_shift,
+                              const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t i
     cdef Py_ssize_t mean = 0
@@ -125,7 +119,9 @@ cdef inline void _kernel_geometric_mean(dtype_t_out* out, Py_ssize_t odepth,
                                         cnp.float64_t pop, dtype_t g,
                                         Py_ssize_t n_bins, Py_ssize_t mid_bin,
                                         cnp.float64_t p0, cnp.float64_t p1,
-                                        Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                                        Py_ssize_t s0, Py_ssize_t s1,
+                                        Py_ssize_t bucket_shift,
+                                        const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t i
     cdef cnp.float64_t mean = 0.
@@ -144,7 +140,9 @@ cdef inline void _kernel_subtract_mean(dtype_t_out* out, Py_ssize_t odepth,
                                        cnp.float64_t pop, dtype_t g,
                                        Py_ssize_t n_bins, Py_ssize_t mid_bin,
                                        cnp.float64_t p0, cnp.float64_t p1,
-                                       Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                                       Py_ssize_t s0, Py_ssize_t s1,
+                                       Py_ssize_t bucket_shift,
+                                       const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t i
     cdef Py_ssize_t mean = 0
@@ -162,18 +160,12 @@ cdef inline void _kernel_median(dtype_t_out* out, Py_ssize_t odepth,
                                 cnp.float64_t pop, dtype_t g,
                                 Py_ssize_t n_bins, Py_ssize_t mid_bin,
                                 cnp.float64_t p0, cnp.float64_t p1,
-                                Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
-
-    cdef Py_ssize_t i
-    cdef cnp.float64_t sum = pop / 2.0
+                                Py_ssize_t s0, Py_ssize_t s1,
+                                Py_ssize_t bucket_shift,
+                                const cnp.float64_t* params) noexcept nogil:
 
     if pop:
-        for i in range(n_bins):
-            if histo[i]:
-                sum -= histo[i]
-                if sum < 0:
-                    out[0] = <dtype_t_out>i
-                    return
+        out[0] = <dtype_t_out>_bucketed_search(histo, n_bins, bucket_shift, pop / 2.0)
     else:
         out[0] = <dtype_t_out>0
 
@@ -183,15 +175,12 @@ cdef inline void _kernel_minimum(dtype_t_out* out, Py_ssize_t odepth,
                                  cnp.float64_t pop, dtype_t g,
                                  Py_ssize_t n_bins, Py_ssize_t mid_bin,
                                  cnp.float64_t p0, cnp.float64_t p1,
-                                 Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
-
-    cdef Py_ssize_t i
+                                 Py_ssize_t s0, Py_ssize_t s1,
+                                 Py_ssize_t bucket_shift,
+                                 const cnp.float64_t* params) noexcept nogil:
 
     if pop:
-        for i in range(n_bins):
-            if histo[i]:
-                out[0] = <dtype_t_out>i
-                return
+        out[0] = <dtype_t_out>_bucketed_search(histo, n_bins, bucket_shift, 0)
     else:
         out[0] = <dtype_t_out>0
 
@@ -201,7 +190,9 @@ cdef inline void _kernel_modal(dtype_t_out* out, Py_ssize_t odepth,
                                cnp.float64_t pop, dtype_t g,
                                Py_ssize_t n_bins, Py_ssize_t mid_bin,
                                cnp.float64_t p0, cnp.float64_t p1,
-                               Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                               Py_ssize_t s0, Py_ssize_t s1,
+                               Py_ssize_t bucket_shift,
+                               const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t hmax = 0, imax = 0
 
@@ -223,19 +214,15 @@ cdef inline void _kernel_enhance_contrast(dtype_t_out* out,
                                           Py_ssize_t n_bins,
                                           Py_ssize_t mid_bin, cnp.float64_t p0,
                                           cnp.float64_t p1, Py_ssize_t s0,
-                                          Py_ssize_t s1) noexcept nogil:
+                                          Py_ssize_t s1,
+                                          Py_ssize_t bucket_shift,
+                                          const cnp.float64_t* params) noexcept nogil:
 
-    cdef Py_ssize_t i, imin = 0, imax = 0
+    cdef Py_ssize_t imin, imax
 
     if pop:
-        for i in range(n_bins - 1, -1, -1):
-            if histo[i]:
-                imax = i
-                break
-        for i in range(n_bins):
-            if histo[i]:
-                imin = i
-                break
+        imax = _bucketed_last(histo, n_bins, bucket_shift)
+        imin = _bucketed_search(histo, n_bins, bucket_shift, 0)
         if imax - g < g - imin:
             out[0] = <dtype_t_out>imax
         else:
@@ -249,7 +236,9 @@ cdef inline void _kernel_pop(dtype_t_out* out, Py_ssize_t odepth,
                              cnp.float64_t pop, dtype_t g,
                              Py_ssize_t n_bins, Py_ssize_t mid_bin,
                              cnp.float64_t p0, cnp.float64_t p1,
-                             Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                             Py_ssize_t s0, Py_ssize_t s1,
+                             Py_ssize_t bucket_shift,
+                             const cnp.float64_t* params) noexcept nogil:
 
     out[0] = <dtype_t_out>pop
 
@@ -259,7 +248,9 @@ cdef inline void _kernel_sum(dtype_t_out* out, Py_ssize_t odepth,
                              cnp.float64_t pop, dtype_t g,
                              Py_ssize_t n_bins, Py_ssize_t mid_bin,
                              cnp.float64_t p0, cnp.float64_t p1,
-                             Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                             Py_ssize_t s0, Py_ssize_t s1,
+                             Py_ssize_t bucket_shift,
+                             const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t i
     cdef Py_ssize_t sum = 0
@@ -277,7 +268,9 @@ cdef inline void _kernel_threshold(dtype_t_out* out, Py_ssize_t odepth,
                                    cnp.float64_t pop, dtype_t g,
                                    Py_ssize_t n_bins, Py_ssize_t mid_bin,
                                    cnp.float64_t p0, cnp.float64_t p1,
-                                   Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                                   Py_ssize_t s0, Py_ssize_t s1,
+                                   Py_ssize_t bucket_shift,
+                                   const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t i
     cdef Py_ssize_t mean = 0
@@ -295,7 +288,9 @@ cdef inline void _kernel_noise_filter(dtype_t_out* out, Py_ssize_t odepth,
                                       cnp.float64_t pop, dtype_t g,
                                       Py_ssize_t n_bins, Py_ssize_t mid_bin,
                                       cnp.float64_t p0, cnp.float64_t p1,
-                                      Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                                      Py_ssize_t s0, Py_ssize_t s1,
+                                      Py_ssize_t bucket_shift,
+                                      const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t i
     cdef Py_ssize_t min_i
@@ -323,7 +318,9 @@ cdef inline void _kernel_entropy(dtype_t_out* out, Py_ssize_t odepth,
                                  cnp.float64_t pop, dtype_t g,
                                  Py_ssize_t n_bins, Py_ssize_t mid_bin,
                                  cnp.float64_t p0, cnp.float64_t p1,
-                                 Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                                 Py_ssize_t s0, Py_ssize_t s1,
+                                 Py_ssize_t bucket_shift,
+                                 const cnp.float64_t* params) noexcept nogil:
     cdef Py_ssize_t i
     cdef cnp.float64_t e, p
 
@@ -343,7 +340,9 @@ cdef inline void _kernel_otsu(dtype_t_out* out, Py_ssize_t odepth,
                               cnp.float64_t pop, dtype_t g,
                               Py_ssize_t n_bins, Py_ssize_t mid_bin,
                               cnp.float64_t p0, cnp.float64_t p1,
-                              Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                              Py_ssize_t s0, Py_ssize_t s1,
+                              Py_ssize_t bucket_shift,
+                              const cnp.float64_t* params) noexcept nogil:
     cdef Py_ssize_t i
     cdef Py_ssize_t max_i
     cdef Py_ssize_t P, q1, mu1, mu2, mu = 0
@@ -389,7 +388,9 @@ cdef inline void _kernel_win_hist(dtype_t_out* out, Py_ssize_t odepth,
                                   cnp.float64_t pop, dtype_t g,
                                   Py_ssize_t n_bins, Py_ssize_t mid_bin,
                                   cnp.float64_t p0, cnp.float64_t p1,
-                                  Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                                  Py_ssize_t s0, Py_ssize_t s1,
+                                  Py_ssize_t bucket_shift,
+                                  const cnp.float64_t* params) noexcept nogil:
     cdef Py_ssize_t i
     cdef cnp.float64_t scale
     if pop:
@@ -406,7 +407,9 @@ cdef inline void _kernel_majority(dtype_t_out* out, Py_ssize_t odepth,
                                   cnp.float64_t pop, dtype_t g,
                                   Py_ssize_t n_bins, Py_ssize_t mid_bin,
                                   cnp.float64_t p0, cnp.float64_t p1,
-                                  Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                                  Py_ssize_t s0, Py_ssize_t s1,
+                                  Py_ssize_t bucket_shift,
+                                  const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t i
     cdef Py_ssize_t votes
@@ -422,14 +425,130 @@ cdef inline void _kernel_majority(dtype_t_out* out, Py_ssize_t odepth,
     out[0] = <dtype_t_out>(candidate)
 
 
+cdef inline void _kernel_percentile(dtype_t_out* out, Py_ssize_t odepth,
+                                    Py_ssize_t[::1] histo,
+                                    cnp.float64_t pop, dtype_t g,
+                                    Py_ssize_t n_bins, Py_ssize_t mid_bin,
+                                    cnp.float64_t p0, cnp.float64_t p1,
+                                    Py_ssize_t s0, Py_ssize_t s1,
+                                    Py_ssize_t bucket_shift,
+                                    const cnp.float64_t* params) noexcept nogil:
+    # same as `percentile_cy._kernel_percentile`
+
+    if pop:
+        if p0 == 1:  # make sure p0 = 1 returns the maximum filter
+            out[0] = <dtype_t_out>_bucketed_last(histo, n_bins, bucket_shift)
+        else:
+            out[0] = <dtype_t_out>_bucketed_search(histo, n_bins, bucket_shift, p0 * pop)
+    else:
+        out[0] = <dtype_t_out>0
+
+
+# Statistics of `_kernel_statistics`, the code of a statistic is its index
+STATISTICS = (
+    'autolevel',
+    'equalize',
+    'gradient',
+    'maximum',
+    'mean',
+    'geometric_mean',
+    'subtract_mean',
+    'median',
+    'minimum',
+    'modal',
+    'enhance_contrast',
+    'pop',
+    'sum',
+    'threshold',
+    'entropy',
+    'otsu',
+    'majority',
+    'percentile',
+)
+
+
+cdef inline void _kernel_statistics(dtype_t_out* out, Py_ssize_t odepth,
+                                    Py_ssize_t[::1] histo,
+                                    cnp.float64_t pop, dtype_t g,
+                                    Py_ssize_t n_bins, Py_ssize_t mid_bin,
+                                    cnp.float64_t p0, cnp.float64_t p1,
+                                    Py_ssize_t s0, Py_ssize_t s1,
+                                    Py_ssize_t bucket_shift,
+                                    const cnp.float64_t* params) noexcept nogil:
+    # `params` is an (odepth, 2) array of statistic codes and percentiles
+    cdef Py_ssize_t k, code
+    cdef cnp.float64_t p
+
+    for k in range(odepth):
+        code = <Py_ssize_t>params[2 * k]
+        p = params[2 * k + 1]
+        if code == 0:
+            _kernel_autolevel(&out[k], 1, histo, pop, g, n_bins, mid_bin, p, p, 0, 0,
+                              bucket_shift, NULL)
+        elif code == 1:
+            _kernel_equalize(&out[k], 1, histo, pop, g, n_bins, mid_bin, p, p, 0, 0,
+                             bucket_shift, NULL)
+        elif code == 2:
+            _kernel_gradient(&out[k], 1, histo, pop, g, n_bins, mid_bin, p, p, 0, 0,
+                             bucket_shift, NULL)
+        elif code == 3:
+            _kernel_maximum(&out[k], 1, histo, pop, g, n_bins, mid_bin, p, p, 0, 0,
+                            bucket_shift, NULL)
+        elif code == 4:
+            _kernel_mean(&out[k], 1, histo, pop, g, n_bins, mid_bin, p, p, 0, 0,
+                         bucket_shift, NULL)
+        elif code == 5:
+            _kernel_geometric_mean(&out[k], 1, histo, pop, g, n_bins, mid_bin, p, p, 0, 0,
+                                   bucket_shift, NULL)
+        elif code == 6:
+            _kernel_subtract_mean(&out[k], 1, histo, pop, g, n_bins, mid_bin, p, p, 0, 0,
+                                  bucket_shift, NULL)
+        elif code == 7:
+            _kernel_median(&out[k], 1, histo, pop, g, n_bins, mid_bin, p, p, 0, 0,
+                           bucket_shift, NULL)
+        elif code == 8:
+            _kernel_minimum(&out[k], 1, histo, pop, g, n_bins, mid_bin, p, p, 0, 0,
+                            bucket_shift, NULL)
+        elif code == 9:
+            _kernel_modal(&out[k], 1, histo, pop, g, n_bins, mid_bin, p, p, 0, 0,
+                          bucket_shift, NULL)
+        elif code == 10:
+            _kernel_enhance_contrast(&out[k], 1, histo, pop, g, n_bins, mid_bin, p, p, 0, 0,
+                                     bucket_shift, NULL)
+        elif code == 11:
+            _kernel_pop(&out[k], 1, histo, pop, g, n_bins, mid_bin, p, p, 0, 0,
+                        bucket_shift, NULL)
+        elif code == 12:
+            _kernel_sum(&out[k], 1, histo, pop, g, n_bins, mid_bin, p, p, 0, 0,
+                        bucket_shift, NULL)
+        elif code == 13:
+            _kernel_threshold(&out[k], 1, histo, pop, g, n_bins, mid_bin, p, p, 0, 0,
+                              bucket_shift, NULL)
+        elif code == 14:
+            _kernel_entropy(&out[k], 1, histo, pop, g, n_bins, mid_bin, p, p, 0, 0,
+                            bucket_shift, NULL)
+        elif code == 15:
+            _kernel_otsu(&out[k], 1, histo, pop, g, n_bins, mid_bin, p, p, 0, 0,
+                         bucket_shift, NULL)
+        elif code == 16:
+            _kernel_majority(&out[k], 1, histo, pop, g, n_bins, mid_bin, p, p, 0, 0,
+                             bucket_shift, NULL)
+        elif code == 17:
+            _kernel_percentile(&out[k], 1, histo, pop, g, n_bins, mid_bin, p, p, 0, 0,
+                               bucket_shift, NULL)
+
+
 def _autolevel(dtype_t[:, ::1] image,
                char[:, ::1] footprint,
                char[:, ::1] mask,
                dtype_t_out[:, :, ::1] out,
                signed char shift_x, signed char shift_y, Py_ssize_t n_bins):
 
+    cdef Py_ssize_t bucket_shift = _bucket_shift(n_bins)
+
     _core(_kernel_autolevel[dtype_t_out, dtype_t], image, footprint, mask, out,
-          shift_x, shift_y, 0, 0, 0, 0, n_bins)
+          shift_x, shift_y, 0, 0, 0, 0, n_bins,
+          bucket_shift)
 
 
 def _autolevel_3D(dtype_t[:, :, ::1] image,
@@ -439,8 +558,11 @@ def _autolevel_3D(dtype_t[:, :, ::1] image,
                   signed char shift_x, signed char shift_y, signed char shift_z,
                   Py_ssize_t n_bins):
 
+    cdef Py_ssize_t bucket_shift = _bucket_shift(n_bins)
+
     _core_3D(_kernel_autolevel[dtype_t_out, dtype_t], image, footprint, mask,
-             out, shift_x, shift_y, shift_z, 0, 0, 0, 0, n_bins)
+             out, shift_x, shift_y, shift_z, 0, 0, 0, 0, n_bins,
+             bucket_shift)
 
 
 def _equalize(dtype_t[:, ::1] image,
@@ -470,8 +592,11 @@ def _gradient(dtype_t[:, ::1] image,
               dtype_t_out[:, :, ::1] out,
               signed char shift_x, signed char shift_y, Py_ssize_t n_bins):
 
+    cdef Py_ssize_t bucket_shift = _bucket_shift(n_bins)
+
     _core(_kernel_gradient[dtype_t_out, dtype_t], image, footprint, mask, out,
-          shift_x, shift_y, 0, 0, 0, 0, n_bins)
+          shift_x, shift_y, 0, 0, 0, 0, n_bins,
+          bucket_shift)
 
 
 def _gradient_3D(dtype_t[:, :, ::1] image,
@@ -481,8 +606,11 @@ def _gradient_3D(dtype_t[:, :, ::1] image,
                  signed char shift_x, signed char shift_y, signed char shift_z,
                  Py_ssize_t n_bins):
 
+    cdef Py_ssize_t bucket_shift = _bucket_shift(n_bins)
+
     _core_3D(_kernel_gradient[dtype_t_out, dtype_t], image, footprint, mask,
-             out, shift_x, shift_y, shift_z, 0, 0, 0, 0, n_bins)
+             out, shift_x, shift_y, shift_z, 0, 0, 0, 0, n_bins,
+             bucket_shift)
 
 
 def _maximum(dtype_t[:, ::1] image,
@@ -491,8 +619,11 @@ def _maximum(dtype_t[:, ::1] image,
              dtype_t_out[:, :, ::1] out,
              signed char shift_x, signed char shift_y, Py_ssize_t n_bins):
 
+    cdef Py_ssize_t bucket_shift = _bucket_shift(n_bins)
+
     _core(_kernel_maximum[dtype_t_out, dtype_t], image, footprint, mask, out,
-          shift_x, shift_y, 0, 0, 0, 0, n_bins)
+          shift_x, shift_y, 0, 0, 0, 0, n_bins,
+          bucket_shift)
 
 
 def _maximum_3D(dtype_t[:, :, ::1] image,
@@ -502,8 +633,11 @@ def _maximum_3D(dtype_t[:, :, ::1] image,
                 signed char shift_x, signed char shift_y, signed char shift_z,
                 Py_ssize_t n_bins):
 
+    cdef Py_ssize_t bucket_shift = _bucket_shift(n_bins)
+
     _core_3D(_kernel_maximum[dtype_t_out, dtype_t], image, footprint, mask,
-             out, shift_x, shift_y, shift_z, 0, 0, 0, 0, n_bins)
+             out, shift_x, shift_y, shift_z, 0, 0, 0, 0, n_bins,
+             bucket_shift)
 
 
 def _mean(dtype_t[:, ::1] image,
@@ -575,8 +709,11 @@ def _median(dtype_t[:, ::1] image,
             dtype_t_out[:, :, ::1] out,
             signed char shift_x, signed char shift_y, Py_ssize_t n_bins):
 
+    cdef Py_ssize_t bucket_shift = _bucket_shift(n_bins)
+
     _core(_kernel_median[dtype_t_out, dtype_t], image, footprint, mask, out,
-          shift_x, shift_y, 0, 0, 0, 0, n_bins)
+          shift_x, shift_y, 0, 0, 0, 0, n_bins,
+          bucket_shift)
 
 
 def _median_3D(dtype_t[:, :, ::1] image,
@@ -586,8 +723,11 @@ def _median_3D(dtype_t[:, :, ::1] image,
                signed char shift_x, signed char shift_y, signed char shift_z,
                Py_ssize_t n_bins):
 
+    cdef Py_ssize_t bucket_shift = _bucket_shift(n_bins)
+
     _core_3D(_kernel_median[dtype_t_out, dtype_t], image, footprint, mask, out,
-             shift_x, shift_y, shift_z, 0, 0, 0, 0, n_bins)
+             shift_x, shift_y, shift_z, 0, 0, 0, 0, n_bins,
+             bucket_shift)
 
 
 def _minimum(dtype_t[:, ::1] image,
@@ -596,8 +736,11 @@ def _minimum(dtype_t[:, ::1] image,
              dtype_t_out[:, :, ::1] out,
              signed char shift_x, signed char shift_y, Py_ssize_t n_bins):
 
+    cdef Py_ssize_t bucket_shift = _bucket_shift(n_bins)
+
     _core(_kernel_minimum[dtype_t_out, dtype_t], image, footprint, mask, out,
-          shift_x, shift_y, 0, 0, 0, 0, n_bins)
+          shift_x, shift_y, 0, 0, 0, 0, n_bins,
+          bucket_shift)
 
 
 def _minimum_3D(dtype_t[:, :, ::1] image,
@@ -607,8 +750,11 @@ def _minimum_3D(dtype_t[:, :, ::1] image,
                 signed char shift_x, signed char shift_y, signed char shift_z,
                 Py_ssize_t n_bins):
 
+    cdef Py_ssize_t bucket_shift = _bucket_shift(n_bins)
+
     _core_3D(_kernel_minimum[dtype_t_out, dtype_t], image, footprint, mask,
-             out, shift_x, shift_y, shift_z, 0, 0, 0, 0, n_bins)
+             out, shift_x, shift_y, shift_z, 0, 0, 0, 0, n_bins,
+             bucket_shift)
 
 
 def _enhance_contrast(dtype_t[:, ::1] image,
@@ -617,8 +763,11 @@ def _enhance_contrast(dtype_t[:, ::1] image,
                       dtype_t_out[:, :, ::1] out,
                       signed char shift_x, signed char shift_y, Py_ssize_t n_bins):
 
+    cdef Py_ssize_t bucket_shift = _bucket_shift(n_bins)
+
     _core(_kernel_enhance_contrast[dtype_t_out, dtype_t], image, footprint, mask,
-          out, shift_x, shift_y, 0, 0, 0, 0, n_bins)
+          out, shift_x, shift_y, 0, 0, 0, 0, n_bins,
+          bucket_shift)
 
 
 def _enhance_contrast_3D(dtype_t[:, :, ::1] image,
@@ -628,8 +777,11 @@ def _enhance_contrast_3D(dtype_t[:, :, ::1] image,
                          signed char shift_x, signed char shift_y, signed char shift_z,
                          Py_ssize_t n_bins):
 
+    cdef Py_ssize_t bucket_shift = _bucket_shift(n_bins)
+
     _core_3D(_kernel_enhance_contrast[dtype_t_out, dtype_t], image, footprint,
-             mask, out, shift_x, shift_y, shift_z, 0, 0, 0, 0, n_bins)
+             mask, out, shift_x, shift_y, shift_z, 0, 0, 0, 0, n_bins,
+             bucket_shift)
 
 
 def _modal(dtype_t[:, ::1] image,
@@ -808,3 +960,32 @@ def _majority_3D(dtype_t[:, :, ::1] image,
 
     _core_3D(_kernel_majority[dtype_t_out, dtype_t], image, footprint, mask,
              out, shift_x, shift_y, shift_z, 0, 0, 0, 0, n_bins)
+
+
+def _statistics(dtype_t[:, ::1] image,
+                char[:, ::1] footprint,
+                char[:, ::1] mask,
+                dtype_t_out[:, :, ::1] out,
+                signed char shift_x, signed char shift_y, Py_ssize_t n_bins,
+                cnp.float64_t[:, ::1] params):
+
+    cdef Py_ssize_t bucket_shift = _bucket_shift(n_bins)
+
+    _core(_kernel_statistics[dtype_t_out, dtype_t], image, footprint, mask,
+          out, shift_x, shift_y, 0, 0, 0, 0, n_bins, bucket_shift,
+          &params[0, 0])
+
+
+def _statistics_3D(dtype_t[:, :, ::1] image,
+                   char[:, :, ::1] footprint,
+                   char[:, :, ::1] mask,
+                   dtype_t_out[:, :, :, ::1] out,
+                   signed char shift_x, signed char shift_y,
+                   signed char shift_z, Py_ssize_t n_bins,
+                   cnp.float64_t[:, ::1] params):
+
+    cdef Py_ssize_t bucket_shift = _bucket_shift(n_bins)
+
+    _core_3D(_kernel_statistics[dtype_t_out, dtype_t], image, footprint, mask,
+             out, shift_x, shift_y, shift_z, 0, 0, 0, 0, n_bins,
+             bucket_shift, &params[0, 0])
@@ -4,7 +4,8 @@
 #cython: wraparound=False
 
 cimport numpy as cnp
-from .core_cy cimport dtype_t, dtype_t_out, _core, _min, _max
+from .core_cy cimport (dtype_t, dtype_t_out, _core, _min, _max, _bucket_shift,
+                       _bucketed_search, _bucketed_last)
 cnp.import_array()
 
 cdef inline void _kernel_autolevel(dtype_t_out* out, Py_ssize_t odepth,
@@ -12,7 +13,9 @@ cdef inline void _kernel_autolevel(dtype_t_out* out, Py_ssize_t odepth,
                                    cnp.float64_t pop, dtype_t g,
                                    Py_ssize_t n_bins, Py_ssize_t mid_bin,
                                    cnp.float64_t p0, cnp.float64_t p1,
-                                   Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                                   Py_ssize_t s0, Py_ssize_t s1,
+                                   Py_ssize_t bucket_shift,
+                                   const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t i = 0, imin = 0, imax = 0, sum, delta
 
@@ -46,7 +49,9 @@ cdef inline void _kernel_gradient(dtype_t_out* out, Py_ssize_t odepth,
                                   cnp.float64_t pop, dtype_t g,
                                   Py_ssize_t n_bins, Py_ssize_t mid_bin,
                                   cnp.float64_t p0, cnp.float64_t p1,
-                                  Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                                  Py_ssize_t s0, Py_ssize_t s1,
+                                  Py_ssize_t bucket_shift,
+                                  const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t i, imin = 0, imax = 0, sum
 
@@ -75,7 +80,9 @@ cdef inline void _kernel_mean(dtype_t_out* out, Py_ssize_t odepth,
                               cnp.float64_t pop, dtype_t g,
                               Py_ssize_t n_bins, Py_ssize_t mid_bin,
                               cnp.float64_t p0, cnp.float64_t p1,
-                              Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                              Py_ssize_t s0, Py_ssize_t s1,
+                              Py_ssize_t bucket_shift,
+                              const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t i, sum, mean, n
 
@@ -101,7 +108,9 @@ cdef inline void _kernel_sum(dtype_t_out* out, Py_ssize_t odepth,
                              cnp.float64_t pop, dtype_t g,
                              Py_ssize_t n_bins, Py_ssize_t mid_bin,
                              cnp.float64_t p0, cnp.float64_t p1,
-                             Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                             Py_ssize_t s0, Py_ssize_t s1,
+                             Py_ssize_t bucket_shift,
+                             const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t i, sum, sum_g, n
 
@@ -128,7 +137,9 @@ cdef inline void _kernel_subtract_mean(dtype_t_out* out, Py_ssize_t odepth,
                                        Py_ssize_t n_bins,
                                        Py_ssize_t mid_bin, cnp.float64_t p0,
                                        cnp.float64_t p1, Py_ssize_t s0,
-                                       Py_ssize_t s1) noexcept nogil:
+                                       Py_ssize_t s1,
+                                       Py_ssize_t bucket_shift,
+                                       const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t i, sum, mean, n
 
@@ -156,7 +167,9 @@ cdef inline void _kernel_enhance_contrast(dtype_t_out* out,
                                           Py_ssize_t n_bins,
                                           Py_ssize_t mid_bin, cnp.float64_t p0,
                                           cnp.float64_t p1, Py_ssize_t s0,
-                                          Py_ssize_t s1) noexcept nogil:
+                                          Py_ssize_t s1,
+                                          Py_ssize_t bucket_shift,
+                                          const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t i, imin = 0, imax = 0, sum
 
@@ -191,22 +204,15 @@ cdef inline void _kernel_percentile(dtype_t_out* out, Py_ssize_t odepth,
                                     cnp.float64_t pop, dtype_t g,
                                     Py_ssize_t n_bins, Py_ssize_t mid_bin,
                                     cnp.float64_t p0, cnp.float64_t p1,
-                                    Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
-
-    cdef Py_ssize_t i = 0
-    cdef Py_ssize_t sum = 0
+                                    Py_ssize_t s0, Py_ssize_t s1,
+                                    Py_ssize_t bucket_shift,
+                                    const cnp.float64_t* params) noexcept nogil:
 
     if pop:
         if p0 == 1:  # make sure p0 = 1 returns the maximum filter
-            for i in range(n_bins - 1, -1, -1):
-                if histo[i]:
-                    break
+            out[0] = <dtype_t_out>_bucketed_last(histo, n_bins, bucket_shift)
         else:
-            for i in range(n_bins):
-                sum += histo[i]
-                if sum > p0 * pop:
-                    break
-        out[0] = <dtype_t_out>i
+            out[0] = <dtype_t_out>_bucketed_search(histo, n_bins, bucket_shift, p0 * pop)
     else:
         out[0] = <dtype_t_out>0
 
@@ -216,7 +222,9 @@ cdef inline void _kernel_pop(dtype_t_out* out, Py_ssize_t odepth,
                              cnp.float64_t pop, dtype_t g,
                              Py_ssize_t n_bins, Py_ssize_t mid_bin,
                              cnp.float64_t p0, cnp.float64_t p1,
-                             Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                             Py_ssize_t s0, Py_ssize_t s1,
+                             Py_ssize_t bucket_shift,
+                             const cnp.float64_t* params) noexcept nogil:
 
     cdef Py_ssize_t i = 0, sum, n
 
@@ -237,7 +245,9 @@ cdef inline void _kernel_threshold(dtype_t_out* out, Py_ssize_t odepth,
                                    cnp.float64_t pop, dtype_t g,
                                    Py_ssize_t n_bins, Py_ssize_t mid_bin,
                                    cnp.float64_t p0, cnp.float64_t p1,
-                                   Py_ssize_t s0, Py_ssize_t s1) noexcept nogil:
+                                   Py_ssize_t s0, Py_ssize_t s1,
+                                   Py_ssize_t bucket_shift,
+                                   const cnp.float64_t* params) noexcept nogil:
 
     cdef int i = 0
     cdef Py_ssize_t sum = 0
@@ -326,8 +336,10 @@ def _percentile(dtype_t[:, ::1] image,
                 signed char shift_x, signed char shift_y, cnp.float64_t p0, cnp.float64_t p1,
                 Py_ssize_t n_bins):
 
+    cdef Py_ssize_t bucket_shift = _bucket_shift(n_bins)
+
     _core(_kernel_percentile[dtype_t_out, dtype_t], image, footprint, mask, out,
-          shift_x, shift_y, p0, 1, 0, 0, n_bins)
+          shift_x, shift_y, p0, 1, 0, 0, n_bins, bucket_shift)
 
 
 def _pop(dtype_t[:, ::1] image,
@@ -8,7 +8,7 @@ from .._shared.version_requirements import require
 from ..exposure import is_low_contrast
 from ..color.colorconv import rgb2gray, rgba2rgb
 from ..io.manage_plugins import call_plugin, _hide_plugin_deprecation_warnings
-from .util import file_or_url_context
+from .util import file_or_url_context, is_url
 
 __all__ = [
     'imread',
@@ -35,7 +35,7 @@ _remove_plugin_param_template = (
     stop_version="0.27",
     template=_remove_plugin_param_template,
 )
-def imread(fname, as_gray=False, plugin=DEPRECATED, **plugin_args):
+def imread(fname, as_gray=False, plugin=DEPRECATED, *, mmap=False, **plugin_args):
     """Load an image from file.
 
     Parameters
@@ -45,6 +45,10 @@ def imread(fname, as_gray=False, plugin=DEPRECATED, **plugin_args):
     as_gray : bool, optional
         If True, convert color images to gray-scale (64-bit floats).
         Images that are already in gray-scale format are not converted.
+    mmap : bool, optional
+        If True, return a read-only memory-mapped view of the image data
+        instead of reading it into memory. Only local uncompressed TIFF files
+        and NumPy ``.npy`` files are supported, and `as_gray` must be False.
 
     Other Parameters
     ----------------
@@ -58,6 +62,12 @@ def imread(fname, as_gray=False, plugin=DEPRECATED, **plugin_args):
         third dimension, such that a gray-image is MxN, an
         RGB-image MxNx3 and an RGBA-image MxNx4.
 
+    Raises
+    ------
+    ValueError
+        If `mmap` is True and the file cannot be memory-mapped, e.g., because
+        its image data are compressed or stored in tiles.
+
     """
     if plugin is DEPRECATED:
         plugin = None
@@ -74,12 +84,19 @@ def imread(fname, as_gray=False, plugin=DEPRECATED, **plugin_args):
     if isinstance(fname, pathlib.Path):
         fname = str(fname.resolve())
 
-    if plugin is None and hasattr(fname, 'lower'):
-        if fname.lower().endswith(('.tiff', '.tif')):
-            plugin = 'tifffile'
-
-    with file_or_url_context(fname) as fname, _hide_plugin_deprecation_warnings():
-        img = call_plugin('imread', fname, plugin=plugin, **plugin_args)
+    if mmap:
+        if as_gray:
+            raise ValueError("`as_gray` is not supported with `mmap=True`")
+        if plugin is not None or plugin_args:
+            raise ValueError("plugins are not supported with `mmap=True`")
+        img = _imread_mmap(fname)
+    else:
+        if plugin is None and hasattr(fname, 'lower'):
+            if fname.lower().endswith(('.tiff', '.tif')):
+                plugin = 'tifffile'
+
+        with file_or_url_context(fname) as fname, _hide_plugin_deprecation_warnings():
+            img = call_plugin('imread', fname, plugin=plugin, **plugin_args)
 
     if not hasattr(img, 'ndim'):
         return img
@@ -97,6 +114,39 @@ def imread(fname, as_gray=False, plugin=DEPRECATED, **plugin_args):
     return img
 
 
+def _imread_mmap(fname):
+    """Memory-map the image data of an uncompressed TIFF or a .npy file."""
+    if is_url(fname) or not isinstance(fname, str):
+        raise ValueError(f"cannot memory-map {fname!r}: not a local file name")
+
+    if fname.lower().endswith('.npy'):
+        try:
+            return np.load(fname, mmap_mode='r', allow_pickle=False)
+        except ValueError as e:
+            raise ValueError(f"cannot memory-map {fname!r}: {e}") from e
+
+    if fname.lower().endswith(('.tiff', '.tif')):
+        import tifffile
+
+        with tifffile.TiffFile(fname) as tif:
+            series = tif.series[0]
+            if series.dataoffset is None:
+                page = series.keyframe
+                if page.compression != tifffile.COMPRESSION.NONE:
+                    reason = f"image data are compressed ({page.compression.name})"
+                elif page.is_tiled:
+                    reason = "image data are stored in tiles"
+                else:
+                    reason = "image data are not stored contiguously"
+                raise ValueError(f"cannot memory-map {fname!r}: {reason}")
+        return tifffile.memmap(fname, mode='r')
+
+    raise ValueError(
+        f"cannot memory-map {fname!r}: only uncompressed TIFF and .npy files "
+        "are supported"
+    )
+
+
 @deprecate_parameter(
     "plugin",
     start_version="0.25",
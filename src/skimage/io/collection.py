@@ -3,7 +3,9 @@
 import os
 from glob import glob
 import re
+from collections import OrderedDict, deque, namedtuple
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor as PoolExecutor
 from copy import copy
 
 import numpy as np
@@ -20,13 +22,22 @@ __all__ = [
 ]
 
 
-def concatenate_images(ic):
+_CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'currsize', 'nbytes'])
+
+
+def concatenate_images(ic, *, workers=1):
     """Concatenate all images in the image collection into an array.
 
     Parameters
     ----------
     ic : an iterable of images
         The images to be concatenated.
+    workers : int or None, optional
+        The number of parallel threads loading the images. With more than one
+        thread, the output array is allocated from the shape and dtype of the
+        first image and the other images are loaded into it concurrently,
+        which requires `ic` to be an ImageCollection or a sequence. If None,
+        use as many threads as there are CPUs.
 
     Returns
     -------
@@ -48,6 +59,11 @@ def concatenate_images(ic):
     ``concatenate_images`` receives any iterable object containing images,
     including ImageCollection and MultiImage, and returns a NumPy array.
     """
+    if workers is None:
+        workers = os.cpu_count()
+    if workers > 1 and isinstance(ic, (ImageCollection, Sequence)) and len(ic):
+        return _concatenate_parallel(ic, workers)
+
     all_images = [image[np.newaxis, ...] for image in ic]
     try:
         array_cat = np.concatenate(all_images)
@@ -56,6 +72,41 @@ def concatenate_images(ic):
     return array_cat
 
 
+def _concatenate_parallel(ic, workers):
+    """Load the images of `ic` in threads into a preallocated array."""
+    # ImageCollection.__getitem__ updates the cache, which is not thread-safe
+    if isinstance(ic, ImageCollection):
+        load = ic._load
+    else:
+        load = ic.__getitem__
+
+    first = np.asarray(load(0))
+    array_cat = np.empty((len(ic),) + first.shape, dtype=first.dtype)
+    array_cat[0] = first
+    # images that need a wider dtype than the first one, like the promotion
+    # in `np.concatenate`, are stored once all images are loaded
+    promoted = {}
+
+    def load_into(n):
+        image = np.asarray(load(n))
+        if image.shape != first.shape:
+            raise ValueError('Image dimensions must agree.')
+        if np.result_type(first.dtype, image.dtype) == first.dtype:
+            array_cat[n] = image
+        else:
+            promoted[n] = image
+
+    with PoolExecutor(max_workers=workers) as executor:
+        # consume the results to raise the errors of the threads, if any
+        list(executor.map(load_into, range(1, len(ic))))
+    if promoted:
+        dtype = np.result_type(first.dtype, *(im.dtype for im in promoted.values()))
+        array_cat = array_cat.astype(dtype)
+        for n, image in promoted.items():
+            array_cat[n] = image
+    return array_cat
+
+
 def alphanumeric_key(s):
     """Convert string to list of strings and ints that gives intuitive sorting.
 
@@ -108,6 +159,13 @@ class ImageCollection:
     conserve_memory : bool, optional
         If True, :class:`skimage.io.ImageCollection` does not keep more than one in
         memory at a specific time. Otherwise, images will be cached once they are loaded.
+        Ignored if `cache_size` or `cache_bytes` is given.
+    cache_size : int, optional
+        Maximum number of images kept in a least-recently-used (LRU) cache.
+    cache_bytes : int, optional
+        Maximum total size, in bytes, of the images kept in a
+        least-recently-used (LRU) cache. Images larger than this are not
+        cached.
 
     Other parameters
     ----------------
@@ -123,6 +181,10 @@ class ImageCollection:
         stores the expanded file list. Otherwise, this is equal to
         `load_pattern`.
 
+    See Also
+    --------
+    ImageCollection.cache_info
+
     Notes
     -----
     Note that files are always returned in alphanumerical order. Also note that slicing
@@ -206,7 +268,14 @@ class ImageCollection:
     """
 
     def __init__(
-        self, load_pattern, conserve_memory=True, load_func=None, **load_func_kwargs
+        self,
+        load_pattern,
+        conserve_memory=True,
+        load_func=None,
+        *,
+        cache_size=None,
+        cache_bytes=None,
+        **load_func_kwargs,
     ):
         """Load and manage a collection of images."""
         self._files = []
@@ -234,7 +303,20 @@ class ImageCollection:
             self._numframes = len(self._files)
             self._frame_index = None
 
-        if conserve_memory:
+        for name, value in [('cache_size', cache_size), ('cache_bytes', cache_bytes)]:
+            if value is not None and value < 0:
+                raise ValueError(f"`{name}` must be non-negative, got {value}")
+        self._cache_size = cache_size
+        self._cache_bytes = cache_bytes
+        self._lru = None
+        self._lru_nbytes = 0
+        self._hits = 0
+        self._misses = 0
+
+        if self._use_lru:
+            self._lru = OrderedDict()
+            memory_slots = 0
+        elif conserve_memory:
             memory_slots = 1
         else:
             memory_slots = self._numframes
@@ -253,6 +335,10 @@ class ImageCollection:
     def conserve_memory(self):
         return self._conserve_memory
 
+    @property
+    def _use_lru(self):
+        return self._cache_size is not None or self._cache_bytes is not None
+
     def _find_images(self):
         index = []
         for fname in self._files:
@@ -304,28 +390,15 @@ class ImageCollection:
 
         if isinstance(n, int):
             n = self._check_imgnum(n)
-            idx = n % len(self.data)
-
-            if (self.conserve_memory and n != self._cached) or (self.data[idx] is None):
-                kwargs = self.load_func_kwargs
-                if self._frame_index:
-                    fname, img_num = self._frame_index[n]
-                    if img_num is not None:
-                        kwargs['img_num'] = img_num
-                    try:
-                        self.data[idx] = self.load_func(fname, **kwargs)
-                    # Account for functions that do not accept an img_num kwarg
-                    except TypeError as e:
-                        if "unexpected keyword argument 'img_num'" in str(e):
-                            del kwargs['img_num']
-                            self.data[idx] = self.load_func(fname, **kwargs)
-                        else:
-                            raise
-                else:
-                    self.data[idx] = self.load_func(self.files[n], **kwargs)
-                self._cached = n
 
-            return self.data[idx]
+            if self._is_cached(n):
+                self._hits += 1
+                return self._get_cached(n)
+
+            self._misses += 1
+            img = self._load(n)
+            self._store(n, img)
+            return img
         else:
             # A slice object was provided, so create a new ImageCollection
             # object. Any loaded image data in the original ImageCollection
@@ -341,8 +414,14 @@ class ImageCollection:
                 new_ic._files = [self._files[i] for i in fidx]
 
             new_ic._numframes = len(fidx)
-
-            if self.conserve_memory:
+            new_ic._hits = new_ic._misses = 0
+
+            if self._use_lru:
+                new_ic._lru = OrderedDict(
+                    (fidx.index(i), img) for i, img in self._lru.items() if i in fidx
+                )
+                new_ic._lru_nbytes = sum(_nbytes(img) for img in new_ic._lru.values())
+            elif self.conserve_memory:
                 if self._cached in fidx:
                     new_ic._cached = fidx.index(self._cached)
                     new_ic.data = np.copy(self.data)
@@ -352,6 +431,97 @@ class ImageCollection:
                 new_ic.data = self.data[fidx]
             return new_ic
 
+    def _is_cached(self, n):
+        """Whether the `n`-th image is in the cache."""
+        if self._use_lru:
+            return n in self._lru
+        if self.conserve_memory:
+            return n == self._cached and self.data[0] is not None
+        return self.data[n] is not None
+
+    def _get_cached(self, n):
+        """Return the cached `n`-th image, marking it as recently used."""
+        if self._use_lru:
+            self._lru.move_to_end(n)
+            return self._lru[n]
+        return self.data[n % len(self.data)]
+
+    def _store(self, n, img):
+        """Put the `n`-th image in the cache, evicting other images if needed."""
+        if not self._use_lru:
+            self.data[n % len(self.data)] = img
+            self._cached = n
+            return
+
+        if n in self._lru:
+            self._lru_nbytes -= _nbytes(self._lru.pop(n))
+        if self._cache_size == 0 or (
+            self._cache_bytes is not None and _nbytes(img) > self._cache_bytes
+        ):
+            # `img` does not fit at all, keep the cache as it is
+            return
+        self._lru[n] = img
+        self._lru_nbytes += _nbytes(img)
+        # Evict the least recently used images
+        while len(self._lru) > 1 and (
+            (self._cache_size is not None and len(self._lru) > self._cache_size)
+            or (self._cache_bytes is not None and self._lru_nbytes > self._cache_bytes)
+        ):
+            _, evicted = self._lru.popitem(last=False)
+            self._lru_nbytes -= _nbytes(evicted)
+
+    def cache_info(self):
+        """Report the usage of the image cache.
+
+        Returns
+        -------
+        info : namedtuple
+            Named tuple with the number of `hits` and `misses` of the cache
+            when indexing the collection, as well as the number of cached
+            images `currsize` and their total size in bytes `nbytes`.
+
+        Examples
+        --------
+        >>> import skimage.io as io
+        >>> data_dir = os.path.join(os.path.dirname(__file__), '../data')
+        >>> coll = io.ImageCollection(data_dir + '/chess*.png', cache_size=1)
+        >>> _ = coll[0], coll[0], coll[1], coll[0]
+        >>> info = coll.cache_info()
+        >>> info.hits, info.misses, info.currsize
+        (1, 3, 1)
+        """
+        if self._use_lru:
+            images = list(self._lru.values())
+        else:
+            images = [img for img in self.data if img is not None]
+        return _CacheInfo(
+            hits=self._hits,
+            misses=self._misses,
+            currsize=len(images),
+            nbytes=sum(_nbytes(img) for img in images),
+        )
+
+    def _load(self, n):
+        """Load the `n`-th image with `load_func`, bypassing the cache.
+
+        This does not modify the collection, so that it can be called
+        concurrently from several threads.
+        """
+        kwargs = dict(self.load_func_kwargs)
+        if self._frame_index:
+            fname, img_num = self._frame_index[n]
+            if img_num is not None:
+                kwargs['img_num'] = img_num
+            try:
+                return self.load_func(fname, **kwargs)
+            # Account for functions that do not accept an img_num kwarg
+            except TypeError as e:
+                if "unexpected keyword argument 'img_num'" in str(e):
+                    del kwargs['img_num']
+                    return self.load_func(fname, **kwargs)
+                raise
+        return self.load_func(self.files[n], **kwargs)
+
     def _check_imgnum(self, n):
         """Check that the given image number is valid."""
         num = self._numframes
@@ -366,6 +536,72 @@ class ImageCollection:
         for i in range(len(self)):
             yield self[i]
 
+    def iter_prefetch(self, workers=None, read_ahead=None):
+        """Iterate over the images, loading the next ones in parallel threads.
+
+        While an image is processed by the caller, the following images are
+        loaded in a thread pool, which overlaps reading and decoding the files
+        with the downstream computations. The images are yielded in order and
+        cached as with indexing.
+
+        Parameters
+        ----------
+        workers : int or None, optional
+            The number of parallel threads loading images. If None, use as
+            many threads as there are CPUs.
+        read_ahead : int or None, optional
+            The number of images loaded ahead of the one being processed.
+            By default, twice the number of threads.
+
+        Yields
+        ------
+        img : ndarray
+            The images of the collection.
+
+        Notes
+        -----
+        `load_func` is called from several threads at once and must therefore
+        be thread-safe.
+
+        Examples
+        --------
+        >>> import skimage.io as io
+        >>> data_dir = os.path.join(os.path.dirname(__file__), '../data')
+        >>> coll = io.ImageCollection(data_dir + '/chess*.png')
+        >>> images = [img for img in coll.iter_prefetch(workers=2)]
+        >>> len(images)
+        2
+        """
+        if workers is None:
+            workers = os.cpu_count()
+        if read_ahead is None:
+            read_ahead = 2 * workers
+        read_ahead = max(int(read_ahead), 1)
+
+        with PoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            try:
+                for n in range(len(self)):
+                    # keep the next `read_ahead` images loading
+                    stop = min(n + 1 + read_ahead, len(self))
+                    for m in range(n + len(pending), stop):
+                        future = None
+                        if not self._is_cached(m):
+                            future = executor.submit(self._load, m)
+                        pending.append(future)
+                    future = pending.popleft()
+                    if future is not None and not self._is_cached(n):
+                        self._misses += 1
+                        img = future.result()
+                        self._store(n, img)
+                        yield img
+                    else:
+                        yield self[n]
+            finally:
+                for future in pending:
+                    if future is not None:
+                        future.cancel()
+
     def __len__(self):
         """Number of images in collection."""
         return self._numframes
@@ -384,10 +620,19 @@ class ImageCollection:
 
         """
         self.data = np.empty_like(self.data)
+        if self._use_lru:
+            self._lru.clear()
+            self._lru_nbytes = 0
 
-    def concatenate(self):
+    def concatenate(self, *, workers=1):
         """Concatenate all images in the collection into an array.
 
+        Parameters
+        ----------
+        workers : int or None, optional
+            The number of parallel threads loading the images, see
+            `skimage.io.concatenate_images`.
+
         Returns
         -------
         ar : np.ndarray
@@ -403,7 +648,12 @@ class ImageCollection:
             If images in the :class:`skimage.io.ImageCollection` do not have identical
             shapes.
         """
-        return concatenate_images(self)
+        return concatenate_images(self, workers=workers)
+
+
+def _nbytes(img):
+    """Size in bytes of a loaded image, for the cache accounting."""
+    return getattr(img, 'nbytes', 0)
 
 
 def imread_collection_wrapper(imread):
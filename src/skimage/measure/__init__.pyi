@@ -6,6 +6,7 @@ __all__ = [
     'find_contours',
     'regionprops',
     'regionprops_table',
+    'RegionpropsCache',
     'perimeter',
     'perimeter_crofton',
     'euler_number',
@@ -49,6 +50,7 @@ from ._regionprops import (
     euler_number,
     regionprops_table,
 )
+from ._regionprops_cache import RegionpropsCache
 from ._polygon import approximate_polygon, subdivide_polygon
 from .pnpoly import points_in_poly, grid_points_in_poly
 from ._moments import (
@@ -265,6 +265,52 @@ cdef inline void join_trees(DTYPE_t *forest, DTYPE_t n, DTYPE_t m) noexcept nogi
         set_root(forest, m, root)
 
 
+def merge_equivalences(DTYPE_t[::1] forest, DTYPE_t[:, ::1] pairs):
+    """
+    Join the trees of all node pairs in-place.
+
+    Args:
+        forest (np.ndarray): Forest of shape (N,), where every node
+            points to a node with a lower or equal index.
+        pairs (np.ndarray): Array of shape (M, 2) with pairs of equivalent
+            nodes.
+    """
+    cdef DTYPE_t i
+    if forest.shape[0] == 0:
+        return
+    cdef DTYPE_t *forest_p = &forest[0]
+    with nogil:
+        for i in range(pairs.shape[0]):
+            join_trees(forest_p, pairs[i, 0], pairs[i, 1])
+
+
+def resolve_forest(DTYPE_t[::1] forest):
+    """
+    Assign consecutive final labels to the trees of a forest.
+
+    The same as :func:`resolve_labels`, but without background: trees are
+    numbered starting at 1 in the order of their roots.
+
+    Args:
+        forest (np.ndarray): Forest of shape (N,).
+
+    Returns:
+        tuple (labels, num): The final label of every node and the number
+        of distinct labels.
+    """
+    cdef DTYPE_t i, counter = 1, n = forest.shape[0]
+    labels = np.empty(n, dtype=DTYPE)
+    cdef DTYPE_t[::1] labels_view = labels
+    with nogil:
+        for i in range(n):
+            if forest[i] == i:
+                labels_view[i] = counter
+                counter += 1
+            else:
+                labels_view[i] = labels_view[forest[i]]
+    return labels, counter - 1
+
+
 def _get_swaps(shp):
     """
     What axes to swap if we want to convert an illegal array shape
@@ -1,5 +1,17 @@
+import itertools
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor as PoolExecutor
+
+import numpy as np
 from scipy import ndimage
-from ._ccomp import label_cython as clabel
+
+from ._ccomp import (
+    _get_swaps,
+    label_cython as clabel,
+    merge_equivalences,
+    resolve_forest,
+)
 
 
 def _label_bool(image, background=None, return_num=False, connectivity=None):
@@ -30,7 +42,302 @@ def _label_bool(image, background=None, return_num=False, connectivity=None):
         return result[0]
 
 
-def label(label_image, background=None, return_num=False, connectivity=None):
+def _normalize_chunks(chunks, shape):
+    """Expand `chunks` into a sequence of block lengths for every axis.
+
+    Examples
+    --------
+    >>> _normalize_chunks(2, (5, 4))
+    ((2, 2, 1), (2, 2))
+    >>> _normalize_chunks((3, 4), (5, 4))
+    ((3, 2), (4,))
+    >>> _normalize_chunks(((1, 4), (4,)), (5, 4))
+    ((1, 4), (4,))
+    """
+    if np.isscalar(chunks):
+        chunks = (chunks,) * len(shape)
+    if len(chunks) != len(shape):
+        raise ValueError(
+            f'`chunks` must have one entry per image axis ({len(shape)}), '
+            f'got {len(chunks)}.'
+        )
+    normalized = []
+    for chunk, length in zip(chunks, shape):
+        if np.isscalar(chunk):
+            chunk = int(chunk)
+            if chunk < 1:
+                raise ValueError(f'Chunk lengths must be positive, got {chunk}.')
+            full, remainder = divmod(length, chunk)
+            chunk = (chunk,) * full + ((remainder,) if remainder else ())
+        else:
+            chunk = tuple(int(c) for c in chunk)
+            if sum(chunk) != length or any(c < 1 for c in chunk):
+                raise ValueError(
+                    f'Chunk lengths {chunk} do not partition an axis '
+                    f'of length {length}.'
+                )
+        normalized.append(chunk)
+    return tuple(normalized)
+
+
+def _chunk_slices(chunks):
+    """Slices of all blocks of normalized `chunks`, in raster order.
+
+    Examples
+    --------
+    >>> _chunk_slices(((2, 1), (4,)))
+    [(slice(0, 2, None), slice(0, 4, None)), (slice(2, 3, None), slice(0, 4, None))]
+    """
+    bounds = [np.cumsum((0,) + c) for c in chunks]
+    return [
+        tuple(slice(int(b[i]), int(b[i + 1])) for b, i in zip(bounds, idx))
+        for idx in itertools.product(*(range(len(c)) for c in chunks))
+    ]
+
+
+def _scan_axes(label_image):
+    """Order of the axes in which :func:`label` numbers the labels of
+    `label_image` when it is not chunked.
+
+    The Cython implementation moves axes of length 1 to the front before
+    scanning the image, see :func:`skimage.measure._ccomp.reshape_array`.
+    """
+    axes = list(range(label_image.ndim))
+    if label_image.dtype != bool:
+        for one, two in _get_swaps(label_image.shape):
+            axes[one], axes[two] = axes[two], axes[one]
+    return axes
+
+
+def _first_indices(labels, num, start, shape, axes):
+    """Scan index into an image of `shape` of the first pixel of every label
+    in `labels`, a block of that image beginning at `start`.
+
+    The image is scanned in C order after transposing it to `axes`. The
+    order of pixels inside a block is the same as in the full image.
+    """
+    labels = labels.transpose(axes)
+    start = [start[ax] for ax in axes]
+    shape = [shape[ax] for ax in axes]
+    flat = labels.ravel()
+    first = np.full(num + 1, flat.size, dtype=np.intp)
+    np.minimum.at(first, flat, np.arange(flat.size))
+    local = np.unravel_index(first[1:], labels.shape)
+    return np.ravel_multi_index(tuple(idx + s for idx, s in zip(local, start)), shape)
+
+
+def _face_offsets(ndim, axis, connectivity):
+    """Neighbor offsets that cross a block face orthogonal to `axis`."""
+    for offset in itertools.product((-1, 0, 1), repeat=ndim):
+        if offset[axis] == 1 and np.count_nonzero(offset) <= connectivity:
+            yield offset
+
+
+def _face_slices(shape, axis, position):
+    """Slices selecting the planes ``position - 1`` and `position` along
+    `axis` of an image of `shape`."""
+    face = [slice(None)] * len(shape)
+    face[axis] = slice(position - 1, position + 1)
+    return tuple(face)
+
+
+def _face_equivalences(label_image, labels, axis, position, connectivity):
+    """Pairs of provisional `labels` that touch across the block face between
+    ``position - 1`` and `position` along `axis`.
+
+    `labels` holds the provisional labels of these two planes only.
+    """
+    ndim = label_image.ndim
+    image = np.asarray(label_image[_face_slices(label_image.shape, axis, position)])
+    labels = np.asarray(labels)
+
+    # Slices selecting a pixel and its neighbor at `offset`
+    index = {-1: slice(1, None), 0: slice(None), 1: slice(None, -1)}
+    neighbor = {-1: slice(None, -1), 0: slice(None), 1: slice(1, None)}
+    for offset in _face_offsets(ndim, axis, connectivity):
+        src = tuple(index[o] for o in offset)
+        dst = tuple(neighbor[o] for o in offset)
+        connected = (image[src] == image[dst]) & (labels[src] > 0)
+        yield np.stack([labels[src][connected], labels[dst][connected]], axis=1)
+
+
+def _imap(func, iterable, workers):
+    """Lazily map `func` over `iterable` on `workers` threads.
+
+    Results are yielded in order. At most ``2 * workers`` results are
+    pending at a time, so that memory stays bounded for long iterables.
+    """
+    if workers == 1:
+        yield from map(func, iterable)
+        return
+    with PoolExecutor(max_workers=workers) as ex:
+        pending = deque()
+        for item in iterable:
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+            pending.append(ex.submit(func, item))
+        while pending:
+            yield pending.popleft().result()
+
+
+def _slabs(shape, workers):
+    """Split the first axis longer than 1 into `workers` slabs."""
+    chunks = [(length,) for length in shape]
+    for axis, length in enumerate(shape):
+        if length > 1:
+            n_slabs = min(workers, length)
+            size, remainder = divmod(length, n_slabs)
+            chunks[axis] = (size + 1,) * remainder + (size,) * (n_slabs - remainder)
+            break
+    return tuple(chunks)
+
+
+def _label_chunked(
+    label_image, background, return_num, connectivity, chunks, out, workers=1
+):
+    """Label `label_image` block by block and merge labels across blocks.
+
+    See :func:`label` for a description of the parameters.
+    """
+    shape = label_image.shape
+    ndim = label_image.ndim
+    if connectivity is None:
+        connectivity = ndim
+    if not 1 <= connectivity <= ndim:
+        raise ValueError(
+            f'Connectivity for {ndim}D image should '
+            f'be in [1, ..., {ndim}]. Got {connectivity}.'
+        )
+    chunks = _normalize_chunks(chunks, shape)
+    if out is None:
+        out = np.empty(shape, dtype=np.intp)
+    elif out.shape != shape:
+        raise ValueError(
+            f'`out` has shape {out.shape}, expected the shape of `label_image` {shape}.'
+        )
+
+    blocks = _chunk_slices(chunks)
+    faces = [
+        (axis, int(position))
+        for axis in range(ndim)
+        for position in np.cumsum(chunks[axis])[:-1]
+    ]
+
+    # The provisional labels can exceed the final number of labels, only
+    # store them in `out` if its dtype can hold any of them. Otherwise, keep
+    # the provisional labels of the planes on either side of every block face
+    # and label every block again in the second pass.
+    out_dtype = np.dtype(out.dtype)
+    if out_dtype.kind in 'iu' and np.iinfo(out_dtype).max >= np.iinfo(np.intp).max:
+        face_labels = None
+    else:
+        face_labels = {}
+        for axis, position in faces:
+            face_shape = list(shape)
+            face_shape[axis] = 2
+            face_labels[axis, position] = np.zeros(face_shape, dtype=np.intp)
+
+    axes = _scan_axes(label_image)
+
+    def block_labels(block):
+        labels, num = label(
+            np.asarray(label_image[block]),
+            background=background,
+            return_num=True,
+            connectivity=connectivity,
+        )
+        return labels.astype(np.intp, copy=False), num
+
+    def label_block(block):
+        labels, num = block_labels(block)
+        first = _first_indices(labels, num, [sl.start for sl in block], shape, axes)
+        return labels, num, first
+
+    def store_face_labels(block, labels):
+        for axis in range(ndim):
+            # the first plane of the block is after a face, the last before
+            for side, position, plane in (
+                (1, block[axis].start, 0),
+                (0, block[axis].stop, -1),
+            ):
+                if (axis, position) not in face_labels:
+                    continue
+                index = list(block)
+                index[axis] = side
+                face_labels[axis, position][tuple(index)] = np.take(
+                    labels, plane, axis=axis
+                )
+
+    # First pass: label every block on its own and store the provisional
+    # labels, offset to be unique across blocks
+    num_provisional = 0
+    offsets = []
+    first = []
+    for block, (labels, num, block_first) in zip(
+        blocks, _imap(label_block, blocks, workers)
+    ):
+        first.append(block_first)
+        offsets.append(num_provisional)
+        np.add(labels, num_provisional, out=labels, where=labels > 0)
+        if face_labels is None:
+            out[block] = labels
+        else:
+            store_face_labels(block, labels)
+        num_provisional += num
+    first = np.concatenate(first) if first else np.empty(0, dtype=np.intp)
+
+    # Sort the nodes of the forest by the first pixel of their provisional
+    # label, so that the trees are rooted at the pixel where the in-memory
+    # scan would have started a new label
+    order = np.argsort(first, kind='stable')
+    node = np.empty_like(order)
+    node[order] = np.arange(num_provisional)
+    forest = np.arange(num_provisional, dtype=np.intp)
+
+    def face_equivalences(face):
+        if face_labels is None:
+            labels = out[_face_slices(shape, *face)]
+        else:
+            labels = face_labels.pop(face)
+        return list(_face_equivalences(label_image, labels, *face, connectivity))
+
+    for face_pairs in _imap(face_equivalences, faces, workers):
+        for pairs in face_pairs:
+            merge_equivalences(forest, np.ascontiguousarray(node[pairs - 1]))
+    final, num = resolve_forest(forest)
+
+    # Second pass: replace the provisional labels by the final ones
+    lut = np.zeros(num_provisional + 1, dtype=np.intp)
+    lut[1:] = final[node]
+
+    def relabel_block(item):
+        block, offset = item
+        if face_labels is None:
+            labels = np.asarray(out[block])
+        else:
+            labels, _ = block_labels(block)
+            np.add(labels, offset, out=labels, where=labels > 0)
+        out[block] = lut[labels]
+
+    for _ in _imap(relabel_block, zip(blocks, offsets), workers):
+        pass
+
+    if return_num:
+        return out, num
+    else:
+        return out
+
+
+def label(
+    label_image,
+    background=None,
+    return_num=False,
+    connectivity=None,
+    *,
+    chunks=None,
+    out=None,
+    workers=1,
+):
     r"""Label connected regions of an integer array.
 
     Two pixels are connected when they are neighbors and have the same value.
@@ -61,12 +368,39 @@ def label(label_image, background=None, return_num=False, connectivity=None):
         as a neighbor.
         Accepted values are ranging from  1 to input.ndim. If ``None``, a full
         connectivity of ``input.ndim`` is used.
+    chunks : int or tuple of int or tuple of tuple of int, optional
+        If given, label `label_image` block by block instead of loading it
+        into memory as a whole. Only one block, or the two planes on either
+        side of a block face, are read into memory at a time, which allows
+        labeling arrays that are larger than the available memory, e.g., a
+        :class:`numpy.memmap`, a Zarr or a Dask array. A single integer is
+        the length of the blocks along every axis, a tuple of integers is the
+        shape of a block, and a tuple of tuples lists the lengths of the
+        blocks along every axis. The result is identical to the one of
+        labeling the full image.
+
+        .. versionadded:: 0.26
+    out : array-like, optional
+        Array with the same shape as `label_image` to write the labels to,
+        e.g., a writable :class:`numpy.memmap` or Zarr array. Its dtype must
+        be able to hold the number of labels. By default, a new array of
+        dtype ``intp`` is created.
+
+        .. versionadded:: 0.26
+    workers : int or None, optional
+        The number of parallel threads to use. If set to ``None``, the full
+        set of available cores are used. Unless `chunks` is given, the image
+        is split into one slab per thread along its first axis. Slabs are
+        labeled concurrently and labels are merged across slab boundaries,
+        which gives the same result as labeling with a single thread.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
     labels : ndarray of dtype int
         Labeled array, where all connected regions are assigned the
-        same integer value.
+        same integer value. This is `out` if it was given.
     num : int, optional
         Number of labels, which equals the maximum label index and is only
         returned if return_num is `True`.
@@ -76,6 +410,20 @@ def label(label_image, background=None, return_num=False, connectivity=None):
     skimage.measure.regionprops
     skimage.measure.regionprops_table
 
+    Notes
+    -----
+    When `chunks` is given, every block is labeled independently first, and
+    the provisional labels are written to `out`. Labels of neighboring pixels
+    that belong to different blocks are then merged with a union-find pass
+    over the block faces, and finally the labels in `out` are replaced block
+    by block with labels numbered in the same order as :func:`label` numbers
+    them without chunks. If the dtype of `out` is narrower than ``intp``, it
+    cannot hold the provisional labels: only the ones of the planes on either
+    side of the block faces are kept in memory, and every block is labeled
+    again before writing its final labels. With several `workers`, the
+    blocks are labeled and relabeled on a thread pool; the Cython labeling
+    kernel releases the GIL.
+
     References
     ----------
     .. [1] Christophe Fiorio and Jens Gustedt, "Two linear time Union-Find
@@ -110,16 +458,37 @@ def label(label_image, background=None, return_num=False, connectivity=None):
     ...               [1, 1, 5],
     ...               [0, 0, 0]])
     >>> print(label(x))
+    [[1 0 0]
+     [1 1 2]
+     [0 0 0]]
+    >>> print(label(x, chunks=2))
     [[1 0 0]
      [1 1 2]
      [0 0 0]]
     """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunks is None and workers > 1 and label_image.size > 0:
+        chunks = _slabs(label_image.shape, workers)
+    if chunks is not None:
+        return _label_chunked(
+            label_image, background, return_num, connectivity, chunks, out, workers
+        )
+
     if label_image.dtype == bool:
-        return _label_bool(
+        result = _label_bool(
             label_image,
             background=background,
-            return_num=return_num,
+            return_num=True,
             connectivity=connectivity,
         )
     else:
-        return clabel(label_image, background, return_num, connectivity)
+        result = clabel(label_image, background, True, connectivity)
+
+    if out is not None:
+        out[...] = result[0]
+        result = (out, result[1])
+    if return_num:
+        return result
+    else:
+        return result[0]
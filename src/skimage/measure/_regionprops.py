@@ -12,6 +12,7 @@ from scipy.spatial.distance import pdist
 from . import _moments
 from ._find_contours import find_contours
 from ._marching_cubes_lewiner import marching_cubes
+from ._regionprops_cache import RegionpropsCache
 from ._regionprops_utils import (
     _normalize_spacing,
     euler_number,
@@ -240,7 +241,12 @@ def _cached(f):
             return f(obj)
 
         if prop not in cache:
-            cache[prop] = f(obj)
+            if obj._shared_cache is None:
+                cache[prop] = f(obj)
+            else:
+                cache[prop] = obj._shared_cache.get(
+                    obj._shared_cache_key(prop), lambda: f(obj)
+                )
 
         return cache[prop]
 
@@ -356,6 +362,12 @@ class RegionProperties:
         self._label_image = label_image
         self._intensity_image = intensity_image
 
+        if isinstance(cache_active, RegionpropsCache):
+            self._shared_cache = cache_active
+            cache_active = True
+        else:
+            self._shared_cache = None
+        self._image_key = None
         self._cache_active = cache_active
         self._cache = {}
         self._ndim = label_image.ndim
@@ -440,6 +452,14 @@ class RegionProperties:
         # Fallback to default behavior, potentially raising an attribute error
         return self.__getattribute__(attr)
 
+    def _shared_cache_key(self, prop):
+        """Key of `prop` of this region in the shared cache."""
+        if self._image_key is None:
+            self._image_key = self._shared_cache.image_key(
+                self._label_image, self._intensity_image, self._spacing, self._offset
+            )
+        return self._image_key + (self.label, prop)
+
     def __setattr__(self, name, value):
         if name in PROPS:
             super().__setattr__(PROPS[name], value)
@@ -970,6 +990,108 @@ def _props_to_dict(regions, properties=('label', 'bbox'), separator='-'):
     return out
 
 
+def _columnar_props_to_dict(
+    table, columnar, properties, *, separator, label_image, **kwargs
+):
+    """Convert region properties into a column dictionary, like
+    :func:`_props_to_dict`, with `columnar` properties taken from `table`.
+
+    The remaining properties are computed per region with
+    :func:`regionprops`, which is called with `label_image` and `kwargs`.
+    """
+    if len(columnar) < len(properties):
+        regions = regionprops(label_image, **kwargs)
+    out = {}
+    for prop in properties:
+        if prop not in columnar:
+            out.update(_props_to_dict(regions, properties=[prop], separator=separator))
+            continue
+        values = np.asarray(getattr(table, PROPS.get(prop, prop)))
+        dtype = COL_DTYPES[PROPS.get(prop, prop)]
+        if values.ndim == 1:
+            out[prop] = values.astype(dtype)
+            continue
+        for ind in np.ndindex(values.shape[1:]):
+            column = separator.join(map(str, (prop,) + ind))
+            out[column] = values[(slice(None),) + ind].astype(dtype)
+    return out
+
+
+def _tiled_props_to_dict(
+    label_image,
+    intensity_image,
+    properties,
+    *,
+    separator,
+    extra_properties,
+    spacing,
+    chunks,
+):
+    """Compute :func:`regionprops_table` tile by tile."""
+    from ._regionprops_tiled import TiledRegionProperties
+
+    _check_label_image(label_image)
+    if extra_properties is not None:
+        raise ValueError('`extra_properties` are not supported with `chunks`.')
+    not_tiled = [
+        prop
+        for prop in properties
+        if not TiledRegionProperties.is_tiled(PROPS.get(prop, prop), label_image.ndim)
+    ]
+    if not_tiled:
+        raise ValueError(
+            f'Properties {not_tiled} cannot be accumulated over tiles; '
+            f'compute them without `chunks`.'
+        )
+    if intensity_image is None:
+        for prop in properties:
+            if PROPS.get(prop, prop) in _require_intensity_image:
+                raise AttributeError(
+                    f"Attribute '{prop}' unavailable when `intensity_image` "
+                    f"has not been specified."
+                )
+
+    table = TiledRegionProperties(
+        label_image, intensity_image=intensity_image, spacing=spacing, chunks=chunks
+    )
+    if len(table) == 0:
+        # Columns of the right type, from a table without chunks
+        ndim = label_image.ndim
+        if intensity_image is not None:
+            intensity_image = np.zeros(
+                (1,) * ndim + intensity_image.shape[ndim:],
+                dtype=intensity_image.dtype,
+            )
+        return regionprops_table(
+            np.zeros((1,) * ndim, dtype=label_image.dtype),
+            intensity_image,
+            properties,
+            separator=separator,
+            spacing=spacing,
+        )
+    return _columnar_props_to_dict(
+        table, properties, properties, separator=separator, label_image=label_image
+    )
+
+
+def _check_label_image(label_image):
+    """Raise if `label_image` is not a 2D or 3D image of integer labels."""
+    if label_image.ndim not in (2, 3):
+        raise TypeError('Only 2-D and 3-D images supported.')
+
+    if not np.issubdtype(label_image.dtype, np.integer):
+        if np.issubdtype(label_image.dtype, bool):
+            raise TypeError(
+                'Non-integer image types are ambiguous: '
+                'use skimage.measure.label to label the connected '
+                'components of label_image, '
+                'or label_image.astype(np.uint8) to interpret '
+                'the True values as a single label.'
+            )
+        else:
+            raise TypeError('Non-integer label_image types are ambiguous')
+
+
 def regionprops_table(
     label_image,
     intensity_image=None,
@@ -979,6 +1101,8 @@ def regionprops_table(
     separator='-',
     extra_properties=None,
     spacing=None,
+    vectorized=False,
+    chunks=None,
 ):
     """Compute region properties and return them as a pandas-compatible table.
 
@@ -1012,10 +1136,15 @@ def regionprops_table(
         For a list of available properties, please see :func:`regionprops`.
         Users should remember to add "label" to keep track of region
         identities.
-    cache : bool, optional
+    cache : bool or RegionpropsCache, optional
         Determine whether to cache calculated properties. The computation is
         much faster for cached properties, whereas the memory consumption
-        increases.
+        increases. If a :class:`skimage.measure.RegionpropsCache` is given,
+        properties are also stored in it and reused by later calls on the
+        same images.
+
+        .. versionchanged:: 0.26
+            A shared `RegionpropsCache` can be passed.
     separator : str, optional
         For non-scalar properties not listed in OBJECT_COLUMNS, each element
         will appear in its own column, with the index of that element separated
@@ -1038,6 +1167,42 @@ def regionprops_table(
         accept the intensity image as the second argument.
     spacing : tuple of float, shape (ndim,)
         The pixel spacing along each axis of the image.
+    vectorized : bool, optional
+        If True, compute the properties that reduce the pixels of a region,
+        like "area", "bbox", "centroid", the moments, the inertia tensor and
+        the intensity statistics, for all regions at once with a few passes
+        over the label image instead of region by region. This is much faster
+        for images with many regions. All other properties, including
+        `extra_properties`, are still computed region by region. Counts,
+        bounding boxes, centroids, raw moments and intensity extrema and
+        medians are identical to the ones computed region by region for
+        integer pixel coordinates. Properties that sum floating point values
+        (central, normalized and weighted moments, the inertia tensor and the
+        properties derived from it, and the intensity mean and standard
+        deviation) add the pixels in a different order, so they may differ
+        due to floating point rounding.
+
+        .. versionadded:: 0.26
+    chunks : int or tuple, optional
+        If given, `label_image` and `intensity_image` are read tile by tile,
+        so that they can be memory-mapped arrays larger than the available
+        memory, such as a :class:`numpy.memmap`. The tile shape is given as
+        for :func:`skimage.measure.label`. Regions that span several tiles
+        are accumulated into a single row. Only properties that are sums,
+        minima or maxima over the pixels of a region, or are derived from
+        them, can be computed this way: "area", "area_bbox",
+        "axis_major_length", "axis_minor_length", "bbox", "centroid",
+        "centroid_local", "centroid_weighted", "centroid_weighted_local",
+        "eccentricity", "equivalent_diameter_area", "extent",
+        "inertia_tensor", "inertia_tensor_eigvals", "intensity_max",
+        "intensity_mean", "intensity_min", "intensity_std", "label",
+        "moments", "moments_central", "moments_normalized",
+        "moments_weighted", "moments_weighted_central",
+        "moments_weighted_normalized", "num_pixels" and, in 2D,
+        "orientation". Requesting any other property, or passing
+        `extra_properties`, raises a ValueError.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -1128,6 +1293,54 @@ def regionprops_table(
     4      5       112.50        113.0        114.0
 
     """
+    from ._regionprops_columnar import ColumnarRegionProperties
+
+    if chunks is not None:
+        return _tiled_props_to_dict(
+            label_image,
+            intensity_image,
+            properties,
+            separator=separator,
+            extra_properties=extra_properties,
+            spacing=spacing,
+            chunks=chunks,
+        )
+
+    if extra_properties is not None:
+        properties = list(properties) + [prop.__name__ for prop in extra_properties]
+    extra_names = {prop.__name__ for prop in extra_properties or ()}
+    unavailable = _require_intensity_image if intensity_image is None else ()
+    columnar = [
+        prop
+        for prop in properties
+        if vectorized
+        and prop not in extra_names
+        and PROPS.get(prop, prop) not in unavailable
+        and ColumnarRegionProperties.is_columnar(
+            PROPS.get(prop, prop), label_image.ndim
+        )
+    ]
+    if columnar:
+        _check_label_image(label_image)
+        table = ColumnarRegionProperties(
+            label_image,
+            intensity_image=intensity_image,
+            spacing=spacing,
+            cache=cache if isinstance(cache, RegionpropsCache) else None,
+        )
+        if len(table) > 0:
+            return _columnar_props_to_dict(
+                table,
+                columnar,
+                properties,
+                separator=separator,
+                label_image=label_image,
+                intensity_image=intensity_image,
+                cache=cache,
+                extra_properties=extra_properties,
+                spacing=spacing,
+            )
+
     regions = regionprops(
         label_image,
         intensity_image=intensity_image,
@@ -1135,8 +1348,6 @@ def regionprops_table(
         extra_properties=extra_properties,
         spacing=spacing,
     )
-    if extra_properties is not None:
-        properties = list(properties) + [prop.__name__ for prop in extra_properties]
     if len(regions) == 0:
         ndim = label_image.ndim
         label_image = np.zeros((3,) * ndim, dtype=int)
@@ -1194,10 +1405,15 @@ def regionprops(
 
         .. versionchanged:: 0.18.0
             The ability to provide an extra dimension for channels was added.
-    cache : bool, optional
+    cache : bool or RegionpropsCache, optional
         Determine whether to cache calculated properties. The computation is
         much faster for cached properties, whereas the memory consumption
-        increases.
+        increases. If a :class:`skimage.measure.RegionpropsCache` is given,
+        properties are also stored in it and reused by later calls on the
+        same images.
+
+        .. versionchanged:: 0.26
+            A shared `RegionpropsCache` can be passed.
     extra_properties : iterable of callables
         Add extra property computation functions that are not included with
         skimage. The name of the property is derived from the function name
@@ -1421,20 +1637,7 @@ def regionprops(
 
     """
 
-    if label_image.ndim not in (2, 3):
-        raise TypeError('Only 2-D and 3-D images supported.')
-
-    if not np.issubdtype(label_image.dtype, np.integer):
-        if np.issubdtype(label_image.dtype, bool):
-            raise TypeError(
-                'Non-integer image types are ambiguous: '
-                'use skimage.measure.label to label the connected '
-                'components of label_image, '
-                'or label_image.astype(np.uint8) to interpret '
-                'the True values as a single label.'
-            )
-        else:
-            raise TypeError('Non-integer label_image types are ambiguous')
+    _check_label_image(label_image)
 
     if offset is None:
         offset_arr = np.zeros((label_image.ndim,), dtype=int)
@@ -1447,6 +1650,18 @@ def regionprops(
                 f'{offset} was provided.'
             )
 
+    image_key = None
+    if isinstance(cache, RegionpropsCache):
+        image_key = cache.image_key(
+            label_image,
+            intensity_image,
+            _normalize_spacing(
+                np.full(label_image.ndim, 1.0) if spacing is None else spacing,
+                label_image.ndim,
+            ),
+            offset_arr,
+        )
+
     regions = []
 
     objects = ndi.find_objects(label_image)
@@ -1466,6 +1681,7 @@ def regionprops(
             extra_properties=extra_properties,
             offset=offset_arr,
         )
+        props._image_key = image_key
         regions.append(props)
 
     return regions
@@ -0,0 +1,160 @@
+"""Region property cache shared across calls of `regionprops`."""
+
+import hashlib
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+CacheInfo = namedtuple(
+    'CacheInfo', ['hits', 'misses', 'entries', 'nbytes', 'max_bytes']
+)
+
+
+def _nbytes(value):
+    """Approximate memory footprint of a cached property value."""
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return value.nbytes + sum(_nbytes(v) for v in value.flat)
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(_nbytes(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def _array_digest(array):
+    """Digest of the shape, dtype and values of `array`."""
+    if array is None:
+        return None
+    array = np.ascontiguousarray(array)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f'{array.shape}{array.dtype.str}'.encode())
+    digest.update(array.reshape(-1).view(np.uint8))
+    return digest.hexdigest()
+
+
+class RegionpropsCache:
+    """Least recently used cache of region properties.
+
+    Region properties computed with a cache are stored under a key made of
+    a hash of the label and intensity images, the pixel spacing, the offset,
+    the region label and the property name. Passing the same cache to
+    several calls of :func:`skimage.measure.regionprops` or
+    :func:`skimage.measure.regionprops_table` on identical images thus
+    computes every property only once. When the cached values exceed
+    `max_bytes`, the least recently used ones are evicted.
+
+    Images are hashed when properties are computed, so they must not be
+    modified in place while the objects returned by `regionprops` are in
+    use. The cache can safely be shared between threads.
+
+    .. versionadded:: 0.26
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Memory budget of the cached values, in bytes.
+
+    Examples
+    --------
+    >>> from skimage import data, measure
+    >>> label_image = measure.label(data.coins() > 110)
+    >>> cache = measure.RegionpropsCache(max_bytes=2**20)
+    >>> first = measure.regionprops(label_image, cache=cache)[0].area
+    >>> second = measure.regionprops(label_image, cache=cache)[0].area
+    >>> cache.info().hits
+    1
+    >>> cache.clear()
+    >>> len(cache)
+    0
+    """
+
+    def __init__(self, max_bytes=2**28):
+        self.max_bytes = max_bytes
+        self._values = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return f'<RegionpropsCache: {self.info()}>'
+
+    def info(self):
+        """Cache statistics.
+
+        Returns
+        -------
+        info : CacheInfo
+            Named tuple with the number of `hits` and `misses` since the cache
+            was created or cleared, the number of cached `entries`, their
+            memory footprint `nbytes` and the budget `max_bytes`.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                len(self._values),
+                self._nbytes,
+                self.max_bytes,
+            )
+
+    def clear(self):
+        """Remove all cached values and reset the statistics."""
+        with self._lock:
+            self._values.clear()
+            self._nbytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def image_key(self, label_image, intensity_image, spacing, offset=None):
+        """Key of the images the properties are computed on.
+
+        Parameters
+        ----------
+        label_image : ndarray
+            Label image.
+        intensity_image : ndarray or None
+            Intensity image.
+        spacing : ndarray
+            The pixel spacing along each axis of the image.
+        offset : ndarray, optional
+            Coordinates of the origin of the label image.
+
+        Returns
+        -------
+        key : tuple
+        """
+        return (
+            _array_digest(label_image),
+            _array_digest(intensity_image),
+            tuple(float(s) for s in spacing),
+            None if offset is None else tuple(int(o) for o in offset),
+        )
+
+    def get(self, key, compute):
+        """Return the value cached under `key`, calling `compute` on a miss."""
+        with self._lock:
+            if key in self._values:
+                self._hits += 1
+                self._values.move_to_end(key)
+                return self._values[key][0]
+            self._misses += 1
+
+        value = compute()
+        nbytes = _nbytes(value)
+        if nbytes > self.max_bytes:
+            return value
+        with self._lock:
+            if key in self._values:
+                return self._values[key][0]
+            self._values[key] = (value, nbytes)
+            self._nbytes += nbytes
+            while self._nbytes > self.max_bytes:
+                _, (_, evicted) = self._values.popitem(last=False)
+                self._nbytes -= evicted
+        return value
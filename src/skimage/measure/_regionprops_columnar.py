@@ -0,0 +1,482 @@
+"""Vectorized computation of region properties for all regions at once."""
+
+import itertools
+from math import pi as PI
+
+import numpy as np
+
+from ._regionprops import _cached
+from ._regionprops_utils import _normalize_spacing
+
+
+# Properties that `ColumnarRegionProperties` computes for all regions in a
+# single pass over the label image
+COLUMNAR_PROPS = {
+    'area',
+    'area_bbox',
+    'axis_major_length',
+    'axis_minor_length',
+    'bbox',
+    'centroid',
+    'centroid_local',
+    'centroid_weighted',
+    'centroid_weighted_local',
+    'eccentricity',
+    'equivalent_diameter_area',
+    'extent',
+    'inertia_tensor',
+    'inertia_tensor_eigvals',
+    'intensity_max',
+    'intensity_mean',
+    'intensity_median',
+    'intensity_min',
+    'intensity_std',
+    'label',
+    'moments',
+    'moments_central',
+    'moments_normalized',
+    'moments_weighted',
+    'moments_weighted_central',
+    'moments_weighted_normalized',
+    'num_pixels',
+    'orientation',
+}
+
+_ONLY_2D = {'eccentricity', 'orientation'}
+
+
+def _unit_powers(ndim):
+    """Moment indices of the first order moments along every axis."""
+    return [tuple(np.eye(ndim, dtype=int)[axis]) for axis in range(ndim)]
+
+
+def _moments_from_deltas(rows, n_regions, deltas, weights=None, order=3):
+    """Moments up to `order` of every region from per-pixel coordinates.
+
+    Parameters
+    ----------
+    rows : (N,) ndarray of int
+        Region index of every foreground pixel.
+    n_regions : int
+        Number of regions.
+    deltas : list of (N,) ndarray
+        Coordinate of every pixel along each axis, relative to the origin of
+        the moments.
+    weights : (N,) ndarray, optional
+        Weight of every pixel.
+
+    Returns
+    -------
+    moments : (n_regions, order + 1, ..., order + 1) ndarray
+    """
+    ndim = len(deltas)
+    powers_of_delta = [
+        [None] + [delta**k for k in range(1, order + 1)] for delta in deltas
+    ]
+    moments = np.empty((n_regions,) + (order + 1,) * ndim)
+    for powers in itertools.product(range(order + 1), repeat=ndim):
+        w = weights
+        for axis, power in enumerate(powers):
+            if power == 0:
+                continue
+            pw = powers_of_delta[axis][power]
+            w = pw if w is None else w * pw
+        moments[(slice(None),) + powers] = np.bincount(
+            rows, weights=w, minlength=n_regions
+        )
+    return moments
+
+
+def _moments_normalized(mu, spacing, order=3):
+    """Vectorized :func:`skimage.measure.moments_normalized`.
+
+    The first axis of `mu` indexes regions.
+    """
+    ndim = len(spacing)
+    nu = np.zeros_like(mu)
+    mu0 = mu[(slice(None),) + (0,) * ndim]
+    scale = min(spacing)
+    for powers in itertools.product(range(order + 1), repeat=ndim):
+        index = (slice(None),) + powers
+        if sum(powers) < 2:
+            nu[index] = np.nan
+        else:
+            nu[index] = (mu[index] / scale ** sum(powers)) / (
+                mu0 ** (sum(powers) / ndim + 1)
+            )
+    return nu
+
+
+class ColumnarRegionProperties:
+    """Properties of all regions of a label image, computed at once.
+
+    Every property is an array whose first axis indexes the regions in the
+    order of their labels, with the same values as the corresponding property
+    of :class:`skimage.measure._regionprops.RegionProperties`. Instead of
+    iterating over regions in Python, properties are reduced over the whole
+    label image with :func:`numpy.bincount` and sorting.
+
+    Parameters
+    ----------
+    label_image : (M, N[, P]) ndarray of int
+        Label image. Labels with value 0 are ignored.
+    intensity_image : (M, N[, P][, C]) ndarray, optional
+        Intensity image of same shape as label image, plus optionally a
+        trailing channel axis.
+    spacing : tuple of float, shape (ndim,), optional
+        The pixel spacing along each axis of the image.
+    cache : RegionpropsCache, optional
+        Shared cache in which the properties of all regions are stored.
+    """
+
+    def __init__(self, label_image, intensity_image=None, *, spacing=None, cache=None):
+        ndim = label_image.ndim
+        if intensity_image is not None:
+            if not (
+                intensity_image.shape[:ndim] == label_image.shape
+                and intensity_image.ndim in [ndim, ndim + 1]
+            ):
+                raise ValueError(
+                    'Label and intensity image shapes must match,'
+                    ' except for channel (last) axis.'
+                )
+            self._multichannel = label_image.shape < intensity_image.shape
+        else:
+            self._multichannel = False
+
+        self._label_image = label_image
+        self._intensity_image = intensity_image
+        self._ndim = ndim
+        if spacing is None:
+            spacing = np.full(ndim, 1.0)
+        self._spacing = _normalize_spacing(spacing, ndim)
+        self._pixel_area = np.prod(self._spacing)
+        self._cache = {}
+        self._cache_active = True
+        self._shared_cache = cache
+        self._image_key = None
+
+    def __len__(self):
+        return len(self.label)
+
+    def _shared_cache_key(self, prop):
+        """Key of `prop` of all regions in the shared cache."""
+        if self._image_key is None:
+            self._image_key = self._shared_cache.image_key(
+                self._label_image, self._intensity_image, self._spacing
+            )
+        return self._image_key + (None, prop)
+
+    @staticmethod
+    def is_columnar(prop, ndim):
+        """Whether `prop` is computed by this class for an image of `ndim`."""
+        return prop in COLUMNAR_PROPS and not (ndim > 2 and prop in _ONLY_2D)
+
+    @property
+    @_cached
+    def _pixels(self):
+        """Region index, raveled index and coordinates of every foreground
+        pixel."""
+        flat = self._label_image.ravel()
+        index = np.flatnonzero(flat > 0)
+        values = flat[index]
+        counts = np.bincount(values)
+        label = np.flatnonzero(counts)
+        lut = np.zeros(counts.size, dtype=np.intp)
+        lut[label] = np.arange(label.size)
+        rows = lut[values]
+        coords = np.unravel_index(index, self._label_image.shape)
+        return rows, index, coords, label, counts[label]
+
+    @property
+    @_cached
+    def _local_coords(self):
+        """Scaled pixel coordinates relative to their region's bounding box."""
+        rows, _, coords, _, _ = self._pixels
+        start = self.bbox[:, : self._ndim]
+        return [
+            (coords[axis] - start[rows, axis]) * self._spacing[axis]
+            for axis in range(self._ndim)
+        ]
+
+    @property
+    @_cached
+    def _intensities(self):
+        """Intensities of every foreground pixel, with shape (N, C)."""
+        index = self._pixels[1]
+        n_channels = self._intensity_image.shape[-1] if self._multichannel else 1
+        image = self._intensity_image.reshape(-1, n_channels)
+        return image[index]
+
+    def _per_channel(self, func):
+        """Apply `func` to the intensities of every channel and stack the
+        results along a trailing channel axis, if the image has channels."""
+        intensities = self._intensities.astype(np.float64, copy=False)
+        results = [func(intensities[:, c]) for c in range(intensities.shape[1])]
+        if self._multichannel:
+            return np.stack(results, axis=-1)
+        return results[0]
+
+    @property
+    def label(self):
+        return self._pixels[3]
+
+    @property
+    def num_pixels(self):
+        return self._pixels[4]
+
+    @property
+    def area(self):
+        return self.num_pixels * self._pixel_area
+
+    @property
+    @_cached
+    def bbox(self):
+        rows, _, coords, _, _ = self._pixels
+        bbox = np.empty((len(self), 2 * self._ndim), dtype=np.intp)
+        for axis in range(self._ndim):
+            start = np.full(len(self), np.iinfo(np.intp).max)
+            stop = np.full(len(self), -1)
+            np.minimum.at(start, rows, coords[axis])
+            np.maximum.at(stop, rows, coords[axis])
+            bbox[:, axis] = start
+            bbox[:, self._ndim + axis] = stop + 1
+        return bbox
+
+    @property
+    def area_bbox(self):
+        extent = self.bbox[:, self._ndim :] - self.bbox[:, : self._ndim]
+        return np.prod(extent, axis=1) * self._pixel_area
+
+    @property
+    def centroid(self):
+        # Averaging the scaled coordinates themselves, as `regionprops` does,
+        # is exact for integer coordinates, unlike shifting `centroid_local`
+        rows, _, coords, _, _ = self._pixels
+        return np.stack(
+            [
+                np.bincount(rows, weights=c * s, minlength=len(self)) / self.num_pixels
+                for c, s in zip(coords, self._spacing)
+            ],
+            axis=1,
+        )
+
+    @property
+    @_cached
+    def centroid_local(self):
+        rows = self._pixels[0]
+        return np.stack(
+            [
+                np.bincount(rows, weights=coords, minlength=len(self)) / self.num_pixels
+                for coords in self._local_coords
+            ],
+            axis=1,
+        )
+
+    @property
+    def eccentricity(self):
+        l1 = self.inertia_tensor_eigvals[:, 0]
+        l2 = self.inertia_tensor_eigvals[:, -1]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(l1 == 0, 0, np.sqrt(1 - l2 / np.where(l1 == 0, 1, l1)))
+
+    @property
+    def equivalent_diameter_area(self):
+        return (2 * self._ndim * self.area / PI) ** (1 / self._ndim)
+
+    @property
+    def extent(self):
+        return self.area / self.area_bbox
+
+    @property
+    @_cached
+    def inertia_tensor(self):
+        mu = self.moments_central
+        ndim = self._ndim
+        mu0 = mu[(slice(None),) + (0,) * ndim]
+        corners2 = [tuple(2 * np.eye(ndim, dtype=int)[axis]) for axis in range(ndim)]
+        second = np.stack([mu[(slice(None),) + c] for c in corners2], axis=1)
+        result = np.zeros((len(self), ndim, ndim), dtype=mu.dtype)
+        diag = (second.sum(axis=1, keepdims=True) - second) / mu0[:, np.newaxis]
+        result[:, np.arange(ndim), np.arange(ndim)] = diag
+        for dims in itertools.combinations(range(ndim), 2):
+            mu_index = np.zeros(ndim, dtype=int)
+            mu_index[list(dims)] = 1
+            value = -mu[(slice(None),) + tuple(mu_index)] / mu0
+            result[:, dims[0], dims[1]] = value
+            result[:, dims[1], dims[0]] = value
+        return result
+
+    @property
+    @_cached
+    def inertia_tensor_eigvals(self):
+        eigvals = np.linalg.eigvalsh(self.inertia_tensor)
+        eigvals = np.clip(eigvals, 0, None, out=eigvals)
+        return eigvals[:, ::-1]
+
+    @property
+    def intensity_max(self):
+        rows = self._pixels[0]
+
+        def reduce(values):
+            out = np.full(len(self), -np.inf)
+            np.maximum.at(out, rows, values)
+            return out
+
+        return self._per_channel(reduce)
+
+    @property
+    @_cached
+    def intensity_mean(self):
+        rows = self._pixels[0]
+        return self._per_channel(
+            lambda values: (
+                np.bincount(rows, weights=values, minlength=len(self)) / self.num_pixels
+            )
+        )
+
+    @property
+    def intensity_median(self):
+        rows = self._pixels[0]
+        n = self.num_pixels
+        start = np.cumsum(n) - n
+
+        def reduce(values):
+            values = values[np.lexsort((values, rows))]
+            return (values[start + (n - 1) // 2] + values[start + n // 2]) / 2
+
+        return self._per_channel(reduce)
+
+    @property
+    def intensity_min(self):
+        rows = self._pixels[0]
+
+        def reduce(values):
+            out = np.full(len(self), np.inf)
+            np.minimum.at(out, rows, values)
+            return out
+
+        return self._per_channel(reduce)
+
+    @property
+    def intensity_std(self):
+        rows = self._pixels[0]
+        mean = self.intensity_mean
+        if not self._multichannel:
+            mean = mean[:, np.newaxis]
+        channels = iter(range(mean.shape[1]))
+
+        def reduce(values):
+            deviation = values - mean[rows, next(channels)]
+            variance = np.bincount(rows, weights=deviation**2, minlength=len(self))
+            return np.sqrt(variance / self.num_pixels)
+
+        return self._per_channel(reduce)
+
+    @property
+    def axis_major_length(self):
+        ev = self.inertia_tensor_eigvals
+        if self._ndim == 2:
+            return 4 * np.sqrt(ev[:, 0])
+        elif self._ndim == 3:
+            return np.sqrt(np.maximum(0, 10 * (ev[:, 0] + ev[:, 1] - ev[:, 2])))
+        else:
+            raise ValueError("axis_major_length only available in 2D and 3D")
+
+    @property
+    def axis_minor_length(self):
+        ev = self.inertia_tensor_eigvals
+        if self._ndim == 2:
+            return 4 * np.sqrt(ev[:, -1])
+        elif self._ndim == 3:
+            return np.sqrt(np.maximum(0, 10 * (-ev[:, 0] + ev[:, 1] + ev[:, 2])))
+        else:
+            raise ValueError("axis_minor_length only available in 2D and 3D")
+
+    @property
+    @_cached
+    def moments(self):
+        rows = self._pixels[0]
+        return _moments_from_deltas(rows, len(self), self._local_coords)
+
+    @property
+    @_cached
+    def moments_central(self):
+        rows = self._pixels[0]
+        centroid = self.centroid_local
+        deltas = [
+            coords - centroid[rows, axis]
+            for axis, coords in enumerate(self._local_coords)
+        ]
+        return _moments_from_deltas(rows, len(self), deltas)
+
+    @property
+    def moments_normalized(self):
+        return _moments_normalized(self.moments_central, self._spacing)
+
+    @property
+    def orientation(self):
+        T = self.inertia_tensor
+        a, b, c = T[:, 0, 0], T[:, 0, 1], T[:, 1, 1]
+        return np.where(
+            a - c == 0,
+            np.where(b < 0, PI / 4.0, -PI / 4.0),
+            0.5 * np.arctan2(-2 * b, c - a),
+        )
+
+    @property
+    def centroid_weighted(self):
+        start = self.bbox[:, : self._ndim] * self._spacing
+        if self._multichannel:
+            start = start[..., np.newaxis]
+        return self.centroid_weighted_local + start
+
+    @property
+    def centroid_weighted_local(self):
+        M = self.moments_weighted
+        M0 = M[(slice(None),) + (0,) * self._ndim]
+        return np.stack(
+            [M[(slice(None),) + e] / M0 for e in _unit_powers(self._ndim)], axis=1
+        )
+
+    @property
+    @_cached
+    def moments_weighted(self):
+        rows = self._pixels[0]
+        return self._per_channel(
+            lambda values: _moments_from_deltas(
+                rows, len(self), self._local_coords, weights=values
+            )
+        )
+
+    @property
+    @_cached
+    def moments_weighted_central(self):
+        rows = self._pixels[0]
+        centroid = self.centroid_weighted_local
+        if not self._multichannel:
+            centroid = centroid[..., np.newaxis]
+        channels = iter(range(centroid.shape[-1]))
+
+        def reduce(values):
+            c = next(channels)
+            deltas = [
+                coords - centroid[rows, axis, c]
+                for axis, coords in enumerate(self._local_coords)
+            ]
+            return _moments_from_deltas(rows, len(self), deltas, weights=values)
+
+        return self._per_channel(reduce)
+
+    @property
+    def moments_weighted_normalized(self):
+        mu = self.moments_weighted_central
+        if self._multichannel:
+            return np.stack(
+                [
+                    _moments_normalized(mu[..., c], self._spacing)
+                    for c in range(mu.shape[-1])
+                ],
+                axis=-1,
+            )
+        return _moments_normalized(mu, self._spacing)
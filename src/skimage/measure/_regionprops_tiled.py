@@ -0,0 +1,278 @@
+"""Region properties of label images that are processed tile by tile."""
+
+import numpy as np
+
+from ._label import _chunk_slices, _normalize_chunks
+from ._regionprops import _cached
+from ._regionprops_columnar import (
+    COLUMNAR_PROPS,
+    ColumnarRegionProperties,
+    _moments_from_deltas,
+)
+
+
+# Properties whose values are derived from sums, minima and maxima over the
+# pixels of a region, which can be accumulated exactly across tiles
+TILED_PROPS = COLUMNAR_PROPS - {'intensity_median'}
+
+
+class TiledRegionProperties(ColumnarRegionProperties):
+    """Properties of all regions of a label image, accumulated over tiles.
+
+    Only one tile of `label_image` and `intensity_image` is loaded in memory
+    at a time, so both can be memory-mapped arrays or any other array-like
+    supporting slicing. Per-tile sums, minima and maxima of every region are
+    combined into the values of the whole region, which are the same as the
+    ones of :class:`ColumnarRegionProperties` up to floating point rounding.
+
+    Every group of properties needs its own pass over the tiles: one for the
+    pixel counts, bounding boxes and centroids, one for the intensity sums
+    and extrema, and one for each kind of moments and for the intensity
+    standard deviation.
+
+    Parameters
+    ----------
+    label_image : (M, N[, P]) array_like of int
+        Label image. Labels with value 0 are ignored.
+    intensity_image : (M, N[, P][, C]) array_like, optional
+        Intensity image of same shape as label image, plus optionally a
+        trailing channel axis.
+    spacing : tuple of float, shape (ndim,), optional
+        The pixel spacing along each axis of the image.
+    chunks : int or tuple
+        Shape of the tiles, see :func:`skimage.measure.label`.
+    """
+
+    def __init__(self, label_image, intensity_image=None, *, spacing=None, chunks):
+        super().__init__(label_image, intensity_image=intensity_image, spacing=spacing)
+        self._tile_slices = _chunk_slices(_normalize_chunks(chunks, label_image.shape))
+
+    @staticmethod
+    def is_tiled(prop, ndim):
+        """Whether `prop` can be accumulated over tiles for an image of
+        `ndim`."""
+        return prop in TILED_PROPS and ColumnarRegionProperties.is_columnar(prop, ndim)
+
+    @property
+    def _pixels(self):
+        raise NotImplementedError(
+            'Property requires all pixels of a region at once and cannot be '
+            'accumulated over tiles.'
+        )
+
+    def _tiles(self, intensity=False):
+        """Yield the labels, region index, coordinates and intensities of
+        the foreground pixels of every tile."""
+        if self._multichannel:
+            n_channels = self._intensity_image.shape[-1]
+        else:
+            n_channels = 1
+        for tile in self._tile_slices:
+            labels = np.asarray(self._label_image[tile])
+            index = np.flatnonzero(labels > 0)
+            if index.size == 0:
+                continue
+            tile_labels, rows = np.unique(labels.ravel()[index], return_inverse=True)
+            coords = np.unravel_index(index, labels.shape)
+            coords = [c + s.start for c, s in zip(coords, tile)]
+            image = None
+            if intensity:
+                image = np.asarray(self._intensity_image[tile])
+                image = image.reshape(-1, n_channels)[index].astype(np.float64)
+            yield tile_labels, rows.reshape(-1), coords, image
+
+    def _accumulate(self, reduce, intensity=False):
+        """Sum the values returned by `reduce` for every tile.
+
+        `reduce` is called with the index of the regions of a tile among all
+        regions, the region index within the tile and the local coordinates
+        (see :attr:`ColumnarRegionProperties._local_coords`) of every pixel,
+        and its intensities. It returns an array whose first axis indexes the
+        regions of the tile.
+        """
+        start = self.bbox[:, : self._ndim]
+        total = None
+        for tile_labels, rows, coords, image in self._tiles(intensity):
+            regions = np.searchsorted(self.label, tile_labels)
+            local = [
+                (coords[axis] - start[regions[rows], axis]) * self._spacing[axis]
+                for axis in range(self._ndim)
+            ]
+            partial = reduce(regions, rows, local, image)
+            if total is None:
+                total = np.zeros((len(self),) + partial.shape[1:])
+            total[regions] += partial
+        return total
+
+    def _channels(self, values):
+        """Drop the trailing channel axis of `values` without channels."""
+        return values if self._multichannel else values[..., 0]
+
+    @property
+    @_cached
+    def _label_stats(self):
+        """Labels, pixel counts, bounding boxes and coordinate sums."""
+        ndim = self._ndim
+        parts = []
+        for tile_labels, rows, coords, _ in self._tiles():
+            n = len(tile_labels)
+            bbox = np.empty((n, 2 * ndim), dtype=np.intp)
+            bbox[:, :ndim] = np.iinfo(np.intp).max
+            bbox[:, ndim:] = -1
+            for axis in range(ndim):
+                np.minimum.at(bbox[:, axis], rows, coords[axis])
+                np.maximum.at(bbox[:, ndim + axis], rows, coords[axis] + 1)
+            sums = np.stack(
+                [np.bincount(rows, weights=c, minlength=n) for c in coords], axis=1
+            )
+            parts.append((tile_labels, np.bincount(rows, minlength=n), bbox, sums))
+
+        if not parts:
+            return (
+                np.empty(0, dtype=np.intp),
+                np.empty(0, dtype=np.intp),
+                np.empty((0, 2 * ndim), dtype=np.intp),
+                np.empty((0, ndim)),
+            )
+        tile_labels, counts, bboxes, sums = (np.concatenate(p) for p in zip(*parts))
+        label, regions = np.unique(tile_labels, return_inverse=True)
+        regions = regions.reshape(-1)
+        num_pixels = np.zeros(len(label), dtype=np.intp)
+        np.add.at(num_pixels, regions, counts)
+        bbox = np.empty((len(label), 2 * ndim), dtype=np.intp)
+        bbox[:, :ndim] = np.iinfo(np.intp).max
+        bbox[:, ndim:] = -1
+        np.minimum.at(bbox[:, :ndim], regions, bboxes[:, :ndim])
+        np.maximum.at(bbox[:, ndim:], regions, bboxes[:, ndim:])
+        coord_sums = np.zeros((len(label), ndim))
+        np.add.at(coord_sums, regions, sums)
+        return label, num_pixels, bbox, coord_sums
+
+    @property
+    def label(self):
+        return self._label_stats[0]
+
+    @property
+    def num_pixels(self):
+        return self._label_stats[1]
+
+    @property
+    def bbox(self):
+        return self._label_stats[2]
+
+    @property
+    def centroid(self):
+        _, num_pixels, _, coord_sums = self._label_stats
+        return coord_sums / num_pixels[:, np.newaxis] * self._spacing
+
+    @property
+    @_cached
+    def centroid_local(self):
+        _, num_pixels, bbox, coord_sums = self._label_stats
+        mean = coord_sums / num_pixels[:, np.newaxis]
+        return (mean - bbox[:, : self._ndim]) * self._spacing
+
+    @property
+    @_cached
+    def _intensity_stats(self):
+        """Intensity sums, minima and maxima, with a trailing channel axis."""
+        n_channels = self._intensity_image.shape[-1] if self._multichannel else 1
+        sums = np.zeros((len(self), n_channels))
+        minima = np.full((len(self), n_channels), np.inf)
+        maxima = np.full((len(self), n_channels), -np.inf)
+        for tile_labels, rows, _, image in self._tiles(intensity=True):
+            regions = np.searchsorted(self.label, tile_labels)[rows]
+            np.add.at(sums, regions, image)
+            np.minimum.at(minima, regions, image)
+            np.maximum.at(maxima, regions, image)
+        return sums, minima, maxima
+
+    @property
+    def intensity_max(self):
+        return self._channels(self._intensity_stats[2])
+
+    @property
+    @_cached
+    def intensity_mean(self):
+        sums = self._intensity_stats[0]
+        return self._channels(sums / self.num_pixels[:, np.newaxis])
+
+    @property
+    def intensity_min(self):
+        return self._channels(self._intensity_stats[1])
+
+    @property
+    def intensity_std(self):
+        mean = self.intensity_mean
+        if not self._multichannel:
+            mean = mean[:, np.newaxis]
+
+        def reduce(regions, rows, local, image):
+            deviation = image - mean[regions[rows]]
+            return np.stack(
+                [
+                    np.bincount(rows, weights=d**2, minlength=len(regions))
+                    for d in deviation.T
+                ],
+                axis=1,
+            )
+
+        variance = self._accumulate(reduce, intensity=True)
+        return self._channels(np.sqrt(variance / self.num_pixels[:, np.newaxis]))
+
+    @property
+    @_cached
+    def moments(self):
+        def reduce(regions, rows, local, image):
+            return _moments_from_deltas(rows, len(regions), local)
+
+        return self._accumulate(reduce)
+
+    @property
+    @_cached
+    def moments_central(self):
+        centroid = self.centroid_local
+
+        def reduce(regions, rows, local, image):
+            deltas = [
+                coords - centroid[regions[rows], axis]
+                for axis, coords in enumerate(local)
+            ]
+            return _moments_from_deltas(rows, len(regions), deltas)
+
+        return self._accumulate(reduce)
+
+    @property
+    @_cached
+    def moments_weighted(self):
+        def reduce(regions, rows, local, image):
+            return np.stack(
+                [
+                    _moments_from_deltas(rows, len(regions), local, weights=values)
+                    for values in image.T
+                ],
+                axis=-1,
+            )
+
+        return self._channels(self._accumulate(reduce, intensity=True))
+
+    @property
+    @_cached
+    def moments_weighted_central(self):
+        centroid = self.centroid_weighted_local
+        if not self._multichannel:
+            centroid = centroid[..., np.newaxis]
+
+        def reduce(regions, rows, local, image):
+            moments = []
+            for c, values in enumerate(image.T):
+                deltas = [
+                    coords - centroid[regions[rows], axis, c]
+                    for axis, coords in enumerate(local)
+                ]
+                moments.append(
+                    _moments_from_deltas(rows, len(regions), deltas, weights=values)
+                )
+            return np.stack(moments, axis=-1)
+
+        return self._channels(self._accumulate(reduce, intensity=True))
@@ -8,6 +8,7 @@ import numpy as np
 from scipy import ndimage as ndi
 
 from .footprints import _footprint_is_sequence, pad_footprint
+from .gray import _line_extremum, _line_offsets
 from .misc import default_footprint
 from .._shared.utils import deprecate_func
 
@@ -17,22 +18,39 @@ def _iterate_binary_func(binary_func, image, footprint, out, border_value):
 
     binary_func is a binary morphology function that accepts "structure",
     "output" and "iterations" keyword arguments
-    (e.g. `scipy.ndimage.binary_erosion`).
+    (e.g. `scipy.ndimage.binary_erosion`). Line footprints are applied with
+    a running minimum or maximum instead, whose cost does not depend on the
+    length of the line.
     """
-    fp, num_iter = footprint[0]
-    binary_func(
-        image, structure=fp, output=out, iterations=num_iter, border_value=border_value
-    )
-    for fp, num_iter in footprint[1:]:
-        # Note: out.copy() because the computation cannot be in-place!
-        #       SciPy <= 1.7 did not automatically make a copy if needed.
+
+    def apply(image, fp, num_iter):
+        maximum = binary_func is ndi.binary_dilation
+        # `binary_dilation` mirrors the footprint
+        line = _line_offsets(fp, mirror=maximum)
+        if (
+            line is not None
+            and num_iter >= 1
+            and binary_func in (ndi.binary_erosion, ndi.binary_dilation)
+        ):
+            kwargs = dict(out=out, maximum=maximum, mode="constant", cval=border_value)
+            if _line_extremum(np.asarray(image, dtype=bool), *line, **kwargs):
+                for _ in range(1, num_iter):
+                    _line_extremum(out.copy(), *line, **kwargs)
+                return
         binary_func(
-            out.copy(),
+            image,
             structure=fp,
             output=out,
             iterations=num_iter,
             border_value=border_value,
         )
+
+    fp, num_iter = footprint[0]
+    apply(image, fp, num_iter)
+    for fp, num_iter in footprint[1:]:
+        # Note: out.copy() because the computation cannot be in-place!
+        #       SciPy <= 1.7 did not automatically make a copy if needed.
+        apply(out.copy(), fp, num_iter)
     return out
 
 
@@ -5,6 +5,7 @@ Grayscale morphological operations
 import numpy as np
 from scipy import ndimage as ndi
 
+from ._line_morphology_cy import _running_extremum
 from .footprints import _footprint_is_sequence, mirror_footprint, pad_footprint
 from .misc import default_footprint
 
@@ -12,23 +13,224 @@ from .misc import default_footprint
 __all__ = ['erosion', 'dilation', 'opening', 'closing', 'white_tophat', 'black_tophat']
 
 
+# Modes of `scipy.ndimage` and their equivalent for `numpy.pad`
+_NUMPY_PAD_MODES = {
+    "reflect": "symmetric",
+    "mirror": "reflect",
+    "nearest": "edge",
+    "wrap": "wrap",
+    "constant": "constant",
+}
+
+
+def _line_offsets(footprint, mirror=False):
+    """Return the axis and the first and last offset of a line footprint.
+
+    Offsets are relative to the center of `footprint` and negated if `mirror`
+    is true. Returns None unless the nonzero elements of `footprint` are
+    consecutive along a single axis.
+    """
+    fp = np.asarray(footprint)
+    if fp.ndim == 0 or sum(s > 1 for s in fp.shape) > 1:
+        return None
+    axis = int(np.argmax(fp.shape))
+    line = fp.reshape(-1).astype(bool)
+    (indices,) = np.nonzero(line)
+    if indices.size < 2 or indices[-1] - indices[0] + 1 != indices.size:
+        return None
+    center = fp.shape[axis] // 2
+    start, stop = int(indices[0]) - center, int(indices[-1]) - center
+    if mirror:
+        start, stop = -stop, -start
+    return axis, start, stop
+
+
+def _line_extremum(image, axis, start, stop, out, *, maximum, mode, cval):
+    """Running minimum or maximum of `image` along `axis`.
+
+    Sets ``out[..., i, ...]`` to the extremum of ``image[..., i + start, ...]``
+    to ``image[..., i + stop, ...]``, where values past the edges are given
+    by `mode` and `cval` as in `scipy.ndimage`. The cost per pixel does not
+    depend on the length of the line. Returns False without touching `out` if
+    `image` or the arguments are not supported, so that the caller can fall
+    back to `scipy.ndimage`, e.g. for non-native byte order or images with
+    NaN.
+    """
+    image = np.asarray(image)
+    pad_before, pad_after = max(-start, 0), max(stop, 0)
+    if (
+        mode not in _NUMPY_PAD_MODES
+        or image.ndim == 0
+        or image.shape[axis] <= max(pad_before, pad_after)
+    ):
+        return False
+    if not image.dtype.isnative:
+        return False
+    if image.dtype == bool:
+        image = image.view(np.uint8)
+    elif image.dtype.kind not in "iuf" or image.dtype == np.float16:
+        return False
+    elif image.dtype.kind == "f" and np.isnan(image).any():
+        # NaN do not propagate like in `scipy.ndimage`
+        return False
+    pad_kwargs = {"mode": _NUMPY_PAD_MODES[mode]}
+    if mode == "constant":
+        constant = np.asarray(cval).astype(image.dtype)
+        if constant != cval:
+            return False
+        pad_kwargs["constant_values"] = constant
+
+    lines = np.moveaxis(image, axis, -1)
+    pad_width = [(0, 0)] * (image.ndim - 1) + [(pad_before, pad_after)]
+    padded = np.pad(lines, pad_width, **pad_kwargs)
+    padded = np.ascontiguousarray(padded).reshape(-1, padded.shape[-1])
+    size = stop - start + 1
+    windows = np.empty((padded.shape[0], padded.shape[1] - size + 1), image.dtype)
+    _running_extremum(padded, windows, size, maximum)
+
+    first = start + pad_before
+    windows = windows[:, first : first + image.shape[axis]]
+    np.moveaxis(out, axis, -1)[...] = windows.reshape(lines.shape)
+    return True
+
+
 def _iterate_gray_func(gray_func, image, footprints, out, mode, cval):
     """Helper to call `gray_func` for each footprint in a sequence.
 
     `gray_func` is a morphology function that accepts `footprint`, `output`,
     `mode` and `cval` keyword arguments (e.g. `scipy.ndimage.grey_erosion`).
+    Line footprints are applied with a running minimum or maximum instead,
+    whose cost does not depend on the length of the line.
     """
+
+    def apply(image, fp):
+        maximum = gray_func is ndi.grey_dilation
+        # `grey_dilation` mirrors the footprint
+        line = _line_offsets(fp, mirror=maximum)
+        if line is not None and gray_func in (ndi.grey_erosion, ndi.grey_dilation):
+            applied = _line_extremum(
+                image, *line, out=out, maximum=maximum, mode=mode, cval=cval
+            )
+            if applied:
+                return
+        gray_func(image, footprint=fp, output=out, mode=mode, cval=cval)
+
     fp, num_iter = footprints[0]
-    gray_func(image, footprint=fp, output=out, mode=mode, cval=cval)
+    apply(image, fp)
     for _ in range(1, num_iter):
-        gray_func(out.copy(), footprint=fp, output=out, mode=mode, cval=cval)
+        apply(out.copy(), fp)
     for fp, num_iter in footprints[1:]:
         # Note: out.copy() because the computation cannot be in-place!
         for _ in range(num_iter):
-            gray_func(out.copy(), footprint=fp, output=out, mode=mode, cval=cval)
+            apply(out.copy(), fp)
     return out
 
 
+def _separable_factors(footprint):
+    """Split `footprint` into one 1D footprint per axis, if it is separable.
+
+    A footprint is separable if it is the outer product of its projections
+    onto the axes, e.g. a (padded) rectangle. Eroding or dilating with each
+    factor in turn then gives exactly the same result as with `footprint`.
+    Returns None if `footprint` is not separable.
+    """
+    fp = footprint.astype(bool, copy=False)
+    factors = []
+    product = np.ones((1,) * fp.ndim, dtype=bool)
+    for axis in range(fp.ndim):
+        other_axes = tuple(a for a in range(fp.ndim) if a != axis)
+        shape = [1] * fp.ndim
+        shape[axis] = fp.shape[axis]
+        factor = np.any(fp, axis=other_axes).reshape(shape)
+        factors.append(factor)
+        product = product & factor
+    if not np.array_equal(product, fp):
+        return None
+    return factors
+
+
+def _rounded_box_radii(footprint):
+    """Return the radii of `footprint` if it is a dilated box.
+
+    Matches footprints made of all points whose city block distance to a
+    centered box of half-widths `half_widths` is at most `radius`. This
+    includes :func:`diamond`, :func:`octahedron` and :func:`octagon`.
+    Returns None for any other footprint.
+    """
+    fp = footprint.astype(bool, copy=False)
+    center = tuple(s // 2 for s in fp.shape)
+    if fp.ndim < 2 or not fp[center]:
+        return None
+
+    coords = np.nonzero(fp)
+    extents = [
+        int(max(c - coord.min(), coord.max() - c)) for c, coord in zip(center, coords)
+    ]
+    # Along the first axis, the outermost slice is the box itself
+    outer = np.abs(coords[0] - center[0]) == extents[0]
+    half_widths = [extents[0]] + [
+        int(np.abs(coord[outer] - c).max()) for c, coord in zip(center[1:], coords[1:])
+    ]
+    radius = extents[1] - half_widths[1]
+    half_widths[0] -= radius
+    if radius < 0 or half_widths[0] < 0:
+        return None
+
+    distance = sum(
+        np.maximum(np.abs(np.arange(size) - c) - h, 0).reshape(
+            (1,) * axis + (size,) + (1,) * (fp.ndim - axis - 1)
+        )
+        for axis, (size, c, h) in enumerate(zip(fp.shape, center, half_widths))
+    )
+    if not np.array_equal(distance <= radius, fp):
+        return None
+    return half_widths, radius
+
+
+def _decompose_footprint(footprint):
+    """Return a cheaper footprint sequence exactly equivalent to `footprint`.
+
+    Separable footprints such as rectangles are split into 1D footprints
+    along each axis. Boxes dilated by a diamond, e.g. :func:`diamond` or
+    :func:`octagon`, are split into 1D footprints and repeated applications
+    of the cross-shaped footprint of connectivity 1. The number of footprint
+    elements visited per pixel then grows linearly with the radius instead
+    of quadratically. Other footprints, such as disks, have no exact
+    decomposition and are returned as a single element sequence.
+    """
+    fp = np.asarray(footprint)
+    # SciPy already applies full (hyper-)rectangles axis by axis
+    if fp.ndim < 2 or max(fp.shape) <= 3 or fp.all():
+        return [(footprint, 1)]
+    cost = np.count_nonzero(fp)
+
+    factors = _separable_factors(fp)
+    if factors is not None:
+        sequence = [
+            (factor.astype(fp.dtype), 1) for factor in factors if factor.size > 1
+        ]
+        if sum(np.count_nonzero(f) for f, _ in sequence) < cost:
+            return sequence
+
+    radii = _rounded_box_radii(fp)
+    if radii is not None:
+        half_widths, radius = radii
+        sequence = []
+        for axis, h in enumerate(half_widths):
+            if h > 0:
+                shape = (1,) * axis + (2 * h + 1,) + (1,) * (fp.ndim - axis - 1)
+                sequence.append((np.ones(shape, dtype=fp.dtype), 1))
+        if radius > 0:
+            cross = ndi.generate_binary_structure(fp.ndim, 1).astype(fp.dtype)
+            sequence.append((cross, radius))
+        decomposed_cost = sum(2 * h + 1 for h in half_widths if h > 0)
+        decomposed_cost += radius * (2 * fp.ndim + 1)
+        if decomposed_cost < cost:
+            return sequence
+
+    return [(footprint, 1)]
+
+
 def _min_max_to_constant_mode(dtype, mode, cval):
     """Replace 'max' and 'min' with appropriate 'cval' and 'constant' mode."""
     if mode == "max":
@@ -122,7 +324,9 @@ def erosion(
     effect that is the same as ``footprint=np.ones((9, 9))``, but with lower
     computational cost. Most of the builtin footprints such as
     :func:`skimage.morphology.disk` provide an option to automatically generate
-    a footprint sequence of this type.
+    a footprint sequence of this type. Footprints given as a single array that
+    have an exact decomposition, such as rectangles, diamonds and octagons,
+    are decomposed automatically.
 
     For even-sized footprints, :func:`skimage.morphology.binary_erosion` and
     this function produce an output that differs: one is shifted by one pixel
@@ -158,7 +362,7 @@ def erosion(
 
     footprint = pad_footprint(footprint, pad_end=False)
     if not _footprint_is_sequence(footprint):
-        footprint = [(footprint, 1)]
+        footprint = _decompose_footprint(footprint)
 
     out = _iterate_gray_func(
         gray_func=ndi.grey_erosion,
@@ -232,7 +436,9 @@ def dilation(
     effect that is the same as ``footprint=np.ones((9, 9))``, but with lower
     computational cost. Most of the builtin footprints such as
     :func:`skimage.morphology.disk` provide an option to automatically generate
-    a footprint sequence of this type.
+    a footprint sequence of this type. Footprints given as a single array that
+    have an exact decomposition, such as rectangles, diamonds and octagons,
+    are decomposed automatically.
 
     For non-symmetric footprints, :func:`skimage.morphology.binary_dilation`
     and :func:`skimage.morphology.dilation` produce an output that differs:
@@ -271,7 +477,7 @@ def dilation(
     # additional inversion should be removed in skimage2, see gh-6676.
     footprint = mirror_footprint(footprint)
     if not _footprint_is_sequence(footprint):
-        footprint = [(footprint, 1)]
+        footprint = _decompose_footprint(footprint)
 
     out = _iterate_gray_func(
         gray_func=ndi.grey_dilation,
@@ -1,14 +1,11 @@
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor as PoolExecutor
 from itertools import product
+
 import numpy as np
 from .._shared import utils
-from .._shared.utils import warn, deprecate_parameter, DEPRECATED
-
-try:
-    import dask
-
-    dask_available = True
-except ImportError:
-    dask_available = False
+from .._shared.utils import deprecate_parameter, DEPRECATED
 
 
 def _generate_shifts(ndim, multichannel, max_shifts, shift_steps=1):
@@ -47,6 +44,32 @@ def _generate_shifts(ndim, multichannel, max_shifts, shift_steps=1):
     return product(*[range(0, s + 1, t) for s, t in zip(max_shifts, shift_steps)])
 
 
+def _add_unshifted(out, y, shift):
+    """Add ``np.roll(y, [-s for s in shift])`` to `out`, in place.
+
+    The roll is performed by adding blocks of `y` to the corresponding blocks
+    of `out`, so that no rolled copy of `y` is allocated.
+
+    Examples
+    --------
+    >>> y = np.arange(6).reshape(2, 3)
+    >>> out = np.zeros_like(y)
+    >>> _add_unshifted(out, y, (1, 1))
+    >>> np.array_equal(out, np.roll(y, (-1, -1), axis=(0, 1)))
+    True
+    """
+    axis_blocks = []
+    for n, s in zip(y.shape, shift):
+        s %= n
+        blocks = [(slice(0, n - s), slice(s, n))]
+        if s:
+            blocks.append((slice(n - s, n), slice(0, s)))
+        axis_blocks.append(blocks)
+    for blocks in product(*axis_blocks):
+        dst, src = zip(*blocks)
+        out[dst] += y[src]
+
+
 @deprecate_parameter(
     deprecated_name="num_workers",
     new_name="workers",
@@ -85,7 +108,8 @@ def cycle_spin(
         provided, the same step size is used for all axes.
     workers : int or None, optional
         The number of parallel threads to use during cycle spinning. If set to
-        ``None``, the full set of available cores are used.
+        ``None``, the full set of available cores are used. ``func`` must be
+        thread-safe when ``workers > 1``.
     func_kw : dict, optional
         Additional keyword arguments to supply to ``func``.
     channel_axis : int or None, optional
@@ -114,6 +138,10 @@ def cycle_spin(
     For transforms such as the blockwise discrete cosine transform, one may
     wish to evaluate shifts up to the block size used by the transform.
 
+    The shifted outputs are summed into a single accumulator, in the order of
+    the shifts, as soon as they are computed. At most ``workers`` of them are
+    held in memory at once and the result does not depend on ``workers``.
+
     References
     ----------
     .. [1] R.R. Coifman and D.L. Donoho.  "Translation-Invariant De-Noising".
@@ -143,30 +171,33 @@ def cycle_spin(
     roll_axes = tuple(range(x.ndim))
 
     def _run_one_shift(shift):
-        # shift, apply function, inverse shift
+        # shift, apply function
         xs = np.roll(x, shift, axis=roll_axes)
-        tmp = func(xs, **func_kw)
-        return np.roll(tmp, tuple(-s for s in shift), axis=roll_axes)
-
-    if not dask_available and (workers is None or workers > 1):
-        workers = 1
-        warn(
-            'The optional dask dependency is not installed. '
-            'The number of workers is set to 1. To silence '
-            'this warning, install dask or explicitly set `workers=1` '
-            'when calling the `cycle_spin` function',
-            stacklevel=4,
-        )
+        return func(xs, **func_kw)
+
+    if workers is None:
+        workers = os.cpu_count()
+
     # compute a running average across the cycle shifts
-    if workers == 1:
-        # serial processing
-        mean = _run_one_shift(all_shifts[0])
-        for shift in all_shifts[1:]:
-            mean += _run_one_shift(shift)
-        mean /= len(all_shifts)
-    else:
-        # multithreaded via dask
-        futures = [dask.delayed(_run_one_shift)(s) for s in all_shifts]
-        mean = sum(futures) / len(futures)
-        mean = mean.compute(workers=workers)
+    mean = None
+
+    def _accumulate(shift, future):
+        # inverse shift into the accumulator
+        nonlocal mean
+        y = future.result()
+        if mean is None:
+            mean = np.zeros_like(y)
+        _add_unshifted(mean, y, shift)
+
+    with PoolExecutor(max_workers=workers) as executor:
+        # accumulate in the order of the shifts, with at most `workers`
+        # shifted outputs in flight
+        pending = deque()
+        for shift in all_shifts:
+            pending.append((shift, executor.submit(_run_one_shift, shift)))
+            if len(pending) == workers:
+                _accumulate(*pending.popleft())
+        while pending:
+            _accumulate(*pending.popleft())
+    mean /= len(all_shifts)
     return mean
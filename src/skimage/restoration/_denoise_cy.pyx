@@ -5,7 +5,7 @@
 
 cimport numpy as cnp
 import numpy as np
-from libc.math cimport sqrt
+from libc.math cimport sqrt, sqrtf
 from libc.float cimport DBL_MAX
 from .._shared.interpolation cimport get_pixel3d
 from .._shared.fused_numerics cimport np_floats
@@ -205,3 +205,206 @@ def _denoise_tv_bregman(np_floats[:, :, ::1] image, np_floats weight,
 
             rmse = sqrt(rmse / total)
             i += 1
+
+
+cdef inline np_floats _tv_sqrt(np_floats value) noexcept nogil:
+    if np_floats is cnp.float32_t:
+        return sqrtf(value)
+    else:
+        return sqrt(value)
+
+
+cdef inline np_floats _tv_project_2d(np_floats* q, np_floats g0, np_floats g1,
+                                     np_floats tau,
+                                     np_floats scale) noexcept nogil:
+    """Take a projected gradient step on the dual variable `q` of one pixel.
+
+    Returns the norm of the gradient.
+    """
+    cdef np_floats norm = _tv_sqrt(g0 * g0 + g1 * g1)
+    cdef np_floats inv_norm = 1 / (norm * scale + 1)
+    q[0] = (q[0] - tau * g0) * inv_norm
+    q[1] = (q[1] - tau * g1) * inv_norm
+    return norm
+
+
+cdef inline np_floats _tv_project_3d(np_floats* q, np_floats g0, np_floats g1,
+                                     np_floats g2, np_floats tau,
+                                     np_floats scale) noexcept nogil:
+    """Take a projected gradient step on the dual variable `q` of one voxel.
+
+    Returns the norm of the gradient.
+    """
+    cdef np_floats norm = _tv_sqrt(g0 * g0 + g1 * g1 + g2 * g2)
+    cdef np_floats inv_norm = 1 / (norm * scale + 1)
+    q[0] = (q[0] - tau * g0) * inv_norm
+    q[1] = (q[1] - tau * g1) * inv_norm
+    q[2] = (q[2] - tau * g2) * inv_norm
+    return norm
+
+
+def _tv_chambolle_update_out_2d(np_floats[:, ::1] image,
+                                np_floats[:, :, ::1] p,
+                                np_floats[:, ::1] out,
+                                Py_ssize_t start, Py_ssize_t stop):
+    """Set ``out = image - div(p)`` on the rows ``[start, stop)``.
+
+    The components of the dual variable `p` are along its last axis.
+    Returns the sum of the squared divergence over these rows.
+    """
+    cdef:
+        Py_ssize_t cols = image.shape[1]
+        Py_ssize_t r, c
+        np_floats[:, ::1] zeros
+        np_floats* q
+        np_floats* q_prev
+        np_floats d
+        cnp.float64_t energy = 0
+
+    if np_floats is cnp.float32_t:
+        zeros = np.zeros((cols, 2), dtype=np.float32)
+    else:
+        zeros = np.zeros((cols, 2), dtype=np.float64)
+
+    with nogil:
+        for r in range(start, stop):
+            q = &p[r, 0, 0]
+            # the divergence has no contribution from before the first row
+            q_prev = &p[r - 1, 0, 0] if r > 0 else &zeros[0, 0]
+            d = -(q[0] + q[1]) + q_prev[0]
+            out[r, 0] = image[r, 0] + d
+            energy += d * d
+            for c in range(1, cols):
+                d = -(q[2 * c] + q[2 * c + 1]) + q_prev[2 * c] + q[2 * c - 1]
+                out[r, c] = image[r, c] + d
+                energy += d * d
+    return energy
+
+
+def _tv_chambolle_update_p_2d(np_floats[:, ::1] out,
+                              np_floats[:, :, ::1] p,
+                              cnp.float64_t weight,
+                              Py_ssize_t start, Py_ssize_t stop):
+    """Take a projected gradient step on the dual variable `p`, in place, on
+    the rows ``[start, stop)``.
+
+    The components of `p` are along its last axis. Returns the total
+    variation of `out` over these rows.
+    """
+    cdef:
+        Py_ssize_t rows = out.shape[0]
+        Py_ssize_t cols = out.shape[1]
+        Py_ssize_t r, c
+        np_floats tau = 1.0 / 4
+        np_floats scale = tau / weight
+        np_floats* row
+        np_floats* row_next
+        np_floats* q
+        np_floats value
+        cnp.float64_t tv = 0
+
+    with nogil:
+        for r in range(start, stop):
+            row = &out[r, 0]
+            # the gradient along the rows is zero on the last row
+            row_next = &out[r + 1, 0] if r < rows - 1 else row
+            q = &p[r, 0, 0]
+            for c in range(cols - 1):
+                value = row[c]
+                tv += _tv_project_2d(&q[2 * c], row_next[c] - value,
+                                     row[c + 1] - value, tau, scale)
+            c = cols - 1
+            tv += _tv_project_2d(&q[2 * c], row_next[c] - row[c], 0, tau, scale)
+    return tv
+
+
+def _tv_chambolle_update_out_3d(np_floats[:, :, ::1] image,
+                                np_floats[:, :, :, ::1] p,
+                                np_floats[:, :, ::1] out,
+                                Py_ssize_t start, Py_ssize_t stop):
+    """Set ``out = image - div(p)`` on the planes ``[start, stop)``.
+
+    The components of the dual variable `p` are along its last axis.
+    Returns the sum of the squared divergence over these planes.
+    """
+    cdef:
+        Py_ssize_t rows = image.shape[1]
+        Py_ssize_t cols = image.shape[2]
+        Py_ssize_t pln, r, c
+        np_floats[:, ::1] zeros
+        np_floats* q
+        np_floats* q_prev0
+        np_floats* q_prev1
+        np_floats d
+        cnp.float64_t energy = 0
+
+    if np_floats is cnp.float32_t:
+        zeros = np.zeros((cols, 3), dtype=np.float32)
+    else:
+        zeros = np.zeros((cols, 3), dtype=np.float64)
+
+    with nogil:
+        for pln in range(start, stop):
+            for r in range(rows):
+                q = &p[pln, r, 0, 0]
+                # the divergence has no contribution from before the first
+                # plane and row
+                q_prev0 = &p[pln - 1, r, 0, 0] if pln > 0 else &zeros[0, 0]
+                q_prev1 = &p[pln, r - 1, 0, 0] if r > 0 else &zeros[0, 0]
+                d = -(q[0] + q[1] + q[2]) + q_prev0[0] + q_prev1[1]
+                out[pln, r, 0] = image[pln, r, 0] + d
+                energy += d * d
+                for c in range(1, cols):
+                    d = (
+                        -(q[3 * c] + q[3 * c + 1] + q[3 * c + 2])
+                        + q_prev0[3 * c]
+                        + q_prev1[3 * c + 1]
+                        + q[3 * c - 1]
+                    )
+                    out[pln, r, c] = image[pln, r, c] + d
+                    energy += d * d
+    return energy
+
+
+def _tv_chambolle_update_p_3d(np_floats[:, :, ::1] out,
+                              np_floats[:, :, :, ::1] p,
+                              cnp.float64_t weight,
+                              Py_ssize_t start, Py_ssize_t stop):
+    """Take a projected gradient step on the dual variable `p`, in place, on
+    the planes ``[start, stop)``.
+
+    The components of `p` are along its last axis. Returns the total
+    variation of `out` over these planes.
+    """
+    cdef:
+        Py_ssize_t plns = out.shape[0]
+        Py_ssize_t rows = out.shape[1]
+        Py_ssize_t cols = out.shape[2]
+        Py_ssize_t pln, r, c
+        np_floats tau = 1.0 / 6
+        np_floats scale = tau / weight
+        np_floats* row
+        np_floats* row_next0
+        np_floats* row_next1
+        np_floats* q
+        np_floats value
+        cnp.float64_t tv = 0
+
+    with nogil:
+        for pln in range(start, stop):
+            for r in range(rows):
+                row = &out[pln, r, 0]
+                # the gradient along an axis is zero on its last plane or row
+                row_next0 = &out[pln + 1, r, 0] if pln < plns - 1 else row
+                row_next1 = &out[pln, r + 1, 0] if r < rows - 1 else row
+                q = &p[pln, r, 0, 0]
+                for c in range(cols - 1):
+                    value = row[c]
+                    tv += _tv_project_3d(&q[3 * c], row_next0[c] - value,
+                                         row_next1[c] - value,
+                                         row[c + 1] - value, tau, scale)
+                c = cols - 1
+                value = row[c]
+                tv += _tv_project_3d(&q[3 * c], row_next0[c] - value,
+                                     row_next1[c] - value, 0, tau, scale)
+    return tv
@@ -3,10 +3,12 @@
 #cython: boundscheck=False
 #cython: cdivision=True
 
+from concurrent.futures import ThreadPoolExecutor as PoolExecutor
+
 import numpy as np
 cimport numpy as cnp
 
-from .._shared.fast_exp cimport _fast_exp
+from .._shared.fast_exp cimport _fast_exp, _fast_exp_floats
 from .._shared.fused_numerics cimport np_floats
 
 
@@ -312,11 +314,11 @@ def _nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=3] image,
 #-------------- Accelerated algorithm of Froment 2015 ------------------
 
 
-cdef inline cnp.float64_t _integral_to_distance_2d(cnp.float64_t [:, ::] integral,
+cdef inline np_floats _integral_to_distance_2d(np_floats [:, ::1] integral,
                                                    Py_ssize_t row,
                                                    Py_ssize_t col,
                                                    Py_ssize_t offset,
-                                                   cnp.float64_t h2s2) noexcept nogil:
+                                                   np_floats h2s2) noexcept nogil:
     """
     Parameters
     ----------
@@ -349,19 +351,19 @@ cdef inline cnp.float64_t _integral_to_distance_2d(cnp.float64_t [:, ::] integra
     .. [2] Jacques Froment. Parameter-Free Fast Pixelwise Non-Local Means
            Denoising. Image Processing On Line, 2014, vol. 4, pp. 300-326.
     """
-    cdef cnp.float64_t distance = (integral[row + offset, col + offset] +
+    cdef np_floats distance = (integral[row + offset, col + offset] +
                                    integral[row - offset, col - offset] -
                                    integral[row - offset, col + offset] -
                                    integral[row + offset, col - offset])
     return max(distance, 0.0) / h2s2
 
 
-cdef inline cnp.float64_t _integral_to_distance_3d(cnp.float64_t[:, :, ::] integral,
+cdef inline np_floats _integral_to_distance_3d(np_floats [:, :, ::1] integral,
                                                    Py_ssize_t pln,
                                                    Py_ssize_t row,
                                                    Py_ssize_t col,
                                                    Py_ssize_t offset,
-                                                   cnp.float64_t s_cube_h_square) noexcept nogil:
+                                                   np_floats s_cube_h_square) noexcept nogil:
     """
     Parameters
     ----------
@@ -394,7 +396,7 @@ cdef inline cnp.float64_t _integral_to_distance_3d(cnp.float64_t[:, :, ::] integ
     .. [2] Jacques Froment. Parameter-Free Fast Pixelwise Non-Local Means
            Denoising. Image Processing On Line, 2014, vol. 4, pp. 300-326.
     """
-    cdef cnp.float64_t distance = (
+    cdef np_floats distance = (
         integral[pln + offset, row + offset, col + offset] -
         integral[pln - offset, row - offset, col - offset] +
         integral[pln - offset, row - offset, col + offset] +
@@ -406,13 +408,13 @@ cdef inline cnp.float64_t _integral_to_distance_3d(cnp.float64_t[:, :, ::] integ
     return max(distance, 0.0) / (s_cube_h_square)
 
 
-cdef inline cnp.float64_t _integral_to_distance_4d(cnp.float64_t [:, :, :, ::] integral,
+cdef inline np_floats _integral_to_distance_4d(np_floats [:, :, :, ::1] integral,
                                                    Py_ssize_t time,
                                                    Py_ssize_t pln,
                                                    Py_ssize_t row,
                                                    Py_ssize_t col,
                                                    Py_ssize_t offset,
-                                                   cnp.float64_t s4_h_square) noexcept nogil:
+                                                   np_floats s4_h_square) noexcept nogil:
     """
     Parameters
     ----------
@@ -449,7 +451,7 @@ cdef inline cnp.float64_t _integral_to_distance_4d(cnp.float64_t [:, :, :, ::] i
     .. [3] Tapia, E. A note on the computation of high-dimensional integral
            images. Pattern Recognition Letters, 2011, Vol. 32, pp.197-201.
     """
-    cdef cnp.float64_t distance
+    cdef np_floats distance
     distance = (
         integral[time - offset, pln - offset, row - offset, col - offset] -
         integral[time - offset, pln - offset, row - offset, col + offset] -
@@ -470,12 +472,12 @@ cdef inline cnp.float64_t _integral_to_distance_4d(cnp.float64_t [:, :, :, ::] i
     return max(distance, 0.0) / s4_h_square
 
 
-cdef inline void _integral_image_2d(cnp.float64_t [:, :, ::] padded,
-                                    cnp.float64_t [:, ::] integral,
+cdef inline void _integral_image_2d(np_floats [:, :, ::1] padded,
+                                    np_floats [:, ::1] integral,
                                     Py_ssize_t t_row, Py_ssize_t t_col,
                                     Py_ssize_t n_row, Py_ssize_t n_col,
                                     Py_ssize_t n_channels,
-                                    cnp.float64_t var_diff) noexcept nogil:
+                                    np_floats var_diff) noexcept nogil:
     """ Compute the integral of the squared difference between an image
     ``padded`` and the same image shifted by ``(t_row, t_col)``.
 
@@ -493,7 +495,7 @@ cdef inline void _integral_image_2d(cnp.float64_t [:, :, ::] padded,
     n_row : Py_ssize_t
     n_col : Py_ssize_t
     n_channels : Py_ssize_t
-    var_diff : cnp.float64_t
+    var_diff : np_floats
         The double of the expected noise variance.  If non-zero, this
         is used to reduce the apparent patch distances by the expected
         distance due to the noise.
@@ -508,7 +510,7 @@ cdef inline void _integral_image_2d(cnp.float64_t [:, :, ::] padded,
     cdef Py_ssize_t row, col, channel
     cdef Py_ssize_t row_start = max(1, -t_row)
     cdef Py_ssize_t row_end = min(n_row, n_row - t_row)
-    cdef cnp.float64_t t, distance
+    cdef np_floats t, distance
 
     for row in range(row_start, row_end):
         for col in range(1, n_col - t_col):
@@ -524,13 +526,13 @@ cdef inline void _integral_image_2d(cnp.float64_t [:, :, ::] padded,
                                   integral[row - 1, col - 1])
 
 
-cdef inline void _integral_image_3d(cnp.float64_t [:, :, :, ::] padded,
-                                    cnp.float64_t [:, :, ::] integral,
+cdef inline void _integral_image_3d(np_floats [:, :, :, ::1] padded,
+                                    np_floats [:, :, ::1] integral,
                                     Py_ssize_t t_pln, Py_ssize_t t_row,
                                     Py_ssize_t t_col, Py_ssize_t n_pln,
                                     Py_ssize_t n_row, Py_ssize_t n_col,
                                     Py_ssize_t n_channels,
-                                    cnp.float64_t var_diff) noexcept nogil:
+                                    np_floats var_diff) noexcept nogil:
     """Compute the integral of the squared difference between an image ``padded``
     and the same image shifted by ``(t_pln, t_row, t_col)``.
 
@@ -568,7 +570,7 @@ cdef inline void _integral_image_3d(cnp.float64_t [:, :, :, ::] padded,
     cdef Py_ssize_t pln_end = min(n_pln, n_pln - t_pln)
     cdef Py_ssize_t row_start = max(1, -t_row)
     cdef Py_ssize_t row_end = min(n_row, n_row - t_row)
-    cdef cnp.float64_t t, distance
+    cdef np_floats t, distance
 
     for pln in range(pln_start, pln_end):
         for row in range(row_start, row_end):
@@ -591,12 +593,12 @@ cdef inline void _integral_image_3d(cnp.float64_t [:, :, :, ::] padded,
                     integral[pln - 1, row, col - 1])
 
 
-cdef inline void _integral_image_4d(cnp.float64_t [:, :, :, :, ::] padded,
-                                    cnp.float64_t [:, :, :, ::] integral,
+cdef inline void _integral_image_4d(np_floats [:, :, :, :, ::1] padded,
+                                    np_floats [:, :, :, ::1] integral,
                                     Py_ssize_t t_time, Py_ssize_t t_pln, Py_ssize_t t_row,
                                     Py_ssize_t t_col, Py_ssize_t n_time, Py_ssize_t n_pln,
                                     Py_ssize_t n_row, Py_ssize_t n_col, Py_ssize_t n_channels,
-                                    cnp.float64_t var_diff) noexcept nogil:
+                                    np_floats var_diff) noexcept nogil:
     """Compute the integral of the squared difference between an image ``padded``
     and the same image shifted by ``(t_pln, t_row, t_col)``.
 
@@ -619,7 +621,7 @@ cdef inline void _integral_image_4d(cnp.float64_t [:, :, :, :, ::] padded,
     n_pln : Py_ssize_t
     n_row : Py_ssize_t
     n_col : Py_ssize_t
-    var_diff : cnp.float64_t
+    var_diff : np_floats
         The double of the expected noise variance. If non-zero, this
         is used to reduce the apparent patch distances by the expected
         distance due to the noise.
@@ -638,7 +640,7 @@ cdef inline void _integral_image_4d(cnp.float64_t [:, :, :, :, ::] padded,
     cdef Py_ssize_t pln_end = min(n_pln, n_pln - t_pln)
     cdef Py_ssize_t row_start = max(1, -t_row)
     cdef Py_ssize_t row_end = min(n_row, n_row - t_row)
-    cdef cnp.float64_t t, distance
+    cdef np_floats t, distance
 
     for time in range(time_start, time_end):
         for pln in range(pln_start, pln_end):
@@ -675,9 +677,129 @@ cdef inline void _integral_image_4d(cnp.float64_t [:, :, :, :, ::] padded,
                         integral[time - 1, pln - 1, row - 1, col - 1])
 
 
+def _accumulate_shifts(shifts_func, padded, Py_ssize_t n_shifts, workers,
+                       *args):
+    """Accumulate the contributions of all patch shifts, in parallel threads.
+
+    The shifts are split into ``workers`` contiguous ranges, each processed by
+    ``shifts_func`` in its own thread, with its own weight and result
+    buffers. The buffers are summed in a fixed order, so that the output only
+    depends on the number of workers.
+
+    Returns
+    -------
+    weights, result : ndarray
+        Sum of the patch weights and of the weighted pixel values.
+    """
+    workers = max(1, min(workers, n_shifts))
+    bounds = np.linspace(0, n_shifts, workers + 1).astype(np.intp)
+    weights = [np.zeros(padded.shape[:-1], dtype=padded.dtype)
+               for _ in range(workers)]
+    results = [np.zeros_like(padded) for _ in range(workers)]
+
+    def accumulate(i):
+        shifts_func(padded, weights[i], results[i], bounds[i], bounds[i + 1],
+                    *args)
+
+    if workers == 1:
+        accumulate(0)
+    else:
+        with PoolExecutor(max_workers=workers) as executor:
+            list(executor.map(accumulate, range(workers)))
+    for i in range(1, workers):
+        weights[0] += weights[i]
+        results[0] += results[i]
+    return weights[0], results[0]
+
+
+def _fast_nl_means_shifts_2d(np_floats [:, :, ::1] padded,
+                             np_floats [:, ::1] weights,
+                             np_floats [:, :, ::1] result,
+                             Py_ssize_t shift_start, Py_ssize_t shift_stop,
+                             Py_ssize_t s, Py_ssize_t d,
+                             cnp.float64_t h2s2, cnp.float64_t var):
+    """Accumulate the patch weights and weighted pixel values of a range of
+    patch shifts for fast non-local means denoising on a 2-D array.
+
+    Parameters
+    ----------
+    padded : ndarray
+        Padded input image, with channels along the last axis. Its dtype,
+        float32 or float64, is used for all computations.
+    weights : ndarray
+        Sum of the weights of the patches, updated in place.
+    result : ndarray
+        Sum of the weighted pixel values, updated in place.
+    shift_start, shift_stop : Py_ssize_t
+        Range of the patch shifts, numbered in the order of the loops over
+        ``t_row`` in ``[-d, d]`` and ``t_col`` in ``[0, d]``.
+    s : Py_ssize_t
+        Size of patches used for denoising, odd.
+    d : Py_ssize_t
+        Maximal distance in pixels where to search patches used for denoising.
+    h2s2 : cnp.float64_t
+        Normalization factor of the patch distances.
+    var : cnp.float64_t
+        The double of the expected noise variance.
+    """
+    cdef np_floats DISTANCE_CUTOFF = 5.0
+    cdef Py_ssize_t n_row, n_col, t_row, t_col, row, col, n_channels, channel
+    cdef Py_ssize_t row_start, row_end, row_shift, col_shift, shift
+    cdef Py_ssize_t offset = s / 2
+    cdef np_floats [:, ::1] integral = np.zeros_like(weights)
+    cdef np_floats distance, weight, alpha
+    cdef np_floats norm = h2s2
+    cdef np_floats var_diff = var
+
+    n_row, n_col, n_channels = padded.shape[0], padded.shape[1], padded.shape[2]
+
+    with nogil:
+        # Outer loop on patch shifts
+        # With t2 >= 0, reference patch is always on the left of test patch
+        for shift in range(shift_start, shift_stop):
+            t_row = shift // (d + 1) - d
+            t_col = shift % (d + 1)
+            row_start = max(offset, offset - t_row)
+            row_end = min(n_row - offset, n_row - offset - t_row)
+            # alpha is to account for patches on the same column
+            # distance is computed twice in this case
+            alpha = 0.5 if t_col == 0 else 1
+
+            # Compute integral image of the squared difference between
+            # padded and the same image shifted by (t_row, t_col)
+            _integral_image_2d(padded, integral, t_row, t_col,
+                               n_row, n_col, n_channels, var_diff)
+
+            # Inner loops on pixel coordinates
+            # Iterate over rows, taking offset and shift into account
+            for row in range(row_start, row_end):
+                row_shift = row + t_row
+                # Iterate over columns, taking offset and shift into account
+                for col in range(offset, n_col - offset - t_col):
+                    # Compute squared distance between shifted patches
+                    distance = _integral_to_distance_2d(
+                        integral, row, col, offset, norm)
+                    # exp of large negative numbers is close to zero
+                    if distance > DISTANCE_CUTOFF:
+                        continue
+                    col_shift = col + t_col
+                    weight = alpha * _fast_exp_floats(-distance)
+                    # Accumulate weights corresponding to different shifts
+                    weights[row, col] += weight
+                    weights[row_shift, col_shift] += weight
+                    # Iterate over channels
+                    for channel in range(n_channels):
+                        result[row, col, channel] += weight * \
+                            padded[row_shift, col_shift, channel]
+                        result[row_shift, col_shift, channel] += \
+                            weight * padded[row, col, channel]
+
+
 def _fast_nl_means_denoising_2d(cnp.ndarray[np_floats, ndim=3] image,
                                 Py_ssize_t s, Py_ssize_t d,
-                                cnp.float64_t h, cnp.float64_t var):
+                                cnp.float64_t h, cnp.float64_t var,
+                                workers=1, accumulation_dtype=np.float64,
+                                pad=True):
     """Perform fast non-local means denoising on 2-D array, with the outer
     loop on patch shifts in order to reduce the number of operations.
 
@@ -695,6 +817,15 @@ def _fast_nl_means_denoising_2d(cnp.ndarray[np_floats, ndim=3] image,
     var : cnp.float64_t
         Expected noise variance.  If non-zero, this is used to reduce the
         apparent patch distances by the expected distance due to the noise.
+    workers : int, optional
+        Number of parallel threads, each processing a part of the patch
+        shifts.
+    accumulation_dtype : {np.float64, np.float32}, optional
+        The dtype of the integral images and of the accumulated weights.
+    pad : bool, optional
+        Whether to pad `image` by reflection. Otherwise, `image` must already
+        be padded by ``s // 2 + d + 1`` pixels along the spatial axes, and
+        the result only covers the unpadded region.
 
     Returns
     -------
@@ -711,8 +842,6 @@ def _fast_nl_means_denoising_2d(cnp.ndarray[np_floats, ndim=3] image,
     ..[2] Jacques Froment. Parameter-Free Fast Pixelwise Non-Local Means
           Denoising. Image Processing On Line, 2014, vol. 4, pp. 300-326.
     """
-
-    cdef cnp.float64_t DISTANCE_CUTOFF = 5.0
     if s % 2 == 0:
         s += 1  # odd value for symmetric patch
 
@@ -723,81 +852,114 @@ def _fast_nl_means_denoising_2d(cnp.ndarray[np_floats, ndim=3] image,
 
     # Image padding: we need to account for patch size, possible shift,
     # + 1 for the boundary effects in finite differences
-    cdef Py_ssize_t n_row, n_col, t_row, t_col, row, col, n_channels, channel
-    cdef Py_ssize_t row_start, row_end, row_shift, col_shift
     cdef Py_ssize_t offset = s / 2
     cdef Py_ssize_t pad_size = offset + d + 1
 
-    cdef cnp.float64_t [:, :, ::1] padded = np.ascontiguousarray(
-        np.pad(image, ((pad_size, pad_size), (pad_size, pad_size), (0, 0)),
-               mode='reflect').astype(np.float64))
-    cdef cnp.float64_t [:, ::1] weights = np.zeros_like(padded[..., 0])
-    cdef cnp.float64_t [:, ::1] integral = np.zeros_like(weights)
-    cdef cnp.float64_t [:, :, ::1] result = np.zeros_like(padded)
-    cdef cnp.float64_t distance, h2s2, weight, alpha
+    if pad:
+        image = np.pad(image,
+                       ((pad_size, pad_size), (pad_size, pad_size), (0, 0)),
+                       mode='reflect')
+    padded = np.ascontiguousarray(image, dtype=accumulation_dtype)
+    cdef cnp.float64_t h2s2 = padded.shape[2] * h * h * s * s
+
+    weights, result = _accumulate_shifts(
+        _fast_nl_means_shifts_2d, padded, (2 * d + 1) * (d + 1), workers,
+        s, d, h2s2, 2 * var)
+
+    # Normalize pixel values using sum of weights of contributing patches,
+    # no risk of division by zero, since the contribution of a null shift is
+    # strictly positive. Return cropped result, undoing padding
+    crop = (slice(pad_size, -pad_size),) * 2
+    result = result[crop] / weights[crop][..., np.newaxis]
+    return np.squeeze(result.astype(dtype))
+
+
+def _fast_nl_means_shifts_3d(np_floats [:, :, :, ::1] padded,
+                             np_floats [:, :, ::1] weights,
+                             np_floats [:, :, :, ::1] result,
+                             Py_ssize_t shift_start, Py_ssize_t shift_stop,
+                             Py_ssize_t s, Py_ssize_t d,
+                             cnp.float64_t s_cube_h_square,
+                             cnp.float64_t var):
+    """Accumulate the patch weights and weighted pixel values of a range of
+    patch shifts for fast non-local means denoising on a 3-D array.
+
+    See ``_fast_nl_means_shifts_2d``, the shifts are numbered in the order of
+    the loops over ``t_pln`` and ``t_row`` in ``[-d, d]`` and ``t_col`` in
+    ``[0, d]``.
+    """
+    cdef np_floats DISTANCE_CUTOFF = 5.0
+    cdef Py_ssize_t offset = s / 2
+    cdef np_floats [:, :, ::1] integral = np.zeros_like(weights)
+    cdef np_floats norm = s_cube_h_square
+    cdef np_floats var_diff = var
 
-    n_row, n_col, n_channels = padded.shape[0], padded.shape[1], padded.shape[2]
-    h2s2 = n_channels * h * h * s * s
-    var *= 2
+    cdef Py_ssize_t n_pln, n_row, n_col, t_pln, t_row, t_col, \
+             pln, row, col, channel, n_channels, shift
+    cdef Py_ssize_t pln_dist_min, pln_dist_max, row_dist_min, row_dist_max, \
+             col_dist_min, col_dist_max
+    cdef np_floats weight, distance, alpha
+    n_pln, n_row, n_col, n_channels = padded.shape[0], padded.shape[1], padded.shape[2], padded.shape[3]
 
     with nogil:
-        # Outer loops on patch shifts
+        # Outer loop on patch shifts
         # With t2 >= 0, reference patch is always on the left of test patch
-        # Iterate over shifts along the row axis
-        for t_row in range(-d, d + 1):
-            row_start = max(offset, offset - t_row)
-            row_end = min(n_row - offset, n_row - offset - t_row)
-            # Iterate over shifts along the column axis
-            for t_col in range(0, d + 1):
-                # alpha is to account for patches on the same column
-                # distance is computed twice in this case
-                alpha = 0.5 if t_col == 0 else 1
-
-                # Compute integral image of the squared difference between
-                # padded and the same image shifted by (t_row, t_col)
-                _integral_image_2d(padded, integral, t_row, t_col,
-                                   n_row, n_col, n_channels, var)
-
-                # Inner loops on pixel coordinates
-                # Iterate over rows, taking offset and shift into account
-                for row in range(row_start, row_end):
-                    row_shift = row + t_row
-                    # Iterate over columns, taking offset and shift into account
-                    for col in range(offset, n_col - offset - t_col):
-                        # Compute squared distance between shifted patches
-                        distance = _integral_to_distance_2d(
-                            integral, row, col, offset, h2s2)
+        for shift in range(shift_start, shift_stop):
+            t_pln = shift // ((2 * d + 1) * (d + 1)) - d
+            t_row = (shift // (d + 1)) % (2 * d + 1) - d
+            t_col = shift % (d + 1)
+            pln_dist_min = max(offset, offset - t_pln)
+            pln_dist_max = min(n_pln - offset, n_pln - offset - t_pln)
+            row_dist_min = max(offset, offset - t_row)
+            row_dist_max = min(n_row - offset, n_row - offset - t_row)
+            # alpha is to account for patches on the same column
+            # distance is computed twice in this case
+            alpha = 0.5 if t_col == 0 else 1
+
+            col_dist_min = offset
+            col_dist_max = n_col - offset - t_col
+
+            # Compute integral image of the squared difference between
+            # padded and the same image shifted by (t_pln, t_row, t_col)
+            _integral_image_3d(padded, integral, t_pln,
+                               t_row, t_col, n_pln, n_row,
+                               n_col, n_channels, var_diff)
+
+            # Inner loops on pixel coordinates
+            # Iterate over planes, taking offset and shift into account
+            for pln in range(pln_dist_min, pln_dist_max):
+                # Iterate over rows, taking offset and shift
+                # into account
+                for row in range(row_dist_min, row_dist_max):
+                    # Iterate over columns
+                    for col in range(col_dist_min, col_dist_max):
+                        # Compute squared distance between
+                        # shifted patches
+                        distance = _integral_to_distance_3d(integral,
+                            pln, row, col, offset, norm)
                         # exp of large negative numbers is close to zero
                         if distance > DISTANCE_CUTOFF:
                             continue
-                        col_shift = col + t_col
-                        weight = alpha * _fast_exp(-distance)
-                        # Accumulate weights corresponding to different shifts
-                        weights[row, col] += weight
-                        weights[row_shift, col_shift] += weight
-                        # Iterate over channels
-                        for channel in range(n_channels):
-                            result[row, col, channel] += weight * \
-                                padded[row_shift, col_shift, channel]
-                            result[row_shift, col_shift, channel] += \
-                                weight * padded[row, col, channel]
-
-        # Normalize pixel values using sum of weights of contributing patches
-        for row in range(pad_size, n_row - pad_size):
-            for col in range(pad_size, n_col - pad_size):
-                for channel in range(n_channels):
-                    # No risk of division by zero, since the contribution
-                    # of a null shift is strictly positive
-                    result[row, col, channel] /= weights[row, col]
 
-    # Return cropped result, undoing padding
-    return np.squeeze(np.asarray(result[pad_size: -pad_size,
-                                        pad_size: -pad_size, :]).astype(dtype))
+                        weight = alpha * _fast_exp_floats(-distance)
+                        # Accumulate weights for the different shifts
+                        weights[pln, row, col] += weight
+                        weights[pln + t_pln, row + t_row,
+                                             col + t_col] += weight
+                        for channel in range(n_channels):
+                            result[pln, row, col, channel] += weight * \
+                                    padded[pln + t_pln, row + t_row,
+                                           col + t_col, channel]
+                            result[pln + t_pln, row + t_row,
+                                   col + t_col, channel] += weight * \
+                                                            padded[pln, row, col, channel]
 
 
 def _fast_nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=4] image,
                                 Py_ssize_t s=5, Py_ssize_t d=7,
-                                cnp.float64_t h=0.1, cnp.float64_t var=0.):
+                                cnp.float64_t h=0.1, cnp.float64_t var=0.,
+                                workers=1, accumulation_dtype=np.float64,
+                                pad=True):
     """Perform fast non-local means denoising on 3-D array, with the outer
     loop on patch shifts in order to reduce the number of operations.
 
@@ -815,6 +977,15 @@ def _fast_nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=4] image,
     var : cnp.float64_t
         Expected noise variance.  If non-zero, this is used to reduce the
         apparent patch distances by the expected distance due to the noise.
+    workers : int, optional
+        Number of parallel threads, each processing a part of the patch
+        shifts.
+    accumulation_dtype : {np.float64, np.float32}, optional
+        The dtype of the integral images and of the accumulated weights.
+    pad : bool, optional
+        Whether to pad `image` by reflection. Otherwise, `image` must already
+        be padded by ``s // 2 + d + 1`` pixels along the spatial axes, and
+        the result only covers the unpadded region.
 
     Returns
     -------
@@ -831,8 +1002,6 @@ def _fast_nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=4] image,
     ..[2] Jacques Froment. Parameter-Free Fast Pixelwise Non-Local Means
           Denoising. Image Processing On Line, 2014, vol. 4, pp. 300-326.
     """
-
-    cdef cnp.float64_t DISTANCE_CUTOFF = 5.0
     if s % 2 == 0:
         s += 1  # odd value for symmetric patch
 
@@ -845,104 +1014,123 @@ def _fast_nl_means_denoising_3d(cnp.ndarray[np_floats, ndim=4] image,
     # Image padding: we need to account for patch size, possible shift,
     # + 1 for the boundary effects in finite differences
     cdef Py_ssize_t pad_size = offset + d + 1
-    cdef cnp.float64_t [:, :, :, ::1] padded = np.ascontiguousarray(
-        np.pad(image,
-               ((pad_size, pad_size),
-                (pad_size, pad_size),
-                (pad_size, pad_size),
-                (0, 0)),
-               mode='reflect'),
-        dtype=np.float64)
-    cdef cnp.float64_t [:, :, ::1] weights = np.zeros_like(padded[..., 0])
-    cdef cnp.float64_t [:, :, ::1] integral = np.zeros_like(padded[..., 0])
-    cdef cnp.float64_t [:, :, :, ::1] result = np.zeros_like(padded)
-
+    if pad:
+        image = np.pad(image,
+                       ((pad_size, pad_size),
+                        (pad_size, pad_size),
+                        (pad_size, pad_size),
+                        (0, 0)),
+                       mode='reflect')
+    padded = np.ascontiguousarray(image, dtype=accumulation_dtype)
+    cdef cnp.float64_t s_cube_h_square = padded.shape[3] * h * h * s * s * s
+
+    weights, result = _accumulate_shifts(
+        _fast_nl_means_shifts_3d, padded, (2 * d + 1) ** 2 * (d + 1), workers,
+        s, d, s_cube_h_square, 2 * var)
+
+    # Normalize pixel values using sum of weights of contributing patches,
+    # no risk of division by zero, since the contribution of a null shift is
+    # strictly positive. Return cropped result, undoing padding
+    crop = (slice(pad_size, -pad_size),) * 3
+    result = result[crop] / weights[crop][..., np.newaxis]
+    return np.squeeze(np.asarray(result, dtype=dtype))
+
+
+def _fast_nl_means_shifts_4d(np_floats [:, :, :, :, ::1] padded,
+                             np_floats [:, :, :, ::1] weights,
+                             np_floats [:, :, :, :, ::1] result,
+                             Py_ssize_t shift_start, Py_ssize_t shift_stop,
+                             Py_ssize_t s, Py_ssize_t d,
+                             cnp.float64_t s4_h_square, cnp.float64_t var):
+    """Accumulate the patch weights and weighted pixel values of a range of
+    patch shifts for fast non-local means denoising on a 4-D array.
+
+    See ``_fast_nl_means_shifts_2d``, the shifts are numbered in the order of
+    the loops over ``t_time``, ``t_pln`` and ``t_row`` in ``[-d, d]`` and
+    ``t_col`` in ``[0, d]``.
+    """
+    cdef np_floats DISTANCE_CUTOFF = 5.0
+    cdef Py_ssize_t offset = s / 2
+    cdef np_floats [:, :, :, ::1] integral = np.zeros_like(weights)
+    cdef np_floats norm = s4_h_square
+    cdef np_floats var_diff = var
     cdef Py_ssize_t n_pln, n_row, n_col, t_pln, t_row, t_col, \
-             pln, row, col, channel, n_channels
-    cdef Py_ssize_t pln_dist_min, pln_dist_max, row_dist_min, row_dist_max, \
-             col_dist_min, col_dist_max
-    cdef cnp.float64_t weight, distance, alpha
-    n_pln, n_row, n_col, n_channels = padded.shape[0], padded.shape[1], padded.shape[2], padded.shape[3]
-    cdef cnp.float64_t s_cube_h_square = n_channels * h * h * s * s * s
-
-
-    var *= 2
+             pln, row, col, channel, n_channels, t_time, n_time, time, shift
+    cdef Py_ssize_t time_dist_min, time_dist_max, pln_dist_min, pln_dist_max, \
+             row_dist_min, row_dist_max, col_dist_min, col_dist_max,
+    cdef Py_ssize_t n_spatial = 2 * d + 1
+    cdef np_floats weight, distance, alpha
+    n_time, n_pln, n_row, n_col, n_channels = padded.shape[0], padded.shape[1], padded.shape[2], padded.shape[3], padded.shape[4]
 
     with nogil:
-        # Outer loops on patch shifts
+        # Outer loop on patch shifts
         # With t2 >= 0, reference patch is always on the left of test patch
-        # Iterate over shifts along the plane axis
-        for t_pln in range(-d, d + 1):
+        for shift in range(shift_start, shift_stop):
+            t_time = shift // (n_spatial * n_spatial * (d + 1)) - d
+            t_pln = (shift // (n_spatial * (d + 1))) % n_spatial - d
+            t_row = (shift // (d + 1)) % n_spatial - d
+            t_col = shift % (d + 1)
+            time_dist_min = max(offset, offset - t_time)
+            time_dist_max = min(n_time - offset, n_time - offset - t_time)
             pln_dist_min = max(offset, offset - t_pln)
             pln_dist_max = min(n_pln - offset, n_pln - offset - t_pln)
-            # Iterate over shifts along the row axis
-            for t_row in range(-d, d + 1):
-                row_dist_min = max(offset, offset - t_row)
-                row_dist_max = min(n_row - offset, n_row - offset - t_row)
-                # Iterate over shifts along the column axis
-                for t_col in range(0, d + 1):
-                    # alpha is to account for patches on the same column
-                    # distance is computed twice in this case
-                    alpha = 0.5 if t_col == 0 else 1
-
-                    col_dist_min = offset
-                    col_dist_max = n_col - offset - t_col
-
-                    # Compute integral image of the squared difference between
-                    # padded and the same image shifted by (t_pln, t_row, t_col)
-                    _integral_image_3d(padded, integral, t_pln,
-                                       t_row, t_col, n_pln, n_row,
-                                       n_col, n_channels, var)
-
-                    # Inner loops on pixel coordinates
-                    # Iterate over planes, taking offset and shift into account
-                    for pln in range(pln_dist_min, pln_dist_max):
-                        # Iterate over rows, taking offset and shift
-                        # into account
-                        for row in range(row_dist_min, row_dist_max):
-                            # Iterate over columns
-                            for col in range(col_dist_min, col_dist_max):
-                                # Compute squared distance between
-                                # shifted patches
-                                distance = _integral_to_distance_3d(integral,
-                                    pln, row, col, offset, s_cube_h_square)
-                                # exp of large negative numbers is close to zero
-                                if distance > DISTANCE_CUTOFF:
-                                    continue
-
-                                weight = alpha * _fast_exp(-distance)
-                                # Accumulate weights for the different shifts
-                                weights[pln, row, col] += weight
-                                weights[pln + t_pln, row + t_row,
-                                                     col + t_col] += weight
-                                for channel in range(n_channels):
-                                    result[pln, row, col, channel] += weight * \
-                                            padded[pln + t_pln, row + t_row,
-                                                   col + t_col, channel]
-                                    result[pln + t_pln, row + t_row,
-                                           col + t_col, channel] += weight * \
-                                                                    padded[pln, row, col, channel]
-
-        # Normalize pixel values using sum of weights of contributing patches
-        for pln in range(offset, n_pln - offset):
-            for row in range(offset, n_row - offset):
-                for col in range(offset, n_col - offset):
-                    for channel in range(n_channels):
-                        # No risk of division by zero, since the contribution
-                        # of a null shift is strictly positive
-                        result[pln, row, col, channel] /= weights[pln, row, col]
-
-    # Return cropped result, undoing padding
-    return np.squeeze(
-        np.asarray(result[pad_size:-pad_size,
-                          pad_size:-pad_size,
-                          pad_size:-pad_size, :], dtype=dtype)
-    )
+            row_dist_min = max(offset, offset - t_row)
+            row_dist_max = min(n_row - offset, n_row - offset - t_row)
+            # alpha is to account for patches on the same column
+            # distance is computed twice in this case
+            alpha = 0.5 if t_col == 0 else 1
+
+            col_dist_min = offset
+            col_dist_max = n_col - offset - t_col
+
+            # Compute integral image of the squared difference between
+            # padded and the same image shifted by (t_pln, t_row, t_col)
+            _integral_image_4d(padded, integral, t_time, t_pln, t_row,
+                               t_col, n_time, n_pln, n_row, n_col,
+                               n_channels, var_diff)
+
+            # Inner loops on pixel coordinates
+            # Iterate over planes, taking offset and shift into account
+            for time in range(time_dist_min, time_dist_max):
+                for pln in range(pln_dist_min, pln_dist_max):
+                    # Iterate over rows, taking offset and shift
+                    # into account
+                    for row in range(row_dist_min, row_dist_max):
+                        # Iterate over columns
+                        for col in range(col_dist_min, col_dist_max):
+                            # Compute squared distance between
+                            # shifted patches
+                            distance = _integral_to_distance_4d(
+                                integral, time, pln, row, col, offset,
+                                norm)
+                            # exp of large negative numbers is close to zero
+                            if distance > DISTANCE_CUTOFF:
+                                continue
+
+                            weight = alpha * _fast_exp_floats(-distance)
+                            # Accumulate weights for the different shifts
+                            weights[time, pln, row, col] += weight
+                            weights[time + t_time, pln + t_pln,
+                                    row + t_row, col + t_col] += weight
+                            for channel in range(n_channels):
+                                result[time, pln, row, col,
+                                       channel] += weight * \
+                                           padded[time + t_time,
+                                                  pln + t_pln,
+                                                  row + t_row,
+                                                  col + t_col, channel]
+                                result[time + t_time, pln + t_pln,
+                                       row + t_row, col + t_col,
+                                       channel] += weight * \
+                                           padded[time, pln, row,
+                                                  col, channel]
 
 
 def _fast_nl_means_denoising_4d(cnp.ndarray[np_floats, ndim=5] image,
                                 Py_ssize_t s=3, Py_ssize_t d=3,
-                                cnp.float64_t h=0.1, cnp.float64_t var=0.):
+                                cnp.float64_t h=0.1, cnp.float64_t var=0.,
+                                workers=1, accumulation_dtype=np.float64,
+                                pad=True):
     """
     Perform fast non-local means denoising on 3-D array, with the outer
     loop on patch shifts in order to reduce the number of operations.
@@ -961,6 +1149,15 @@ def _fast_nl_means_denoising_4d(cnp.ndarray[np_floats, ndim=5] image,
     var : cnp.float64_t
         Expected noise variance.  If non-zero, this is used to reduce the
         apparent patch distances by the expected distance due to the noise.
+    workers : int, optional
+        Number of parallel threads, each processing a part of the patch
+        shifts.
+    accumulation_dtype : {np.float64, np.float32}, optional
+        The dtype of the integral images and of the accumulated weights.
+    pad : bool, optional
+        Whether to pad `image` by reflection. Otherwise, `image` must already
+        be padded by ``s // 2 + d + 1`` pixels along the spatial axes, and
+        the result only covers the unpadded region.
 
     Returns
     -------
@@ -977,8 +1174,6 @@ def _fast_nl_means_denoising_4d(cnp.ndarray[np_floats, ndim=5] image,
     ..[2] Jacques Froment. Parameter-Free Fast Pixelwise Non-Local Means
           Denoising. Image Processing On Line, 2014, vol. 4, pp. 300-326.
     """
-
-    cdef cnp.float64_t DISTANCE_CUTOFF = 5.0
     if s % 2 == 0:
         s += 1  # odd value for symmetric patch
 
@@ -991,107 +1186,24 @@ def _fast_nl_means_denoising_4d(cnp.ndarray[np_floats, ndim=5] image,
     # Image padding: we need to account for patch size, possible shift,
     # + 1 for the boundary effects in finite differences
     cdef Py_ssize_t pad_size = offset + d + 1
-    cdef cnp.float64_t [:, :, :, :, ::1] padded = np.ascontiguousarray(
-        np.pad(image,
-               ((pad_size, pad_size),
-                (pad_size, pad_size),
-                (pad_size, pad_size),
-                (pad_size, pad_size),
-                (0, 0)),
-               mode='reflect'),
-        dtype=np.float64)
-    cdef cnp.float64_t [:, :, :, :, ::1] result = np.zeros_like(padded)
-    cdef cnp.float64_t [:, :, :, ::1] weights = np.zeros_like(padded[..., 0])
-    cdef cnp.float64_t [:, :, :, ::1] integral = np.zeros_like(padded[..., 0])
-    cdef Py_ssize_t n_pln, n_row, n_col, t_pln, t_row, t_col, \
-             pln, row, col, channel, n_channels, t_time, n_time, time
-    cdef Py_ssize_t time_dist_min, time_dist_max, pln_dist_min, pln_dist_max, \
-             row_dist_min, row_dist_max, col_dist_min, col_dist_max,
-    cdef cnp.float64_t weight, distance, alpha
-    n_time, n_pln, n_row, n_col, n_channels = padded.shape[0], padded.shape[1], padded.shape[2], padded.shape[3], padded.shape[4]
-    cdef cnp.float64_t s4_h_square = n_channels * h * h * s * s * s * s
-
-    # Outer loops on patch shifts
-    # With t2 >= 0, reference patch is always on the left of test patch
-    # Iterate over shifts along the plane axis
-    var *= 2
-    with nogil:
-        for t_time in range(-d, d + 1):
-            time_dist_min = max(offset, offset - t_time)
-            time_dist_max = min(n_time - offset, n_time - offset - t_time)
-            for t_pln in range(-d, d + 1):
-                pln_dist_min = max(offset, offset - t_pln)
-                pln_dist_max = min(n_pln - offset, n_pln - offset - t_pln)
-                # Iterate over shifts along the row axis
-                for t_row in range(-d, d + 1):
-                    row_dist_min = max(offset, offset - t_row)
-                    row_dist_max = min(n_row - offset, n_row - offset - t_row)
-                    # Iterate over shifts along the column axis
-                    for t_col in range(0, d + 1):
-                        # alpha is to account for patches on the same column
-                        # distance is computed twice in this case
-                        alpha = 0.5 if t_col == 0 else 1
-
-                        col_dist_min = offset
-                        col_dist_max = n_col - offset - t_col
-
-                        # Compute integral image of the squared difference between
-                        # padded and the same image shifted by (t_pln, t_row, t_col)
-                        _integral_image_4d(padded, integral, t_time, t_pln, t_row,
-                                           t_col, n_time, n_pln, n_row, n_col,
-                                           n_channels, var)
-
-                        # Inner loops on pixel coordinates
-                        # Iterate over planes, taking offset and shift into account
-                        for time in range(time_dist_min, time_dist_max):
-                            for pln in range(pln_dist_min, pln_dist_max):
-                                # Iterate over rows, taking offset and shift
-                                # into account
-                                for row in range(row_dist_min, row_dist_max):
-                                    # Iterate over columns
-                                    for col in range(col_dist_min, col_dist_max):
-                                        # Compute squared distance between
-                                        # shifted patches
-                                        distance = _integral_to_distance_4d(
-                                            integral, time, pln, row, col, offset,
-                                            s4_h_square)
-                                        # exp of large negative numbers is close to zero
-                                        if distance > DISTANCE_CUTOFF:
-                                            continue
-
-                                        weight = alpha * _fast_exp(-distance)
-                                        # Accumulate weights for the different shifts
-                                        weights[time, pln, row, col] += weight
-                                        weights[time + t_time, pln + t_pln,
-                                                row + t_row, col + t_col] += weight
-                                        for channel in range(n_channels):
-                                            result[time, pln, row, col,
-                                                   channel] += weight * \
-                                                       padded[time + t_time,
-                                                              pln + t_pln,
-                                                              row + t_row,
-                                                              col + t_col, channel]
-                                            result[time + t_time, pln + t_pln,
-                                                   row + t_row, col + t_col,
-                                                   channel] += weight * \
-                                                       padded[time, pln, row,
-                                                              col, channel]
-
-        # Normalize pixel values using sum of weights of contributing patches
-        for time in range(offset, n_time - offset):
-            for pln in range(offset, n_pln - offset):
-                for row in range(offset, n_row - offset):
-                    for col in range(offset, n_col - offset):
-                        for channel in range(n_channels):
-                            # No risk of division by zero, since the contribution
-                            # of a null shift is strictly positive
-                            result[time, pln, row, col, channel] /= weights[
-                                time, pln, row, col]
-
-    # Return cropped result, undoing padding
-    return np.squeeze(
-        np.asarray(result[pad_size:-pad_size,
-                          pad_size:-pad_size,
-                          pad_size:-pad_size,
-                          pad_size:-pad_size, :], dtype=dtype)
-    )
+    if pad:
+        image = np.pad(image,
+                       ((pad_size, pad_size),
+                        (pad_size, pad_size),
+                        (pad_size, pad_size),
+                        (pad_size, pad_size),
+                        (0, 0)),
+                       mode='reflect')
+    padded = np.ascontiguousarray(image, dtype=accumulation_dtype)
+    cdef cnp.float64_t s4_h_square = padded.shape[4] * h * h * s * s * s * s
+
+    weights, result = _accumulate_shifts(
+        _fast_nl_means_shifts_4d, padded, (2 * d + 1) ** 3 * (d + 1), workers,
+        s, d, s4_h_square, 2 * var)
+
+    # Normalize pixel values using sum of weights of contributing patches,
+    # no risk of division by zero, since the contribution of a null shift is
+    # strictly positive. Return cropped result, undoing padding
+    crop = (slice(pad_size, -pad_size),) * 4
+    result = result[crop] / weights[crop][..., np.newaxis]
+    return np.squeeze(np.asarray(result, dtype=dtype))
@@ -1,11 +1,12 @@
 import itertools
 import functools
+import os
+from concurrent.futures import ThreadPoolExecutor as PoolExecutor
 
 import numpy as np
 from scipy import ndimage as ndi
 
 from .._shared.utils import _supported_float_type
-from ..metrics import mean_squared_error
 from ..util import img_as_float
 
 
@@ -87,6 +88,13 @@ def _generate_grid_slice(shape, *, offset, stride=3):
     return mask
 
 
+def _masked_image(image, interp, mask):
+    """Replace the pixels of `image` selected by `mask` with `interp`."""
+    masked = image.copy()
+    masked[mask] = interp[mask]
+    return masked
+
+
 def denoise_invariant(
     image, denoise_function, *, stride=4, masks=None, denoiser_kwargs=None
 ):
@@ -169,8 +177,7 @@ def denoise_invariant(
         )
 
     for mask in masks:
-        input_image = image.copy()
-        input_image[mask] = interp[mask]
+        input_image = _masked_image(image, interp, mask)
         output[mask] = denoise_function(input_image, **denoiser_kwargs)[mask]
     return output
 
@@ -205,6 +212,8 @@ def calibrate_denoiser(
     stride=4,
     approximate_loss=True,
     extra_output=False,
+    search='grid',
+    workers=1,
 ):
     """Calibrate a denoising function and return optimal J-invariant version.
 
@@ -229,6 +238,19 @@ def calibrate_denoiser(
     extra_output : bool, optional
         If True, return parameters and losses in addition to the calibrated
         denoising function
+    search : {'grid', 'halving'}, optional
+        With 'grid', the loss is computed for every set of parameters. With
+        'halving', successive halving is used: all sets of parameters are
+        evaluated on one masked version of the image, then the best half is
+        evaluated on twice as many masked versions, and so on until one set
+        remains or all masked versions are used. This requires
+        ``approximate_loss=False``, and costs about ``2 * len(parameters)``
+        denoiser calls per round instead of ``stride**image.ndim *
+        len(parameters)``.
+    workers : int or None, optional
+        The number of parallel threads evaluating the denoiser, over
+        parameters and masked versions of the image. If None, use as many
+        threads as there are CPUs. `denoise_function` must be thread-safe.
 
     Returns
     -------
@@ -241,6 +263,8 @@ def calibrate_denoiser(
         List of parameters tested for `denoise_function`, as a dictionary of
         kwargs
         Self-supervised loss for each set of parameters in `parameters_tested`.
+        With ``search='halving'``, the losses of the parameters eliminated
+        early are estimated on fewer masked versions of the image.
 
 
     Notes
@@ -257,6 +281,9 @@ def calibrate_denoiser(
      at the expense of increasing its runtime. It has no effect on the runtime
      of the calibration.
 
+    The interpolated image and each masked version of it are computed once
+    and shared by all sets of parameters.
+
     References
     ----------
     .. [1] J. Batson & L. Royer. Noise2Self: Blind Denoising by Self-Supervision,
@@ -276,16 +303,17 @@ def calibrate_denoiser(
     >>> denoised_img = denoising_function(img)
 
     """
-    parameters_tested, losses = _calibrate_denoiser_search(
+    parameters_tested, losses, best = _calibrate_denoiser_search(
         image,
         denoise_function,
         denoise_parameters=denoise_parameters,
         stride=stride,
         approximate_loss=approximate_loss,
+        search=search,
+        workers=workers,
     )
 
-    idx = np.argmin(losses)
-    best_parameters = parameters_tested[idx]
+    best_parameters = parameters_tested[best]
 
     best_denoise_function = functools.partial(
         denoise_invariant,
@@ -301,7 +329,14 @@ def calibrate_denoiser(
 
 
 def _calibrate_denoiser_search(
-    image, denoise_function, denoise_parameters, *, stride=4, approximate_loss=True
+    image,
+    denoise_function,
+    denoise_parameters,
+    *,
+    stride=4,
+    approximate_loss=True,
+    search='grid',
+    workers=1,
 ):
     """Return a parameter search history with losses for a denoise function.
 
@@ -320,6 +355,11 @@ def _calibrate_denoiser_search(
         Whether to approximate the self-supervised loss used to evaluate the
         denoiser by only computing it on one masked version of the image.
         If False, the runtime will be a factor of `stride**image.ndim` longer.
+    search : {'grid', 'halving'}, optional
+        Evaluate all parameters on the same masks, or use successive halving,
+        see `calibrate_denoiser`.
+    workers : int or None, optional
+        The number of parallel threads evaluating the denoiser.
 
     Returns
     -------
@@ -328,31 +368,87 @@ def _calibrate_denoiser_search(
         kwargs.
     losses : list of int
         Self-supervised loss for each set of parameters in `parameters_tested`.
+    best : int
+        Index of the best parameters in `parameters_tested`.
     """
+    if search not in ('grid', 'halving'):
+        raise ValueError(f"Unknown search {search!r}")
+    if search == 'halving' and approximate_loss:
+        raise ValueError("`search='halving'` requires `approximate_loss=False`")
+    if workers is None:
+        workers = os.cpu_count()
+
     image = img_as_float(image)
     parameters_tested = list(_product_from_dict(denoise_parameters))
-    losses = []
-
-    for denoiser_kwargs in parameters_tested:
-        multichannel = denoiser_kwargs.get('channel_axis', None) is not None
-        if not approximate_loss:
-            denoised = denoise_invariant(
-                image, denoise_function, stride=stride, denoiser_kwargs=denoiser_kwargs
-            )
-            loss = mean_squared_error(image, denoised)
-        else:
-            spatialdims = image.ndim if not multichannel else image.ndim - 1
-            n_masks = stride**spatialdims
-            mask = _generate_grid_slice(
-                image.shape[:spatialdims], offset=n_masks // 2, stride=stride
-            )
-
-            masked_denoised = denoise_invariant(
-                image, denoise_function, masks=[mask], denoiser_kwargs=denoiser_kwargs
-            )
-
-            loss = mean_squared_error(image[mask], masked_denoised[mask])
-
-        losses.append(loss)
+    n_params = len(parameters_tested)
+
+    multichannel = [
+        kwargs.get('channel_axis', None) is not None for kwargs in parameters_tested
+    ]
+    # the mask of the approximate loss comes first
+    offsets = []
+    for mc in multichannel:
+        n_masks = stride ** (image.ndim - mc)
+        offsets.append(
+            [n_masks // 2] + [i for i in range(n_masks) if i != n_masks // 2]
+        )
 
-    return parameters_tested, losses
+    interps = {}
+    squared_errors = np.zeros(n_params)
+    n_pixels = np.zeros(n_params, dtype=np.intp)
+    n_evaluated = [0] * n_params
+
+    def masked_squared_error(task):
+        masked, mask, i = task
+        denoised = denoise_function(masked, **parameters_tested[i])[mask]
+        return np.sum((image[mask] - denoised) ** 2, dtype=np.float64)
+
+    def evaluate(candidates, n_used, executor):
+        """Evaluate the `candidates` on their first `n_used` masks."""
+        # candidates sharing a mask share its masked image
+        groups = {}
+        for i in candidates:
+            for offset in offsets[i][n_evaluated[i] : n_used]:
+                groups.setdefault((multichannel[i], offset), []).append(i)
+            n_evaluated[i] = max(n_evaluated[i], min(n_used, len(offsets[i])))
+
+        # limit the number of masked images in memory to the number of threads
+        keys = list(groups)
+        for start in range(0, len(keys), workers):
+            tasks = []
+            for mc, offset in keys[start : start + workers]:
+                if mc not in interps:
+                    interps[mc] = _interpolate_image(image, multichannel=mc)
+                spatialdims = image.ndim - mc
+                mask = _generate_grid_slice(
+                    image.shape[:spatialdims], offset=offset, stride=stride
+                )
+                masked = _masked_image(image, interps[mc], mask)
+                tasks += [(masked, mask, i) for i in groups[mc, offset]]
+            results = executor.map(masked_squared_error, tasks)
+            for (_, mask, i), squared_error in zip(tasks, results):
+                squared_errors[i] += squared_error
+                n_pixels[i] += image[mask].size
+
+    with PoolExecutor(max_workers=workers) as executor:
+        candidates = list(range(n_params))
+        if search == 'grid':
+            n_used = 1 if approximate_loss else max(map(len, offsets))
+            evaluate(candidates, n_used, executor)
+        else:
+            # the number of masks doubles while the number of candidates
+            # halves, the last candidate is evaluated on all masks
+            n_rounds = (n_params - 1).bit_length()
+            n_masks = max(map(len, offsets))
+            for k in range(n_rounds + 1):
+                n_used = -(-n_masks // 2 ** (n_rounds - k))
+                evaluate(candidates, n_used, executor)
+                if k < n_rounds:
+                    losses = squared_errors[candidates] / n_pixels[candidates]
+                    n_keep = -(-len(candidates) // 2)
+                    keep = np.argsort(losses, kind='stable')[:n_keep]
+                    candidates = [candidates[i] for i in sorted(keep)]
+
+    losses = squared_errors / n_pixels
+    best = candidates[int(np.argmin(losses[candidates]))]
+    return parameters_tested, list(losses), best
@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 
 from .._shared import utils
@@ -22,6 +24,9 @@ def denoise_nl_means(
     *,
     preserve_range=False,
     channel_axis=None,
+    workers=1,
+    accumulation_dtype=np.float64,
+    memory_limit=None,
 ):
     """Perform non-local means denoising on 2D-4D grayscale or RGB images.
 
@@ -60,6 +65,25 @@ def denoise_nl_means(
 
         .. versionadded:: 0.19
            ``channel_axis`` was added in 0.19.
+    workers : int or None, optional
+        The number of parallel threads used with `fast_mode`, each processing
+        a part of the patch shifts. Every thread allocates its own buffers,
+        about ``(n_channels + 2) * padded_image.size`` 64-bit floats. For a
+        given number of threads the result is deterministic, but it can
+        differ by floating-point rounding between numbers of threads. If
+        None, use as many threads as there are CPUs.
+    accumulation_dtype : {np.float64, np.float32}, optional
+        The floating-point type used with `fast_mode` for the integral images
+        and the accumulated patch weights. float32 halves the memory
+        footprint, at the cost of precision. This loss of precision grows
+        with the image size and is reduced by `memory_limit`.
+    memory_limit : int or None, optional
+        Approximate bound, in bytes, on the working memory of `fast_mode`,
+        not counting the input and output images. If given, the image is
+        denoised tile by tile along its first axis, each tile being padded by
+        ``patch_size // 2 + patch_distance + 1`` pixels of its neighbors so
+        that the result is the same as without tiles, up to floating-point
+        rounding. By default, the whole image is processed at once.
 
     Returns
     -------
@@ -167,6 +191,14 @@ def denoise_nl_means(
         image = np.ascontiguousarray(image)
 
     kwargs = dict(s=patch_size, d=patch_distance, h=h, var=sigma * sigma)
+    if fast_mode:
+        if np.dtype(accumulation_dtype) not in (np.float32, np.float64):
+            raise ValueError(
+                "`accumulation_dtype` must be float32 or float64, got "
+                f"{accumulation_dtype}"
+            )
+        kwargs['workers'] = os.cpu_count() if workers is None else workers
+        kwargs['accumulation_dtype'] = accumulation_dtype
     if ndim_no_channel == 2:
         nlm_func = _fast_nl_means_denoising_2d if fast_mode else _nl_means_denoising_2d
     elif ndim_no_channel == 3:
@@ -183,5 +215,47 @@ def denoise_nl_means(
             nlm_func = _fast_nl_means_denoising_4d
         else:
             raise NotImplementedError("4D requires fast_mode to be True.")
+    if fast_mode and memory_limit is not None:
+        return np.squeeze(_denoise_tiles(nlm_func, image, memory_limit, **kwargs))
     dn = np.asarray(nlm_func(image, **kwargs))
     return dn
+
+
+def _denoise_tiles(nlm_func, image, memory_limit, **kwargs):
+    """Apply fast non-local means to tiles along the first axis of `image`.
+
+    The tiles are chosen small enough for the padded tile and the buffers of
+    every thread of `nlm_func` to fit in `memory_limit` bytes.
+    """
+    s = kwargs['s'] + (kwargs['s'] % 2 == 0)
+    pad_size = s // 2 + kwargs['d'] + 1
+    n_channels = image.shape[-1]
+    itemsize = np.dtype(kwargs['accumulation_dtype']).itemsize
+    # memory per padded position along the first axis: the padded tile plus
+    # the integral, weight and result buffers of each thread
+    per_position = (
+        itemsize
+        * np.prod([n + 2 * pad_size for n in image.shape[1:-1]])
+        * (n_channels + kwargs['workers'] * (n_channels + 2))
+    )
+    tile_size = int(memory_limit // per_position) - 2 * pad_size
+    if tile_size < 1:
+        raise ValueError(
+            f"`memory_limit` is too small, at least {(2 * pad_size + 1) * per_position}"
+            " bytes are needed for this image"
+        )
+
+    out = np.empty_like(image)
+    pad_width = [(0, 0)] + [(pad_size, pad_size)] * (image.ndim - 2) + [(0, 0)]
+    for start in range(0, image.shape[0], tile_size):
+        stop = min(start + tile_size, image.shape[0])
+        # take the padding along the first axis from the neighboring tiles,
+        # reflecting the image only at its ends
+        lo = max(start - pad_size, 0)
+        hi = min(stop + pad_size, image.shape[0])
+        pad_width[0] = (pad_size - (start - lo), pad_size - (hi - stop))
+        tile = np.pad(image[lo:hi], pad_width, mode='reflect')
+        out[start:stop] = np.reshape(
+            nlm_func(tile, pad=False, **kwargs), out[start:stop].shape
+        )
+    return out
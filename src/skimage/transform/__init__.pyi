@@ -18,6 +18,8 @@ __all__ = [
     'integral_image',
     'integrate',
     'warp',
+    'warp_stack',
+    'PrecomputedWarp',
     'warp_coords',
     'warp_polar',
     'estimate_transform',
@@ -41,6 +43,7 @@ __all__ = [
     'pyramid_expand',
     'pyramid_gaussian',
     'pyramid_laplacian',
+    'pyramid_gaussian_stream',
 ]
 
 from .hough_transform import (
@@ -74,6 +77,8 @@ from ._warps import (
     rescale,
     downscale_local_mean,
     warp,
+    warp_stack,
+    PrecomputedWarp,
     warp_coords,
     warp_polar,
     resize_local_mean,
@@ -83,4 +88,5 @@ from .pyramids import (
     pyramid_expand,
     pyramid_gaussian,
     pyramid_laplacian,
+    pyramid_gaussian_stream,
 )
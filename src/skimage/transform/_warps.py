@@ -1,8 +1,11 @@
+import os
+from concurrent.futures import ThreadPoolExecutor as PoolExecutor
+
 import numpy as np
-from scipy import ndimage as ndi
+from scipy import ndimage as ndi, sparse
 
 from ._geometric import SimilarityTransform, AffineTransform, ProjectiveTransform
-from ._warps_cy import _warp_fast
+from ._warps_cy import _warp_fast, _warp_fast_stack
 from ..measure import block_reduce
 
 from .._shared.utils import (
@@ -68,6 +71,37 @@ def _preprocess_resize_output_shape(image, output_shape):
     return image, output_shape
 
 
+def _run_in_bands(func, length, workers):
+    """Call ``func(start, stop)`` on bands of ``range(length)`` in threads.
+
+    The range is split into at most `workers` contiguous bands that are
+    processed concurrently. The called routines release the GIL and fill
+    disjoint parts of the output, so the result does not depend on the number
+    of threads.
+
+    Parameters
+    ----------
+    func : callable
+        Function called with the bounds of each band.
+    length : int
+        Length of the range to split.
+    workers : int or None
+        The number of parallel threads to use. If None, use as many threads
+        as there are CPUs.
+    """
+    if workers is None:
+        workers = os.cpu_count()
+    n_bands = max(min(workers, length), 1)
+    edges = np.linspace(0, length, n_bands + 1).astype(int)
+    bands = list(zip(edges[:-1], edges[1:]))
+    if n_bands == 1:
+        func(*bands[0])
+        return
+    with PoolExecutor(max_workers=n_bands) as executor:
+        # consume the results to raise the errors of the threads, if any
+        list(executor.map(lambda bounds: func(*bounds), bands))
+
+
 def resize(
     image,
     output_shape,
@@ -78,6 +112,9 @@ def resize(
     preserve_range=False,
     anti_aliasing=None,
     anti_aliasing_sigma=None,
+    *,
+    kernel=None,
+    workers=1,
 ):
     """Resize image to match a certain size.
 
@@ -133,6 +170,16 @@ def resize(
         By default, this value is chosen as (s - 1) / 2 where s is the
         downsampling factor, where s > 1. For the up-size case, s < 1, no
         anti-aliasing is performed prior to rescaling.
+    kernel : {'linear', 'lanczos', 'area', 'gaussian'}, optional
+        Resample with precomputed separable filter weights instead of spline
+        interpolation, see Notes. Cannot be combined with `order`.
+    workers : int or None, optional
+        The number of parallel threads to split the rows of the image across.
+        The anti-aliasing filter and, for `order` 0 and 1, the interpolation
+        are computed in bands of rows, which gives the same result up to
+        floating point rounding. With `kernel`, the products along each axis
+        are split across threads. If None, use as many threads as there are
+        CPUs.
 
     See Also
     --------
@@ -158,6 +205,26 @@ def resize(
     For a similar function that preserves the dtype of the input, consider
     `scipy.ndimage.zoom`.
 
+    With `kernel`, the weights of the input pixels contributing to each
+    output pixel are computed once per axis, and the image is resampled one
+    axis at a time by sparse matrix products. This is much faster than the
+    spline interpolation, in particular with anti-aliasing, and single
+    precision input is processed in single precision throughout. The kernels
+    are:
+
+    - 'linear': linear interpolation.
+    - 'lanczos': Lanczos interpolation with three lobes.
+    - 'area': average of the input pixels covered by each output pixel, as
+      in `resize_local_mean`.
+    - 'gaussian': the anti-aliasing Gaussian filter of the default method
+      followed by linear interpolation, i.e., the same result as with
+      ``order=1``.
+
+    When down-sizing with anti-aliasing, the 'linear' and 'lanczos' kernels
+    are stretched by the down-sizing factor so that they average over the
+    input pixels covered by each output pixel. `anti_aliasing_sigma` only
+    applies to the 'gaussian' kernel.
+
     Examples
     --------
     >>> from skimage import data
@@ -165,6 +232,8 @@ def resize(
     >>> image = data.camera()
     >>> resize(image, (100, 100)).shape
     (100, 100)
+    >>> resize(image, (100, 100), kernel='lanczos').shape
+    (100, 100)
 
     """
 
@@ -186,6 +255,16 @@ def resize(
         raise ValueError("anti_aliasing must be False for boolean images")
 
     factors = np.divide(input_shape, output_shape)
+    if kernel is not None:
+        if kernel not in _RESAMPLING_KERNELS:
+            raise ValueError(
+                f"Unknown kernel: '{kernel}', the kernel should be one of "
+                f"{', '.join(repr(k) for k in _RESAMPLING_KERNELS)}"
+            )
+        if order is not None:
+            raise ValueError("`order` cannot be combined with `kernel`")
+        # the kernels interpolate, which is not defined for bool images
+        order = 1
     order = _validate_interpolation_order(input_type, order)
     if order > 0:
         image = convert_to_float(image, preserve_range)
@@ -209,22 +288,304 @@ def resize(
                     "Anti-aliasing standard deviation greater than zero but "
                     "not down-sampling along all axes"
                 )
-        filtered = ndi.gaussian_filter(
-            image, anti_aliasing_sigma, cval=cval, mode=ndi_mode
+
+    if kernel is not None:
+        out = _resize_separable(
+            image,
+            output_shape,
+            kernel,
+            mode,
+            cval,
+            anti_aliasing,
+            anti_aliasing_sigma,
+            workers,
         )
+        _clip_warp_output(image, out, mode, cval, clip)
+        return out
+
+    if anti_aliasing:
+        if workers == 1:
+            filtered = ndi.gaussian_filter(
+                image, anti_aliasing_sigma, cval=cval, mode=ndi_mode
+            )
+        else:
+            filtered = _gaussian_filter_in_bands(
+                image, anti_aliasing_sigma, ndi_mode, cval, workers
+            )
     else:
         filtered = image
 
-    zoom_factors = [1 / f for f in factors]
-    out = ndi.zoom(
-        filtered, zoom_factors, order=order, mode=ndi_mode, cval=cval, grid_mode=True
-    )
+    if workers == 1 or order > 1:
+        zoom_factors = [1 / f for f in factors]
+        out = ndi.zoom(
+            filtered,
+            zoom_factors,
+            order=order,
+            mode=ndi_mode,
+            cval=cval,
+            grid_mode=True,
+        )
+    else:
+        out = _zoom_in_bands(filtered, output_shape, order, ndi_mode, cval, workers)
 
     _clip_warp_output(image, out, mode, cval, clip)
 
     return out
 
 
+def _gaussian_filter_in_bands(image, sigma, mode, cval, workers):
+    """Gaussian filter computed in bands of rows, see `_run_in_bands`.
+
+    Each band is filtered with a margin of the radius of the kernel along the
+    first axis, so that the result is identical to `ndi.gaussian_filter`. With
+    periodic boundaries, the margins of the first and last bands are taken
+    from the opposite end of the image.
+    """
+    sigma = np.broadcast_to(sigma, (image.ndim,))
+    # radius of the kernel along the first axis, as in `ndi.gaussian_filter`
+    radius = int(4.0 * float(sigma[0]) + 0.5)
+    length = image.shape[0]
+    filtered = np.empty_like(image)
+    wrap = mode in ('wrap', 'grid-wrap')
+
+    def filter_rows(start, stop):
+        if wrap:
+            lo = start - radius
+            rows = np.arange(lo, stop + radius)
+            band = np.take(image, rows, axis=0, mode='wrap')
+        else:
+            lo, hi = max(start - radius, 0), min(stop + radius, length)
+            band = image[lo:hi]
+        band = ndi.gaussian_filter(band, sigma, mode=mode, cval=cval)
+        filtered[start:stop] = band[start - lo : stop - lo]
+
+    _run_in_bands(filter_rows, length, workers)
+    return filtered
+
+
+def _zoom_in_bands(image, output_shape, order, mode, cval, workers):
+    """Zoom without spline prefilter computed in bands of output rows.
+
+    This is the equivalent of ``ndi.zoom(..., grid_mode=True)`` for `order`
+    0 and 1, with each band warped by `ndi.affine_transform`.
+    """
+    output_shape = tuple(int(round(s)) for s in output_shape)
+    out = np.empty(output_shape, dtype=image.dtype)
+    scale = np.divide(image.shape, output_shape)
+
+    def zoom_rows(start, stop):
+        # align the pixel centers of input and output like `grid_mode`
+        offset = 0.5 * scale - 0.5
+        offset[0] += scale[0] * start
+        ndi.affine_transform(
+            image,
+            scale,
+            offset=offset,
+            output=out[start:stop],
+            order=order,
+            mode=mode,
+            cval=cval,
+            prefilter=False,
+        )
+
+    _run_in_bands(zoom_rows, out.shape[0], workers)
+    return out
+
+
+def _lanczos(x, lobes=3):
+    return np.where(np.abs(x) < lobes, np.sinc(x) * np.sinc(x / lobes), 0)
+
+
+def _triangle(x):
+    return np.maximum(1 - np.abs(x), 0)
+
+
+# Radius and function of the kernels of `resize`, ``None`` for kernels with
+# dedicated weights
+_RESAMPLING_KERNELS = {
+    'linear': (1, _triangle),
+    'lanczos': (3, _lanczos),
+    'area': None,
+    'gaussian': None,
+}
+
+
+def _resampling_taps(in_size, out_size, kernel, anti_aliasing):
+    """Input pixels and weights of each output pixel along one axis.
+
+    Parameters
+    ----------
+    in_size, out_size : int
+        Size of the axis before and after resampling.
+    kernel : {'linear', 'lanczos', 'area'}
+        Resampling kernel, see `resize`.
+    anti_aliasing : bool
+        Whether to stretch the 'linear' and 'lanczos' kernels by the
+        down-sizing factor.
+
+    Returns
+    -------
+    indices : (out_size, K) ndarray of intp
+        Indices of the input pixels, possibly outside ``[0, in_size)``.
+    weights : (out_size, K) ndarray of float64
+        Weights of the input pixels, the rows sum to 1.
+    """
+    scale = in_size / out_size
+    if kernel == 'area':
+        # overlap of each output pixel with the input pixels, the pixel
+        # edges being at integer positions in input coordinates
+        lower = np.arange(out_size) * scale
+        upper = lower + scale
+        n_taps = int(np.ceil(scale)) + 1
+        indices = np.floor(lower).astype(np.intp)[:, np.newaxis] + np.arange(n_taps)
+        weights = np.minimum(upper[:, np.newaxis], indices + 1) - np.maximum(
+            lower[:, np.newaxis], indices
+        )
+        weights = np.maximum(weights, 0)
+    else:
+        radius, func = _RESAMPLING_KERNELS[kernel]
+        stretch = max(scale, 1) if anti_aliasing else 1
+        support = radius * stretch
+        # centers of the output pixels in input coordinates, as with
+        # ``grid_mode=True`` in `ndi.zoom`
+        centers = (np.arange(out_size) + 0.5) * scale - 0.5
+        n_taps = int(np.ceil(2 * support)) + 1
+        indices = np.floor(centers - support).astype(np.intp) + 1
+        indices = indices[:, np.newaxis] + np.arange(n_taps)
+        weights = func((indices - centers[:, np.newaxis]) / stretch)
+    weights /= weights.sum(axis=1, keepdims=True)
+    return indices, weights
+
+
+def _gaussian_taps(size, sigma):
+    """Input pixels and weights of a Gaussian filter along one axis.
+
+    The kernel is the one of `ndi.gaussian_filter`.
+    """
+    radius = int(4.0 * sigma + 0.5)
+    offsets = np.arange(-radius, radius + 1)
+    kernel = np.exp(-0.5 / sigma**2 * offsets**2)
+    kernel /= kernel.sum()
+    indices = np.arange(size)[:, np.newaxis] + offsets
+    weights = np.broadcast_to(kernel, indices.shape)
+    return indices, weights
+
+
+def _resampling_operator(indices, weights, in_size, mode):
+    """Sparse matrix applying the weights of `_resampling_taps`.
+
+    Returns
+    -------
+    matrix : (out_size, in_size) sparse matrix
+        Weights of the input pixels of each output pixel, with the indices
+        outside of the input mapped according to `mode`.
+    missing : (out_size,) ndarray or None
+        For ``mode='constant'``, the total weight of the pixels outside the
+        input, which take the value `cval`.
+    """
+    missing = None
+    if mode == 'constant':
+        inside = (indices >= 0) & (indices < in_size)
+        missing = np.where(inside, 0, weights).sum(axis=1)
+        weights = np.where(inside, weights, 0)
+        indices = np.where(inside, indices, 0)
+    else:
+        indices = _pad_indices(indices, in_size, mode)
+    n_taps = indices.shape[1]
+    matrix = sparse.csr_matrix(
+        (
+            np.ravel(weights),
+            np.ravel(indices),
+            np.arange(0, indices.size + 1, n_taps),
+        ),
+        shape=(indices.shape[0], in_size),
+    )
+    return matrix, missing
+
+
+def _smooth_resample_operator(in_size, out_size, sigma, mode, smooth_mode=None):
+    """Gaussian filter followed by linear interpolation along one axis.
+
+    This is the operator of `ndi.gaussian_filter` followed by `ndi.zoom` with
+    ``order=1`` and ``grid_mode=True``, see `_resampling_operator`. The
+    filter uses `smooth_mode` if given, and `mode` otherwise. Returns
+    ``(None, None)`` for the identity.
+    """
+    if smooth_mode is None:
+        smooth_mode = mode
+    matrix, missing = None, None
+    if sigma > 1e-15:
+        matrix, missing = _resampling_operator(
+            *_gaussian_taps(in_size, float(sigma)), in_size, smooth_mode
+        )
+    if in_size != out_size:
+        linear, linear_missing = _resampling_operator(
+            *_resampling_taps(in_size, out_size, 'linear', False), in_size, mode
+        )
+        if matrix is None:
+            matrix, missing = linear, linear_missing
+        else:
+            if missing is not None:
+                missing = linear @ missing + linear_missing
+            matrix = linear @ matrix
+    return matrix, missing
+
+
+def _resample_axis(image, axis, matrix, missing, cval, workers):
+    """Apply a resampling operator along one axis of `image`.
+
+    The columns of the other axes are split across `workers` threads.
+    """
+    moved = np.moveaxis(image, axis, 0)
+    columns = moved.reshape(moved.shape[0], -1)
+    out = np.empty((matrix.shape[0], columns.shape[1]), dtype=image.dtype)
+
+    def resample_columns(start, stop):
+        out[:, start:stop] = matrix @ columns[:, start:stop]
+        if missing is not None:
+            out[:, start:stop] += cval * missing[:, np.newaxis]
+
+    _run_in_bands(resample_columns, columns.shape[1], workers)
+    out = out.reshape((matrix.shape[0],) + moved.shape[1:])
+    return np.moveaxis(out, 0, axis)
+
+
+def _resize_separable(
+    image, output_shape, kernel, mode, cval, anti_aliasing, sigma, workers
+):
+    """Resize `image` axis by axis with a separable kernel, see `resize`."""
+    dtype = image.dtype
+    operators = []
+    for axis, (in_size, out_size) in enumerate(zip(image.shape, output_shape)):
+        in_size, out_size = int(in_size), int(round(out_size))
+        if kernel == 'gaussian':
+            matrix, missing = _smooth_resample_operator(
+                in_size, out_size, sigma[axis] if anti_aliasing else 0, mode
+            )
+            if matrix is None:
+                continue
+        elif in_size == out_size:
+            continue
+        else:
+            matrix, missing = _resampling_operator(
+                *_resampling_taps(in_size, out_size, kernel, anti_aliasing),
+                in_size,
+                mode,
+            )
+        if missing is not None:
+            missing = missing.astype(dtype)
+        operators.append((out_size / in_size, axis, matrix.astype(dtype), missing))
+
+    # shrink the image as early as possible
+    operators.sort(key=lambda operator: operator[:2])
+    resized = image
+    for _, axis, matrix, missing in operators:
+        resized = _resample_axis(resized, axis, matrix, missing, cval, workers)
+    if resized is image:
+        resized = image.copy()
+    return resized
+
+
 @channel_as_last_axis()
 def rescale(
     image,
@@ -238,6 +599,8 @@ def rescale(
     anti_aliasing_sigma=None,
     *,
     channel_axis=None,
+    kernel=None,
+    workers=1,
 ):
     """Scale image by a certain factor.
 
@@ -296,6 +659,11 @@ def rescale(
 
         .. versionadded:: 0.19
            ``channel_axis`` was added in 0.19.
+    kernel : {'linear', 'lanczos', 'area', 'gaussian'}, optional
+        Resample with precomputed separable filter weights instead of spline
+        interpolation, see `resize`.
+    workers : int or None, optional
+        The number of parallel threads to use, see `resize`.
 
     Notes
     -----
@@ -340,6 +708,8 @@ def rescale(
         preserve_range=preserve_range,
         anti_aliasing=anti_aliasing,
         anti_aliasing_sigma=anti_aliasing_sigma,
+        kernel=kernel,
+        workers=workers,
     )
 
 
@@ -353,6 +723,8 @@ def rotate(
     cval=0,
     clip=True,
     preserve_range=False,
+    *,
+    workers=1,
 ):
     """Rotate image by a certain angle around its center.
 
@@ -398,6 +770,8 @@ def rotate(
         image is converted according to the conventions of `img_as_float`.
         Also see
         https://scikit-image.org/docs/dev/user_guide/data_types.html
+    workers : int or None, optional
+        The number of parallel threads to use, see `warp`.
 
     Notes
     -----
@@ -466,6 +840,7 @@ def rotate(
         cval=cval,
         clip=clip,
         preserve_range=preserve_range,
+        workers=workers,
     )
 
 
@@ -777,6 +1152,38 @@ def _clip_warp_output(input_image, output_image, mode, cval, clip):
         np.clip(output_image, min_val, max_val, out=output_image)
 
 
+def _warp_fast_in_bands(image, matrix, output_shape, order, mode, cval, workers):
+    """Warp a 2-D image, with optional channels, with `_warp_fast`.
+
+    The rows of the output are split into bands that are warped concurrently,
+    see `_run_in_bands`.
+    """
+    matrix = matrix.astype(image.dtype)
+    ctype = 'float32_t' if image.dtype == np.float32 else 'float64_t'
+    shape = (int(output_shape[0]), int(output_shape[1])) + image.shape[2:]
+    warped = np.empty(shape, dtype=image.dtype)
+    if image.ndim == 2:
+        planes, out_planes = [np.ascontiguousarray(image)], [warped]
+    else:
+        planes = [np.ascontiguousarray(image[..., c]) for c in range(image.shape[2])]
+        out_planes = [warped[..., c] for c in range(image.shape[2])]
+
+    def warp_rows(start, stop):
+        for plane, plane_out in zip(planes, out_planes):
+            _warp_fast[ctype](
+                plane,
+                matrix,
+                order=order,
+                mode=mode,
+                cval=cval,
+                out=plane_out[start:stop],
+                row_start=start,
+            )
+
+    _run_in_bands(warp_rows, warped.shape[0], workers)
+    return warped
+
+
 def warp(
     image,
     inverse_map,
@@ -787,6 +1194,8 @@ def warp(
     cval=0.0,
     clip=True,
     preserve_range=False,
+    *,
+    workers=1,
 ):
     """Warp an image according to a given coordinate transformation.
 
@@ -857,6 +1266,11 @@ def warp(
         image is converted according to the conventions of `img_as_float`.
         Also see
         https://scikit-image.org/docs/dev/user_guide/data_types.html
+    workers : int or None, optional
+        The number of parallel threads to split the rows of the output across.
+        This applies to the fast routine for homographies and, for `order` 0
+        and 1, to the interpolation of other inverse maps. If None, use as
+        many threads as there are CPUs.
 
     Returns
     -------
@@ -984,32 +1398,10 @@ def warp(
             # inverse_map is the inverse of a homography
             matrix = np.linalg.inv(inverse_map.__self__.params)
 
-        if matrix is not None:
-            matrix = matrix.astype(image.dtype)
-            ctype = 'float32_t' if image.dtype == np.float32 else 'float64_t'
-            if image.ndim == 2:
-                warped = _warp_fast[ctype](
-                    image,
-                    matrix,
-                    output_shape=output_shape,
-                    order=order,
-                    mode=mode,
-                    cval=cval,
-                )
-            elif image.ndim == 3:
-                dims = []
-                for dim in range(image.shape[2]):
-                    dims.append(
-                        _warp_fast[ctype](
-                            image[..., dim],
-                            matrix,
-                            output_shape=output_shape,
-                            order=order,
-                            mode=mode,
-                            cval=cval,
-                        )
-                    )
-                warped = np.dstack(dims)
+        if matrix is not None and image.ndim in (2, 3):
+            warped = _warp_fast_in_bands(
+                image, matrix, output_shape, order, mode, cval, workers
+            )
 
     if warped is None:
         # use ndi.map_coordinates
@@ -1049,15 +1441,496 @@ def warp(
         prefilter = order > 1
 
         ndi_mode = _to_ndimage_mode(mode)
-        warped = ndi.map_coordinates(
-            image, coords, prefilter=prefilter, mode=ndi_mode, order=order, cval=cval
-        )
+        if workers == 1 or prefilter:
+            warped = ndi.map_coordinates(
+                image,
+                coords,
+                prefilter=prefilter,
+                mode=ndi_mode,
+                order=order,
+                cval=cval,
+            )
+        else:
+            warped = np.empty(coords.shape[1:], dtype=image.dtype)
+
+            def map_rows(start, stop):
+                ndi.map_coordinates(
+                    image,
+                    coords[:, start:stop],
+                    output=warped[start:stop],
+                    prefilter=False,
+                    mode=ndi_mode,
+                    order=order,
+                    cval=cval,
+                )
+
+            _run_in_bands(map_rows, warped.shape[0], workers)
 
     _clip_warp_output(image, warped, mode, cval, clip)
 
     return warped
 
 
+def _clip_warp_stack_output(input_images, output_images, mode, cval, clip):
+    """Clip each output frame to the range of values of its input frame.
+
+    Vectorized version of `_clip_warp_output` for stacks of frames along the
+    first axis.
+    """
+    if not clip:
+        return
+    axes = tuple(range(1, input_images.ndim))
+    min_val = np.nanmin(input_images, axis=axes, keepdims=True)
+    max_val = np.nanmax(input_images, axis=axes, keepdims=True)
+
+    if mode == 'constant':
+        # Keep cval if it expands the effective input range of a frame
+        preserve_cval = (
+            ~((min_val <= cval) & (cval <= max_val))
+            & (np.nanmin(output_images, axis=axes, keepdims=True) <= cval)
+            & (cval <= np.nanmax(output_images, axis=axes, keepdims=True))
+        )
+        cval = input_images.dtype.type(cval)
+        min_val = np.where(preserve_cval, np.minimum(min_val, cval), min_val)
+        max_val = np.where(preserve_cval, np.maximum(max_val, cval), max_val)
+
+    np.clip(output_images, min_val, max_val, out=output_images)
+
+
+def warp_stack(
+    images,
+    inverse_maps,
+    *,
+    output_shape=None,
+    order=None,
+    mode='constant',
+    cval=0.0,
+    clip=True,
+    preserve_range=False,
+    out=None,
+    workers=1,
+):
+    """Warp every frame of an image stack with its own homography.
+
+    Equivalent to calling :func:`warp` on every frame with its transformation,
+    but the input is validated and converted once for the whole stack and,
+    for bi-linear and bi-cubic interpolation, all frames are warped in a
+    single call of the compiled routine, without holding the GIL.
+
+    Parameters
+    ----------
+    images : (N, M, P[, C]) ndarray
+        Stack of `N` 2-D images, with an optional trailing channel axis.
+    inverse_maps : (N, 3, 3) array or sequence of transformation objects
+        Inverse coordinate map of each frame, which transforms coordinates in
+        the output frame into their corresponding coordinates in the input
+        frame. Either homogeneous transformation matrices, as accepted by
+        :func:`warp`, or `SimilarityTransform`, `AffineTransform` or
+        `ProjectiveTransform` objects (or their inverse).
+    output_shape : tuple (rows, cols), optional
+        Shape of the output frames. By default the shape of the input frames
+        is preserved.
+    order : int, optional
+        The order of interpolation, see :func:`warp`. Orders other than 1 and
+        3 are supported by calling :func:`warp` for each frame.
+    mode : {'constant', 'edge', 'symmetric', 'reflect', 'wrap'}, optional
+        Points outside the boundaries of the input are filled according
+        to the given mode.  Modes match the behaviour of `numpy.pad`.
+    cval : float, optional
+        Used in conjunction with mode 'constant', the value outside
+        the image boundaries.
+    clip : bool, optional
+        Whether to clip each output frame to the range of values of its
+        input frame.
+    preserve_range : bool, optional
+        Whether to keep the original range of values. Otherwise, the input
+        images are converted according to the conventions of `img_as_float`.
+    out : ndarray, optional
+        Preallocated array for the output, of shape ``(N, rows, cols[, C])``
+        and of the dtype of the input after conversion, i.e. float32 for
+        float32 input and float64 otherwise, or the input dtype if `order`
+        is 0.
+    workers : int or None, optional
+        The number of parallel threads to split the frames across. If None,
+        use as many threads as there are CPUs.
+
+    Returns
+    -------
+    warped : (N, rows, cols[, C]) ndarray
+        The warped frames.
+
+    See Also
+    --------
+    warp
+
+    Examples
+    --------
+    >>> from skimage.transform import EuclideanTransform, warp_stack
+    >>> rng = np.random.default_rng()
+    >>> stack = rng.random((4, 32, 32))
+    >>> tforms = [EuclideanTransform(translation=(t, 0)) for t in range(4)]
+    >>> warp_stack(stack, tforms).shape
+    (4, 32, 32)
+    """
+    images = np.asarray(images)
+    if images.ndim not in (3, 4):
+        raise ValueError(
+            f"`images` must be a stack of 2-D images with an optional channel "
+            f"axis, got an array of shape {images.shape}"
+        )
+    if images.size == 0:
+        raise ValueError("Cannot warp empty image stack with dimensions", images.shape)
+
+    if isinstance(inverse_maps, np.ndarray):
+        matrices = inverse_maps
+    else:
+        matrices = np.array(
+            [
+                tform.params if isinstance(tform, HOMOGRAPHY_TRANSFORMS) else tform
+                for tform in inverse_maps
+            ]
+        )
+    if matrices.shape != (images.shape[0], 3, 3):
+        raise ValueError(
+            f"expected {images.shape[0]} homogeneous transformation matrices "
+            f"of shape (3, 3), got an array of shape {matrices.shape}"
+        )
+
+    order = _validate_interpolation_order(images.dtype, order)
+    if order > 0:
+        images = convert_to_float(images, preserve_range)
+
+    if output_shape is None:
+        output_shape = images.shape[1:3]
+    else:
+        output_shape = tuple(safe_as_int(output_shape)[:2])
+    shape = (images.shape[0],) + output_shape + images.shape[3:]
+    if out is None:
+        out = np.empty(shape, dtype=images.dtype)
+    elif out.shape != shape or out.dtype != images.dtype:
+        raise ValueError(
+            f"`out` must have shape {shape} and dtype {images.dtype}, "
+            f"got {out.shape} and {out.dtype}"
+        )
+
+    if order not in (1, 3):
+        for frame, matrix, frame_out in zip(images, matrices, out):
+            frame_out[...] = warp(
+                frame,
+                matrix,
+                output_shape=output_shape,
+                order=order,
+                mode=mode,
+                cval=cval,
+                clip=clip,
+                preserve_range=preserve_range,
+            )
+        return out
+
+    # the compiled routine expects the channels before the rows and columns
+    if images.ndim == 3:
+        planes, out_planes = images[:, np.newaxis], out[:, np.newaxis]
+    else:
+        planes, out_planes = np.moveaxis(images, -1, 1), np.moveaxis(out, -1, 1)
+    planes = np.ascontiguousarray(planes)
+    matrices = np.ascontiguousarray(matrices, dtype=images.dtype)
+    ctype = 'float32_t' if images.dtype == np.float32 else 'float64_t'
+
+    def warp_frames(start, stop):
+        _warp_fast_stack[ctype](
+            planes[start:stop],
+            matrices[start:stop],
+            out_planes[start:stop],
+            order=order,
+            mode=mode,
+            cval=cval,
+        )
+
+    _run_in_bands(warp_frames, images.shape[0], workers)
+
+    _clip_warp_stack_output(images, out, mode, cval, clip)
+    return out
+
+
+def _pad_indices(indices, size, mode):
+    """Map integer indices outside ``[0, size)`` into the image like `np.pad`.
+
+    Indices outside the image are left untouched for ``mode='constant'``.
+    """
+    if mode == 'edge':
+        return np.clip(indices, 0, size - 1)
+    if mode == 'wrap':
+        return indices % size
+    if mode == 'symmetric':
+        indices = indices % (2 * size)
+        return np.where(indices < size, indices, 2 * size - 1 - indices)
+    if mode == 'reflect':
+        if size == 1:
+            return np.zeros_like(indices)
+        period = 2 * (size - 1)
+        indices = indices % period
+        return np.where(indices < size, indices, period - indices)
+    return indices
+
+
+def _interpolation_weights(coords, order, dtype):
+    """Start index and weights of the interpolation kernel along one axis.
+
+    The kernels match the ones of the compiled routine used by `warp` for
+    homographies: linear interpolation and Keys' cubic convolution for
+    `order` 1 and 3.
+
+    Returns
+    -------
+    indices : (order + 1, P) ndarray of intp
+        Indices of the neighbors of each coordinate.
+    weights : (order + 1, P) ndarray of `dtype`
+        Weight of each neighbor.
+    """
+    coords = np.asarray(coords, dtype=np.float64).ravel()
+    floor = np.floor(coords)
+    x = coords - floor
+    if order == 1:
+        weights = [1 - x, x]
+        start = floor
+    else:
+        x2, x3 = x * x, x * x * x
+        weights = [
+            0.5 * (-x + 2 * x2 - x3),
+            0.5 * (2 - 5 * x2 + 3 * x3),
+            0.5 * (x + 4 * x2 - 3 * x3),
+            0.5 * (x3 - x2),
+        ]
+        start = floor - 1
+    offsets = np.arange(order + 1)[:, np.newaxis]
+    indices = start.astype(np.intp) + offsets
+    return indices, np.asarray(weights, dtype=dtype)
+
+
+class PrecomputedWarp:
+    """Warp of 2-D images with a precomputed inverse mapping.
+
+    The source coordinates of each output pixel, and the weights of the
+    input pixels they are interpolated from, are computed once. Warping an
+    image is then a pure gather of the stored neighbors, which makes
+    repeatedly applying the same transform to images of the same shape much
+    faster than calling `warp` each time, in particular for transforms with
+    an expensive inverse such as `PiecewiseAffineTransform`.
+
+    Parameters
+    ----------
+    inverse_map : transformation object, callable ``cr = f(cr, **kwargs)``, or ndarray
+        Inverse coordinate map, which transforms coordinates in the output
+        images into their corresponding coordinates in the input image. Either
+        a transformation object, a ``(3, 3)`` homogeneous transformation
+        matrix, a callable or an array of coordinates of shape
+        ``(2, rows, cols)``, see `warp`.
+    shape : tuple (rows, cols)
+        Shape of the input images. Only the first two values are used, so
+        that images with any number of channels can be warped.
+    output_shape : tuple (rows, cols), optional
+        Shape of the output images. By default the shape of the input images.
+        Ignored if `inverse_map` is an array of coordinates.
+    map_args : dict, optional
+        Keyword arguments passed to `inverse_map`.
+    order : {0, 1, 3}, optional
+        The order of interpolation: nearest-neighbor, bi-linear or bi-cubic.
+    mode : {'constant', 'edge', 'symmetric', 'reflect', 'wrap'}, optional
+        Points outside the boundaries of the input are filled according
+        to the given mode.  Modes match the behaviour of `numpy.pad`.
+    dtype : {np.float64, np.float32}, optional
+        Precision of the stored interpolation weights. Single precision
+        halves the memory used by the weights.
+
+    Attributes
+    ----------
+    shape : tuple (rows, cols)
+        Shape of the input images.
+    output_shape : tuple (rows, cols)
+        Shape of the output images.
+    nbytes : int
+        Memory used by the precomputed map in bytes.
+
+    See Also
+    --------
+    warp
+
+    Notes
+    -----
+    Nearest neighbors are looked up with `scipy.ndimage.map_coordinates`,
+    as in `warp`, so that the result is the same as with `warp` for
+    ``order=0``. The bi-linear and bi-cubic kernels are the ones `warp` uses
+    for homographies, so the result is the same as with `warp` for these
+    transforms. For other inverse maps, `warp` uses
+    `scipy.ndimage.map_coordinates`, whose bi-cubic spline interpolation
+    differs slightly.
+
+    The map stores ``(order + 1) ** 2`` indices and weights per output pixel.
+
+    Examples
+    --------
+    >>> from skimage import data
+    >>> from skimage.transform import PiecewiseAffineTransform, PrecomputedWarp
+    >>> image = data.camera()
+    >>> rows, cols = np.mgrid[0:512:64j, 0:512:64j]
+    >>> src = np.column_stack([cols.ravel(), rows.ravel()])
+    >>> dst = src + np.sin(src / 40) * 4
+    >>> tform = PiecewiseAffineTransform.from_estimate(src, dst)
+    >>> warp_map = PrecomputedWarp(tform.inverse, image.shape)
+    >>> warped = warp_map(image)
+    >>> warped.shape
+    (512, 512)
+    """
+
+    def __init__(
+        self,
+        inverse_map,
+        shape,
+        output_shape=None,
+        *,
+        map_args=None,
+        order=1,
+        mode='constant',
+        dtype=np.float64,
+    ):
+        if order not in (0, 1, 3):
+            raise ValueError(f"`order` must be 0, 1 or 3, got {order}")
+        # validate the mode
+        _to_ndimage_mode(mode)
+        if map_args is None:
+            map_args = {}
+
+        self.shape = tuple(int(s) for s in safe_as_int(shape)[:2])
+        self.order = order
+        self.mode = mode
+        rows, cols = self.shape
+
+        if isinstance(inverse_map, np.ndarray) and inverse_map.shape == (3, 3):
+            inverse_map = ProjectiveTransform(matrix=inverse_map)
+        if isinstance(inverse_map, np.ndarray):
+            if inverse_map.ndim != 3 or inverse_map.shape[0] != 2:
+                raise ValueError(
+                    f"coordinates must be of shape (2, rows, cols), got "
+                    f"{inverse_map.shape}"
+                )
+            coords = inverse_map
+        else:
+            if output_shape is None:
+                output_shape = self.shape
+
+            def coord_map(*args):
+                return inverse_map(*args, **map_args)
+
+            coords = warp_coords(coord_map, tuple(safe_as_int(output_shape)[:2]))
+        self.output_shape = coords.shape[1:]
+        index_dtype = np.int32 if rows * cols < 2**31 else np.intp
+
+        if order == 0:
+            # Look up the index of the nearest neighbor the way `warp` does,
+            # including the rounding of half-integer coordinates and the
+            # boundary modes of ndimage
+            flat = np.arange(rows * cols, dtype=np.float64).reshape(rows, cols)
+            nearest = ndi.map_coordinates(
+                flat, coords, order=0, mode=_to_ndimage_mode(mode), cval=-1
+            ).ravel()
+            outside = nearest < 0
+            self._indices = np.where(outside, 0, nearest).astype(index_dtype)
+            self._outside = outside if mode == 'constant' else None
+            self._matrix = self._cval_weights = None
+            return
+
+        row_indices, row_weights = _interpolation_weights(coords[0], order, dtype)
+        col_indices, col_weights = _interpolation_weights(coords[1], order, dtype)
+        row_inside = (row_indices >= 0) & (row_indices < rows)
+        col_inside = (col_indices >= 0) & (col_indices < cols)
+        row_indices = _pad_indices(row_indices, rows, mode)
+        col_indices = _pad_indices(col_indices, cols, mode)
+
+        # Combine the neighbors along both axes, shape (P, (order + 1) ** 2)
+        indices = row_indices[:, np.newaxis] * cols + col_indices[np.newaxis]
+        indices = indices.reshape(-1, indices.shape[-1]).T
+        weights = row_weights[:, np.newaxis] * col_weights[np.newaxis]
+        weights = weights.reshape(-1, weights.shape[-1]).T
+        if mode == 'constant':
+            inside = row_inside[:, np.newaxis] & col_inside[np.newaxis]
+            inside = inside.reshape(-1, inside.shape[-1]).T
+            # neighbors outside the image contribute `cval` instead
+            indices = np.where(inside, indices, 0)
+            weights = np.where(inside, weights, 0)
+
+        n_neighbors = weights.shape[1]
+        self._matrix = sparse.csr_matrix(
+            (
+                weights.ravel(),
+                indices.ravel().astype(index_dtype),
+                np.arange(0, weights.size + 1, n_neighbors, dtype=index_dtype),
+            ),
+            shape=(weights.shape[0], rows * cols),
+        )
+        self._cval_weights = None
+        if mode == 'constant':
+            self._cval_weights = (1 - weights.sum(axis=1)).astype(dtype)
+        self._indices = self._outside = None
+
+    @property
+    def nbytes(self):
+        arrays = [self._indices, self._outside, self._cval_weights]
+        if self._matrix is not None:
+            matrix = self._matrix
+            arrays += [matrix.data, matrix.indices, matrix.indptr]
+        return sum(a.nbytes for a in arrays if a is not None)
+
+    def __call__(self, image, *, cval=0.0, clip=True, preserve_range=False):
+        """Warp an image with the precomputed map.
+
+        Parameters
+        ----------
+        image : (rows, cols[, C]) ndarray
+            Input image, of the shape the map was computed for.
+        cval : float, optional
+            Used in conjunction with mode 'constant', the value outside
+            the image boundaries.
+        clip : bool, optional
+            Whether to clip the output to the range of values of the input
+            image.
+        preserve_range : bool, optional
+            Whether to keep the original range of values. Otherwise, the input
+            image is converted according to the conventions of `img_as_float`.
+
+        Returns
+        -------
+        warped : ndarray
+            The warped image. As with `warp`, its dtype is the input dtype for
+            nearest-neighbor interpolation and floating point otherwise.
+        """
+        image = np.asarray(image)
+        if image.ndim not in (2, 3) or image.shape[:2] != self.shape:
+            raise ValueError(
+                f"expected an image of shape {self.shape} with an optional "
+                f"channel axis, got {image.shape}"
+            )
+        out_shape = self.output_shape + image.shape[2:]
+        plane = image.reshape(self.shape[0] * self.shape[1], -1)
+
+        if self.order == 0:
+            warped = plane[self._indices]
+            if self._outside is not None:
+                warped[self._outside] = cval
+            return warped.reshape(out_shape)
+
+        image = convert_to_float(image, preserve_range)
+        if image.dtype == np.float16:
+            image = image.astype(np.float32)
+        plane = image.reshape(self.shape[0] * self.shape[1], -1)
+        warped = np.asarray(self._matrix @ plane)
+        if self._cval_weights is not None:
+            warped += cval * self._cval_weights[:, np.newaxis]
+        warped = warped.astype(image.dtype, copy=False).reshape(out_shape)
+
+        _clip_warp_output(image, warped, self.mode, cval, clip)
+        return warped
+
+
 def _linear_polar_mapping(output_coords, k_angle, k_radius, center):
     """Inverse mapping function to convert from cartesian to polar coordinates
 
@@ -68,8 +68,59 @@ cdef inline void _transform_projective(np_floats x, np_floats y, np_floats* H,
     y_[0] = (H[3] * x + H[4] * y + H[5]) / z_
 
 
+cdef void _warp_plane(np_floats* img, Py_ssize_t rows, Py_ssize_t cols,
+                      np_floats* M, np_floats* out, Py_ssize_t out_r,
+                      Py_ssize_t out_c, Py_ssize_t row_stride,
+                      Py_ssize_t col_stride, Py_ssize_t row_start, int order,
+                      char mode_c, np_floats cval) noexcept nogil:
+    """Warp a single C-contiguous plane into `out`, see `_warp_fast`.
+
+    `out` holds the `out_r` output rows starting at `row_start` and its
+    strides are given in elements. `order` must be one of 0, 1, 2 or 3.
+    """
+    cdef Py_ssize_t tfr, tfc
+    cdef np_floats r, c
+
+    cdef void (*transform_func)(np_floats, np_floats, np_floats*,
+                                np_floats*, np_floats*) noexcept nogil
+    if M[6] == 0 and M[7] == 0 and M[8] == 1:
+        if M[1] == 0 and M[3] == 0:
+            transform_func = _transform_metric
+        else:
+            transform_func = _transform_affine
+    else:
+        transform_func = _transform_projective
+
+    cdef void (*interp_func)(np_floats*, Py_ssize_t , Py_ssize_t ,
+                             np_floats, np_floats, char, np_floats,
+                             np_floats*) noexcept nogil
+    if order == 0:
+        interp_func = nearest_neighbor_interpolation[np_floats, np_floats,
+                                                      np_floats]
+    elif order == 1:
+        interp_func = bilinear_interpolation[np_floats, np_floats, np_floats]
+    elif order == 2:
+        interp_func = biquadratic_interpolation[np_floats, np_floats, np_floats]
+    else:
+        interp_func = bicubic_interpolation[np_floats, np_floats, np_floats]
+
+    for tfr in range(out_r):
+        for tfc in range(out_c):
+            transform_func(tfc, tfr + row_start, M, &c, &r)
+            interp_func(img, rows, cols, r, c, mode_c, cval,
+                        &out[tfr * row_stride + tfc * col_stride])
+
+
+cdef char _mode_code(mode) except 0:
+    if mode not in ('constant', 'wrap', 'symmetric', 'reflect', 'edge'):
+        raise ValueError("Invalid mode specified.  Please use `constant`, "
+                         "`edge`, `wrap`, `reflect` or `symmetric`.")
+    return ord(mode[0].upper())
+
+
 def _warp_fast(np_floats[:, :] image, np_floats[:, :] H, output_shape=None,
-               int order=1, mode='constant', np_floats cval=0):
+               int order=1, mode='constant', np_floats cval=0,
+               np_floats[:, :] out=None, Py_ssize_t row_start=0):
     """Projective transformation (homography).
 
     Perform a projective transformation (homography) of a floating
@@ -110,6 +161,13 @@ def _warp_fast(np_floats[:, :] image, np_floats[:, :] H, output_shape=None,
     cval : float, optional (default 0)
         Used in conjunction with mode 'C' (constant), the value
         outside the image boundaries.
+    out : ndarray, shape (P, Q), optional
+        Output array, filled with the rows ``row_start`` to
+        ``row_start + P`` of the warped image. If given, `output_shape` is
+        ignored. The GIL is released while filling it, so that bands of rows
+        can be warped concurrently in separate threads.
+    row_start : int, optional (default 0)
+        Index of the first output row to compute, see `out`.
 
     Notes
     -----
@@ -129,56 +187,77 @@ def _warp_fast(np_floats[:, :] image, np_floats[:, :] H, output_shape=None,
     else:
         dtype = np.float64
 
-    if mode not in ('constant', 'wrap', 'symmetric', 'reflect', 'edge'):
-        raise ValueError("Invalid mode specified.  Please use `constant`, "
-                         "`edge`, `wrap`, `reflect` or `symmetric`.")
-    cdef char mode_c = ord(mode[0].upper())
+    cdef char mode_c = _mode_code(mode)
+    if order not in (0, 1, 2, 3):
+        raise ValueError("Unsupported interpolation order", order)
 
     cdef Py_ssize_t out_r, out_c
-    if output_shape is None:
-        out_r = int(img.shape[0])
-        out_c = int(img.shape[1])
-    else:
-        out_r = int(output_shape[0])
-        out_c = int(output_shape[1])
+    if out is None:
+        if output_shape is None:
+            out_r = int(img.shape[0])
+            out_c = int(img.shape[1])
+        else:
+            out_r = int(output_shape[0])
+            out_c = int(output_shape[1])
+        out = np.zeros((out_r, out_c), dtype=dtype)
+    out_r = out.shape[0]
+    out_c = out.shape[1]
+
+    cdef Py_ssize_t itemsize = sizeof(np_floats)
+    if out_r > 0 and out_c > 0:
+        with nogil:
+            _warp_plane(&img[0, 0], img.shape[0], img.shape[1], &M[0, 0],
+                        &out[0, 0], out_r, out_c, out.strides[0] // itemsize,
+                        out.strides[1] // itemsize, row_start, order, mode_c,
+                        cval)
 
-    cdef np_floats[:, ::1] out = np.zeros((out_r, out_c), dtype=dtype)
+    return np.asarray(out)
 
-    cdef Py_ssize_t tfr, tfc
-    cdef np_floats r, c
-    cdef Py_ssize_t rows = img.shape[0]
-    cdef Py_ssize_t cols = img.shape[1]
 
-    cdef void (*transform_func)(np_floats, np_floats, np_floats*,
-                                np_floats*, np_floats*) noexcept nogil
-    if M[2, 0] == 0 and M[2, 1] == 0 and M[2, 2] == 1:
-        if M[0, 1] == 0 and M[1, 0] == 0:
-            transform_func = _transform_metric
-        else:
-            transform_func = _transform_affine
-    else:
-        transform_func = _transform_projective
+def _warp_fast_stack(np_floats[:, :, :, ::1] images,
+                     np_floats[:, :, ::1] H,
+                     np_floats[:, :, :, :] out,
+                     int order=1, mode='constant', np_floats cval=0):
+    """Projective transformation of each frame of a stack of images.
 
-    cdef void (*interp_func)(np_floats*, Py_ssize_t , Py_ssize_t ,
-                             np_floats, np_floats, char, np_floats,
-                             np_floats*) noexcept nogil
-    if order == 0:
-        interp_func = nearest_neighbor_interpolation[np_floats, np_floats,
-                                                      np_floats]
-    elif order == 1:
-        interp_func = bilinear_interpolation[np_floats, np_floats, np_floats]
-    elif order == 2:
-        interp_func = biquadratic_interpolation[np_floats, np_floats, np_floats]
-    elif order == 3:
-        interp_func = bicubic_interpolation[np_floats, np_floats, np_floats]
-    else:
-        raise ValueError("Unsupported interpolation order", order)
+    Same as `_warp_fast`, but all frames and channels are warped without
+    holding the GIL, each with the matrix of its frame.
 
+    Parameters
+    ----------
+    images : ndarray, shape (F, C, M, N)
+        Input frames, with the channels before the rows and columns.
+    H : array, shape (F, 3, 3)
+        Transformation matrix of each frame.
+    out : ndarray, shape (F, C, P, Q)
+        Output frames, may be a strided view.
+    order : {0, 1, 2, 3}, optional
+        Order of interpolation, see `_warp_fast`.
+    mode : {'constant', 'edge', 'symmetric', 'reflect', 'wrap'}, optional
+        Points outside the boundaries of the input are filled according
+        to the given mode.
+    cval : float, optional (default 0)
+        Used in conjunction with mode 'constant', the value outside the image
+        boundaries.
+    """
+    cdef char mode_c = _mode_code(mode)
+    if order not in (0, 1, 2, 3):
+        raise ValueError("Unsupported interpolation order", order)
+    if (H.shape[0] != images.shape[0] or out.shape[0] != images.shape[0]
+            or out.shape[1] != images.shape[1]):
+        raise ValueError("`images`, `H` and `out` must have as many frames "
+                         "and `images` and `out` as many channels")
+
+    cdef Py_ssize_t frame, channel
+    cdef Py_ssize_t itemsize = sizeof(np_floats)
+    if out.shape[2] == 0 or out.shape[3] == 0:
+        return
     with nogil:
-        for tfr in range(out_r):
-            for tfc in range(out_c):
-                transform_func(tfc, tfr, &M[0, 0], &c, &r)
-                interp_func(&img[0, 0], rows, cols, r, c,
-                            mode_c, cval, &out[tfr, tfc])
-
-    return np.asarray(out)
+        for frame in range(images.shape[0]):
+            for channel in range(images.shape[1]):
+                _warp_plane(&images[frame, channel, 0, 0], images.shape[2],
+                            images.shape[3], &H[frame, 0, 0],
+                            &out[frame, channel, 0, 0], out.shape[2],
+                            out.shape[3], out.strides[2] // itemsize,
+                            out.strides[3] // itemsize, 0, order, mode_c,
+                            cval)
@@ -1,10 +1,11 @@
 import math
 
 import numpy as np
+from scipy import sparse
 
 from .._shared.filters import gaussian
-from .._shared.utils import convert_to_float
-from ._warps import resize
+from .._shared.utils import convert_to_float, _to_ndimage_mode
+from ._warps import resize, _resample_axis, _smooth_resample_operator
 
 
 def _smooth(image, sigma, mode, cval, channel_axis):
@@ -406,3 +407,243 @@ def pyramid_laplacian(
         current_shape = resized_image.shape
 
         yield resized_image - smoothed_image
+
+
+class _LayerStream:
+    """Compute the rows of a pyramid layer from the rows of the previous one.
+
+    The rows of the previous layer are pushed in order. They are first
+    smoothed and resized along all axes but the first one, and buffered
+    until all rows needed by the next rows of the layer are available. Rows
+    that are not needed anymore are discarded from the buffer.
+    """
+
+    def __init__(self, in_shape, out_shape, sigmas, mode, cval, dtype):
+        self.cval = cval
+        self.dtype = dtype
+        # as in `pyramid_reduce`, the smoothing passes `mode` to SciPy, for
+        # which 'reflect' is the 'symmetric' mode of `numpy.pad`
+        smooth_mode = 'symmetric' if mode == 'reflect' else mode
+        self.axis_operators = []
+        for axis in range(1, len(in_shape)):
+            matrix, missing = _smooth_resample_operator(
+                in_shape[axis], out_shape[axis], sigmas[axis], mode, smooth_mode
+            )
+            if matrix is not None:
+                if missing is not None:
+                    missing = missing.astype(dtype)
+                self.axis_operators.append((axis, matrix.astype(dtype), missing))
+
+        matrix, missing = _smooth_resample_operator(
+            in_shape[0], out_shape[0], sigmas[0], mode, smooth_mode
+        )
+        if matrix is None:
+            matrix = sparse.identity(in_shape[0], format='csr')
+        self.matrix = matrix.tocsr().astype(dtype)
+        self.missing = None if missing is None else missing.astype(dtype)
+
+        # the last input row needed by each output row and the rows before it,
+        # as the rows are emitted in order, and the first input row needed by
+        # the remaining rows for discarding the buffer
+        rows_needed = [
+            self.matrix.indices[start:stop]
+            for start, stop in zip(self.matrix.indptr[:-1], self.matrix.indptr[1:])
+        ]
+        first = np.array([r.min() if r.size else 0 for r in rows_needed])
+        last = np.array([r.max() if r.size else 0 for r in rows_needed])
+        self.last_needed = np.maximum.accumulate(last)
+        self.keep_from = np.minimum.accumulate(first[::-1])[::-1]
+
+        self.buffer = None
+        self.buffer_start = 0
+        self.n_received = 0
+        self.n_emitted = 0
+
+    def push(self, rows):
+        """Add the next rows of the previous layer.
+
+        Returns
+        -------
+        start : int
+            Index of the first of the new rows of this layer.
+        rows : ndarray
+            New rows of this layer, possibly empty.
+        """
+        for axis, matrix, missing in self.axis_operators:
+            rows = _resample_axis(rows, axis, matrix, missing, self.cval, 1)
+        if self.buffer is None:
+            self.buffer = rows
+        else:
+            self.buffer = np.concatenate([self.buffer, rows])
+        self.n_received += len(rows)
+
+        start = self.n_emitted
+        stop = start + np.searchsorted(
+            self.last_needed[start:], self.n_received, side='left'
+        )
+        buffer_stop = self.buffer_start + len(self.buffer)
+        band = self.matrix[start:stop, self.buffer_start : buffer_stop]
+        out = band @ self.buffer.reshape(len(self.buffer), -1)
+        out = np.asarray(out, dtype=self.dtype)
+        if self.missing is not None:
+            out += self.cval * self.missing[start:stop, np.newaxis]
+        out = out.reshape((stop - start,) + self.buffer.shape[1:])
+        self.n_emitted = stop
+
+        if stop < len(self.keep_from):
+            keep_from = self.keep_from[stop]
+            self.buffer = self.buffer[keep_from - self.buffer_start :]
+            self.buffer_start = keep_from
+        return start, out
+
+
+def pyramid_gaussian_stream(
+    image,
+    sink,
+    max_layer=-1,
+    downscale=2,
+    sigma=None,
+    mode='reflect',
+    cval=0,
+    preserve_range=False,
+    *,
+    channel_axis=None,
+    dtype=np.float32,
+    chunk_rows=256,
+):
+    """Write all layers of the Gaussian pyramid of an image in a single pass.
+
+    The image is read once, in chunks of rows along its first axis, and every
+    layer of the pyramid is computed and handed to `sink` chunk by chunk as
+    soon as the rows it depends on are available. Only a few rows of each
+    layer are held in memory at any time, so that pyramids of images that do
+    not fit in memory, e.g. memory-mapped or chunked arrays, can be built.
+
+    The layers are the same as the ones of `pyramid_gaussian` with
+    ``order=1``, up to floating point rounding.
+
+    Parameters
+    ----------
+    image : array_like
+        Input image. Any object supporting slicing of rows along the first
+        axis into arrays, such as a `numpy.memmap` or a zarr array.
+    sink : callable
+        Function called as ``sink(layer, start, rows)`` with the rows
+        ``start`` to ``start + len(rows)`` of `layer`, where layer 0 is the
+        converted input image. The rows of each layer are passed in order.
+    max_layer : int, optional
+        Number of layers for the pyramid. 0th layer is the original image.
+        Default is -1 which builds all possible layers.
+    downscale : float, optional
+        Downscale factor.
+    sigma : float, optional
+        Sigma for Gaussian filter. Default is `2 * downscale / 6.0` which
+        corresponds to a filter mask twice the size of the scale factor that
+        covers more than 99% of the Gaussian distribution.
+    mode : {'reflect', 'constant', 'edge', 'symmetric', 'wrap'}, optional
+        The mode parameter determines how the array borders are handled, where
+        cval is the value when mode is equal to 'constant'. With 'wrap', the
+        first rows of each layer depend on its last rows, so that the whole
+        layers are held in memory.
+    cval : float, optional
+        Value to fill past edges of input if mode is 'constant'.
+    preserve_range : bool, optional
+        Whether to keep the original range of values. Otherwise, the input
+        image is converted according to the conventions of `img_as_float`.
+        Also see https://scikit-image.org/docs/dev/user_guide/data_types.html
+    channel_axis : int or None, optional
+        If None, the image is assumed to be a grayscale (single channel) image.
+        Otherwise, this parameter indicates which axis of the array corresponds
+        to channels. The channels cannot be along the first axis.
+    dtype : dtype, optional
+        Data type of the layers passed to `sink`, float32 by default. If it is
+        the integer data type of the input, the layers keep the range of
+        values of the input and are rounded.
+    chunk_rows : int, optional
+        Number of rows of the input read at once.
+
+    Returns
+    -------
+    shapes : list of tuple
+        Shapes of the layers.
+
+    See Also
+    --------
+    pyramid_gaussian
+
+    Examples
+    --------
+    >>> from skimage import data
+    >>> from skimage.transform import pyramid_gaussian_stream
+    >>> image = data.camera()
+    >>> layers = {}
+    >>> def sink(layer, start, rows):
+    ...     layers.setdefault(layer, []).append(rows)
+    >>> shapes = pyramid_gaussian_stream(image, sink, max_layer=3)
+    >>> shapes
+    [(512, 512), (256, 256), (128, 128), (64, 64)]
+    >>> np.concatenate(layers[2]).shape
+    (128, 128)
+    """
+    _check_factor(downscale)
+    if sigma is None:
+        # automatically determine sigma which covers > 99% of distribution
+        sigma = 2 * downscale / 6.0
+    if chunk_rows < 1:
+        raise ValueError("`chunk_rows` must be positive")
+    # validate the mode
+    _to_ndimage_mode(mode)
+
+    dtype = np.dtype(dtype)
+    ndim = len(image.shape)
+    if channel_axis is not None:
+        channel_axis = channel_axis % ndim
+        if channel_axis == 0:
+            raise ValueError("the channels cannot be along the first axis")
+    if np.issubdtype(dtype, np.integer):
+        if dtype != image.dtype:
+            raise ValueError(
+                f"`dtype` must be a floating point type or the data type of "
+                f"the image, {image.dtype}, got {dtype}"
+            )
+        preserve_range = True
+        work_dtype = np.float32
+    elif np.issubdtype(dtype, np.floating):
+        work_dtype = np.float64 if dtype == np.float64 else np.float32
+    else:
+        raise ValueError(f"unsupported `dtype`: {dtype}")
+
+    def to_output(rows):
+        if np.issubdtype(dtype, np.integer):
+            info = np.iinfo(dtype)
+            rows = np.clip(np.round(rows), info.min, info.max)
+        return rows.astype(dtype, copy=False)
+
+    # shapes of the layers, as in `pyramid_gaussian`
+    shapes = [tuple(int(d) for d in image.shape)]
+    while len(shapes) - 1 != max_layer:
+        shape = tuple(
+            math.ceil(d / float(downscale)) if ax != channel_axis else d
+            for ax, d in enumerate(shapes[-1])
+        )
+        if shape == shapes[-1]:
+            break
+        shapes.append(shape)
+
+    sigmas = [0 if ax == channel_axis else sigma for ax in range(ndim)]
+    streams = [
+        _LayerStream(in_shape, out_shape, sigmas, mode, cval, work_dtype)
+        for in_shape, out_shape in zip(shapes[:-1], shapes[1:])
+    ]
+
+    for chunk_start in range(0, shapes[0][0], chunk_rows):
+        rows = np.asarray(image[chunk_start : chunk_start + chunk_rows])
+        rows = convert_to_float(rows, preserve_range).astype(work_dtype, copy=False)
+        sink(0, chunk_start, to_output(rows))
+        for layer, stream in enumerate(streams, start=1):
+            start, rows = stream.push(rows)
+            if len(rows) == 0:
+                break
+            sink(layer, start, to_output(rows))
+
+    return shapes
@@ -47,6 +47,253 @@ def _get_chunks(shape, ncpu):
     return tuple(chunks)
 
 
+def _normalize_chunks(chunks, shape):
+    """Return the chunk sizes along each axis of an array of `shape`.
+
+    Examples
+    --------
+    >>> _normalize_chunks(4, (10, 4))
+    ((4, 4, 2), (4,))
+    >>> _normalize_chunks(((5, 5), -1), (10, 4))
+    ((5, 5), (4,))
+    """
+    if numpy.isscalar(chunks):
+        chunks = (chunks,) * len(shape)
+    if len(chunks) != len(shape):
+        raise ValueError(
+            f"`chunks` must have one entry per axis, got {chunks} for an "
+            f"array of shape {shape}"
+        )
+    normalized = []
+    for size, c in zip(shape, chunks):
+        if c is None or (numpy.isscalar(c) and c == -1):
+            c = (size,)
+        elif numpy.isscalar(c):
+            c = int(c)
+            c = (c,) * (size // c) + ((size % c,) if size % c else ())
+        c = tuple(int(n) for n in c)
+        if sum(c) != size:
+            raise ValueError(
+                f"chunks {c} do not add up to the axis length {size} of an "
+                f"array of shape {shape}"
+            )
+        normalized.append(c)
+    return tuple(normalized)
+
+
+def _normalize_depth(depth, ndim):
+    """Return the depth along each axis as a tuple."""
+    if isinstance(depth, dict):
+        return tuple(int(depth.get(ax, 0)) for ax in range(ndim))
+    if numpy.isscalar(depth):
+        return (int(depth),) * ndim
+    if len(depth) != ndim:
+        raise ValueError(f"`depth` must have one entry per axis, got {depth}")
+    return tuple(int(d) for d in depth)
+
+
+# numpy.pad modes equivalent to the dask boundary modes, None to not pad
+_NUMPY_PAD_MODES = {
+    'reflect': 'symmetric',
+    'periodic': 'wrap',
+    'nearest': 'edge',
+    'none': None,
+}
+
+
+def _overlapping_block(array, chunk, depth, mode):
+    """Extract a chunk of `array` extended by `depth` on each side.
+
+    Parts of the extension lying inside the array are taken from the
+    neighbouring chunks, the rest is padded according to `mode`. Chunks away
+    from the array border are returned as views.
+
+    Returns
+    -------
+    block : ndarray
+        The extended chunk.
+    trim : tuple of slice
+        Slices selecting the original chunk in `block`.
+    """
+    view = []
+    pad_width = []
+    trim = []
+    for s, d, size in zip(chunk, depth, array.shape):
+        start = max(s.start - d, 0)
+        stop = min(s.stop + d, size)
+        view.append(slice(start, stop))
+        if mode is None:
+            pad = (0, 0)
+        else:
+            pad = (d - (s.start - start), d - (stop - s.stop))
+        pad_width.append(pad)
+        before = s.start - start + pad[0]
+        trim.append(slice(before, before + s.stop - s.start))
+
+    if mode == 'wrap' and any(pad != (0, 0) for pad in pad_width):
+        # the padding values come from the other end of the array rather than
+        # from the extracted view, gather them with modular indices
+        wrapped = [pad != (0, 0) for pad in pad_width]
+        block = array[tuple(slice(None) if w else v for w, v in zip(wrapped, view))]
+        for ax, (s, d, w) in enumerate(zip(chunk, depth, wrapped)):
+            if w:
+                indices = numpy.arange(s.start - d, s.stop + d) % array.shape[ax]
+                block = numpy.take(block, indices, axis=ax)
+    else:
+        block = array[tuple(view)]
+        if any(pad != (0, 0) for pad in pad_width):
+            block = numpy.pad(block, pad_width, mode=mode)
+    return block, tuple(trim)
+
+
+def _apply_parallel_threads(
+    wrapped_func, array, chunks, depth, mode, dtype, workers, stitch_labels=False
+):
+    """Apply `wrapped_func` to overlapping chunks of `array` in threads."""
+    # lazy imports, see the comments in `apply_parallel`
+    import itertools
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+
+    array = numpy.asarray(array)
+    chunks = _normalize_chunks(chunks, array.shape)
+    depth = _normalize_depth(depth, array.ndim)
+    if mode not in _NUMPY_PAD_MODES:
+        raise ValueError(f"Unsupported boundary mode {mode!r}")
+    mode = _NUMPY_PAD_MODES[mode]
+
+    bounds = []
+    for c in chunks:
+        edges = numpy.cumsum((0,) + c)
+        bounds.append([slice(a, b) for a, b in zip(edges[:-1], edges[1:])])
+    all_chunks = list(itertools.product(*bounds))
+    if array.size == 0:
+        # there is no chunk to get the output dtype from
+        return numpy.empty(array.shape, dtype=array.dtype if dtype is None else dtype)
+
+    def process(chunk):
+        block, trim = _overlapping_block(array, chunk, depth, mode)
+        res = numpy.asarray(wrapped_func(block))
+        if res.shape != block.shape:
+            raise ValueError(
+                f"`function` returned an array of shape {res.shape} for a "
+                f"chunk of shape {block.shape}; the 'threads' backend "
+                "requires it to preserve the shape of its input"
+            )
+        return res, trim
+
+    if workers is None:
+        workers = os.cpu_count()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        if stitch_labels:
+            results = list(executor.map(process, all_chunks))
+            return _stitch_labels(results, all_chunks, array.shape, dtype, executor)
+
+        # the first chunk gives the output dtype
+        first, trim = process(all_chunks[0])
+        out = numpy.empty(array.shape, dtype=first.dtype if dtype is None else dtype)
+        out[all_chunks[0]] = first[trim]
+
+        def process_into(chunk):
+            res, trim = process(chunk)
+            out[chunk] = res[trim]
+
+        list(executor.map(process_into, all_chunks[1:]))
+    return out
+
+
+def _stitch_labels(results, chunks, shape, dtype, executor):
+    """Combine per-chunk label images into globally consistent labels.
+
+    Parameters
+    ----------
+    results : list of tuple
+        For each chunk, the label image computed on the chunk extended by the
+        overlap, without padding at the array border, and the slices
+        selecting the chunk itself in it.
+    chunks : list of tuple of slice
+        The position of the chunks in the array.
+    shape : tuple of int
+        The shape of the array.
+    dtype : data-type or None
+        The data-type of the output.
+    executor : concurrent.futures.Executor
+        Executor used to run the per-chunk steps.
+
+    Returns
+    -------
+    out : ndarray
+        The labels, numbered sequentially from 1 with 0 as background.
+    """
+    from scipy import sparse
+
+    for res, _ in results:
+        if res.dtype.kind not in 'iu':
+            raise ValueError(
+                "`stitch_labels` requires `function` to return label "
+                f"images, got an array of dtype {res.dtype}"
+            )
+
+    # make the labels of the chunks, including their overlap, unique
+    label_counts = [int(res.max(initial=0)) for res, _ in results]
+    offsets = numpy.cumsum([0] + label_counts[:-1])
+    n_labels = sum(label_counts) + 1
+    label_dtype = numpy.min_scalar_type(n_labels)
+
+    def offset_block(i):
+        res, trim = results[i]
+        block = res.astype(label_dtype)
+        block[res > 0] += label_dtype.type(offsets[i])
+        out[chunks[i]] = block[trim]
+        return block
+
+    out = numpy.empty(shape, dtype=label_dtype)
+    blocks = list(executor.map(offset_block, range(len(chunks))))
+
+    def overlap_pairs(i):
+        # as the blocks are not padded, the extended chunk is a view of
+        # the array
+        block = blocks[i]
+        _, trim = results[i]
+        view = tuple(
+            slice(c.start - t.start, c.start - t.start + n)
+            for c, t, n in zip(chunks[i], trim, block.shape)
+        )
+        owner = out[view]
+        overlap = (block != owner) & (block > 0) & (owner > 0)
+        return block[overlap], owner[overlap]
+
+    pairs = list(executor.map(overlap_pairs, range(len(chunks))))
+    rows = numpy.concatenate([a for a, _ in pairs])
+    cols = numpy.concatenate([b for _, b in pairs])
+
+    # objects with pixels labelled in several chunks are the same object
+    graph = sparse.coo_matrix(
+        (numpy.ones(len(rows), dtype=bool), (rows, cols)),
+        shape=(n_labels, n_labels),
+    )
+    _, components = sparse.csgraph.connected_components(graph, directed=False)
+
+    # number the objects found in the output sequentially, keeping the
+    # background, which is its own component, as 0
+    present = numpy.bincount(out.ravel(), minlength=n_labels) > 0
+    present[0] = True
+    _, sequential = numpy.unique(components[present], return_inverse=True)
+    if dtype is None:
+        dtype = numpy.result_type(*(res.dtype for res, _ in results))
+        if numpy.iinfo(dtype).max < sequential.max():
+            dtype = numpy.intp
+    lut = numpy.zeros(n_labels, dtype=dtype)
+    lut[present] = sequential.astype(dtype, copy=False)
+
+    def relabel(chunk):
+        out_final[chunk] = lut[out[chunk]]
+
+    out_final = numpy.empty(shape, dtype=dtype)
+    list(executor.map(relabel, chunks))
+    return out_final
+
+
 def _ensure_dask_array(array, chunks=None):
     import dask.array as da
 
@@ -68,6 +315,9 @@ def apply_parallel(
     dtype=None,
     compute=None,
     channel_axis=None,
+    backend=None,
+    workers=None,
+    stitch_labels=False,
 ):
     """Map a function in parallel across an array.
 
@@ -108,7 +358,8 @@ def apply_parallel(
         infer this by calling the function on data of shape ``(1,) * ndim``.
         For functions expecting RGB or multichannel data this may be
         problematic. In such cases, the user should manually specify this dtype
-        argument instead.
+        argument instead. With the 'threads' backend, the dtype of
+        the result of the first chunk is used.
 
         .. versionadded:: 0.18
            ``dtype`` was added in 0.18.
@@ -121,6 +372,22 @@ def apply_parallel(
         If None, the image is assumed to be a grayscale (single channel) image.
         Otherwise, this parameter indicates which axis of the array corresponds
         to channels.
+    backend : {'dask', 'threads'} or None, optional
+        With 'dask', the array is split with ``dask.array.map_overlap``. With
+        'threads', the chunks of a NumPy array are extended by `depth`,
+        processed in a thread pool and written directly into a preallocated
+        output array, without requiring dask. The function must then return
+        arrays with the same shape as its input. If None (default), use
+        'dask' if it is installed and 'threads' otherwise.
+    workers : int or None, optional
+        The number of parallel threads of the 'threads' backend. If None, use
+        as many threads as there are CPUs.
+    stitch_labels : bool, optional
+        Whether `function` returns label images, e.g., a segmentation, that
+        must be combined into consistent labels across chunks. The labels of
+        the chunks are made unique and objects sharing pixels in the overlap
+        of two chunks are merged. Only supported by the 'threads' backend,
+        and the chunks are not padded at the array border. See Notes.
 
     Returns
     -------
@@ -137,20 +404,57 @@ def apply_parallel(
     For example region selection to preview a result or storing large data
     to disk instead of loading in memory.
 
+    The 'threads' backend avoids the overhead of building and scheduling a
+    dask graph, which is significant for mid-size images. Chunks away from
+    the array border are passed to `function` as views of `array`. It always
+    computes eagerly and is efficient for functions releasing the GIL, which
+    is the case of most NumPy and SciPy operations.
+
+    With ``stitch_labels=True``, the output labels are numbered sequentially
+    from 1, 0 being the background. For connected-component labeling such as
+    :func:`skimage.measure.label`, the result is exactly the single-pass
+    labeling, up to a permutation of the labels, provided `depth` is at least
+    1 along all axes: pixels connected across a chunk boundary are then both
+    in the overlap of one of the chunks. For other functions, e.g.,
+    :func:`skimage.segmentation.watershed` or
+    :func:`skimage.morphology.remove_small_objects`, the result approximates
+    the single-pass one, with an accuracy improving with `depth`. Objects
+    are still merged whenever they share a pixel in an overlap, but each
+    chunk only sees its part of an object.
+
     """
-    try:
-        # Importing dask takes time. since apply_parallel is on the
-        # minimum import path of skimage, we lazy attempt to import dask
-        import dask.array as da
-    except ImportError:
-        raise RuntimeError(
-            "Could not import 'dask'.  Please install " "using 'pip install dask'"
-        )
+    if backend not in (None, 'dask', 'threads'):
+        raise ValueError(f"Unknown backend {backend!r}")
+
+    if stitch_labels:
+        if backend == 'dask':
+            raise ValueError("`stitch_labels` requires the 'threads' backend")
+        backend = 'threads'
+        if mode not in (None, 'none'):
+            raise ValueError("`stitch_labels` does not support padding modes")
+        mode = 'none'
+
+    if backend != 'threads':
+        try:
+            # Importing dask takes time. since apply_parallel is on the
+            # minimum import path of skimage, we lazy attempt to import dask
+            import dask.array as da
+        except ImportError:
+            if backend == 'dask':
+                raise RuntimeError(
+                    "Could not import 'dask'.  Please install using 'pip install dask'"
+                )
+            backend = 'threads'
+        else:
+            backend = 'dask'
 
     if extra_keywords is None:
         extra_keywords = {}
 
-    if compute is None:
+    if backend == 'threads':
+        if compute is False:
+            raise ValueError("`compute=False` requires the 'dask' backend")
+    elif compute is None:
         compute = not isinstance(array, da.Array)
 
     if channel_axis is not None:
@@ -204,6 +508,11 @@ def apply_parallel(
     def wrapped_func(arr):
         return function(arr, *extra_arguments, **extra_keywords)
 
+    if backend == 'threads':
+        return _apply_parallel_threads(
+            wrapped_func, array, chunks, depth, mode, dtype, workers, stitch_labels
+        )
+
     darr = _ensure_dask_array(array, chunks=chunks)
 
     res = darr.map_overlap(wrapped_func, depth, boundary=mode, dtype=dtype)
@@ -13,12 +13,15 @@ from skimage._shared.testing import (
     run_in_parallel,
 )
 from skimage.filters import rank
-from skimage.filters.rank import __all__ as all_rank_filters
+from skimage.filters.rank import __all__ as _all_rank_functions
 from skimage.filters.rank import __3Dfilters as _3d_rank_filters
 from skimage.filters.rank import subtract_mean
 from skimage.morphology import ball, disk, gray
 from skimage.util import img_as_float, img_as_ubyte
 
+# `statistics` takes the statistics to compute and is tested separately
+all_rank_filters = [f for f in _all_rank_functions if f != 'statistics']
+
 
 def test_otsu_edge_case():
     # This is an edge case that causes OTSU to appear to misbehave
@@ -181,6 +184,80 @@ class TestRank:
 
         check()
 
+    @pytest.mark.parametrize('workers', [2, 5, None])
+    @pytest.mark.parametrize('filter', all_rank_filters)
+    def test_rank_filter_workers(self, filter, workers):
+        rng = np.random.default_rng(0)
+        image = rng.integers(0, 1000, size=(41, 23), dtype=np.uint16)
+        mask = rng.random(image.shape) > 0.1
+        footprint = np.ones((5, 3), dtype=np.uint8)
+        footprint[0, 0] = 0
+        func = getattr(rank, filter)
+        for kwargs in [{}, {'mask': mask, 'shift_y': -1}, {'shift_y': 2}]:
+            expected = func(image, footprint, **kwargs)
+            result = func(image, footprint, workers=workers, **kwargs)
+            assert_equal(result, expected)
+
+    @pytest.mark.parametrize('workers', [2, 3])
+    @pytest.mark.parametrize('filter', _3d_rank_filters)
+    def test_rank_filters_3D_workers(self, filter, workers):
+        rng = np.random.default_rng(0)
+        volume = rng.integers(0, 256, size=(7, 9, 8), dtype=np.uint8)
+        mask = rng.random(volume.shape) > 0.1
+        func = getattr(rank, filter)
+        for kwargs in [{}, {'mask': mask, 'shift_x': 1}]:
+            expected = func(volume, self.footprint_3d, **kwargs)
+            result = func(volume, self.footprint_3d, workers=workers, **kwargs)
+            assert_equal(result, expected)
+
+    @pytest.mark.parametrize('dtype', [np.uint8, np.uint16])
+    def test_statistics(self, dtype):
+        rng = np.random.default_rng(0)
+        image = rng.integers(0, 300, size=(29, 31)).astype(dtype)
+        mask = rng.random(image.shape) > 0.1
+        footprint = np.ones((5, 3), dtype=np.uint8)
+        footprint[0, 0] = 0
+        names = [f for f in _3d_rank_filters if f != 'noise_filter']
+        stats = names + [('percentile', 0.25), ('percentile', 1)]
+        for kwargs in [{}, {'mask': mask, 'shift_x': 1, 'shift_y': -1}]:
+            result = rank.statistics(image, footprint, stats, **kwargs)
+            assert result.shape == image.shape + (len(stats),)
+            assert result.dtype == np.float64
+            for i, name in enumerate(names):
+                out = np.empty(image.shape, dtype=np.float64)
+                expected = getattr(rank, name)(image, footprint, out=out, **kwargs)
+                assert_equal(result[..., i], expected)
+            for i, (_, p0) in enumerate(stats[len(names) :], len(names)):
+                expected = rank.percentile(image, footprint, p0=p0, **kwargs)
+                assert_equal(result[..., i], expected)
+            parallel = rank.statistics(image, footprint, stats, workers=3, **kwargs)
+            assert_equal(parallel, result)
+
+    def test_statistics_3D(self):
+        rng = np.random.default_rng(0)
+        volume = rng.integers(0, 256, size=(7, 9, 8), dtype=np.uint8)
+        mask = rng.random(volume.shape) > 0.1
+        names = [f for f in _3d_rank_filters if f != 'noise_filter']
+        for kwargs in [{}, {'mask': mask, 'shift_x': 1}]:
+            result = rank.statistics(volume, self.footprint_3d, names, **kwargs)
+            assert result.shape == volume.shape + (len(names),)
+            for i, name in enumerate(names):
+                out = np.empty(volume.shape, dtype=np.float64)
+                func = getattr(rank, name)
+                expected = func(volume, self.footprint_3d, out=out, **kwargs)
+                assert_equal(result[..., i], expected)
+            parallel = rank.statistics(
+                volume, self.footprint_3d, names, workers=2, **kwargs
+            )
+            assert_equal(parallel, result)
+
+    @pytest.mark.parametrize(
+        'stats', ['median', [], ['noise_filter'], ['percentile'], [('median', 0.5)]]
+    )
+    def test_statistics_invalid(self, stats):
+        with pytest.raises(ValueError):
+            rank.statistics(self.image.astype(np.uint8), self.footprint, stats)
+
     def test_random_sizes(self):
         # make sure the size is not a problem
 
@@ -397,7 +474,38 @@ class TestRank:
         out = np.empty_like(image)
         mask = np.ones(image.shape, dtype=np.uint8)
         with expected_warnings(["Bad rank filter performance"]):
-            rank.maximum(image=image, footprint=elem, out=out, mask=mask)
+            rank.mean(image=image, footprint=elem, out=out, mask=mask)
+
+    @pytest.mark.parametrize(
+        'filter', ['minimum', 'maximum', 'median', 'gradient', 'percentile']
+    )
+    def test_bucketed_histogram_16bit(self, filter):
+        # filters searching a coarse histogram support the full 16-bit range
+        # without a performance warning and match the per-bin search
+        rng = np.random.default_rng(0)
+        image = rng.integers(0, 2**16, size=(31, 27), dtype=np.uint16)
+        footprint = disk(3)
+        kwargs = {'p0': 0.3} if filter == 'percentile' else {}
+        result = getattr(rank, filter)(image, footprint, **kwargs)
+
+        offsets = np.argwhere(footprint) - 3
+        expected = np.empty_like(image)
+        for r in range(image.shape[0]):
+            for c in range(image.shape[1]):
+                rr, cc = (offsets + (r, c)).T
+                inside = (rr >= 0) & (rr < image.shape[0])
+                inside &= (cc >= 0) & (cc < image.shape[1])
+                values = np.sort(image[rr[inside], cc[inside]])
+                if filter == 'minimum':
+                    expected[r, c] = values[0]
+                elif filter == 'maximum':
+                    expected[r, c] = values[-1]
+                elif filter == 'gradient':
+                    expected[r, c] = values[-1] - values[0]
+                else:
+                    rank_ = 0.5 if filter == 'median' else 0.3
+                    expected[r, c] = values[int(rank_ * values.size)]
+        assert_equal(result, expected)
 
     def test_inplace_output(self):
         # rank filters are not supposed to filter inplace
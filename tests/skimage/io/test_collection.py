@@ -4,7 +4,12 @@ import itertools
 import numpy as np
 import imageio.v3 as iio3
 from skimage import data_dir
-from skimage.io.collection import ImageCollection, MultiImage, alphanumeric_key
+from skimage.io.collection import (
+    ImageCollection,
+    MultiImage,
+    alphanumeric_key,
+    concatenate_images,
+)
 from skimage.io import reset_plugins
 
 from skimage._shared import testing
@@ -162,6 +167,98 @@ class TestImageCollection:
     def test_concatenate_mismatched_image_shapes(self):
         with testing.raises(ValueError):
             self.images.concatenate()
+        with testing.raises(ValueError):
+            self.images.concatenate(workers=2)
+
+    @pytest.mark.parametrize('workers', [2, None])
+    def test_concatenate_workers(self, workers):
+        expected = self.images_matched.concatenate()
+        assert_equal(self.images_matched.concatenate(workers=workers), expected)
+        frames = [frame for frame in expected]
+        assert_equal(concatenate_images(frames, workers=workers), expected)
+
+    def test_concatenate_workers_promotion(self):
+        images = [
+            np.zeros((2, 3), dtype=np.uint8),
+            np.full((2, 3), 0.7),
+            np.ones((2, 3), dtype=np.uint8),
+            np.full((2, 3), -1, dtype=np.int8),
+        ]
+        expected = concatenate_images(images)
+        result = concatenate_images(images, workers=2)
+        assert result.dtype == expected.dtype == np.float64
+        assert_equal(result, expected)
+
+        images = [images[0], images[3]]
+        result = concatenate_images(images, workers=2)
+        assert result.dtype == np.int16
+        assert_equal(result, concatenate_images(images))
+
+    @pytest.mark.parametrize('conserve_memory', [True, False])
+    @pytest.mark.parametrize('read_ahead', [None, 1, 10])
+    def test_iter_prefetch(self, conserve_memory, read_ahead):
+        loaded = []
+
+        def load_fn(n):
+            loaded.append(n)
+            return np.full((3, 3), n)
+
+        ic = ImageCollection(
+            range(7), load_func=load_fn, conserve_memory=conserve_memory
+        )
+        ic[2]
+        images = list(ic.iter_prefetch(workers=3, read_ahead=read_ahead))
+        assert len(images) == 7
+        for n, image in enumerate(images):
+            assert_equal(image, n)
+        assert sorted(loaded) == sorted(list(range(7)) + [2] * conserve_memory)
+        assert_equal(ic[6], 6)
+        assert len(loaded) == 8 if conserve_memory else 7
+
+    def test_lru_cache_size(self):
+        loaded = []
+
+        def load_fn(n):
+            loaded.append(n)
+            return np.full((3, 3), n, dtype=np.uint8)
+
+        ic = ImageCollection(range(5), load_func=load_fn, cache_size=2)
+        for n in [0, 1, 0, 2, 0, 1, 1]:
+            assert_equal(ic[n], n)
+        # 1 is evicted when 2 is loaded, as 0 was used more recently
+        assert loaded == [0, 1, 2, 1]
+        info = ic.cache_info()
+        assert (info.hits, info.misses) == (3, 4)
+        assert (info.currsize, info.nbytes) == (2, 18)
+
+        ic_slice = ic[1:]
+        assert ic_slice.cache_info() == (0, 0, 1, 9)
+        assert_equal(ic_slice[0], 1)
+        assert loaded == [0, 1, 2, 1]
+
+        ic.reload()
+        assert ic.cache_info().currsize == 0
+
+    def test_lru_cache_bytes(self):
+        loaded = []
+
+        def load_fn(n):
+            loaded.append(n)
+            return np.full((n + 1, 10), n, dtype=np.uint8)
+
+        ic = ImageCollection(range(5), load_func=load_fn, cache_bytes=35)
+        for n in [0, 1, 0, 1, 4, 1]:
+            assert_equal(ic[n], n)
+        # image 4 does not fit in the cache and does not evict the others
+        assert loaded == [0, 1, 4]
+        assert ic.cache_info() == (3, 3, 2, 30)
+
+        assert_equal(ic[2], 2)
+        assert loaded == [0, 1, 4, 2]
+        assert ic.cache_info().currsize == 1
+
+        with pytest.raises(ValueError):
+            ImageCollection(range(5), load_func=load_fn, cache_bytes=-1)
 
     def test_multiimage_imagecollection(self):
         assert_equal(self.images_matched[0], self.frames_matched[0])
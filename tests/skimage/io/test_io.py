@@ -60,6 +60,51 @@ def test_imread_http_url(httpserver):
     assert image.shape == (1, 1)
 
 
+def test_imread_mmap(tmp_path):
+    import tifffile
+
+    image = np.arange(2 * 32 * 40, dtype=np.uint16).reshape(2, 32, 40)
+
+    fname = tmp_path / 'image.tif'
+    tifffile.imwrite(fname, image)
+    mapped = io.imread(fname, mmap=True)
+    assert isinstance(mapped, np.memmap)
+    assert not mapped.flags.writeable
+    assert_array_equal(mapped, image)
+    assert_array_equal(mapped, io.imread(fname))
+
+    fname = tmp_path / 'image.npy'
+    np.save(fname, image)
+    mapped = io.imread(str(fname), mmap=True)
+    assert isinstance(mapped, np.memmap)
+    assert_array_equal(mapped, image)
+
+
+@pytest.mark.parametrize(
+    'kwargs, reason',
+    [({'compression': 'zlib'}, 'compressed'), ({'tile': (16, 16)}, 'tiles')],
+)
+def test_imread_mmap_unmappable_tiff(tmp_path, kwargs, reason):
+    import tifffile
+
+    fname = tmp_path / 'image.tif'
+    tifffile.imwrite(fname, np.zeros((32, 32), dtype=np.uint8), **kwargs)
+    with pytest.raises(ValueError, match=reason):
+        io.imread(fname, mmap=True)
+
+
+def test_imread_mmap_errors(tmp_path):
+    fname = tmp_path / 'image.npy'
+    np.save(fname, np.array([None, 1]), allow_pickle=True)
+    with pytest.raises(ValueError, match='cannot memory-map'):
+        io.imread(fname, mmap=True)
+
+    with pytest.raises(ValueError, match='only uncompressed TIFF'):
+        io.imread(fetch('data/camera.png'), mmap=True)
+    with pytest.raises(ValueError, match='as_gray'):
+        io.imread(fetch('data/multipage.tif'), as_gray=True, mmap=True)
+
+
 def test_imread_pathlib_tiff():
     """Tests reading from Path object (issue gh-5545)."""
 
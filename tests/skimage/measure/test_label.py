@@ -1,3 +1,5 @@
+import tracemalloc
+
 import pytest
 import numpy as np
 from skimage import data
@@ -57,3 +59,118 @@ def test_zero_size(dtype):
 
     assert lab.shape == img.shape
     assert num == 0
+
+
+@pytest.mark.parametrize("dtype", [bool, np.uint8])
+@pytest.mark.parametrize("connectivity", [1, 2, 3])
+@pytest.mark.parametrize("chunks", [17, (64, 32, 128), ((50, 78), (128,), (1, 127))])
+def test_chunked(dtype, connectivity, chunks):
+    img = data.binary_blobs(length=128, blob_size_fraction=0.15, n_dim=3)
+    img = img.astype(dtype)
+    expected, expected_num = label(img, return_num=True, connectivity=connectivity)
+    result, num = label(img, return_num=True, connectivity=connectivity, chunks=chunks)
+    testing.assert_equal(result, expected)
+    assert num == expected_num
+
+
+@pytest.mark.parametrize("background", [None, 1, 2])
+@pytest.mark.parametrize("shape", [(40,), (23, 31), (9, 1, 13), (1, 12, 1)])
+def test_chunked_random(background, shape):
+    rng = np.random.default_rng(0)
+    img = rng.integers(0, 3, size=shape)
+    for connectivity in range(1, img.ndim + 1):
+        expected = label(img, background=background, connectivity=connectivity)
+        result = label(img, background=background, connectivity=connectivity, chunks=4)
+        testing.assert_equal(result, expected)
+
+
+def test_chunked_memmap(tmp_path):
+    img = data.binary_blobs(length=128, blob_size_fraction=0.1, n_dim=2)
+    image = np.lib.format.open_memmap(
+        tmp_path / "image.npy", mode="w+", dtype=img.dtype, shape=img.shape
+    )
+    image[:] = img
+    out = np.lib.format.open_memmap(
+        tmp_path / "labels.npy", mode="w+", dtype=np.int32, shape=img.shape
+    )
+    result = label(image, chunks=(50, 40), out=out)
+    assert result is out
+    testing.assert_equal(np.load(tmp_path / "labels.npy"), label(img))
+
+
+def test_chunked_narrow_out():
+    # 26 stripes split into 25 blocks each: many more provisional labels
+    # than fit in uint8, but the final labels do
+    img = np.zeros((52, 100), dtype=np.uint8)
+    img[::2] = 1
+    out = np.zeros(img.shape, dtype=np.uint8)
+    result, num = label(img, return_num=True, chunks=4, out=out)
+    assert result is out
+    assert num == 26
+    testing.assert_equal(out, label(img))
+
+
+def test_chunked_narrow_memmap(tmp_path):
+    rng = np.random.default_rng(0)
+    img = rng.random((256, 32, 32)) > 0.6
+    image = np.lib.format.open_memmap(
+        tmp_path / "image.npy", mode="w+", dtype=img.dtype, shape=img.shape
+    )
+    image[:] = img
+    out = np.lib.format.open_memmap(
+        tmp_path / "labels.npy", mode="w+", dtype=np.uint16, shape=img.shape
+    )
+    # import the modules used by `label` before tracing memory
+    label(img[:4, :4, :4], chunks=2, out=np.zeros((4, 4, 4), dtype=np.uint8))
+
+    tracemalloc.start()
+    try:
+        label(image, chunks=(16, 32, 32), out=out)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # no array of provisional labels of the size of the image is allocated
+    assert peak < img.size * np.dtype(np.intp).itemsize / 2
+    testing.assert_equal(np.load(tmp_path / "labels.npy"), label(img))
+
+
+def test_chunked_invalid():
+    img = np.ones((10, 10), dtype=np.uint8)
+    with pytest.raises(ValueError, match="one entry per image axis"):
+        label(img, chunks=(5,))
+    with pytest.raises(ValueError, match="do not partition"):
+        label(img, chunks=((5, 4), (10,)))
+    with pytest.raises(ValueError, match="Connectivity"):
+        label(img, chunks=5, connectivity=3)
+    with pytest.raises(ValueError, match="shape"):
+        label(img, chunks=5, out=np.empty((5, 5), dtype=int))
+
+
+@pytest.mark.parametrize("dtype", [bool, np.uint8])
+@pytest.mark.parametrize("workers", [2, 3, None])
+def test_workers(dtype, workers):
+    img = data.binary_blobs(length=128, blob_size_fraction=0.15, n_dim=3)
+    img = img.astype(dtype)
+    for connectivity in (1, 2, 3):
+        expected, expected_num = label(img, return_num=True, connectivity=connectivity)
+        result, num = label(
+            img, return_num=True, connectivity=connectivity, workers=workers
+        )
+        testing.assert_equal(result, expected)
+        assert num == expected_num
+
+
+@pytest.mark.parametrize("shape", [(0, 5), (5, 0), (0, 0, 3)])
+def test_workers_empty(shape):
+    img = np.zeros(shape, dtype=bool)
+    expected, expected_num = label(img, return_num=True)
+    result, num = label(img, return_num=True, workers=2)
+    testing.assert_equal(result, expected)
+    assert result.dtype == expected.dtype
+    assert num == expected_num
+
+
+def test_workers_chunked():
+    img = data.binary_blobs(length=256, blob_size_fraction=0.05, n_dim=2)
+    result = label(img, chunks=(40, 70), workers=4)
+    testing.assert_equal(result, label(img))
@@ -29,6 +29,9 @@ from skimage.measure._regionprops import (
     regionprops,
     regionprops_table,
 )
+from skimage.measure import RegionpropsCache
+from skimage.measure._regionprops_columnar import COLUMNAR_PROPS
+from skimage.measure._regionprops_tiled import TILED_PROPS
 from skimage.segmentation import slic
 
 SAMPLE = np.array(
@@ -1268,6 +1271,57 @@ def test_cache():
     assert np.any(f0 != f1)
 
 
+def test_shared_cache():
+    cache = RegionpropsCache()
+    first = regionprops(SAMPLE, INTENSITY_SAMPLE, cache=cache)[0]
+    assert first.area == regionprops(SAMPLE)[0].area
+    misses = cache.info().misses
+    assert misses > 0
+    assert cache.info().hits == 0
+
+    # Copies of the same images hit the cache
+    second = regionprops(SAMPLE.copy(), INTENSITY_SAMPLE.copy(), cache=cache)[0]
+    assert second.area == first.area
+    assert cache.info().hits == 1
+    assert cache.info().misses == misses
+
+    # Different spacing, offset or intensity image miss it
+    regionprops(SAMPLE, INTENSITY_SAMPLE, cache=cache, spacing=(2, 1))[0].area
+    regionprops(SAMPLE, INTENSITY_SAMPLE, cache=cache, offset=(1, 1))[0].coords
+    regionprops(SAMPLE, INTENSITY_SAMPLE + 1, cache=cache)[0].intensity_mean
+    assert cache.info().hits == 1
+
+    # Tables are cached as well
+    table = regionprops_table(SAMPLE, cache=cache, properties=['area', 'perimeter'])
+    hits = cache.info().hits
+    assert_equal(
+        regionprops_table(SAMPLE, cache=cache, properties=['area', 'perimeter']),
+        table,
+    )
+    assert cache.info().hits > hits
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info() == (0, 0, 0, 0, cache.max_bytes)
+
+
+def test_shared_cache_eviction():
+    label_image = np.arange(1, 101).reshape(10, 10)
+    cache = RegionpropsCache(max_bytes=50)
+    regions = regionprops(label_image, cache=cache)
+    for region in regions:
+        region.image
+    info = cache.info()
+    assert 0 < info.nbytes <= 50
+    assert info.entries < len(regions)
+    # The most recently used values are kept
+    hits = info.hits
+    regionprops(label_image, cache=cache)[-1].image
+    assert cache.info().hits == hits + 1
+    regionprops(label_image, cache=cache)[0].image
+    assert cache.info().hits == hits + 1
+
+
 def test_disabled_cache_is_empty():
     SAMPLE_mod = SAMPLE.copy()
     region = regionprops(SAMPLE_mod, cache=False)[0]
@@ -1375,6 +1429,156 @@ def test_regionprops_table_equal_to_original():
                     assert_equal(rp[loc], out_table[modified_prop][i])
 
 
+# Vectorized properties that sum floating point values: they add the pixels
+# of a region in a different order than regionprops, so these only agree up
+# to rounding
+ROUNDED_COLUMNAR_PROPS = {
+    'axis_major_length',
+    'axis_minor_length',
+    'centroid_weighted',
+    'centroid_weighted_local',
+    'eccentricity',
+    'inertia_tensor',
+    'inertia_tensor_eigvals',
+    'intensity_mean',
+    'intensity_std',
+    'moments_central',
+    'moments_normalized',
+    'moments_weighted',
+    'moments_weighted_central',
+    'moments_weighted_normalized',
+    'orientation',
+}
+
+
+def test_regionprops_table_vectorized_equal_to_original():
+    regions = regionprops(SAMPLE, INTENSITY_FLOAT_SAMPLE)
+    out_table = regionprops_table(
+        SAMPLE, INTENSITY_FLOAT_SAMPLE, properties=COL_DTYPES.keys(), vectorized=True
+    )
+
+    for prop, dtype in COL_DTYPES.items():
+        for i, reg in enumerate(regions):
+            rp = reg[prop]
+            if prop in ROUNDED_COLUMNAR_PROPS:
+                rp = np.asarray(rp)
+                column = [
+                    out_table["-".join(map(str, (prop,) + ind))][i]
+                    for ind in np.ndindex(rp.shape)
+                ]
+                assert_allclose(rp.ravel(), column, rtol=1e-12, atol=1e-12)
+            elif np.isscalar(rp) or prop in OBJECT_COLUMNS or dtype is np.object_:
+                assert_array_equal(rp, out_table[prop][i])
+            else:
+                shape = rp.shape if isinstance(rp, np.ndarray) else (len(rp),)
+                for ind in np.ndindex(shape):
+                    modified_prop = "-".join(map(str, (prop,) + ind))
+                    loc = ind if len(ind) > 1 else ind[0]
+                    assert_equal(rp[loc], out_table[modified_prop][i])
+
+
+@pytest.mark.parametrize("spacing", [None, (0.5, 2)])
+@pytest.mark.parametrize("channels", [None, 3])
+def test_regionprops_table_columnar(spacing, channels):
+    rng = np.random.default_rng(0)
+    label_image = rng.integers(0, 40, size=(60, 80))
+    label_image[label_image > 30] = 0
+    intensity_image = rng.random(label_image.shape + ((channels,) if channels else ()))
+    # 'slice' and 'euler_number' are computed per region
+    properties = sorted(COLUMNAR_PROPS) + ['slice', 'euler_number']
+
+    out = regionprops_table(
+        label_image,
+        intensity_image,
+        properties=properties,
+        spacing=spacing,
+        vectorized=True,
+    )
+    expected = _props_to_dict(
+        regionprops(label_image, intensity_image, spacing=spacing),
+        properties=properties,
+    )
+    assert list(out) == list(expected)
+    for key, column in expected.items():
+        assert out[key].dtype == column.dtype
+        if key.split('-')[0] in ROUNDED_COLUMNAR_PROPS:
+            assert_allclose(out[key], column, rtol=1e-10, atol=1e-10)
+        else:
+            assert_array_equal(out[key], column)
+
+
+def test_regionprops_table_columnar_3d():
+    label_image = data.binary_blobs(32, 0.3, n_dim=3, rng=1).astype(np.uint8)
+    label_image[16:] *= 2
+    intensity_image = np.random.default_rng(1).random(label_image.shape)
+    # orientation is only defined in 2D, the per-region path raises
+    properties = ['label', 'centroid', 'inertia_tensor_eigvals', 'moments_weighted']
+    out = regionprops_table(
+        label_image,
+        intensity_image,
+        properties=properties,
+        spacing=(1, 2, 3),
+        vectorized=True,
+    )
+    expected = _props_to_dict(
+        regionprops(label_image, intensity_image, spacing=(1, 2, 3)),
+        properties=properties,
+    )
+    assert out.keys() == expected.keys()
+    for key, column in expected.items():
+        assert_allclose(out[key], column, rtol=1e-10, atol=1e-10)
+    with pytest.raises(NotImplementedError):
+        regionprops_table(label_image, properties=['orientation'], vectorized=True)
+
+
+@pytest.mark.parametrize('chunks', [16, (7, 80), ((30, 30), (1, 79))])
+def test_regionprops_table_chunked(tmp_path, chunks):
+    rng = np.random.default_rng(0)
+    label_image = np.lib.format.open_memmap(
+        tmp_path / 'labels.npy', mode='w+', dtype=np.int32, shape=(60, 80)
+    )
+    label_image[:] = rng.integers(0, 40, size=label_image.shape)
+    label_image[label_image > 30] = 0
+    label_image[20:50, 10:70] = 50
+    intensity_image = np.lib.format.open_memmap(
+        tmp_path / 'intensity.npy', mode='w+', dtype=np.uint8, shape=(60, 80, 2)
+    )
+    intensity_image[:] = rng.integers(0, 256, size=intensity_image.shape)
+    # the orientation of nearly isotropic regions is ambiguous
+    properties = sorted(TILED_PROPS - {'orientation'})
+
+    out = regionprops_table(
+        label_image, intensity_image, properties, spacing=(0.5, 2), chunks=chunks
+    )
+    expected = regionprops_table(
+        np.asarray(label_image),
+        np.asarray(intensity_image),
+        properties,
+        spacing=(0.5, 2),
+    )
+    assert list(out) == list(expected)
+    for key, column in expected.items():
+        assert out[key].dtype == column.dtype
+        assert_allclose(out[key], column, rtol=1e-9, atol=1e-6)
+
+
+def test_regionprops_table_chunked_invalid():
+    label_image = np.ones((10, 10), dtype=int)
+    with pytest.raises(ValueError, match='intensity_median'):
+        regionprops_table(
+            label_image, label_image, ['label', 'intensity_median'], chunks=5
+        )
+    with pytest.raises(ValueError, match='perimeter'):
+        regionprops_table(label_image, properties=['perimeter'], chunks=5)
+    with pytest.raises(ValueError, match='extra_properties'):
+        regionprops_table(label_image, extra_properties=[np.sum], chunks=5)
+    with pytest.raises(AttributeError, match='intensity_image'):
+        regionprops_table(label_image, properties=['intensity_mean'], chunks=5)
+    out = regionprops_table(np.zeros((10, 10), dtype=int), chunks=5)
+    assert list(out) == ['label', 'bbox-0', 'bbox-1', 'bbox-2', 'bbox-3']
+    assert all(len(column) == 0 for column in out.values())
+
+
 def test_regionprops_table_no_regions():
     out = regionprops_table(
         np.zeros((2, 2), dtype=int), properties=('label', 'area', 'bbox'), separator='+'
@@ -202,6 +202,30 @@ def test_octahedron_decomposition(function, radius, decomposition):
     assert_array_equal(expected, out)
 
 
+@pytest.mark.parametrize("function", ["binary_erosion", "binary_dilation"])
+@pytest.mark.parametrize("mode", ["ignore", "min", "max"])
+@pytest.mark.parametrize("line", [[1] * 31, [0, 0, 0, 1, 1, 1, 1, 1]])
+@pytest.mark.parametrize("num_iter", [1, 3])
+def test_line_footprint(function, mode, line, num_iter):
+    """Validate the running minimum and maximum used for line footprints.
+
+    comparison is made to repeated calls of the SciPy functions.
+    """
+    image = bw_img[::4, ::4]
+    footprint = np.reshape(line, (-1, 1)).astype(np.uint8)
+    out = getattr(binary, function)(image, [(footprint, num_iter)], mode=mode)
+
+    border_value = mode == "max" or (mode == "ignore" and function == "binary_erosion")
+    expected = image
+    for _ in range(num_iter):
+        expected = getattr(ndi, function)(
+            expected,
+            structure=footprints.pad_footprint(footprint, pad_end=True),
+            border_value=border_value,
+        )
+    assert_array_equal(expected, out)
+
+
 def test_footprint_overflow():
     footprint = np.ones((17, 17), dtype=np.uint8)
     img = np.zeros((20, 20), dtype=bool)
@@ -485,3 +485,84 @@ def test_octahedron_decomposition(cell3d_image, function, radius, decomposition)
     expected = func(cell3d_image, footprint=footprint_ndarray)
     out = func(cell3d_image, footprint=footprint)
     assert_array_equal(expected, out)
+
+
+@pytest.mark.parametrize(
+    "footprint, decomposable",
+    [
+        (footprints.diamond(4), True),
+        (footprints.octagon(3, 2), True),
+        (footprints.octagon(5, 4), True),
+        (footprints.octahedron(3), True),
+        (footprint_rectangle((6, 9)), True),
+        (footprint_rectangle((4, 5, 6)), True),
+        (footprints.disk(4), False),
+        (footprints.star(3), False),
+    ],
+)
+@pytest.mark.parametrize("mode", ["reflect", "constant", "nearest", "mirror", "wrap"])
+def test_automatic_decomposition(cam_image, footprint, decomposable, mode):
+    """Validate automatic decomposition of standard footprints.
+
+    comparison is made to a direct call of the SciPy functions.
+    """
+    image = cam_image
+    if footprint.ndim == 3:
+        image = np.random.default_rng(0).integers(0, 256, (18, 16, 12), np.uint8)
+    padded = footprints.pad_footprint(footprint, pad_end=False)
+    sequence = gray._decompose_footprint(padded)
+    assert (sequence[0][0] is not padded) == decomposable
+
+    expected = ndi.grey_erosion(image, footprint=padded, mode=mode, cval=3)
+    out = gray.erosion(image, footprint, mode=mode, cval=3)
+    assert_array_equal(expected, out)
+
+    expected = ndi.grey_dilation(
+        image, footprint=footprints.mirror_footprint(padded), mode=mode, cval=3
+    )
+    out = gray.dilation(image, footprint, mode=mode, cval=3)
+    assert_array_equal(expected, out)
+
+
+@pytest.mark.parametrize("dtype", [np.uint8, np.int16, np.float32])
+@pytest.mark.parametrize("axis", [0, 2])
+@pytest.mark.parametrize("line", [[1] * 4, [1] * 25, [0, 0, 1, 1, 1, 1, 1], [1, 1, 0]])
+@pytest.mark.parametrize("mode", ["reflect", "constant", "nearest", "mirror", "wrap"])
+def test_line_footprint(dtype, axis, line, mode):
+    """Validate the running minimum and maximum used for line footprints.
+
+    comparison is made to a direct call of the SciPy functions.
+    """
+    image = np.random.default_rng(0).integers(0, 100, (30, 11, 27)).astype(dtype)
+    shape = [1, 1, 1]
+    shape[axis] = len(line)
+    footprint = np.reshape(line, shape).astype(np.uint8)
+    padded = footprints.pad_footprint(footprint, pad_end=False)
+    assert gray._line_offsets(padded) is not None
+
+    expected = ndi.grey_erosion(image, footprint=padded, mode=mode, cval=3)
+    out = gray.erosion(image, footprint, mode=mode, cval=3)
+    assert_array_equal(expected, out)
+
+    expected = ndi.grey_dilation(
+        image, footprint=footprints.mirror_footprint(padded), mode=mode, cval=3
+    )
+    out = gray.dilation(image, footprint, mode=mode, cval=3)
+    assert_array_equal(expected, out)
+
+
+@pytest.mark.parametrize("func", [gray.erosion, gray.dilation])
+def test_line_footprint_fallback(func):
+    """Big-endian images and images with NaN use the SciPy functions."""
+    image = np.random.default_rng(0).random((20, 20))
+    footprint = np.ones((1, 5), dtype=bool)
+    expected = func(image, footprint)
+    out = func(image.astype(">f8"), footprint)
+    assert_array_equal(out, expected)
+
+    image[7, 9] = np.nan
+    ndi_func = ndi.grey_erosion if func is gray.erosion else ndi.grey_dilation
+    expected = ndi_func(image, footprint=footprint)
+    out = func(image, footprint)
+    assert_array_equal(out, expected)
+    assert np.isnan(out).sum() == np.isnan(expected).sum()
@@ -11,7 +11,7 @@ from skimage._shared._warnings import expected_warnings
 from skimage._shared.testing import assert_stacklevel
 from skimage._shared.utils import _supported_float_type, slice_at_axis
 from skimage.metrics import peak_signal_noise_ratio, structural_similarity
-from skimage.restoration._denoise import _wavelet_threshold
+from skimage.restoration._denoise import _denoise_tv_chambolle_nd, _wavelet_threshold
 
 
 PYWT_NOT_INSTALLED = importlib.util.find_spec("pywt") is None
@@ -22,14 +22,6 @@ xfail_without_pywt = pytest.mark.xfail(
 )
 
 
-try:
-    import dask  # noqa
-except ImportError:
-    DASK_NOT_INSTALLED_WARNING = 'The optional dask dependency is not installed'
-else:
-    DASK_NOT_INSTALLED_WARNING = None
-
-
 np.random.seed(1234)
 
 
@@ -148,6 +140,33 @@ def test_denoise_tv_chambolle_4d():
     assert res.std() * 255 < im.std()
 
 
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+@pytest.mark.parametrize('shape', [(64, 48), (20, 16, 24)])
+def test_denoise_tv_chambolle_kernel(shape, dtype):
+    rstate = np.random.default_rng(1234)
+    img = rstate.random(shape).astype(dtype)
+
+    expected = _denoise_tv_chambolle_nd(img, weight=0.1, eps=1e-5)
+    res = restoration.denoise_tv_chambolle(img, weight=0.1, eps=1e-5)
+    assert res.dtype == dtype
+    decimal = 5 if dtype == np.float32 else 12
+    assert_array_almost_equal(res, expected, decimal=decimal)
+
+    # splitting the first axis between threads does not change the result
+    for workers in [3, None]:
+        res_workers = restoration.denoise_tv_chambolle(
+            img, weight=0.1, eps=1e-5, workers=workers
+        )
+        assert_array_equal(res_workers, res)
+
+    # in float32, a small `eps` can be crossed at a different iteration, but
+    # with a fixed number of iterations the results only differ by rounding
+    expected = _denoise_tv_chambolle_nd(img, weight=0.1, eps=0, max_num_iter=50)
+    res = restoration.denoise_tv_chambolle(img, weight=0.1, eps=0, max_num_iter=50)
+    decimal = 6 if dtype == np.float32 else 12
+    assert_array_almost_equal(res, expected, decimal=decimal)
+
+
 def test_denoise_tv_chambolle_weighting():
     # make sure a specified weight gives consistent results regardless of
     # the number of input image dimensions
@@ -560,6 +579,73 @@ def test_denoise_nl_means_4d_multichannel():
     assert psnr_4dmc > psnr_noisy
 
 
+@pytest.mark.parametrize(
+    'shape, channel_axis',
+    [((30, 32), None), ((24, 26, 3), -1), ((10, 12, 14), None), ((6, 7, 8, 9), None)],
+)
+def test_denoise_nl_means_workers(shape, channel_axis):
+    rng = np.random.default_rng(0)
+    img = rng.random(shape)
+    kwargs = dict(patch_size=3, patch_distance=3, h=0.1, sigma=0.05)
+
+    expected = restoration.denoise_nl_means(img, channel_axis=channel_axis, **kwargs)
+    denoised = restoration.denoise_nl_means(
+        img, channel_axis=channel_axis, workers=3, **kwargs
+    )
+    np.testing.assert_allclose(denoised, expected, rtol=1e-12, atol=1e-12)
+    # the result does not depend on the thread scheduling
+    assert_array_equal(
+        denoised,
+        restoration.denoise_nl_means(
+            img, channel_axis=channel_axis, workers=3, **kwargs
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    'shape, channel_axis, memory_limit',
+    [
+        ((40, 32), None, 20_000),
+        ((24, 26, 3), -1, 40_000),
+        ((12, 14, 10), None, 250_000),
+    ],
+)
+def test_denoise_nl_means_memory_limit(shape, channel_axis, memory_limit):
+    rng = np.random.default_rng(0)
+    img = rng.random(shape)
+    kwargs = dict(patch_size=3, patch_distance=3, h=0.2, channel_axis=channel_axis)
+
+    expected = restoration.denoise_nl_means(img, **kwargs)
+    denoised = restoration.denoise_nl_means(img, memory_limit=memory_limit, **kwargs)
+    assert denoised.shape == expected.shape
+    np.testing.assert_allclose(denoised, expected, rtol=1e-12, atol=1e-12)
+
+    with pytest.raises(ValueError, match='memory_limit'):
+        restoration.denoise_nl_means(img, memory_limit=1000, **kwargs)
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_denoise_nl_means_accumulation_dtype(dtype):
+    img = data.camera()[100:200, 200:300] / 255.0
+    img += 0.1 * np.random.default_rng(0).standard_normal(img.shape)
+    img = img.astype(dtype)
+    kwargs = dict(patch_size=5, patch_distance=4, h=0.08, sigma=0.1)
+
+    expected = restoration.denoise_nl_means(img, **kwargs)
+    denoised = restoration.denoise_nl_means(
+        img, accumulation_dtype=np.float32, **kwargs
+    )
+    assert denoised.dtype == dtype
+    np.testing.assert_allclose(denoised, expected, atol=1e-3)
+    tiled = restoration.denoise_nl_means(
+        img, accumulation_dtype=np.float32, memory_limit=100_000, **kwargs
+    )
+    np.testing.assert_allclose(tiled, expected, atol=1e-3)
+
+    with pytest.raises(ValueError):
+        restoration.denoise_nl_means(img, accumulation_dtype=np.int32, **kwargs)
+
+
 def test_denoise_nl_means_wrong_dimension():
     # 1D not implemented
     img = np.zeros((5,))
@@ -1091,41 +1177,38 @@ def test_cycle_spinning_multichannel(rescale_sigma, channel_axis):
     func_kw = dict(sigma=sigma, channel_axis=channel_axis, rescale_sigma=rescale_sigma)
 
     # max_shifts=0 is equivalent to just calling denoise_func
-    with expected_warnings([DASK_NOT_INSTALLED_WARNING]):
+    dn_cc = restoration.cycle_spin(
+        noisy,
+        denoise_func,
+        max_shifts=0,
+        func_kw=func_kw,
+        channel_axis=channel_axis,
+    )
+    dn = denoise_func(noisy, **func_kw)
+    assert_array_equal(dn, dn_cc)
+
+    # denoising with cycle spinning will give better PSNR than without
+    for max_shifts in valid_shifts:
         dn_cc = restoration.cycle_spin(
             noisy,
             denoise_func,
-            max_shifts=0,
+            max_shifts=max_shifts,
             func_kw=func_kw,
             channel_axis=channel_axis,
         )
-        dn = denoise_func(noisy, **func_kw)
-    assert_array_equal(dn, dn_cc)
-
-    # denoising with cycle spinning will give better PSNR than without
-    for max_shifts in valid_shifts:
-        with expected_warnings([DASK_NOT_INSTALLED_WARNING]):
-            dn_cc = restoration.cycle_spin(
-                noisy,
-                denoise_func,
-                max_shifts=max_shifts,
-                func_kw=func_kw,
-                channel_axis=channel_axis,
-            )
         psnr = peak_signal_noise_ratio(img, dn)
         psnr_cc = peak_signal_noise_ratio(img, dn_cc)
         assert psnr_cc > psnr
 
     for shift_steps in valid_steps:
-        with expected_warnings([DASK_NOT_INSTALLED_WARNING]):
-            dn_cc = restoration.cycle_spin(
-                noisy,
-                denoise_func,
-                max_shifts=2,
-                shift_steps=shift_steps,
-                func_kw=func_kw,
-                channel_axis=channel_axis,
-            )
+        dn_cc = restoration.cycle_spin(
+            noisy,
+            denoise_func,
+            max_shifts=2,
+            shift_steps=shift_steps,
+            func_kw=func_kw,
+            channel_axis=channel_axis,
+        )
         psnr = peak_signal_noise_ratio(img, dn)
         psnr_cc = peak_signal_noise_ratio(img, dn_cc)
         assert psnr_cc > psnr
@@ -1178,29 +1261,69 @@ def test_cycle_spinning_workers():
     )
     assert_array_equal(dn_cc1, dn_cc1_)
 
-    with expected_warnings([DASK_NOT_INSTALLED_WARNING]):
-        dn_cc2 = restoration.cycle_spin(
-            noisy,
-            denoise_func,
-            max_shifts=1,
-            func_kw=func_kw,
-            channel_axis=None,
-            workers=4,
-        )
-        dn_cc3 = restoration.cycle_spin(
-            noisy,
-            denoise_func,
-            max_shifts=1,
-            func_kw=func_kw,
-            channel_axis=None,
-            workers=None,
-        )
+    dn_cc2 = restoration.cycle_spin(
+        noisy,
+        denoise_func,
+        max_shifts=1,
+        func_kw=func_kw,
+        channel_axis=None,
+        workers=4,
+    )
+    dn_cc3 = restoration.cycle_spin(
+        noisy,
+        denoise_func,
+        max_shifts=1,
+        func_kw=func_kw,
+        channel_axis=None,
+        workers=None,
+    )
     assert_array_almost_equal(dn_cc1, dn_cc2)
     assert_array_almost_equal(dn_cc1, dn_cc3)
 
 
+@pytest.mark.parametrize('channel_axis', [-1, None])
+def test_cycle_spinning_running_mean(channel_axis):
+    img = astro[:64, :48] if channel_axis is not None else astro_gray[:64, :48]
+    func_kw = dict(weight=0.1, channel_axis=channel_axis)
+    max_shifts = (2, 3)
+
+    expected = np.mean(
+        [
+            np.roll(
+                restoration.denoise_tv_chambolle(
+                    np.roll(img, (i, j), axis=(0, 1)), **func_kw
+                ),
+                (-i, -j),
+                axis=(0, 1),
+            )
+            for i in range(3)
+            for j in range(4)
+        ],
+        axis=0,
+    )
+    dn_cc1 = restoration.cycle_spin(
+        img,
+        restoration.denoise_tv_chambolle,
+        max_shifts=max_shifts,
+        func_kw=func_kw,
+        channel_axis=channel_axis,
+        workers=1,
+    )
+    assert_array_almost_equal(dn_cc1, expected)
+
+    for workers in [2, 5, None]:
+        dn_cc = restoration.cycle_spin(
+            img,
+            restoration.denoise_tv_chambolle,
+            max_shifts=max_shifts,
+            func_kw=func_kw,
+            channel_axis=channel_axis,
+            workers=workers,
+        )
+        assert_array_equal(dn_cc, dn_cc1)
+
+
 @xfail_without_pywt
-@pytest.mark.filterwarnings("ignore:.*dask dependency is not installed:UserWarning")
 @pytest.mark.parametrize("num_workers", [None, 1])
 def test_cycle_spinner_deprecate_num_workers(num_workers):
     img = astro_gray
@@ -9,8 +9,16 @@ from skimage._shared.utils import _supported_float_type
 from skimage.data import binary_blobs
 from skimage.data import camera, chelsea
 from skimage.metrics import mean_squared_error as mse
-from skimage.restoration import calibrate_denoiser, denoise_wavelet
-from skimage.restoration.j_invariant import denoise_invariant
+from skimage.restoration import (
+    calibrate_denoiser,
+    denoise_tv_chambolle,
+    denoise_wavelet,
+)
+from skimage.restoration.j_invariant import (
+    _calibrate_denoiser_search,
+    _generate_grid_slice,
+    denoise_invariant,
+)
 from skimage.util import img_as_float, random_noise
 
 
@@ -106,3 +114,64 @@ def test_input_image_not_modified():
     )
 
     assert_(np.all(noisy_img == input_image))
+
+
+@pytest.mark.parametrize('approximate_loss', [True, False])
+@pytest.mark.parametrize('workers', [1, 3])
+def test_calibrate_denoiser_search_losses(approximate_loss, workers):
+    image = noisy_img[:64, :64]
+    parameter_ranges = {'weight': [0.05, 0.1, 0.2]}
+    parameters_tested, losses, best = _calibrate_denoiser_search(
+        image,
+        denoise_tv_chambolle,
+        parameter_ranges,
+        approximate_loss=approximate_loss,
+        workers=workers,
+    )
+
+    mask = _generate_grid_slice(image.shape, offset=8, stride=4)
+    expected = []
+    for kwargs in parameters_tested:
+        if approximate_loss:
+            denoised = denoise_invariant(
+                image, denoise_tv_chambolle, masks=[mask], denoiser_kwargs=kwargs
+            )
+            expected.append(mse(image[mask], denoised[mask]))
+        else:
+            denoised = denoise_invariant(
+                image, denoise_tv_chambolle, denoiser_kwargs=kwargs
+            )
+            expected.append(mse(image, denoised))
+    np.testing.assert_allclose(losses, expected, rtol=1e-10)
+    assert best == np.argmin(expected)
+
+
+def test_calibrate_denoiser_halving():
+    image = noisy_img[:64, :64]
+    calls = []
+
+    def denoiser(image, weight):
+        calls.append(weight)
+        return denoise_tv_chambolle(image, weight=weight)
+
+    parameter_ranges = {'weight': [0.01, 0.05, 0.1, 0.2, 0.4]}
+    _, grid_losses, _ = _calibrate_denoiser_search(
+        image, denoise_tv_chambolle, parameter_ranges, approximate_loss=False
+    )
+    _, losses, best = _calibrate_denoiser_search(
+        image,
+        denoiser,
+        parameter_ranges,
+        approximate_loss=False,
+        search='halving',
+        workers=2,
+    )
+    # each weight is evaluated at most once per mask, most of them on few masks
+    assert len(calls) < len(parameter_ranges['weight']) * 16
+    # the selected parameters survived to the end: their loss is exact
+    assert losses[best] == pytest.approx(grid_losses[best], rel=1e-10)
+
+    with pytest.raises(ValueError, match="approximate_loss"):
+        calibrate_denoiser(image, denoiser, parameter_ranges, search='halving')
+    with pytest.raises(ValueError, match="Unknown search"):
+        calibrate_denoiser(image, denoiser, parameter_ranges, search='random')
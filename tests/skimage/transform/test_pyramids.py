@@ -208,3 +208,60 @@ def test_pyramid_dtype_support(pyramid_func, dtype):
     pyramid = pyramid_func(img)
     float_dtype = _supported_float_type(dtype)
     assert np.all([im.dtype == float_dtype for im in pyramid])
+
+
+def _collect_stream(image, **kwargs):
+    layers = {}
+
+    def sink(layer, start, rows):
+        chunks = layers.setdefault(layer, [])
+        assert start == sum(len(chunk) for chunk in chunks)
+        chunks.append(rows)
+
+    shapes = pyramids.pyramid_gaussian_stream(image, sink, **kwargs)
+    assert sorted(layers) == list(range(len(shapes)))
+    return shapes, [np.concatenate(layers[layer]) for layer in range(len(shapes))]
+
+
+@pytest.mark.parametrize('mode', ['reflect', 'constant', 'wrap'])
+@pytest.mark.parametrize('channel_axis', [None, -1])
+def test_pyramid_gaussian_stream(mode, channel_axis):
+    img = image if channel_axis is not None else image_gray
+    expected = list(
+        pyramids.pyramid_gaussian(img, mode=mode, cval=0.2, channel_axis=channel_axis)
+    )
+    shapes, layers = _collect_stream(
+        img,
+        mode=mode,
+        cval=0.2,
+        channel_axis=channel_axis,
+        dtype=np.float64,
+        chunk_rows=37,
+    )
+    assert shapes == [layer.shape for layer in expected]
+    for layer, expected_layer in zip(layers, expected):
+        assert layer.dtype == np.float64
+        np.testing.assert_allclose(layer, expected_layer, rtol=0, atol=1e-12)
+
+
+def test_pyramid_gaussian_stream_dtype():
+    expected = list(pyramids.pyramid_gaussian(image_gray, max_layer=2))
+    shapes, layers = _collect_stream(image_gray, max_layer=2)
+    assert shapes == [(512, 512), (256, 256), (128, 128)]
+    for layer, expected_layer in zip(layers, expected):
+        assert layer.dtype == np.float32
+        np.testing.assert_allclose(layer, expected_layer, atol=1e-5)
+
+    expected = list(
+        pyramids.pyramid_gaussian(image_gray, max_layer=2, preserve_range=True)
+    )
+    _, layers = _collect_stream(image_gray, max_layer=2, dtype=np.uint8)
+    assert_array_equal(layers[0], image_gray)
+    for layer, expected_layer in zip(layers, expected):
+        assert layer.dtype == np.uint8
+        np.testing.assert_allclose(layer, expected_layer, atol=0.5 + 1e-3)
+
+    with pytest.raises(ValueError):
+        _collect_stream(image_gray, dtype=np.uint16)
+    with pytest.raises(ValueError):
+        _collect_stream(image, channel_axis=0)
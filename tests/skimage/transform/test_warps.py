@@ -15,6 +15,8 @@ from skimage.transform._warps import (
     _log_polar_mapping,
     warp,
     warp_coords,
+    warp_stack,
+    PrecomputedWarp,
     rotate,
     resize,
     rescale,
@@ -25,6 +27,7 @@ from skimage.transform._warps import (
 )
 from skimage.transform._geometric import (
     AffineTransform,
+    PiecewiseAffineTransform,
     ProjectiveTransform,
     SimilarityTransform,
 )
@@ -187,6 +190,115 @@ def test_warp_clip_cval_not_used(order):
     assert_array_almost_equal(outx.min(), 1)
 
 
+@pytest.mark.parametrize('channel_axis', [False, True])
+@pytest.mark.parametrize('order', [0, 1, 3])
+@pytest.mark.parametrize('mode', ['constant', 'edge', 'reflect'])
+@pytest.mark.parametrize('workers', [1, 3])
+def test_warp_stack(channel_axis, order, mode, workers):
+    image = astronaut()[::8, ::8]
+    if not channel_axis:
+        image = image[..., 0]
+    stack = np.stack([image, image[::-1], image[:, ::-1], image])
+    tforms = [
+        SimilarityTransform(rotation=0.1 * i, translation=(i, -2 * i)) for i in range(3)
+    ]
+    tforms.append(
+        ProjectiveTransform(np.array([[1, 0.01, 2], [0.02, 1, 1], [1e-4, 2e-4, 1]]))
+    )
+
+    warped = warp_stack(
+        stack,
+        tforms,
+        output_shape=(50, 70),
+        order=order,
+        mode=mode,
+        cval=0.3,
+        workers=workers,
+    )
+    expected = np.stack(
+        [
+            warp(frame, tform, output_shape=(50, 70), order=order, mode=mode, cval=0.3)
+            for frame, tform in zip(stack, tforms)
+        ]
+    )
+    assert warped.dtype == expected.dtype
+    assert_allclose(warped, expected, atol=1e-12)
+
+
+def test_warp_stack_out():
+    stack = np.random.random((3, 20, 20)).astype(np.float32)
+    matrices = np.stack([AffineTransform(shear=0.1 * i).params for i in range(3)])
+    out = np.empty_like(stack)
+    warped = warp_stack(stack, matrices, out=out, workers=None)
+    assert warped is out
+    for frame, matrix, frame_out in zip(stack, matrices, out):
+        assert_allclose(frame_out, warp(frame, matrix), atol=1e-6)
+
+    with pytest.raises(ValueError):
+        warp_stack(stack, matrices, out=out.astype(np.float64))
+    with pytest.raises(ValueError):
+        warp_stack(stack, matrices[:2])
+
+
+@pytest.mark.parametrize('order', [0, 1, 3])
+@pytest.mark.parametrize('mode', ['constant', 'edge', 'symmetric', 'reflect', 'wrap'])
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_precomputed_warp_homography(order, mode, dtype):
+    image = astronaut()[::4, ::4]
+    tform = ProjectiveTransform(
+        np.array([[1, 0.05, -12], [0.03, 0.95, 8], [1e-4, 2e-4, 1]])
+    )
+    warp_map = PrecomputedWarp(
+        tform, image.shape, (100, 150), order=order, mode=mode, dtype=dtype
+    )
+    for img in (image, image[..., 0], image[..., 0] / 255):
+        expected = warp(
+            img, tform, output_shape=(100, 150), order=order, mode=mode, cval=0.3
+        )
+        warped = warp_map(img, cval=0.3)
+        assert warped.dtype == expected.dtype
+        assert_allclose(warped, expected, atol=1e-5)
+
+
+@pytest.mark.parametrize('mode', ['constant', 'edge', 'symmetric', 'reflect', 'wrap'])
+def test_precomputed_warp_nearest_boundaries(mode):
+    # half-integer coordinates and coordinates far outside of the image
+    image = np.linspace(0, 1, 35).reshape(5, 7)
+    x = np.array([-7.6, -5.5, -2.5, -1.5, -0.6, -0.5, 0.5, 2.5, 6.5, 7.5, 9.5, 15.3])
+    rows, cols = np.meshgrid(np.linspace(-6.5, 10.5, 9), x, indexing='ij')
+    coords = np.stack([rows, cols])
+
+    expected = warp(image, coords, order=0, mode=mode, cval=-1, clip=False)
+    warp_map = PrecomputedWarp(coords, image.shape, order=0, mode=mode)
+    assert_array_equal(warp_map(image, cval=-1, clip=False), expected)
+
+
+@pytest.mark.parametrize('order', [0, 1])
+def test_precomputed_warp_piecewise_affine(order):
+    image = astronaut()[::4, ::4, 0]
+    rows, cols = np.mgrid[0:128:8j, 0:128:8j]
+    src = np.column_stack([cols.ravel(), rows.ravel()])
+    dst = src + np.sin(src / 20) * 3
+    tform = PiecewiseAffineTransform.from_estimate(src, dst)
+
+    warp_map = PrecomputedWarp(tform.inverse, image.shape, order=order)
+    assert warp_map.output_shape == image.shape
+    expected = warp(image, tform.inverse, order=order)
+    assert_allclose(warp_map(image), expected, atol=1e-12)
+    # at least one 32-bit index per neighbor of each output pixel
+    assert warp_map.nbytes >= image.size * (order + 1) ** 2 * 4
+
+
+def test_precomputed_warp_errors():
+    with pytest.raises(ValueError):
+        PrecomputedWarp(np.eye(3), (10, 10), order=2)
+    with pytest.raises(ValueError):
+        PrecomputedWarp(np.eye(3), (10, 10), mode='foo')
+    warp_map = PrecomputedWarp(np.eye(3), (10, 10))
+    with pytest.raises(ValueError):
+        warp_map(np.zeros((10, 11)))
+
+
 def test_homography():
     x = np.zeros((5, 5), dtype=np.float64)
     x[1, 1] = 1
@@ -212,6 +324,55 @@ def test_rotate(dtype):
     assert_array_almost_equal(x90, np.rot90(x))
 
 
+@pytest.mark.parametrize('order', [0, 1, 3])
+@pytest.mark.parametrize('workers', [2, 5, None])
+def test_warp_workers(order, workers):
+    image = astronaut()[::4, ::4]
+    tform = ProjectiveTransform(
+        np.array([[1, 0.05, -12], [0.03, 0.95, 8], [1e-4, 2e-4, 1]])
+    )
+
+    def shift(xy):
+        return xy + np.array([3.3, -2.7])
+
+    for inverse_map in (tform, shift):
+        for img in (image, image[..., 0]):
+            expected = warp(img, inverse_map, order=order, output_shape=(101, 77))
+            warped = warp(
+                img, inverse_map, order=order, output_shape=(101, 77), workers=workers
+            )
+            assert warped.dtype == expected.dtype
+            assert_array_equal(warped, expected)
+
+    expected = rotate(image, 17, resize=True, order=order)
+    assert_array_equal(
+        rotate(image, 17, resize=True, order=order, workers=workers), expected
+    )
+
+
+@pytest.mark.parametrize('order', [0, 1, 3])
+@pytest.mark.parametrize('scale', [0.37, 2.2])
+def test_rescale_workers(order, scale):
+    image = astronaut()[::4, ::4]
+    expected = rescale(image, scale, order=order, channel_axis=-1)
+    rescaled = rescale(image, scale, order=order, channel_axis=-1, workers=3)
+    assert rescaled.dtype == expected.dtype
+    assert_allclose(rescaled, expected, rtol=0, atol=1e-12)
+
+
+@pytest.mark.parametrize('mode', ['constant', 'edge', 'symmetric', 'reflect', 'wrap'])
+@pytest.mark.parametrize('dtype, order', [(np.float64, 1), (np.uint8, 0)])
+def test_resize_anti_aliasing_workers(mode, dtype, order):
+    # bright first rows and dark last rows, so that wrapping matters
+    image = np.zeros((97, 83), dtype=dtype)
+    image[:10] = 255
+    kwargs = dict(order=order, mode=mode, anti_aliasing=True, preserve_range=True)
+    expected = resize(image, (50, 40), workers=1, **kwargs)
+    resized = resize(image, (50, 40), workers=4, **kwargs)
+    assert resized.dtype == expected.dtype
+    assert_allclose(resized, expected, rtol=1e-12, atol=0)
+
+
 def test_rotate_resize():
     x = np.zeros((10, 10), dtype=np.float64)
 
@@ -272,6 +433,51 @@ def test_rescale():
     assert_array_almost_equal(scaled, ref)
 
 
+@pytest.mark.parametrize('mode', ['constant', 'edge', 'symmetric', 'reflect', 'wrap'])
+@pytest.mark.parametrize('output_shape', [(37, 61, 3), (150, 100, 3)])
+def test_resize_kernel_gaussian(mode, output_shape):
+    image = img_as_float(astronaut()[::4, ::4])
+    expected = resize(image, output_shape, order=1, mode=mode, cval=0.3)
+    resized = resize(image, output_shape, kernel='gaussian', mode=mode, cval=0.3)
+    assert_allclose(resized, expected, rtol=0, atol=1e-12)
+
+
+def test_resize_kernel_area():
+    image = img_as_float(astronaut()[::4, ::4])
+    for output_shape in [(37, 61), (150, 100)]:
+        expected = resize_local_mean(image, output_shape, channel_axis=-1)
+        resized = resize(image, output_shape + (3,), kernel='area')
+        assert_allclose(resized, expected, rtol=0, atol=1e-12)
+
+
+def test_resize_kernel_linear_upsampling():
+    image = img_as_float(astronaut()[::4, ::4, 0])
+    expected = resize(image, (200, 150), order=1)
+    assert_allclose(resize(image, (200, 150), kernel='linear'), expected, atol=1e-12)
+
+
+@pytest.mark.parametrize('kernel', ['linear', 'lanczos', 'area', 'gaussian'])
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_resize_kernel_dtype(kernel, dtype):
+    image = np.full((50, 40, 30), 0.5, dtype=dtype)
+    resized = resize(image, (20, 70, 10), kernel=kernel)
+    assert resized.dtype == dtype
+    assert_allclose(resized, 0.5, rtol=1e-6)
+
+    expected = rescale(image, 0.5, kernel=kernel)
+    assert_array_equal(rescale(image, 0.5, kernel=kernel, workers=3), expected)
+
+
+def test_resize_kernel_invalid():
+    image = np.zeros((10, 10))
+    with pytest.raises(ValueError):
+        resize(image, (5, 5), kernel='cubic')
+    with pytest.raises(ValueError):
+        resize(image, (5, 5), kernel='linear', order=3)
+    with pytest.raises(ValueError):
+        resize(image.astype(bool), (5, 5), kernel='linear')
+
+
 def test_rescale_invalid_scale():
     x = np.zeros((10, 10, 3))
     with pytest.raises(ValueError):
@@ -2,13 +2,18 @@ import numpy as np
 import platform
 
 from skimage._shared.testing import assert_array_almost_equal, assert_equal
-from skimage import color, data, img_as_float
+from skimage import color, data, img_as_float, measure
 from skimage.filters import threshold_local, gaussian
 from skimage.util.apply_parallel import apply_parallel
 
 import pytest
 
-da = pytest.importorskip('dask.array')
+try:
+    import dask.array as da
+except ImportError:
+    da = None
+
+requires_dask = pytest.mark.skipif(da is None, reason="dask is not installed")
 
 
 IS_MACOS_ARM = platform.system() == 'Darwin' and platform.machine() == 'arm64'
@@ -18,6 +23,7 @@ IMG_COMPARE_PRECISION = 4 if IS_MACOS_ARM else 6
 # so we need to lower the decimal precision
 
 
+@requires_dask
 def test_apply_parallel():
     # data
     a = np.arange(144).reshape(12, 12).astype(float)
@@ -52,6 +58,7 @@ def test_apply_parallel():
     assert_array_almost_equal(result3, expected3)
 
 
+@requires_dask
 def test_apply_parallel_lazy():
     # data
     a = np.arange(144).reshape(12, 12).astype(float)
@@ -87,6 +94,7 @@ def test_apply_parallel_lazy():
     assert_array_almost_equal(result2.compute(), expected1)
 
 
+@requires_dask
 def test_no_chunks():
     a = np.ones(1 * 4 * 8 * 9).reshape(1, 4, 8, 9)
 
@@ -99,6 +107,7 @@ def test_no_chunks():
     assert_array_almost_equal(result, expected)
 
 
+@requires_dask
 def test_apply_parallel_wrap():
     def wrapped(arr):
         return gaussian(arr, sigma=1, mode='wrap')
@@ -110,6 +119,7 @@ def test_apply_parallel_wrap():
     assert_array_almost_equal(result, expected)
 
 
+@requires_dask
 def test_apply_parallel_nearest():
     def wrapped(arr):
         return gaussian(arr, sigma=1, mode='nearest')
@@ -123,6 +133,7 @@ def test_apply_parallel_nearest():
     assert_array_almost_equal(result, expected)
 
 
+@requires_dask
 @pytest.mark.parametrize('dtype', (np.float32, np.float64))
 @pytest.mark.parametrize('chunks', (None, (128, 128, 3)))
 @pytest.mark.parametrize('depth', (0, 8, (8, 8, 0)))
@@ -142,6 +153,7 @@ def test_apply_parallel_rgb(depth, chunks, dtype):
     )
 
 
+@requires_dask
 @pytest.mark.parametrize('chunks', (None, (128, 256), 'ndim'))
 @pytest.mark.parametrize('depth', (0, 8, (8, 16), 'ndim'))
 @pytest.mark.parametrize('channel_axis', (0, 1, 2, -1, -2, -3))
@@ -181,3 +193,144 @@ def test_apply_parallel_rgb_channel_axis(depth, chunks, channel_axis):
     cat_ycbcr = np.moveaxis(cat_ycbcr, channel_axis, -1)
 
     assert_array_almost_equal(cat_ycbcr_expected, cat_ycbcr)
+
+
+@pytest.mark.parametrize('mode', ['reflect', 'symmetric', 'wrap', 'edge', 'nearest'])
+@pytest.mark.parametrize('chunks', [(6, 6), 5, ((3, 9), (12,))])
+def test_apply_parallel_threads(mode, chunks):
+    a = np.arange(144).reshape(12, 12).astype(float)
+    ndi_mode = {'symmetric': 'reflect', 'edge': 'nearest'}.get(mode, mode)
+    if ndi_mode == 'wrap':
+        ndi_mode = 'grid-wrap'
+
+    def wrapped(arr):
+        return gaussian(arr, sigma=1, mode='nearest')
+
+    expected = gaussian(a, sigma=1, mode=ndi_mode)
+    result = apply_parallel(
+        wrapped, a, chunks=chunks, depth=5, mode=mode, backend='threads', workers=2
+    )
+    assert_array_almost_equal(result, expected)
+
+
+def test_apply_parallel_threads_views():
+    a = np.arange(144).reshape(12, 12)
+    blocks = []
+
+    def identity(arr):
+        blocks.append(arr)
+        return arr
+
+    result = apply_parallel(
+        identity, a, chunks=4, depth={1: 2}, mode='none', backend='threads'
+    )
+    assert_equal(result, a)
+    assert result.dtype == a.dtype
+    assert len(blocks) == 9
+    # without padding, all the chunks are views of the input
+    assert all(np.shares_memory(block, a) for block in blocks)
+    assert sorted({block.shape for block in blocks}) == [(4, 6), (4, 8)]
+
+
+@pytest.mark.parametrize('depth', (0, 8, 'ndim'))
+@pytest.mark.parametrize('channel_axis', (0, -1))
+def test_apply_parallel_threads_channel_axis(depth, channel_axis):
+    cat = img_as_float(data.chelsea())
+    expected = color.rgb2ycbcr(cat, channel_axis=-1)
+
+    cat = np.moveaxis(cat, -1, channel_axis)
+    if depth == 'ndim':
+        depth = [8, 8]
+        depth.insert(channel_axis % cat.ndim, 0)
+    result = apply_parallel(
+        color.rgb2ycbcr,
+        cat,
+        depth=depth,
+        dtype=np.float32,
+        channel_axis=channel_axis,
+        extra_keywords=dict(channel_axis=channel_axis),
+        backend='threads',
+    )
+    assert result.dtype == np.float32
+    assert_array_almost_equal(
+        np.moveaxis(result, channel_axis, -1), expected, decimal=4
+    )
+
+
+@pytest.mark.parametrize('dtype', (None, np.float32))
+@pytest.mark.parametrize('stitch_labels', (False, True))
+def test_apply_parallel_threads_empty(dtype, stitch_labels):
+    a = np.ones((0, 5), dtype=np.uint8)
+    result = apply_parallel(
+        np.sqrt,
+        a,
+        chunks=2,
+        depth=1,
+        dtype=dtype,
+        backend='threads',
+        stitch_labels=stitch_labels,
+    )
+    assert result.shape == a.shape
+    assert result.dtype == (a.dtype if dtype is None else dtype)
+
+
+def test_apply_parallel_threads_errors():
+    a = np.ones((12, 12))
+    with pytest.raises(ValueError, match='compute=False'):
+        apply_parallel(np.sqrt, a, compute=False, backend='threads')
+    with pytest.raises(ValueError, match='shape'):
+        apply_parallel(lambda x: x[1:], a, chunks=6, backend='threads')
+    with pytest.raises(ValueError, match='do not add up'):
+        apply_parallel(np.sqrt, a, chunks=((6, 5), 12), backend='threads')
+    with pytest.raises(ValueError, match='backend'):
+        apply_parallel(np.sqrt, a, backend='processes')
+
+
+def _assert_same_labels(result, expected):
+    """Check that the labels are equal up to a permutation."""
+    assert_equal(result == 0, expected == 0)
+    pairs = np.unique(np.stack([result.ravel(), expected.ravel()]), axis=1)
+    assert pairs.shape[1] == len(np.unique(result)) == len(np.unique(expected))
+
+
+@pytest.mark.parametrize('connectivity', [1, 2])
+@pytest.mark.parametrize('chunks', [(7, 9), 5, ((1, 30, 9), (40,))])
+def test_apply_parallel_stitch_labels(connectivity, chunks):
+    rng = np.random.default_rng(0)
+    image = rng.random((40, 40)) > 0.55
+
+    expected = measure.label(image, connectivity=connectivity)
+    result = apply_parallel(
+        measure.label,
+        image,
+        chunks=chunks,
+        depth=1,
+        extra_keywords={'connectivity': connectivity},
+        stitch_labels=True,
+        workers=2,
+    )
+    _assert_same_labels(result, expected)
+    assert result.max() == expected.max()
+    assert result.dtype == expected.dtype
+
+
+def test_apply_parallel_stitch_labels_3d():
+    rng = np.random.default_rng(1)
+    image = rng.random((12, 14, 16)) > 0.7
+    expected = measure.label(image)
+    result = apply_parallel(
+        measure.label, image, chunks=5, depth=(1, 2, 1), stitch_labels=True
+    )
+    _assert_same_labels(result, expected)
+
+
+def test_apply_parallel_stitch_labels_errors():
+    image = np.zeros((12, 12), dtype=bool)
+    with pytest.raises(ValueError, match='label images'):
+        apply_parallel(np.logical_not, image, chunks=6, stitch_labels=True)
+    with pytest.raises(ValueError, match='padding'):
+        apply_parallel(
+            measure.label, image, chunks=6, mode='reflect', stitch_labels=True
+        )
+    with pytest.raises(ValueError, match='threads'):
+        apply_parallel(measure.label, image, backend='dask', stitch_labels=True)